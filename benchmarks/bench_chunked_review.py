@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+bench_chunked_review.py - 전체 검토 vs 섹션 단위 병렬 검토 벤치마크
+synth_issue.py로 합성 이슈와 번역본을 만들고 일부 섹션을 미번역(원문 그대로)으로 남긴 뒤,
+review-links.txt 한 번 호출(REVIEW_MODE=claude)과 chunked_review의 섹션 묶음 병렬 호출을 비교합니다.
+
+Claude CLI 대신 프롬프트 크기에 비례해 지연되는 가짜 CLI를 씁니다
+(지연 = --base-latency + 프롬프트 바이트 / --throughput). 보고 항목:
+- 호출 수, 프롬프트 바이트, 추정 입력 토큰 (llm_ledger.estimate_tokens)
+- 검토 벽시계 시간
+- 미번역으로 남긴 섹션이 모두 의심 섹션으로 선정되었는지
+
+사용법:
+    python3 benchmarks/bench_chunked_review.py
+    python3 benchmarks/bench_chunked_review.py --size 1M --untranslated 5 --max-parallel 8
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+# 모듈 import 전에 설정해야 적용됨 (브레이커 상태와 LLM 장부는 임시 디렉토리에)
+WORK_DIR = Path(tempfile.mkdtemp(prefix="bench-chunked-review-"))
+os.environ["RESILIENCE_DIR"] = str(WORK_DIR / "resilience")
+os.environ["METRICS_DIR"] = str(WORK_DIR / "metrics")
+
+from synth_issue import generate_issue, generate_translation, parse_size  # noqa: E402
+from crawler.fetch_page import process_markdown  # noqa: E402
+from lib import resilience  # noqa: E402
+from lib.llm_ledger import estimate_tokens  # noqa: E402
+from review.chunked_review import build_plan, batch_chunks, batch_prompt, split_sections, render_prompt, run_reviews  # noqa: E402
+
+FRONTMATTER = """---
+title: "합성 이슈 벤치마크 제목"
+date: 2026-01-16
+summary:
+  - "첫 번째 요약 줄은 스무 글자를 넘겨야 합니다"
+  - "두 번째 요약 줄은 스무 글자를 넘겨야 합니다"
+  - "세 번째 요약 줄은 스무 글자를 넘겨야 합니다"
+  - "네 번째 요약 줄은 스무 글자를 넘겨야 합니다"
+  - "다섯 번째 요약 줄은 스무 글자를 넘겨야 합니다"
+originalUrl: "https://news.smol.ai/issues/26-01-16-synthetic"
+hasHeadline: true
+headline: "합성 헤드라인"
+---
+
+"""
+
+FAKE_CLAUDE = """#!/usr/bin/env python3
+import sys, time
+prompt = sys.stdin.buffer.read()
+time.sleep({base} + len(prompt) / {throughput})
+print("PASS")
+"""
+
+
+def build_inputs(size: int, seed: int, untranslated: int) -> tuple[str, str, list[str]]:
+    """(원문, 번역본, 미번역으로 남긴 섹션 첫 줄 목록)"""
+    content, _, _ = process_markdown(generate_issue(size, seed))
+    translated_sections = split_sections(generate_translation(content, seed, 0.0).text)
+    original_sections = split_sections(content)
+
+    # 본문이 충분히 긴 섹션 중 고르게 골라 원문 그대로 둠 (미번역)
+    candidates = [i for i, s in enumerate(original_sections) if len(s) >= 400 and i < len(translated_sections)]
+    step = max(1, len(candidates) // max(untranslated, 1))
+    picked = candidates[step // 2 :: step][:untranslated]
+    for i in picked:
+        translated_sections[i] = original_sections[i]
+
+    translated = FRONTMATTER + "\n\n".join(translated_sections) + "\n"
+    return content, translated, [original_sections[i].split("\n", 1)[0] for i in picked]
+
+
+def run_full(original: str, translated: str, template: str, command: list[str]) -> dict:
+    prompt = render_prompt(template, original, translated)
+    prompt_path = WORK_DIR / "full-prompt.txt"
+    output_path = WORK_DIR / "full-output.txt"
+    prompt_path.write_text(prompt, encoding="utf-8")
+    start = time.perf_counter()
+    exit_code = resilience.exec_command("claude", command, prompt_path, output_path)
+    return {
+        "calls": 1,
+        "prompt_bytes": len(prompt.encode("utf-8")),
+        "input_tokens": estimate_tokens(prompt),
+        "wall_ms": round((time.perf_counter() - start) * 1000, 1),
+        "ok": exit_code == 0,
+    }
+
+
+def run_chunked(
+    original: str, translated: str, template: str, command: list[str],
+    sample_rate: float, max_parallel: int, batch_bytes: int,
+):
+    start = time.perf_counter()
+    plan = build_plan(original, translated, sample_rate)
+    batches = batch_chunks(plan.selected, max_parallel, batch_bytes)
+    results = run_reviews(plan, batches, template, command, "fake", max_parallel)
+    prompts = [batch_prompt(plan, b, template) for b in batches]
+    return plan, {
+        "calls": len(results),
+        "prompt_bytes": sum(r.prompt_bytes for r in results),
+        "input_tokens": sum(estimate_tokens(p) for p in prompts),
+        "wall_ms": round((time.perf_counter() - start) * 1000, 1),
+        "ok": all(r.outcome == "pass" for r in results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 검토 vs 섹션 단위 병렬 검토 벤치마크")
+    parser.add_argument("--size", default="300K", help="합성 원문 크기 (default: 300K)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 이슈 시드")
+    parser.add_argument("--untranslated", type=int, default=3, help="미번역으로 남길 섹션 수")
+    parser.add_argument("--sample-rate", type=float, default=0.2, help="의심 없는 섹션 표본 비율")
+    parser.add_argument("--max-parallel", type=int, default=4, help="동시 Claude 호출 수")
+    parser.add_argument("--batch-bytes", type=int, default=32768, help="호출당 섹션 묶음 바이트 상한")
+    parser.add_argument("--base-latency", type=float, default=0.3, help="가짜 CLI 호출당 기본 지연 (초)")
+    parser.add_argument("--throughput", type=float, default=200_000, help="가짜 CLI 프롬프트 처리 속도 (바이트/초)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    fake = WORK_DIR / "fake-claude"
+    fake.write_text(FAKE_CLAUDE.format(base=args.base_latency, throughput=args.throughput))
+    fake.chmod(0o755)
+    command = [str(fake)]
+
+    original, translated, untranslated = build_inputs(parse_size(args.size), args.seed, args.untranslated)
+    full_template = (PROJECT_ROOT / "prompts" / "review-links.txt").read_text(encoding="utf-8")
+    section_template = (PROJECT_ROOT / "prompts" / "review-section.txt").read_text(encoding="utf-8")
+
+    full = run_full(original, translated, full_template, command)
+    plan, chunked = run_chunked(
+        original, translated, section_template, command, args.sample_rate, args.max_parallel, args.batch_bytes
+    )
+
+    flagged_titles = {c.title for c in plan.chunks if c.flags}
+    missed = [title for title in untranslated if title not in flagged_titles]
+    summary = {
+        "original_bytes": len(original.encode("utf-8")),
+        "sections": len(plan.chunks),
+        "flagged": sum(1 for c in plan.chunks if c.flags),
+        "untranslated": len(untranslated),
+        "missed_untranslated": missed,
+        "full": full,
+        "chunked": chunked,
+    }
+
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+    else:
+        print(
+            f"Issue: {summary['original_bytes'] / 1024:.0f}KB, {summary['sections']} section(s), "
+            f"{summary['flagged']} flagged ({len(untranslated)} left untranslated)\n"
+        )
+        print(f"{'mode':<8} {'calls':>6} {'prompt':>11} {'tokens':>9} {'wall':>10}")
+        for name in ("full", "chunked"):
+            run = summary[name]
+            print(
+                f"{name:<8} {run['calls']:>6} {run['prompt_bytes'] / 1024:>8.0f}KiB "
+                f"{run['input_tokens']:>9,} {run['wall_ms']:>8.0f}ms"
+            )
+        print(
+            f"\nchunked/full: tokens {chunked['input_tokens'] / full['input_tokens']:.2f}x, "
+            f"wall {chunked['wall_ms'] / full['wall_ms']:.2f}x"
+        )
+        if missed:
+            print(f"Untranslated sections not flagged: {', '.join(missed)}")
+
+    if missed or not (full["ok"] and chunked["ok"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+bench_fetch.py - 스트리밍 페치 벤치마크
+로컬 HTTP 서버에서 수 MB 크기의 합성 이슈(뉴스레터 + 긴 Discord 상세 섹션)를 내려주고,
+전체 다운로드(fetch_raw_markdown)와 스트리밍(stream_raw_markdown) 경로의
+다운로드 바이트, 첫 섹션까지 시간, 전체 시간, 피크 메모리를 비교합니다.
+두 경로의 process_markdown 결과가 같은지도 확인합니다.
+
+사용법:
+    python3 benchmarks/bench_fetch.py
+    python3 benchmarks/bench_fetch.py --sizes 2,8,32 --bandwidth 20   # MB, MB/s 제한
+"""
+
+import sys
+import json
+import time
+import argparse
+import threading
+import tracemalloc
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from crawler.fetch_page import fetch_raw_markdown, stream_raw_markdown, process_markdown  # noqa: E402
+
+EXAMPLE = PROJECT_ROOT / "examples" / "2026-01-16-chatgpt-ads.md"
+DISCORD_MARKER = "# Discord: High level Discord summaries"
+SEND_CHUNK = 64 * 1024
+
+
+def build_issue(size_mb: float) -> bytes:
+    """예시 이슈 뒤에 size_mb 크기의 Discord 상세 섹션을 붙인 원문을 만듭니다."""
+    newsletter = EXAMPLE.read_text(encoding="utf-8")
+    detail_line = "- **[Discord channel](https://discord.com/channels/1/2)**: 사용자들이 새 모델의 지연 시간과 가격을 비교했다.\n"
+    repeat = max(1, int(size_mb * 1024 * 1024 / len(detail_line.encode("utf-8"))))
+    tail = f"\n---\n\n{DISCORD_MARKER}\n\n" + detail_line * repeat
+    return (newsletter + tail).encode("utf-8")
+
+
+def start_server(documents: dict[str, bytes], bandwidth_mbps: float) -> ThreadingHTTPServer:
+    """documents를 /<name>.md로 제공하는 로컬 서버 (bandwidth_mbps > 0이면 전송 속도 제한)"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = documents.get(self.path.lstrip("/"))
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            try:
+                for offset in range(0, len(body), SEND_CHUNK):
+                    self.wfile.write(body[offset:offset + SEND_CHUNK])
+                    if bandwidth_mbps > 0:
+                        time.sleep(SEND_CHUNK / (bandwidth_mbps * 1024 * 1024))
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # 스트리밍 클라이언트가 마커에서 연결을 닫은 경우
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_full(url: str) -> tuple[str, dict]:
+    start = time.perf_counter()
+    raw = fetch_raw_markdown(url)
+    elapsed = (time.perf_counter() - start) * 1000
+    # 전체 다운로드는 본문 전체를 받은 뒤에야 첫 섹션을 볼 수 있음
+    return raw, {
+        "bytes_read": len(raw.encode("utf-8")),
+        "first_section_ms": elapsed,
+        "elapsed_ms": elapsed,
+    }
+
+
+def run_stream(url: str) -> tuple[str, dict]:
+    return stream_raw_markdown(url)
+
+
+def measure(fetch, url: str) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    raw, stats = fetch(url)
+    content, _, _ = process_markdown(raw)
+    total_ms = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "bytes_read": stats["bytes_read"],
+        "first_section_ms": stats["first_section_ms"],
+        "total_ms": total_ms,
+        "peak_kib": peak / 1024,
+        "content": content,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스트리밍 페치 벤치마크")
+    parser.add_argument("--sizes", default="1,4,16", help="Discord 상세 섹션 크기 목록 (MB, default: 1,4,16)")
+    parser.add_argument("--bandwidth", type=float, default=0, help="서버 전송 속도 제한 (MB/s, 0: 제한 없음)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    sizes = [float(s) for s in args.sizes.split(",") if s.strip()]
+    documents = {f"issue-{size:g}mb.md": build_issue(size) for size in sizes}
+    server = start_server(documents, args.bandwidth)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    rows = []
+    try:
+        for name, body in documents.items():
+            url = f"{base}/{name}"
+            full = measure(run_full, url)
+            stream = measure(run_stream, url)
+            if full.pop("content") != stream.pop("content"):
+                print(f"MISMATCH: processed content differs for {name}", file=sys.stderr)
+                sys.exit(1)
+            rows.append({"issue": name, "size_bytes": len(body), "full": full, "stream": stream})
+    finally:
+        server.shutdown()
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'issue':<16} {'path':<7} {'downloaded':>12} {'first sect':>11} {'total':>10} {'peak mem':>11}")
+    for row in rows:
+        for path in ("full", "stream"):
+            r = row[path]
+            print(
+                f"{row['issue']:<16} {path:<7} {r['bytes_read'] / 1024:>9.0f}KiB "
+                f"{r['first_section_ms']:>9.1f}ms {r['total_ms']:>8.1f}ms {r['peak_kib']:>8.0f}KiB"
+            )
+    print("\nProcessed content identical for all issues.")
+
+
+if __name__ == "__main__":
+    main()
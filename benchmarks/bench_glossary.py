@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+bench_glossary.py - 용어집 검사 벤치마크
+수천 개 용어의 용어집과 큰 원문/번역본을 만들어 glossary.check(접두사 트리 정규식으로
+한 번 훑기)를 용어집 전체를 긴 표기 우선 교대 정규식 하나로 묶어 훑는 방식과 비교하고,
+용어집 컴파일/디스크 캐시 읽기 시간을 잽니다.
+
+번역본에는 일부 보호 용어를 빼고(--drop), 일부 지정 번역어 대신 금지 표기를 넣어(--misrender)
+두 방식이 같은 위반을 찾는지 확인합니다.
+
+사용법:
+    python3 benchmarks/bench_glossary.py
+    python3 benchmarks/bench_glossary.py --terms 10000 --lines 5000
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import shutil
+import string
+import argparse
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+HANGUL = [chr(c) for c in range(0xAC00, 0xAC00 + 400)]
+
+
+def make_glossary(args, rng: random.Random) -> str:
+    """보호 용어(영문 고유명사)와 지정 번역어(영문 → 한글, 금지 표기 하나) 섞인 TSV"""
+    lines = []
+    for i in range(args.terms):
+        word = "".join(rng.choices(string.ascii_letters, k=rng.randint(4, 9)))
+        if i % 2:
+            lines.append(f"{word.capitalize()}{i}")
+        else:
+            rendering = "".join(rng.choices(HANGUL, k=rng.randint(2, 4)))
+            lines.append(f"{word.lower()}-{i}\t{rendering}어\t{rendering}말")
+    return "\n".join(lines) + "\n"
+
+
+def make_texts(args, terms, rng: random.Random) -> tuple[str, str]:
+    """용어가 군데군데 나오는 원문과 번역본 (일부 위반 포함)"""
+    original, translated = [], []
+    filler_en = "the model was released with a new benchmark and open weights today"
+    filler_ko = "오늘 새로운 벤치마크와 함께 모델이 공개되었습니다"
+    for _ in range(args.lines):
+        en, ko = [filler_en], [filler_ko]
+        for term in rng.sample(terms, k=args.per_line):
+            en.append(term.term)
+            roll = rng.random()
+            if term.protected:
+                if roll >= args.drop:
+                    ko.append(term.term)
+            else:
+                ko.append(term.variants[0] if roll < args.misrender else term.rendering)
+        original.append("- " + " ".join(en) + " ([link](https://example.com/a))")
+        translated.append("- " + " ".join(ko) + " ([link](https://example.com/a))")
+    return "\n".join(original), "\n".join(translated)
+
+
+def _alternation(surfaces: list[str]) -> str:
+    """긴 표기 우선 교대 (영문자/숫자로 시작하거나 끝나면 단어 경계)"""
+    alts = []
+    for surface in sorted(surfaces, key=len, reverse=True):
+        alt = re.escape(surface)
+        if surface[0].isascii() and surface[0].isalnum():
+            alt = r"(?<![A-Za-z0-9])" + alt
+        if surface[-1].isascii() and surface[-1].isalnum():
+            alt += r"(?![A-Za-z0-9])"
+        alts.append(alt)
+    return "|".join(alts)
+
+
+def regex_check(original: str, translated: str, terms) -> set[str]:
+    """용어집 전체를 교대 정규식 하나로 묶어 원문/번역본을 한 번씩 훑는 비교 기준 (위반 용어 집합)
+
+    한 위치에서 긴 표기 하나만 맞추므로, 다른 표기 안에 든 표기도 세도록 앞보기로 모든 시작 위치를 훑습니다.
+    """
+    protected = {t.term: t for t in terms if t.protected}
+    sources = {t.term.lower(): t for t in terms if not t.protected}
+    source_re = re.compile(
+        "(?=(" + _alternation(list(protected)) + "|(?i:" + _alternation([t.term for t in sources.values()]) + ")))"
+    )
+    seen_protected, seen_sources = set(), set()
+    for found in source_re.findall(original):
+        if found in protected:
+            seen_protected.add(found)
+        else:
+            seen_sources.add(found.lower())
+
+    renderings = {t.rendering for t in terms if not t.protected}
+    variants = {v for t in terms for v in t.variants}
+    target_re = re.compile("(?=(" + _alternation(list(protected) + list(renderings | variants)) + "))")
+    in_translated = set(target_re.findall(translated))
+
+    violated = {term for term in seen_protected if term not in in_translated}
+    for name in seen_sources:
+        term = sources[name]
+        if term.rendering not in in_translated or any(v in in_translated for v in term.variants):
+            violated.add(term.term)
+    return violated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="용어집 검사 벤치마크")
+    parser.add_argument("--terms", type=int, default=5000, help="용어집 용어 수")
+    parser.add_argument("--lines", type=int, default=300, help="본문 줄 수 (교대 정규식 비교가 느려 기본값은 작게)")
+    parser.add_argument("--per-line", type=int, default=3, help="줄당 용어 수")
+    parser.add_argument("--drop", type=float, default=0.002, help="번역본에서 보호 용어를 빠뜨릴 확률")
+    parser.add_argument("--misrender", type=float, default=0.002, help="지정 번역어 대신 금지 표기를 쓸 확률")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    from review import glossary as gl
+
+    rng = random.Random(args.seed)
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-glossary-"))
+    try:
+        glossary_file = work_dir / "glossary.tsv"
+        glossary_file.write_text(make_glossary(args, rng), encoding="utf-8")
+        cache_dir = work_dir / "cache"
+
+        start = time.perf_counter()
+        glossary = gl.load_glossary(glossary_file, cache_dir)
+        build_s = time.perf_counter() - start
+        gl._LOADED.clear()
+        re.purge()
+        start = time.perf_counter()
+        gl.load_glossary(glossary_file, cache_dir)
+        cached_s = time.perf_counter() - start
+        start = time.perf_counter()
+        gl.load_glossary(glossary_file, cache_dir)
+        memory_s = time.perf_counter() - start
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    original, translated = make_texts(args, glossary.terms, rng)
+
+    gl.MAX_REPORTED = len(glossary.terms) + 1
+    start = time.perf_counter()
+    violations = gl.check(original, translated, glossary)
+    glossary_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = regex_check(original, translated, glossary.terms)
+    regex_s = time.perf_counter() - start
+
+    found = {re.search(r'"([^"]+)"', v.message).group(1) for v in violations}
+    # 금지 표기 위반은 표기 대신 원래 용어로 맞춤
+    found = {
+        next((t.term for t in glossary.terms if name in t.variants), name) for name in found
+    }
+
+    result = {
+        "terms": len(glossary.terms),
+        "patterns": len(glossary.patterns),
+        "regex_chars": len(glossary.source),
+        "text_chars": len(original) + len(translated),
+        "build_s": round(build_s, 3),
+        "cached_load_s": round(cached_s, 3),
+        "in_process_s": round(memory_s, 6),
+        "glossary_s": round(glossary_s, 3),
+        "alternation_s": round(regex_s, 3),
+        "violations": len(expected),
+    }
+
+    failures = []
+    if found != expected:
+        failures.append(f"glossary.check and alternation regex disagree ({len(found ^ expected)} terms)")
+    if not expected:
+        failures.append("no violations were injected")
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(
+            f"{result['terms']} terms ({result['patterns']} patterns, {result['regex_chars']:,}-char trie regex), "
+            f"{result['text_chars']:,} chars of text\n"
+        )
+        print(f"Compile glossary  {build_s * 1000:>8.1f}ms")
+        print(f"Load from cache   {cached_s * 1000:>8.1f}ms")
+        print(f"In-process reuse  {memory_s * 1000:>8.3f}ms\n")
+        print(f"Check (trie)      {glossary_s * 1000:>8.1f}ms")
+        print(f"Check (one regex) {regex_s * 1000:>8.1f}ms  ({regex_s / glossary_s:.1f}x)")
+        print(f"Violations found: {len(found)} (expected {len(expected)})")
+        for failure in failures:
+            print(f"\nUnexpected: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
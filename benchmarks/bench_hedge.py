@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+bench_hedge.py - 병렬 번역 후보 벤치마크
+가짜 번역/검토 명령으로 여러 날의 이슈를 hedge.run에 돌려, 먼저 통과한 후보를 쓰는 병렬 실행과
+기존 순차 재시도(번역 → 검토 → 실패 시 다음 단계로 재번역 → 검토)의 소요 시간을 비교합니다.
+
+후보는 기본 HEDGE_CANDIDATES(route escalate)와 같이 라우팅 단계와 그다음 단계입니다.
+단계별 번역 시간은 로그정규 분포(--minutes 중앙값, 분 단위)이고, --scale초를 1분으로 줄여 실제로 실행합니다.
+리뷰 통과 확률은 --pass-rate (다음 단계는 --escalated-pass-rate).
+순차 시간은 취소된 후보의 계획된 번역 시간까지 넣어 정확히 계산합니다.
+
+확인 사항:
+- 통과한 후보가 있으면 반드시 통과 후보를 고름
+- 나쁜 날(첫 후보가 리뷰 실패)에 꼬리 지연(p95)이 줄어듦
+
+사용법:
+    python3 benchmarks/bench_hedge.py
+    python3 benchmarks/bench_hedge.py --days 40 --pass-rate 0.6 --scale 0.05
+"""
+
+import os
+import sys
+import json
+import random
+import shutil
+import argparse
+import tempfile
+import textwrap
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+# 후보 단계별 계획(JSON, 단계 → {"sleep", "pass"})을 BENCH_HEDGE_PLAN에서 읽는 가짜 번역/검토
+FAKE_TRANSLATE = textwrap.dedent("""
+    import os, sys, json, time
+    plan = json.loads(os.environ["BENCH_HEDGE_PLAN"])[os.environ["TRANSLATE_ROUTE"]]
+    time.sleep(plan["sleep"])
+    with open(sys.argv[3], "w") as f:
+        f.write(open(sys.argv[1]).read() + ("\\n<!-- PASS -->\\n" if plan["pass"] else "\\n"))
+""")
+FAKE_REVIEW = textwrap.dedent("""
+    import os, sys, time
+    time.sleep(float(os.environ["BENCH_HEDGE_REVIEW"]))
+    print("PASS" if "<!-- PASS -->" in open(sys.argv[2]).read() else "FAIL: 기타 검증 실패")
+""")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="병렬 번역 후보 벤치마크")
+    parser.add_argument("--days", type=int, default=20, help="이슈 수 (날짜 수)")
+    parser.add_argument("--minutes", type=float, default=8.0, help="번역 시간 중앙값 (분)")
+    parser.add_argument("--escalated-slowdown", type=float, default=1.6, help="다음 단계 번역 시간 배수")
+    parser.add_argument("--review-minutes", type=float, default=0.5, help="검토 시간 (분)")
+    parser.add_argument("--pass-rate", type=float, default=0.75, help="첫 후보 리뷰 통과 확률")
+    parser.add_argument("--escalated-pass-rate", type=float, default=0.9, help="다음 단계 리뷰 통과 확률")
+    parser.add_argument("--scale", type=float, default=0.1, help="1분당 실제 실행 초")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-hedge-"))
+    os.environ.update(METRICS_DIR=str(work_dir / "metrics"))
+    from translate import hedge, routing
+
+    fake_translate = work_dir / "translate.py"
+    fake_review = work_dir / "review.py"
+    fake_translate.write_text(FAKE_TRANSLATE)
+    fake_review.write_text(FAKE_REVIEW)
+    original = work_dir / "original.md"
+    original.write_text((PROJECT_ROOT / "examples" / "2026-01-16-chatgpt-ads.md").read_text(encoding="utf-8"))
+    os.environ["BENCH_HEDGE_REVIEW"] = str(args.review_minutes * args.scale)
+
+    rng = random.Random(args.seed)
+    tiers = routing.parse_tiers()
+    rows = []
+    try:
+        for day in range(args.days):
+            candidates = hedge.parse_candidates("route escalate", routing.DEFAULT_TIER, tiers)
+            first, second = candidates
+            minutes = rng.lognormvariate(0, 0.4) * args.minutes
+            plan = {
+                first.tier: {"sleep": minutes * args.scale, "pass": rng.random() < args.pass_rate},
+                second.tier: {
+                    "sleep": minutes * args.escalated_slowdown * args.scale,
+                    "pass": rng.random() < args.escalated_pass_rate,
+                },
+            }
+            os.environ["BENCH_HEDGE_PLAN"] = json.dumps(plan)
+            result = hedge.run(
+                original, "true", candidates, work_dir / f"day-{day}",
+                translate_command=[sys.executable, str(fake_translate)],
+                review_command=[sys.executable, str(fake_review)],
+                poll_interval=args.scale / 10,
+            )
+
+            # 기존 순차 재시도: 첫 후보 번역/검토, 실패하면 다음 단계로 재번역/검토 (계획된 시간으로 계산)
+            review_s = args.review_minutes * args.scale
+            sequential = plan[first.tier]["sleep"] + review_s
+            if not plan[first.tier]["pass"]:
+                sequential += plan[second.tier]["sleep"] + review_s
+            chosen = result["candidates"][result["winner"]] if result["winner"] is not None else None
+            rows.append({
+                "day": day,
+                "bad_day": not plan[first.tier]["pass"],
+                "any_pass": plan[first.tier]["pass"] or plan[second.tier]["pass"],
+                "status": result["status"],
+                "winner": chosen["name"] if chosen else None,
+                "cancelled": sum(1 for c in result["candidates"] if c["state"] == hedge.CANCELLED),
+                "hedged_min": result["wall_s"] / args.scale,
+                "sequential_min": sequential / args.scale,
+                "reported_saved_min": result["saved_s"] / args.scale,
+            })
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    def stats(items: list[dict], key: str) -> dict:
+        values = [row[key] for row in items] or [0.0]
+        return {
+            "total": round(sum(values), 1),
+            "p50": round(percentile(values, 50), 1),
+            "p95": round(percentile(values, 95), 1),
+        }
+
+    bad = [row for row in rows if row["bad_day"]]
+    result = {
+        "days": len(rows),
+        "bad_days": len(bad),
+        "status": {s: sum(1 for row in rows if row["status"] == s) for s in ("pass", "fallback", "failed")},
+        "cancelled": sum(row["cancelled"] for row in rows),
+        "sequential": stats(rows, "sequential_min"),
+        "hedged": stats(rows, "hedged_min"),
+        "bad_day_sequential": stats(bad, "sequential_min"),
+        "bad_day_hedged": stats(bad, "hedged_min"),
+        "reported_saved_min": round(sum(row["reported_saved_min"] for row in rows), 1),
+    }
+
+    failures = []
+    wrong = [row["day"] for row in rows if row["any_pass"] and row["status"] != "pass"]
+    if wrong:
+        failures.append(f"a passing candidate existed but was not chosen on day(s) {wrong}")
+    if bad and result["bad_day_hedged"]["p95"] >= result["bad_day_sequential"]["p95"]:
+        failures.append("hedging did not reduce bad-day tail latency")
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(
+            f"{args.days} issues ({len(bad)} bad days), translation median {args.minutes}m, "
+            f"pass rate {args.pass_rate:.0%} / escalated {args.escalated_pass_rate:.0%}\n"
+        )
+        print(f"{'':<22} {'total':>8} {'p50':>7} {'p95':>7}")
+        for label, key in (
+            ("sequential retry", "sequential"), ("hedged", "hedged"),
+            ("bad days sequential", "bad_day_sequential"), ("bad days hedged", "bad_day_hedged"),
+        ):
+            r = result[key]
+            print(f"{label:<22} {r['total']:>7.1f}m {r['p50']:>6.1f}m {r['p95']:>6.1f}m")
+        print(f"\nStatuses: {result['status']}, cancelled candidates: {result['cancelled']}")
+        print(f"Saved as reported by hedge.run (estimate): {result['reported_saved_min']:.1f}m")
+        for failure in failures:
+            print(f"\nUnexpected: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
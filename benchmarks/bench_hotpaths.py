@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+bench_hotpaths.py - 파이프라인 핫패스 벤치마크
+process_markdown, review, assemble_final_markdown, extract_headlines를
+examples/ 코퍼스와 이를 N배로 늘린 합성 코퍼스에서 측정하고,
+저장된 기준값(baselines.json)과 비교해 성능 회귀를 검출합니다.
+
+사용법:
+    python3 benchmarks/bench_hotpaths.py                  # 측정 + 기준값 비교 출력
+    python3 benchmarks/bench_hotpaths.py --check          # 임계값 초과 시 exit 1
+    python3 benchmarks/bench_hotpaths.py --save-baseline  # 현재 측정값을 기준값으로 저장
+    python3 benchmarks/bench_hotpaths.py --check --against main  # 같은 호스트에서 main과 비교
+
+각 케이스는 --repeat번 측정한 중앙값으로 비교하고, 기준값과 측정값이 모두 --min-ms보다
+짧은 케이스는 타이머/스케줄러 잡음이 더 크므로 회귀 판정에서 제외합니다.
+
+기준값은 머신마다 다르므로 다른 호스트에서 저장된 baselines.json은 참고용으로만 출력하고
+--check에서 실패로 처리하지 않습니다. 게이트로 쓰려면 --against <git ref>로 해당 ref의
+src/를 같은 호스트에서 번갈아 측정해 비교하거나, 실행 호스트에서 --save-baseline으로 다시 만드세요.
+"""
+
+import os
+import sys
+import json
+import timeit
+import shutil
+import tarfile
+import platform
+import tempfile
+import statistics
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Callable
+
+# 프로젝트 루트 추가 (--against 측정 시에는 비교 대상 ref의 src/)
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, os.environ.get("BENCH_SRC_DIR") or str(PROJECT_ROOT / "src"))
+
+from crawler.fetch_page import process_markdown  # noqa: E402
+from review.local_review import review  # noqa: E402
+from generate.generate_markdown import assemble_final_markdown, parse_frontmatter  # noqa: E402
+from generate.generate_youtube import extract_headlines  # noqa: E402
+
+EXAMPLES_DIR = PROJECT_ROOT / "examples"
+BASELINE_FILE = Path(__file__).parent / "baselines.json"
+
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_REPEAT = 7
+DEFAULT_THRESHOLD = 0.25  # 기준값 대비 25% 이상 느려지면 회귀
+DEFAULT_MIN_MS = 1.0  # 이보다 짧은 케이스는 잡음이 커서 비교하지 않음
+
+DISCORD_MARKER = "# Discord: High level Discord summaries"
+
+PIPELINE_METADATA = {
+    "originalUrl": "https://news.smol.ai/issues/bench/",
+    "date": "2026-01-01",
+}
+
+
+def load_corpora(scales: list[int]) -> dict[str, str]:
+    """examples/*.md를 읽고 본문을 scale배로 늘린 코퍼스를 만듭니다.
+
+    Returns:
+        {"<파일 stem>@x<scale>": 마크다운 전문} (frontmatter는 한 번만 유지)
+    """
+    corpora = {}
+    for path in sorted(EXAMPLES_DIR.glob("*.md")):
+        text = path.read_text(encoding="utf-8")
+        frontmatter, body = parse_frontmatter(text)
+        fm_block = text[: len(text) - len(body)] if frontmatter else ""
+        for scale in scales:
+            corpora[f"{path.stem}@x{scale}"] = fm_block + "\n\n".join([body.strip()] * scale) + "\n"
+    return corpora
+
+
+def build_cases(corpora: dict[str, str]) -> list[tuple[str, Callable[[], object]]]:
+    """(케이스 이름, 호출 함수) 목록을 만듭니다."""
+    cases = []
+    for name, text in corpora.items():
+        _, body = parse_frontmatter(text)
+        # 원문 이슈처럼 Discord 상세 섹션을 붙여 잘라내기 경로까지 측정
+        raw = f"{text}\n---\n\n{DISCORD_MARKER}\n\n{body}"
+
+        cases.append((f"process_markdown/{name}", lambda raw=raw: process_markdown(raw)))
+        cases.append((f"review/{name}", lambda text=text: review(text, text)))
+        cases.append((
+            f"assemble_final_markdown/{name}",
+            lambda text=text: assemble_final_markdown(text, PIPELINE_METADATA),
+        ))
+        cases.append((f"extract_headlines/{name}", lambda body=body: extract_headlines(body)))
+    return cases
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """호출 1회당 소요 시간(초)의 중앙값을 반환합니다."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return statistics.median(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def load_baseline_file() -> dict:
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+
+
+def load_baselines() -> dict[str, float]:
+    return load_baseline_file().get("results", {})
+
+
+def save_baselines(results: dict[str, float]):
+    data = {
+        "python": sys.version.split()[0],
+        "host": platform.node(),
+        "results": {name: round(seconds, 9) for name, seconds in sorted(results.items())},
+    }
+    BASELINE_FILE.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(
+    results: dict[str, float],
+    baselines: dict[str, float],
+    threshold: float,
+    min_seconds: float = DEFAULT_MIN_MS / 1e3,
+) -> list[dict]:
+    """측정값을 기준값과 비교합니다 (둘 다 min_seconds 미만이면 판정 제외)."""
+    rows = []
+    for name, seconds in results.items():
+        base = baselines.get(name)
+        ratio = seconds / base if base else None
+        skipped = base is not None and max(seconds, base) < min_seconds
+        rows.append({
+            "case": name,
+            "seconds": seconds,
+            "baseline": base,
+            "ratio": ratio,
+            "skipped": skipped,
+            "regressed": ratio is not None and not skipped and ratio > 1 + threshold,
+        })
+    return rows
+
+
+def measure_against(ref: str, scales: list[int], filter_: str, rounds: int) -> tuple[dict, dict]:
+    """ref의 src/와 현재 src/를 같은 호스트에서 번갈아 측정합니다.
+
+    호스트 부하가 시간에 따라 몰려도 양쪽에 같이 걸리도록 라운드마다 번갈아 실행하고,
+    케이스별로 라운드 중앙값을 씁니다.
+
+    Returns:
+        (현재 측정값, ref 측정값)
+    """
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-hotpaths-"))
+    try:
+        archive = subprocess.run(
+            ["git", "-C", str(PROJECT_ROOT), "archive", "--format=tar", ref, "src", "config"],
+            capture_output=True,
+        )
+        if archive.returncode != 0:
+            raise SystemExit(f"git archive {ref} failed: {archive.stderr.decode('utf-8', 'replace').strip()}")
+        archive_file = work_dir / "ref.tar"
+        archive_file.write_bytes(archive.stdout)
+        with tarfile.open(archive_file) as tar:
+            tar.extractall(work_dir, filter="data")
+
+        command = [
+            sys.executable, __file__, "--raw", "--repeat", "1",
+            "--scales", ",".join(str(s) for s in scales), "--filter", filter_,
+        ]
+        env = {key: value for key, value in os.environ.items() if key != "BENCH_SRC_DIR"}
+        samples: dict[str, dict[str, list[float]]] = {"current": {}, "ref": {}}
+        for _ in range(rounds):
+            for side, side_env in (("ref", dict(env, BENCH_SRC_DIR=str(work_dir / "src"))), ("current", env)):
+                result = subprocess.run(command, capture_output=True, text=True, env=side_env, check=True)
+                for name, seconds in json.loads(result.stdout).items():
+                    samples[side].setdefault(name, []).append(seconds)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    current, base = ({name: statistics.median(values) for name, values in samples[side].items()}
+                     for side in ("current", "ref"))
+    return current, base
+
+
+def format_rows(rows: list[dict]) -> str:
+    lines = [f"{'case':<58} {'time':>11} {'baseline':>11} {'ratio':>7}"]
+    for row in rows:
+        base = f"{row['baseline'] * 1e3:>9.3f}ms" if row["baseline"] else f"{'-':>11}"
+        ratio = f"{row['ratio']:>6.2f}x" if row["ratio"] else f"{'-':>7}"
+        mark = "  REGRESSED" if row["regressed"] else "  (below floor)" if row["skipped"] else ""
+        lines.append(f"{row['case']:<58} {row['seconds'] * 1e3:>9.3f}ms {base} {ratio}{mark}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="파이프라인 핫패스 벤치마크 및 회귀 검사"
+    )
+    parser.add_argument(
+        "--scales",
+        default=",".join(str(s) for s in DEFAULT_SCALES),
+        help=f"코퍼스 배율 목록 (default: {','.join(str(s) for s in DEFAULT_SCALES)})"
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="반복 측정 횟수")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"회귀 판정 임계값 (비율, default: {DEFAULT_THRESHOLD})"
+    )
+    parser.add_argument(
+        "--min-ms",
+        type=float,
+        default=DEFAULT_MIN_MS,
+        help=f"이보다 짧은 케이스는 회귀 판정 제외 (ms, default: {DEFAULT_MIN_MS})"
+    )
+    parser.add_argument("--filter", default="", help="케이스 이름에 포함된 문자열로 필터")
+    parser.add_argument("--check", action="store_true", help="회귀가 있으면 exit 1")
+    parser.add_argument(
+        "--against",
+        metavar="REF",
+        help="baselines.json 대신 이 git ref의 src/를 같은 호스트에서 번갈아 측정해 기준값으로 사용"
+    )
+    parser.add_argument("--raw", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--save-baseline", action="store_true", help="측정값을 기준값으로 저장")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+
+    if args.against:
+        results, baselines = measure_against(args.against, scales, args.filter, args.repeat)
+        foreign_host = None
+    else:
+        cases = [(name, func) for name, func in build_cases(load_corpora(scales)) if args.filter in name]
+        results = {name: measure(func, args.repeat) for name, func in cases}
+        if args.raw:
+            print(json.dumps(results))
+            return
+
+        if args.save_baseline:
+            baselines = load_baselines()
+            baselines.update(results)
+            save_baselines(baselines)
+            print(f"Saved {len(results)} baseline(s) to: {BASELINE_FILE}", file=sys.stderr)
+
+        data = load_baseline_file()
+        baselines = data.get("results", {})
+        foreign_host = data.get("host") or "unknown host"
+        if foreign_host == platform.node():
+            foreign_host = None
+
+    rows = compare(results, baselines, args.threshold, args.min_ms / 1e3)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(format_rows(rows))
+
+    regressed = [row["case"] for row in rows if row["regressed"]]
+    if regressed:
+        print(f"\n{len(regressed)} case(s) slower than baseline by >{args.threshold:.0%}", file=sys.stderr)
+        if foreign_host:
+            # 다른 호스트의 절대 시간은 비교 기준이 될 수 없음
+            print(
+                f"Baselines were recorded on {foreign_host}, not on this host; not failing. "
+                "Use --against <ref> or --save-baseline here to gate.",
+                file=sys.stderr,
+            )
+        elif args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+bench_leases.py - 처리 임대(lease) 복구 벤치마크
+여러 워커 프로세스가 같은 상태 파일에서 이슈를 점유해 처리하면서 일부러 죽는 상황을 흉내 내어
+state_manager의 claim/heartbeat/reclaim이 수동 reset 없이 모든 이슈를 끝내는지 측정합니다.
+
+워커는 main.sh처럼 동작합니다:
+- reclaim으로 만료된 임대를 회수한 뒤 끝나지 않은 이슈 하나를 claim
+- --work초 동안 처리하며 --heartbeat초마다 임대 연장
+- --crash 확률로 처리 도중 죽음 (임대를 남긴 채 연장을 멈추고 새 소유자로 다시 시작, OOM/재부팅/kill과 같음)
+- 끝나면 발행 직전 heartbeat로 임대를 확인하고 success 표시
+
+같은 이슈를 두 워커가 동시에 처리한 적이 있는지 처리 구간을 기록해 확인합니다.
+비교 기준(임대 없음)은 in_progress로 남은 이슈를 아무도 되찾지 못해 죽은 만큼 처리되지 않은 채 남는 경우입니다.
+
+사용법:
+    python3 benchmarks/bench_leases.py
+    python3 benchmarks/bench_leases.py --issues 40 --workers 6 --crash 0.3
+"""
+
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+
+def worker(index: int, args, deadline: float, spans_file: str):
+    from state import state_manager as sm
+
+    rng = random.Random(args.seed * 1000 + index)
+    generation = 0
+    while time.time() < deadline:
+        generation += 1
+        owner = f"worker{index}:{generation}"
+        sm.reclaim_expired(args.max_attempts)
+        state = sm.load_state()
+        done = {
+            item["slug"] for item in state["processed"]
+            if item["status"] in ("success", "failed", "in_progress")
+        }
+        todo = [f"issue-{i:03d}" for i in range(args.issues) if f"issue-{i:03d}" not in done]
+        if not todo:
+            if not any(item["status"] == "in_progress" for item in state["processed"]):
+                return
+            time.sleep(args.heartbeat)
+            continue
+
+        slug = rng.choice(todo)
+        claimed, _ = sm.claim(slug, owner, ttl=args.ttl)
+        if not claimed:
+            continue
+
+        start = time.time()
+        crash_at = start + rng.uniform(0, args.work) if rng.random() < args.crash else None
+        lost = False
+        while time.time() - start < args.work:
+            time.sleep(args.heartbeat)
+            if crash_at and time.time() >= crash_at:
+                # 죽은 워커 대신 새 워커가 뜬 것처럼 다음 세대로 (임대는 그대로 남음)
+                break
+            if not sm.heartbeat(slug, owner, ttl=args.ttl):
+                lost = True
+                break
+        end = time.time()
+        crashed = bool(crash_at) and end - start < args.work
+        with open(spans_file, "a") as f:
+            f.write(json.dumps({"slug": slug, "owner": owner, "start": start, "end": end, "crashed": crashed}) + "\n")
+        if crashed:
+            continue
+        if not lost and sm.heartbeat(slug, owner, ttl=args.ttl):
+            sm.update_status(slug, sm.ProcessStatus.SUCCESS)
+
+
+def overlaps(spans: list[dict]) -> int:
+    """같은 이슈를 서로 다른 워커가 동시에 처리한 구간 수"""
+    count = 0
+    by_slug: dict[str, list[dict]] = {}
+    for span in spans:
+        by_slug.setdefault(span["slug"], []).append(span)
+    for items in by_slug.values():
+        items.sort(key=lambda s: s["start"])
+        for prev, cur in zip(items, items[1:]):
+            if cur["start"] < prev["end"]:
+                count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="처리 임대 복구 벤치마크")
+    parser.add_argument("--issues", type=int, default=30, help="처리할 이슈 수")
+    parser.add_argument("--workers", type=int, default=4, help="동시 워커 수 (겹친 cron 실행)")
+    parser.add_argument("--work", type=float, default=0.6, help="이슈당 처리 시간 (초)")
+    parser.add_argument("--heartbeat", type=float, default=0.1, help="임대 연장 간격 (초)")
+    parser.add_argument("--ttl", type=float, default=1.0, help="임대 유지 시간 (초)")
+    parser.add_argument("--crash", type=float, default=0.25, help="처리 도중 죽을 확률")
+    parser.add_argument("--max-attempts", type=int, default=5, help="최대 점유 횟수")
+    parser.add_argument("--limit", type=float, default=120.0, help="최대 실행 시간 (초)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-leases-"))
+    spans_file = str(work_dir / "spans.jsonl")
+    from state import state_manager as sm
+    sm.DATA_DIR = work_dir
+    sm.STATE_FILE = work_dir / "processed.json"
+    sm.LOCK_FILE = work_dir / "processed.lock"
+
+    # fork로 띄워 위에서 바꾼 경로를 워커가 물려받게 함
+    ctx = multiprocessing.get_context("fork")
+    start = time.time()
+    deadline = start + args.limit
+    procs = [ctx.Process(target=worker, args=(i, args, deadline, spans_file)) for i in range(args.workers)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    elapsed = time.time() - start
+
+    state = sm.load_state()
+    statuses: dict[str, int] = {}
+    for item in state["processed"]:
+        statuses[item["status"]] = statuses.get(item["status"], 0) + 1
+    spans = [json.loads(line) for line in Path(spans_file).read_text().splitlines()] if Path(spans_file).exists() else []
+    shutil.rmtree(work_dir, ignore_errors=True)
+    crashes = sum(1 for s in spans if s["crashed"])
+    # 임대가 없으면 처음 죽은 이슈는 in_progress로 남아 수동 reset 전까지 처리되지 않음
+    stranded_without_leases = len({s["slug"] for s in spans if s["crashed"]})
+
+    result = {
+        "elapsed_s": round(elapsed, 2),
+        "statuses": statuses,
+        "attempts": len(spans),
+        "crashes": crashes,
+        "overlaps": overlaps(spans),
+        "ideal_s": round(args.issues * args.work / args.workers, 2),
+        "stranded_without_leases": stranded_without_leases,
+    }
+
+    failures = []
+    finished = statuses.get("success", 0) + statuses.get("failed", 0)
+    if finished != args.issues:
+        failures.append(f"{args.issues - finished} issues never finished")
+    if result["overlaps"]:
+        failures.append(f"{result['overlaps']} issues were processed by two workers at once")
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(
+            f"{args.issues} issues, {args.workers} workers, {args.work}s per issue, "
+            f"crash rate {args.crash:.0%}, lease TTL {args.ttl}s, heartbeat {args.heartbeat}s\n"
+        )
+        print(f"Finished in {result['elapsed_s']}s (no-crash ideal {result['ideal_s']}s)")
+        print(f"Statuses: {statuses}")
+        print(f"Attempts: {result['attempts']} ({crashes} crashed mid-issue, all reclaimed automatically)")
+        print(f"Concurrent double processing: {result['overlaps']}")
+        print(f"Without leases: {stranded_without_leases} issues would stay in_progress until a manual reset")
+        for failure in failures:
+            print(f"\nUnexpected: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+bench_linkcheck.py - 외부 링크 생존 확인 벤치마크
+로컬 HTTP 서버에 수천 개의 링크를 만들어 check_links의 동시 확인, 호스트별 제한, 결과 캐시를 측정합니다.
+
+서버는 모든 인터페이스에서 한 포트로 열고 127.0.0.1~127.0.0.N을 서로 다른 호스트로 씁니다.
+요청마다 --latency만큼 지연하고, 경로에 따라 응답합니다:
+- /ok/N: 200
+- /gone/N: 404 (broken)
+- /moved/N: 다음 호스트의 /ok/N으로 301 (redirected, 경고 대상)
+- /slash/N: 끝에 /를 붙인 같은 경로로 301 (ok)
+- /nohead/N: HEAD는 405, GET은 200 (ok)
+- /limited/N: 429 (blocked)
+
+시나리오:
+- sequential: 동시 요청 1개, 캐시 없음
+- concurrent: 기본 동시 요청 수와 호스트별 제한, 캐시 없음
+- cold / warm: 빈 캐시로 확인한 뒤 같은 링크를 다시 확인 (warm은 요청 0개여야 함)
+
+사용법:
+    python3 benchmarks/bench_linkcheck.py
+    python3 benchmarks/bench_linkcheck.py --links 5000 --hosts 16 --latency 0.02
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import threading
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+# 경로 종류별 비율과 기대 결과
+KINDS = [
+    ("ok", 0.70, "ok"),
+    ("gone", 0.10, "broken"),
+    ("moved", 0.05, "redirected"),
+    ("slash", 0.05, "ok"),
+    ("nohead", 0.05, "ok"),
+    ("limited", 0.05, "blocked"),
+]
+
+
+class Recorder:
+    """호스트별 요청 수, 최대 동시 요청 수, 요청 시작 간격 기록"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.active = defaultdict(int)
+            self.max_active = defaultdict(int)
+            self.starts = defaultdict(list)
+
+    def enter(self, host: str, followup: bool):
+        """리디렉션을 따라온 요청은 원래 링크의 호스트 제한 안에서 나가므로 제한 측정에서 제외"""
+        with self.lock:
+            self.requests += 1
+            if followup:
+                return
+            self.active[host] += 1
+            self.max_active[host] = max(self.max_active[host], self.active[host])
+            self.starts[host].append(time.monotonic())
+
+    def leave(self, host: str, followup: bool):
+        with self.lock:
+            if not followup:
+                self.active[host] -= 1
+
+    def min_gap(self) -> float:
+        """호스트별 평균 요청 시작 간격 중 최솟값 (서버 도착 시각은 흔들리므로 평균으로 비교)"""
+        gaps = [
+            (max(starts) - min(starts)) / (len(starts) - 1)
+            for starts in self.starts.values()
+            if len(starts) > 1
+        ]
+        return min(gaps) if gaps else 0.0
+
+
+def make_server(recorder: Recorder, latency: float, hosts: int) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.0"
+
+        def log_message(self, *args):
+            pass
+
+        def _respond(self, head: bool):
+            host = self.headers.get("Host", "")
+            followup = self.path.endswith("/") or "?from=" in self.path
+            recorder.enter(host, followup)
+            try:
+                time.sleep(latency)
+                kind = self.path.strip("/").split("/")[0]
+                if kind == "gone":
+                    self.send_response(404)
+                elif kind == "limited":
+                    self.send_response(429)
+                elif kind == "nohead" and head:
+                    self.send_response(405)
+                elif kind == "moved":
+                    name, port = host.rsplit(":", 1)
+                    last = int(name.rsplit(".", 1)[1]) % hosts + 1
+                    self.send_response(301)
+                    self.send_header("Location", f"http://127.0.0.{last}:{port}/ok/{self.path.rsplit('/', 1)[1]}?from=moved")
+                elif kind == "slash" and not self.path.endswith("/"):
+                    self.send_response(301)
+                    self.send_header("Location", self.path + "/")
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            finally:
+                recorder.leave(host, followup)
+
+        def do_HEAD(self):
+            self._respond(head=True)
+
+        def do_GET(self):
+            self._respond(head=False)
+
+    server = ThreadingHTTPServer(("", 0), Handler)
+    server.daemon_threads = True
+    server.request_queue_size = 256
+    return server
+
+
+def make_links(count: int, hosts: int, port: int, seed: int) -> tuple[list[str], dict[str, int]]:
+    rng = random.Random(seed)
+    names = [name for name, _, _ in KINDS]
+    weights = [weight for _, weight, _ in KINDS]
+    outcome = {name: expected for name, _, expected in KINDS}
+    links, expected = [], defaultdict(int)
+    for i in range(count):
+        kind = rng.choices(names, weights)[0]
+        links.append(f"http://127.0.0.{rng.randint(1, hosts)}:{port}/{kind}/{i}")
+        expected[outcome[kind]] += 1
+    return links, dict(expected)
+
+
+def run(check_links, recorder: Recorder, links: list[str], **kwargs) -> dict:
+    recorder.reset()
+    report = check_links.check_links(links, **kwargs)
+    stats = report["stats"]
+    return {
+        "elapsed_s": round(stats["elapsed_ms"] / 1000, 2),
+        "requests": recorder.requests,
+        "max_per_host": max(recorder.max_active.values(), default=0),
+        "min_gap_ms": round(recorder.min_gap() * 1000, 1),
+        "cached": stats["cached"],
+        "counts": {status: stats[status] for status in ("ok", "redirected", "broken", "blocked")},
+        "warnings": len(check_links.format_warnings(report)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="외부 링크 생존 확인 벤치마크")
+    parser.add_argument("--links", type=int, default=3000, help="고유 링크 수")
+    parser.add_argument("--hosts", type=int, default=16, help="호스트 수 (127.0.0.1~N)")
+    parser.add_argument("--latency", type=float, default=0.01, help="서버 응답 지연 (초)")
+    parser.add_argument("--max-parallel", type=int, default=32, help="전체 동시 요청 수")
+    parser.add_argument("--per-host", type=int, default=4, help="호스트별 동시 요청 수")
+    parser.add_argument("--host-interval", type=float, default=0.002, help="같은 호스트 요청 시작 간격 (초)")
+    parser.add_argument("--skip-sequential", action="store_true", help="순차 확인 시나리오 생략")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-linkcheck-"))
+    # 모듈 import 전에 설정해야 적용됨
+    os.environ.update(
+        LINKCHECK_DIR=str(work_dir / "linkcheck"),
+        RATELIMIT_DIR=str(work_dir / "ratelimit"),
+        METRICS_DIR=str(work_dir / "metrics"),
+        HTTP_CASSETTE_MODE="off",
+        no_proxy="*",
+    )
+    from crawler import check_links
+
+    recorder = Recorder()
+    server = make_server(recorder, args.latency, args.hosts)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    links, expected = make_links(args.links, args.hosts, server.server_address[1], args.seed)
+
+    concurrent = dict(max_parallel=args.max_parallel, per_host=args.per_host, host_interval=args.host_interval)
+    results = {}
+    try:
+        if not args.skip_sequential:
+            results["sequential"] = run(
+                check_links, recorder, links, max_parallel=1, per_host=1, host_interval=0, use_cache=False
+            )
+        results["concurrent"] = run(check_links, recorder, links, use_cache=False, **concurrent)
+        results["cold"] = run(check_links, recorder, links, **concurrent)
+        results["warm"] = run(check_links, recorder, links, **concurrent)
+    finally:
+        server.shutdown()
+
+    failures = []
+    for name, r in results.items():
+        counts = {status: r["counts"][status] for status in expected}
+        if counts != expected or r["warnings"] != 2:
+            failures.append(f"{name}: counts {r['counts']} != {expected}")
+        if name != "sequential" and r["max_per_host"] > args.per_host:
+            failures.append(f"{name}: {r['max_per_host']} concurrent requests to one host")
+        if name != "sequential" and r["requests"] and r["min_gap_ms"] < args.host_interval * 1000:
+            failures.append(f"{name}: request starts {r['min_gap_ms']}ms apart")
+    if results["warm"]["requests"] or results["warm"]["cached"] != args.links:
+        failures.append(f"warm: {results['warm']['requests']} requests sent with a warm cache")
+
+    if args.json:
+        print(json.dumps({"expected": expected, "results": results}, indent=2))
+    else:
+        print(
+            f"{args.links} links on {args.hosts} hosts, latency {args.latency * 1000:.0f}ms, "
+            f"parallel {args.max_parallel} / per host {args.per_host}, interval {args.host_interval * 1000:.0f}ms"
+        )
+        print(f"Expected: {expected}\n")
+        base = results.get("sequential", results["concurrent"])["elapsed_s"]
+        print(f"{'scenario':<11} {'elapsed':>8} {'speedup':>8} {'requests':>9} {'host max':>9} {'mean gap':>9} {'cached':>7}")
+        for name, r in results.items():
+            speedup = f"{base / r['elapsed_s']:.1f}x" if r["elapsed_s"] else "-"
+            print(
+                f"{name:<11} {r['elapsed_s']:>7.2f}s {speedup:>8} {r['requests']:>9} "
+                f"{r['max_per_host']:>9} {r['min_gap_ms']:>7.1f}ms {r['cached']:>7}"
+            )
+        for failure in failures:
+            print(f"\nUnexpected: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
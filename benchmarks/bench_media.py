@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+bench_media.py - 이미지/미디어 미러링 벤치마크
+로컬 HTTP 서버의 이미지로 여러 날의 이슈를 흉내 내어 mirror_media의 동시 다운로드와 내용 해시 중복 제거를 측정합니다.
+
+서버는 127.0.0.1~127.0.0.N을 서로 다른 호스트로 쓰고, 응답마다 --latency 지연 후 --bandwidth 속도로 본문을 보냅니다.
+이슈마다 --images개를 참조하며:
+- --repeat 비율은 이전 이슈에 나왔던 URL (로고, 반복 차트 등 → URL 색인으로 다운로드 생략)
+- --mirror-rate 비율은 다른 호스트/URL에 있는 같은 이미지 (CDN 사본 → 내려받지만 저장은 한 번)
+- 나머지는 새 이미지, 일부는 크기 제한 초과(--oversize)와 404
+
+시나리오:
+- sequential: 첫 이슈를 동시 다운로드 1개로 미러링
+- concurrent: 같은 이슈를 빈 저장소에서 기본 동시 다운로드 수로 미러링
+- days: --issues개 이슈를 차례로 미러링해 참조/다운로드/저장 바이트와 중복 제거로 아낀 바이트 집계
+
+사용법:
+    python3 benchmarks/bench_media.py
+    python3 benchmarks/bench_media.py --issues 10 --images 80 --latency 0.05
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+def make_server(blobs: dict[str, bytes], latency: float, bandwidth: float) -> ThreadingHTTPServer:
+    counter = {"requests": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.0"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with lock:
+                counter["requests"] += 1
+            time.sleep(latency)
+            body = blobs.get(self.path.split("/", 2)[-1])
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            chunk = 16 * 1024
+            try:
+                for i in range(0, len(body), chunk):
+                    self.wfile.write(body[i:i + chunk])
+                    if bandwidth:
+                        time.sleep(chunk / bandwidth)
+            except (BrokenPipeError, ConnectionResetError):
+                # 크기 제한을 넘으면 클라이언트가 읽기를 멈추고 연결을 닫음
+                pass
+
+    server = ThreadingHTTPServer(("", 0), Handler)
+    server.daemon_threads = True
+    server.request_queue_size = 256
+    server.counter = counter
+    return server
+
+
+def make_issues(args, port: int, blobs: dict[str, bytes]) -> list[str]:
+    """이슈별 마크다운 (서버가 제공할 이미지는 blobs에 이름 → 내용으로 추가)"""
+    rng = random.Random(args.seed)
+    seen_urls: list[str] = []
+    issues = []
+
+    def new_image(name: str, size: int) -> bytes:
+        blobs[name] = PNG_HEADER + rng.randbytes(size)
+        return blobs[name]
+
+    def url(host: int, name: str) -> str:
+        return f"http://127.0.0.{host}:{port}/img/{name}"
+
+    for day in range(args.issues):
+        lines = [f"# Issue {day}", ""]
+        for i in range(args.images):
+            roll = rng.random()
+            host = rng.randint(1, args.hosts)
+            if seen_urls and roll < args.repeat:
+                link = rng.choice(seen_urls)
+            elif roll < args.repeat + args.mirror_rate and blobs:
+                # 같은 내용을 다른 이름으로 제공하는 CDN 사본
+                source = rng.choice(list(blobs))
+                name = f"d{day}-{i}-copy.png"
+                blobs[name] = blobs[source]
+                link = url(host, name)
+            elif roll < args.repeat + args.mirror_rate + args.oversize:
+                name = f"d{day}-{i}-huge.png"
+                new_image(name, args.max_bytes + 1024)
+                link = url(host, name)
+            elif roll < args.repeat + args.mirror_rate + args.oversize + 0.02:
+                link = url(host, f"d{day}-{i}-missing.png")
+            else:
+                name = f"d{day}-{i}.png"
+                new_image(name, rng.randint(args.min_size, args.max_size))
+                link = url(host, name)
+            seen_urls.append(link)
+            lines.append(f"- item {i} ![chart]({link})")
+        issues.append("\n".join(lines) + "\n")
+    return issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지/미디어 미러링 벤치마크")
+    parser.add_argument("--issues", type=int, default=7, help="이슈 수 (날짜 수)")
+    parser.add_argument("--images", type=int, default=60, help="이슈당 미디어 링크 수")
+    parser.add_argument("--hosts", type=int, default=8, help="호스트 수 (127.0.0.1~N)")
+    parser.add_argument("--repeat", type=float, default=0.3, help="이전 이슈 URL 재사용 비율")
+    parser.add_argument("--mirror-rate", type=float, default=0.1, help="다른 URL의 같은 이미지 비율")
+    parser.add_argument("--oversize", type=float, default=0.02, help="크기 제한 초과 비율")
+    parser.add_argument("--min-size", type=int, default=20_000, help="이미지 최소 바이트")
+    parser.add_argument("--max-size", type=int, default=400_000, help="이미지 최대 바이트")
+    parser.add_argument("--max-bytes", type=int, default=1_000_000, help="파일당 크기 제한")
+    parser.add_argument("--latency", type=float, default=0.03, help="서버 응답 지연 (초)")
+    parser.add_argument("--bandwidth", type=float, default=4_000_000, help="연결당 전송 속도 (바이트/초, 0 = 무제한)")
+    parser.add_argument("--max-parallel", type=int, default=8, help="동시 다운로드 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-media-"))
+    # 모듈 import 전에 설정해야 적용됨
+    os.environ.update(
+        MEDIA_DIR=str(work_dir / "media"),
+        MEDIA_MAX_BYTES=str(args.max_bytes),
+        MEDIA_MAX_TOTAL_BYTES=str(10 ** 12),
+        RESILIENCE_DIR=str(work_dir / "resilience"),
+        RATELIMIT_DIR=str(work_dir / "ratelimit"),
+        METRICS_DIR=str(work_dir / "metrics"),
+        ALERTS_DIR=str(work_dir / "alerts"),
+        HTTP_CASSETTE_MODE="off",
+        MAX_RETRIES="0",
+        no_proxy="*",
+    )
+    from crawler import mirror_media
+
+    # 서버가 참조하는 blobs는 포트가 정해진 뒤 이슈를 만들며 채움
+    blobs: dict[str, bytes] = {}
+    server = make_server(blobs, args.latency, args.bandwidth)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        issues = make_issues(args, server.server_address[1], blobs)
+
+        first = mirror_media.extract_media(issues[0])
+        results = {}
+        for name, parallel in (("sequential", 1), ("concurrent", args.max_parallel)):
+            shutil.rmtree(work_dir / "media", ignore_errors=True)
+            report = mirror_media.fetch_media(first, max_parallel=parallel)
+            results[name] = {"elapsed_s": round(report["stats"]["elapsed_ms"] / 1000, 2), **report["stats"]}
+
+        shutil.rmtree(work_dir / "media", ignore_errors=True)
+        days = []
+        for markdown in issues:
+            before = server.counter["requests"]
+            report = mirror_media.fetch_media(mirror_media.extract_media(markdown), max_parallel=args.max_parallel)
+            days.append({**report["stats"], "requests": server.counter["requests"] - before})
+    finally:
+        server.shutdown()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    totals = {key: sum(day[key] for day in days) for key in (
+        "found", "mirrored", "cached", "failed", "referenced_bytes", "downloaded_bytes", "stored_bytes",
+        "dedup_saved_bytes", "requests")}
+
+    failures = []
+    if results["sequential"]["mirrored"] != results["concurrent"]["mirrored"]:
+        failures.append("sequential and concurrent runs mirrored different media")
+    if totals["stored_bytes"] + totals["dedup_saved_bytes"] != totals["referenced_bytes"]:
+        failures.append("stored + saved bytes do not add up to referenced bytes")
+    if days[-1]["cached"] == 0 and args.repeat > 0:
+        failures.append("repeated URLs were downloaded again")
+
+    if args.json:
+        print(json.dumps({"first_issue": results, "days": days, "totals": totals}, indent=2))
+    else:
+        seq, conc = results["sequential"], results["concurrent"]
+        print(
+            f"{args.issues} issues x {args.images} media links on {args.hosts} hosts, "
+            f"latency {args.latency * 1000:.0f}ms, {args.bandwidth / 1e6:.0f} MB/s per connection\n"
+        )
+        print(f"First issue ({seq['found']} links, {seq['downloaded_bytes'] / 1e6:.1f} MB):")
+        print(f"  sequential  {seq['elapsed_s']:>6.2f}s")
+        print(
+            f"  concurrent  {conc['elapsed_s']:>6.2f}s  ({seq['elapsed_s'] / conc['elapsed_s']:.1f}x, "
+            f"{args.max_parallel} parallel)\n"
+        )
+        print(f"{'day':>3} {'found':>6} {'new':>5} {'cached':>7} {'failed':>7} {'requests':>9} "
+              f"{'referenced':>11} {'stored':>9} {'saved':>9} {'time':>7}")
+        for i, day in enumerate(days):
+            print(
+                f"{i:>3} {day['found']:>6} {day['mirrored']:>5} {day['cached']:>7} {day['failed']:>7} "
+                f"{day['requests']:>9} {day['referenced_bytes'] / 1e6:>9.1f}MB {day['stored_bytes'] / 1e6:>7.1f}MB "
+                f"{day['dedup_saved_bytes'] / 1e6:>7.1f}MB {day['elapsed_ms'] / 1000:>6.2f}s"
+            )
+        saved_ratio = totals["dedup_saved_bytes"] / totals["referenced_bytes"] if totals["referenced_bytes"] else 0
+        print(
+            f"\nTotal: {totals['referenced_bytes'] / 1e6:.1f} MB referenced, "
+            f"{totals['downloaded_bytes'] / 1e6:.1f} MB downloaded, {totals['stored_bytes'] / 1e6:.1f} MB stored "
+            f"({totals['dedup_saved_bytes'] / 1e6:.1f} MB, {saved_ratio:.0%} saved by dedup)"
+        )
+        for failure in failures:
+            print(f"\nUnexpected: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+bench_ratelimit.py - GitHub 속도 제한 예산 공유 벤치마크
+로컬 HTTP 서버가 GitHub처럼 X-RateLimit-* 헤더를 보내고 윈도우당 --limit회를 넘으면 403을 반환합니다.
+백필 프로세스 여러 개(low 우선순위)가 이슈를 연달아 가져오는 동안 새 이슈 확인 프로세스(high)가
+--check-interval마다 목록을 조회합니다.
+
+governor를 끈 경우(GITHUB_RATE_HOSTS 비움)와 켠 경우를 비교합니다:
+- 403 응답 수
+- 새 이슈 확인 성공/실패 수와 지연 시간 (p50/max)
+- 백필 완료 수와 소요 시간
+
+사용법:
+    python3 benchmarks/bench_ratelimit.py
+    python3 benchmarks/bench_ratelimit.py --limit 60 --window 10 --backfill-procs 4 --issues 20
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+
+class GitHubLikeServer(ThreadingHTTPServer):
+    """정수 초 경계에 맞춘 고정 윈도우 속도 제한 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, limit: int, window: int):
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.limit = limit
+        self.window = window
+        self.lock = threading.Lock()
+        self.window_start = 0
+        self.used = 0
+        self.rejected = 0
+        self.served = 0
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server: GitHubLikeServer = self.server
+        with server.lock:
+            now = time.time()
+            start = int(now // server.window) * server.window
+            if start != server.window_start:
+                server.window_start, server.used = start, 0
+            allowed = server.used < server.limit
+            if allowed:
+                server.used += 1
+                server.served += 1
+            else:
+                server.rejected += 1
+            remaining = server.limit - server.used
+            reset = start + server.window
+
+        body = b'{"message": "API rate limit exceeded"}' if not allowed else (
+            b'[{"name": "26-01-16-issue.md"}]' if self.path.endswith(".json") else b"# issue\n" + b"x" * 2048
+        )
+        self.send_response(200 if allowed else 403)
+        self.send_header("X-RateLimit-Limit", str(server.limit))
+        self.send_header("X-RateLimit-Remaining", str(remaining))
+        self.send_header("X-RateLimit-Reset", str(reset))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+# ============================================
+# 작업 프로세스 (governor 설정은 환경 변수로 받음)
+# ============================================
+
+def worker(role: str, base: str, count: int, interval: float, stop_file: Path) -> dict:
+    from urllib.error import URLError
+    from urllib.request import Request
+    from lib.resilience import read_url
+
+    latencies, failures = [], 0
+    start = time.perf_counter()
+    i = 0
+    while True:
+        if role == "check":
+            if stop_file.exists():
+                break
+            url, priority = f"{base}/listing.json", "high"
+        else:
+            if i >= count:
+                break
+            url, priority = f"{base}/issue-{os.getpid()}-{i}.md", "low"
+        i += 1
+
+        request_start = time.perf_counter()
+        try:
+            read_url(Request(url), timeout=30, priority=priority)
+            latencies.append((time.perf_counter() - request_start) * 1000)
+        except URLError:
+            failures += 1
+        if role == "check":
+            time.sleep(interval)
+    return {
+        "role": role,
+        "ok": len(latencies),
+        "failed": failures,
+        "latencies_ms": latencies,
+        "elapsed_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+def run_scenario(governed: bool, args, base: str) -> dict:
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-ratelimit-"))
+    env = dict(
+        os.environ,
+        RATELIMIT_DIR=str(work_dir / "ratelimit"),
+        RESILIENCE_DIR=str(work_dir / "resilience"),
+        METRICS_DIR=str(work_dir / "metrics"),
+        ALERTS_DIR=str(work_dir / "alerts"),
+        GITHUB_RATE_HOSTS="127.0.0.1" if governed else "",
+        GITHUB_RATE_MAX_WAIT="120",
+        MAX_RETRIES="0",
+        HTTP_CASSETTE_MODE="off",
+    )
+    stop_file = work_dir / "stop"
+
+    def spawn(role: str) -> subprocess.Popen:
+        return subprocess.Popen(
+            [sys.executable, __file__, "--worker", role, "--base", base, "--issues", str(args.issues),
+             "--check-interval", str(args.check_interval), "--stop-file", str(stop_file)],
+            env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+
+    checker = spawn("check")
+    backfills = [spawn("backfill") for _ in range(args.backfill_procs)]
+    results = [json.loads(p.communicate()[0]) for p in backfills]
+    stop_file.touch()
+    results.append(json.loads(checker.communicate()[0]))
+    return {
+        "check": next(r for r in results if r["role"] == "check"),
+        "backfill": [r for r in results if r["role"] == "backfill"],
+    }
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GitHub 속도 제한 예산 공유 벤치마크")
+    parser.add_argument("--limit", type=int, default=30, help="윈도우당 허용 요청 수")
+    parser.add_argument("--window", type=int, default=5, help="속도 제한 윈도우 (초)")
+    parser.add_argument("--backfill-procs", type=int, default=3, help="백필 프로세스 수")
+    parser.add_argument("--issues", type=int, default=15, help="백필 프로세스당 가져올 이슈 수")
+    parser.add_argument("--check-interval", type=float, default=0.5, help="새 이슈 확인 간격 (초)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    # 내부용 (작업 프로세스)
+    parser.add_argument("--worker", choices=["check", "backfill"], help=argparse.SUPPRESS)
+    parser.add_argument("--base", help=argparse.SUPPRESS)
+    parser.add_argument("--stop-file", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.base, args.issues, args.check_interval, args.stop_file)))
+        return
+
+    summary = {}
+    for name, governed in (("ungoverned", False), ("governed", True)):
+        server = GitHubLikeServer(args.limit, args.window)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            result = run_scenario(governed, args, f"http://127.0.0.1:{server.server_address[1]}")
+        finally:
+            server.shutdown()
+            server.server_close()
+        check = result["check"]
+        summary[name] = {
+            "rejected_403": server.rejected,
+            "served": server.served,
+            "check_ok": check["ok"],
+            "check_failed": check["failed"],
+            "check_p50_ms": round(_percentile(check["latencies_ms"], 50), 1),
+            "check_max_ms": round(max(check["latencies_ms"], default=0.0), 1),
+            "backfill_ok": sum(r["ok"] for r in result["backfill"]),
+            "backfill_failed": sum(r["failed"] for r in result["backfill"]),
+            "backfill_elapsed_ms": round(max(r["elapsed_ms"] for r in result["backfill"]), 1),
+        }
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    print(
+        f"Server: {args.limit} requests / {args.window}s, {args.backfill_procs} backfill x {args.issues} issues, "
+        f"check every {args.check_interval}s\n"
+    )
+    print(f"{'mode':<11} {'403s':>5} {'check ok':>9} {'failed':>7} {'p50':>8} {'max':>8} {'backfill':>9} {'failed':>7} {'elapsed':>9}")
+    for name, s in summary.items():
+        print(
+            f"{name:<11} {s['rejected_403']:>5} {s['check_ok']:>9} {s['check_failed']:>7} "
+            f"{s['check_p50_ms']:>6.0f}ms {s['check_max_ms']:>6.0f}ms {s['backfill_ok']:>9} "
+            f"{s['backfill_failed']:>7} {s['backfill_elapsed_ms'] / 1000:>8.1f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+bench_replay.py - HTTP 기록/재생 벤치마크
+로컬 HTTP 서버(대역폭 제한)에서 GitHub 목록 API와 이슈 원문을 흉내 내고,
+check_feed/fetch_page 수집 경로를 cassette에 기록한 뒤 서버를 내리고 재생합니다.
+
+- live: 서버에서 직접 가져오기
+- replay: 지연 없이 재생 (HTTP_CASSETTE_LATENCY=0)
+- shaped: 기록된 지연 시간 그대로 재생 (HTTP_CASSETTE_LATENCY=1)
+
+세 경로의 처리 결과(목록, process_markdown 결과)가 같은지 확인하고 소요 시간을 비교합니다.
+
+사용법:
+    python3 benchmarks/bench_replay.py
+    python3 benchmarks/bench_replay.py --size 4 --bandwidth 10   # MB, MB/s 제한
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT / "benchmarks"))
+
+# 모듈 import 전에 설정해야 적용됨 (브레이커 상태는 임시 디렉토리에)
+WORK_DIR = Path(tempfile.mkdtemp(prefix="bench-replay-"))
+os.environ["RESILIENCE_DIR"] = str(WORK_DIR)
+
+from bench_fetch import build_issue, start_server  # noqa: E402
+from crawler.fetch_page import fetch_raw_markdown, stream_raw_markdown, process_markdown  # noqa: E402
+from rss.check_feed import fetch_github_listing, parse_github_listing  # noqa: E402
+from lib.cassette import load  # noqa: E402
+
+
+def ingest(base: str) -> dict:
+    """check-feed + fetch 수집 경로 한 번 (목록 → 스트리밍 페치 → 원문 보관용 전체 페치)"""
+    start = time.perf_counter()
+    items = parse_github_listing(fetch_github_listing(f"{base}/listing.json"))
+    streamed, _ = stream_raw_markdown(f"{base}/26-01-16-chatgpt-ads.md")
+    full = fetch_raw_markdown(f"{base}/26-01-16-chatgpt-ads.md")
+    return {
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        "slugs": [item["slug"] for item in items],
+        "content": process_markdown(streamed)[0],
+        "full_bytes": len(full.encode("utf-8")),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 기록/재생 벤치마크")
+    parser.add_argument("--size", type=float, default=2, help="Discord 상세 섹션 크기 (MB)")
+    parser.add_argument("--bandwidth", type=float, default=20, help="서버 전송 속도 제한 (MB/s)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    listing = [{"name": "26-01-16-chatgpt-ads.md"}, {"name": "26-01-17-not-much.md"}, {"name": "README.md"}]
+    documents = {
+        "listing.json": json.dumps(listing).encode("utf-8"),
+        "26-01-16-chatgpt-ads.md": build_issue(args.size),
+    }
+
+    cassette = WORK_DIR / "ingest.json.gz"
+    os.environ["HTTP_CASSETTE"] = str(cassette)
+
+    server = start_server(documents, args.bandwidth)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        os.environ["HTTP_CASSETTE_MODE"] = "off"
+        live = ingest(base)
+        os.environ["HTTP_CASSETTE_MODE"] = "record"
+        recorded = ingest(base)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # 서버가 내려간 상태에서 재생
+    os.environ["HTTP_CASSETTE_MODE"] = "replay"
+    os.environ["HTTP_CASSETTE_LATENCY"] = "0"
+    replay = ingest(base)
+    os.environ["HTTP_CASSETTE_LATENCY"] = "1"
+    shaped = ingest(base)
+
+    runs = {"live": live, "record": recorded, "replay": replay, "shaped": shaped}
+    mismatched = [
+        name for name, run in runs.items()
+        if (run["slugs"], run["content"], run["full_bytes"]) != (live["slugs"], live["content"], live["full_bytes"])
+    ]
+    entries = load(cassette)["entries"]
+    summary = {
+        "cassette_bytes": cassette.stat().st_size,
+        "recorded_body_bytes": sum(len(e.get("body", "")) for e in entries),
+        "requests": len(entries),
+        "elapsed_ms": {name: run["elapsed_ms"] for name, run in runs.items()},
+        "identical": not mismatched,
+    }
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"{'mode':<8} {'elapsed':>10}")
+        for name, ms in summary["elapsed_ms"].items():
+            print(f"{name:<8} {ms:>8.1f}ms")
+        print(
+            f"\nCassette: {summary['requests']} request(s), "
+            f"{summary['cassette_bytes'] / 1024:.0f}KiB compressed "
+            f"({summary['recorded_body_bytes'] / 1024:.0f}KiB of bodies)"
+        )
+        print("Results identical across modes." if not mismatched else f"MISMATCH: {', '.join(mismatched)}")
+
+    if mismatched:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+bench_resilience.py - 재시도/서킷 브레이커 장애 주입 벤치마크
+로컬 HTTP 서버가 요청마다 정해진 장애(503 + Retry-After, 429, 본문 도중 연결 끊김, 404)를 주입하고,
+fetch_raw_markdown / stream_raw_markdown / fetch_github_listing이 재시도로 복구하는지,
+죽은 엔드포인트에서 브레이커가 열려 다음 프로세스도 즉시 실패하는지 확인합니다.
+
+브레이커 상태와 이벤트는 임시 디렉토리(RESILIENCE_DIR)에 기록되므로 data/는 건드리지 않습니다.
+
+사용법:
+    python3 benchmarks/bench_resilience.py
+    python3 benchmarks/bench_resilience.py --rounds 20 --fault-rate 0.5
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+# 모듈 import 전에 설정해야 적용됨 (짧은 백오프, 임시 상태 디렉토리)
+STATE_DIR = tempfile.mkdtemp(prefix="bench-resilience-")
+os.environ.update({
+    "RESILIENCE_DIR": STATE_DIR,
+    "METRICS_DIR": STATE_DIR,
+    "ALERTS_DIR": str(Path(STATE_DIR) / "alerts"),
+    "RETRY_DELAY": "0.05",
+    "RETRY_MAX_DELAY": "0.5",
+    "MAX_RETRIES": "3",
+    "BREAKER_FAILURE_THRESHOLD": "5",
+    "BREAKER_COOLDOWN": "60",
+})
+
+from lib import resilience  # noqa: E402
+from crawler.fetch_page import fetch_raw_markdown, stream_raw_markdown, process_markdown  # noqa: E402
+from rss.check_feed import fetch_github_listing  # noqa: E402
+
+EXAMPLE = PROJECT_ROOT / "examples" / "2026-01-16-chatgpt-ads.md"
+FAULTS = ["503", "429", "reset", "ok"]
+
+
+class FaultPlan:
+    """경로별로 다음 요청에 주입할 장애 목록 (비면 정상 응답)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queue: dict[str, list[str]] = {}
+        self.requests = 0
+
+    def push(self, path: str, faults: list[str]):
+        with self.lock:
+            self.queue.setdefault(path, []).extend(faults)
+
+    def next(self, path: str) -> str:
+        with self.lock:
+            self.requests += 1
+            faults = self.queue.get(path)
+            return faults.pop(0) if faults else "ok"
+
+
+def start_server(plan: FaultPlan, documents: dict[str, bytes]) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.lstrip("/")
+            if path.startswith("dead"):
+                self.send_error(502)
+                return
+            body = documents.get(path)
+            if body is None:
+                self.send_error(404)
+                return
+
+            fault = plan.next(path)
+            if fault in ("503", "429"):
+                self.send_response(int(fault))
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if fault == "reset":
+                # 본문 일부만 보내고 연결을 끊음 (IncompleteRead)
+                self.wfile.write(body[: len(body) // 3])
+                self.wfile.flush()
+                self.connection.close()
+                return
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_rounds(base: str, plan: FaultPlan, rounds: int, fault_rate: float, seed: int) -> list[dict]:
+    """각 페치 경로에 무작위 장애(재시도 한도 이내)를 주입하고 복구 여부를 기록합니다."""
+    rng = random.Random(seed)
+    expected = process_markdown(EXAMPLE.read_text(encoding="utf-8"))[0]
+    targets = {
+        "full": ("issue.md", lambda: process_markdown(fetch_raw_markdown(f"{base}/issue.md"))[0] == expected),
+        "stream": ("issue.md", lambda: process_markdown(stream_raw_markdown(f"{base}/issue.md")[0])[0] == expected),
+        "listing": ("listing.json", lambda: len(fetch_github_listing(f"{base}/listing.json")) == 2),
+    }
+
+    rows = []
+    for name, (path, fetch) in targets.items():
+        injected = recovered = 0
+        elapsed = []
+        for _ in range(rounds):
+            faults = [rng.choice(FAULTS[:-1]) for _ in range(resilience.MAX_RETRIES) if rng.random() < fault_rate]
+            injected += len(faults)
+            plan.push(path, faults)
+            start = time.perf_counter()
+            try:
+                ok = fetch()
+            except SystemExit:
+                ok = False
+            elapsed.append((time.perf_counter() - start) * 1000)
+            recovered += ok
+        rows.append({
+            "path": name,
+            "rounds": rounds,
+            "faults_injected": injected,
+            "succeeded": recovered,
+            "mean_ms": round(sum(elapsed) / len(elapsed), 1),
+            "max_ms": round(max(elapsed), 1),
+        })
+    return rows
+
+
+def check_breaker(base: str) -> dict:
+    """죽은 엔드포인트에서 브레이커가 열리고 다른 프로세스에서도 즉시 실패하는지 확인합니다."""
+    endpoint = resilience.endpoint_for(base)
+    resilience.reset()
+
+    attempts = 0
+    start = time.perf_counter()
+    while resilience.load_breakers().get(endpoint, {}).get("state") != "open" and attempts < 10:
+        attempts += 1
+        try:
+            fetch_raw_markdown(f"{base}/dead.md")
+        except SystemExit:
+            pass
+    open_ms = (time.perf_counter() - start) * 1000
+
+    # 별도 프로세스: 저장된 상태를 읽어 네트워크 호출 없이 실패해야 함
+    probe = (
+        "import sys, time; sys.path.insert(0, 'src');"
+        "from crawler.fetch_page import fetch_raw_markdown;"
+        "start = time.perf_counter()\n"
+        "try:\n"
+        f"    fetch_raw_markdown('{base}/issue.md')\n"
+        "except SystemExit:\n"
+        "    print(round((time.perf_counter() - start) * 1000, 1))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=PROJECT_ROOT, capture_output=True, text=True, env=os.environ.copy()
+    )
+    breaker = resilience.load_breakers().get(endpoint, {})
+    return {
+        "endpoint": endpoint,
+        "calls_until_open": attempts,
+        "time_until_open_ms": round(open_ms, 1),
+        "state": breaker.get("state"),
+        "retries_total": breaker.get("retries_total"),
+        "short_circuit_in_new_process": "circuit open" in result.stderr,
+        "short_circuit_ms": float(result.stdout.strip() or "nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재시도/서킷 브레이커 장애 주입 벤치마크")
+    parser.add_argument("--rounds", type=int, default=10, help="경로별 페치 횟수")
+    parser.add_argument("--fault-rate", type=float, default=0.4, help="시도별 장애 주입 확률")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    listing = json.dumps([{"name": "26-01-16-a.md"}, {"name": "26-01-17-b.md"}]).encode("utf-8")
+    plan = FaultPlan()
+    server = start_server(plan, {"issue.md": EXAMPLE.read_bytes(), "listing.json": listing})
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        rows = run_rounds(base, plan, args.rounds, args.fault_rate, args.seed)
+        resilience.reset()
+        breaker = check_breaker(base)
+    finally:
+        server.shutdown()
+
+    if args.json:
+        print(json.dumps({"fetch": rows, "breaker": breaker, "requests": plan.requests}, indent=2))
+        return
+
+    print(f"{'path':<8} {'rounds':>6} {'faults':>7} {'ok':>4} {'mean':>9} {'max':>9}")
+    for r in rows:
+        print(
+            f"{r['path']:<8} {r['rounds']:>6} {r['faults_injected']:>7} {r['succeeded']:>4} "
+            f"{r['mean_ms']:>7.1f}ms {r['max_ms']:>7.1f}ms"
+        )
+    print(f"\nHTTP requests served: {plan.requests}")
+    print(
+        f"Breaker on {breaker['endpoint']}: {breaker['state']} after {breaker['calls_until_open']} call(s) "
+        f"({breaker['time_until_open_ms']:.0f}ms, {breaker['retries_total']} retries)"
+    )
+    print(
+        f"New process short-circuited: {breaker['short_circuit_in_new_process']} "
+        f"({breaker['short_circuit_ms']}ms)"
+    )
+
+    failed = [r["path"] for r in rows if r["succeeded"] != r["rounds"]]
+    if failed or breaker["state"] != "open" or not breaker["short_circuit_in_new_process"]:
+        print(f"FAILED: {', '.join(failed) or 'breaker'}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+bench_routing.py - 번역 모델 라우팅 시뮬레이션
+한 달치 이슈(조용한 날/헤드라인 날, 크기 분포)를 만들어 routing.decide가 고르는 단계를 집계하고,
+추론 강도별 지연 모델로 전부 기본 설정으로 번역할 때와 라우팅했을 때의 번역 시간을 비교합니다.
+
+지연 모델 (출력 토큰당 ms): 기본값은 추정치이며 --ms-per-token으로 바꾸거나,
+--from-ledger로 LLM 장부(data/metrics/llm_ledger.jsonl)의 추론 강도별 실제 값을 씁니다.
+리뷰 실패율(--review-fail)만큼은 한 단계 올려 재번역하는 비용을 더합니다.
+
+확인 사항:
+- 헤드라인 날은 기본 단계보다 가벼운 단계로 가지 않음 (품질 유지)
+- 조용한 날의 번역 시간이 줄어듦
+
+사용법:
+    python3 benchmarks/bench_routing.py
+    python3 benchmarks/bench_routing.py --days 90 --quiet-rate 0.4 --from-ledger
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+# 추론 강도별 출력 토큰당 지연 (ms, 추정치)
+DEFAULT_MS_PER_TOKEN = {"low": 12.0, "medium": 25.0, "high": 55.0}
+
+
+def ledger_latency(llm_ledger) -> dict[str, float]:
+    """장부의 번역 호출에서 추론 강도별 출력 토큰당 지연 (ms)"""
+    totals: dict[str, list[float]] = {}
+    for entry in llm_ledger.load_entries():
+        effort = entry.get("reasoning_effort")
+        if entry.get("stage") in ("translate", "retranslate") and effort and entry.get("output_tokens"):
+            ms, tokens = totals.setdefault(effort, [0.0, 0.0])
+            totals[effort] = [ms + entry["latency_ms"], tokens + entry["output_tokens"]]
+    return {effort: ms / tokens for effort, (ms, tokens) in totals.items() if tokens}
+
+
+def make_issues(days: int, quiet_rate: float, seed: int) -> list[dict]:
+    """조용한 날은 작고, 헤드라인 날은 크고 편차가 큰 이슈"""
+    rng = random.Random(seed)
+    issues = []
+    for day in range(days):
+        quiet = rng.random() < quiet_rate
+        tokens = int(rng.lognormvariate(10.0, 0.35) if quiet else rng.lognormvariate(10.6, 0.45))
+        issues.append({
+            "day": day,
+            "headline": not quiet,
+            "tokens": tokens,
+            "length": tokens * 3,
+            "links": tokens // 60,
+        })
+    return issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description="번역 모델 라우팅 시뮬레이션")
+    parser.add_argument("--days", type=int, default=30, help="이슈 수 (날짜 수)")
+    parser.add_argument("--quiet-rate", type=float, default=0.35, help="조용한 날 비율")
+    parser.add_argument("--review-fail", type=float, default=0.1, help="리뷰 실패 비율 (재번역)")
+    parser.add_argument("--output-ratio", type=float, default=1.1, help="입력 대비 출력 토큰 비율")
+    parser.add_argument(
+        "--ms-per-token", default=",".join(f"{k}={v}" for k, v in DEFAULT_MS_PER_TOKEN.items()),
+        help="추론 강도별 출력 토큰당 ms (예: low=12,medium=25,high=55)"
+    )
+    parser.add_argument("--from-ledger", action="store_true", help="LLM 장부의 실제 지연으로 보정")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    os.environ.setdefault("CODEX_MODEL", "gpt-5.4")
+    os.environ.setdefault("CODEX_REASONING_EFFORT", "medium")
+    from translate import routing
+    from lib import llm_ledger
+
+    ms_per_token = {k: float(v) for k, v in (item.split("=") for item in args.ms_per_token.split(","))}
+    if args.from_ledger:
+        ms_per_token.update(ledger_latency(llm_ledger))
+
+    tiers = routing.parse_tiers()
+    rules = routing.parse_rules(routing.RULES, tiers)
+    names = list(tiers)
+    default = routing.DEFAULT_TIER
+    rng = random.Random(args.seed + 1)
+
+    def cost(decision: dict, tokens: int) -> float:
+        return tokens * args.output_ratio * ms_per_token.get(decision["effort"], ms_per_token["medium"]) / 1000
+
+    rows = []
+    for issue in make_issues(args.days, args.quiet_rate, args.seed):
+        signals = {key: issue[key] for key in ("headline", "tokens", "length", "links")}
+        routed = routing.decide(signals, tiers, rules)
+        baseline = {"tier": default, **tiers[default]}
+        failed = rng.random() < args.review_fail
+        routed_s = cost(routed, issue["tokens"])
+        baseline_s = cost(baseline, issue["tokens"])
+        if failed:
+            routed_s += cost(routing.escalate(routed["tier"], tiers), issue["tokens"])
+            baseline_s += cost(routing.escalate(default, tiers), issue["tokens"])
+        rows.append({**issue, "tier": routed["tier"], "routed_s": routed_s, "baseline_s": baseline_s})
+
+    def total(items: list[dict], key: str) -> float:
+        return round(sum(row[key] for row in items), 1)
+
+    quiet = [row for row in rows if not row["headline"]]
+    headline = [row for row in rows if row["headline"]]
+    tiers_used = {name: sum(1 for row in rows if row["tier"] == name) for name in names}
+    downgraded = [row for row in headline if names.index(row["tier"]) < names.index(default)]
+
+    result = {
+        "ms_per_token": ms_per_token,
+        "tiers": tiers_used,
+        "quiet": {"issues": len(quiet), "baseline_s": total(quiet, "baseline_s"), "routed_s": total(quiet, "routed_s")},
+        "headline": {
+            "issues": len(headline), "baseline_s": total(headline, "baseline_s"), "routed_s": total(headline, "routed_s"),
+        },
+        "headline_downgraded": len(downgraded),
+    }
+
+    failures = []
+    if downgraded:
+        failures.append(f"{len(downgraded)} headline day(s) routed below the default tier")
+    if quiet and result["quiet"]["routed_s"] >= result["quiet"]["baseline_s"]:
+        failures.append("quiet days did not get faster")
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{args.days} issues ({len(quiet)} quiet), review failure {args.review_fail:.0%}")
+        print(f"Latency model (ms per output token): {ms_per_token}")
+        print(f"Tiers: {tiers_used}\n")
+        print(f"{'':<10} {'issues':>6} {'baseline':>10} {'routed':>10} {'change':>8}")
+        for name in ("quiet", "headline"):
+            r = result[name]
+            change = (r["routed_s"] / r["baseline_s"] - 1) if r["baseline_s"] else 0
+            print(f"{name:<10} {r['issues']:>6} {r['baseline_s'] / 60:>8.1f}m {r['routed_s'] / 60:>8.1f}m {change:>+7.0%}")
+        for failure in failures:
+            print(f"\nUnexpected: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
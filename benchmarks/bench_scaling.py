@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+bench_scaling.py - 텍스트 처리 단계 크기 확장성 벤치마크
+synth_issue.py로 10KB~10MB 합성 이슈와 링크를 일부 뺀 번역본을 만들고,
+process_markdown, validate_content, validate_links, local_review.review의
+크기별 소요 시간과 피크 메모리를 측정합니다.
+
+log(시간) ~ log(크기) 기울기(스케일링 지수)를 최소제곱으로 구해 1에 가까우면 선형,
+임계값(--max-exponent)을 넘으면 초선형으로 표시합니다. 결과는 터미널용 log-log 차트로 그립니다.
+번역본에서 뺀 링크를 review/validate_links가 정확히 찾는지도 함께 확인합니다.
+
+사용법:
+    python3 benchmarks/bench_scaling.py
+    python3 benchmarks/bench_scaling.py --sizes 10K,100K,1M --check
+    python3 benchmarks/bench_scaling.py --json > scaling.json
+"""
+
+import sys
+import json
+import math
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synth_issue import generate_issue, generate_translation, parse_size  # noqa: E402
+from crawler.fetch_page import process_markdown, validate_content  # noqa: E402
+from generate.generate_markdown import validate_links  # noqa: E402
+from review.local_review import review  # noqa: E402
+
+DEFAULT_SIZES = "10K,32K,100K,320K,1M,3.2M,10M"
+DEFAULT_MAX_EXPONENT = 1.25
+DEFAULT_DROP_RATE = 0.01
+URL = "https://raw.githubusercontent.com/smol-ai/ainews-web-2025/main/src/content/issues/26-01-16-synthetic.md"
+
+CHART_WIDTH = 48
+CHART_HEIGHT = 12
+LABEL_WIDTH = 12
+
+
+def build_cases(raw: str, seed: int, drop_rate: float) -> tuple[dict[str, Callable[[], object]], int, int]:
+    """(단계별 호출 함수, 뺀 링크 수, 검증기가 찾은 누락 수)"""
+    content, _, links = process_markdown(raw)
+    translation = generate_translation(content, seed, drop_rate)
+    translated = translation.text
+
+    found = sum(review(content, translated).missing.values())
+    ok, _ = validate_links(content, translated)
+    if ok == bool(translation.dropped):
+        found = -1  # validate_links와 review의 판정이 어긋남
+
+    cases = {
+        "process_markdown": lambda: process_markdown(raw),
+        "validate_content": lambda: validate_content(content, links, URL),
+        "validate_links": lambda: validate_links(content, translated),
+        "review": lambda: review(content, translated),
+    }
+    return cases, len(translation.dropped), found
+
+
+def measure_time(func: Callable[[], object], budget: float) -> float:
+    """호출 1회당 소요 시간(초)의 최솟값 (대략 budget초 안에서 반복)"""
+    best = math.inf
+    spent = 0.0
+    runs = 0
+    while runs < 3 or (spent < budget and runs < 50):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        runs += 1
+    return best
+
+
+def measure_memory(func: Callable[[], object]) -> int:
+    """호출 중 피크 메모리 할당량 (바이트, 입력 자체는 제외)"""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def fit_exponent(sizes: list[int], values: list[float]) -> float:
+    """log(value) = k * log(size) + c 의 기울기 k"""
+    points = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if v > 0]
+    if len(points) < 2:
+        return float("nan")
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return cov / var_x if var_x else float("nan")
+
+
+def render_chart(series: dict[str, list[tuple[int, float]]], unit: str) -> str:
+    """단계별 (크기, 값) 시리즈를 log-log 문자 차트로 그립니다 (단계마다 다른 기호)."""
+    points = [(s, v) for values in series.values() for s, v in values if v > 0]
+    if not points:
+        return ""
+    min_x, max_x = math.log10(min(s for s, _ in points)), math.log10(max(s for s, _ in points))
+    min_y, max_y = math.log10(min(v for _, v in points)), math.log10(max(v for _, v in points))
+    span_x = (max_x - min_x) or 1.0
+    span_y = (max_y - min_y) or 1.0
+
+    grid = [[" "] * CHART_WIDTH for _ in range(CHART_HEIGHT)]
+    symbols = {}
+    for symbol, (name, values) in zip("ovx+*#", series.items()):
+        symbols[symbol] = name
+        for s, v in values:
+            if v <= 0:
+                continue
+            col = round((math.log10(s) - min_x) / span_x * (CHART_WIDTH - 1))
+            row = CHART_HEIGHT - 1 - round((math.log10(v) - min_y) / span_y * (CHART_HEIGHT - 1))
+            grid[row][col] = symbol
+
+    lines = []
+    for i, row in enumerate(grid):
+        label = ""
+        if i == 0:
+            label = f"{10 ** max_y:,.4g}{unit}"
+        elif i == CHART_HEIGHT - 1:
+            label = f"{10 ** min_y:,.4g}{unit}"
+        lines.append(f"{label:>{LABEL_WIDTH}} |{''.join(row)}")
+    lines.append(f"{'':>{LABEL_WIDTH}} +{'-' * CHART_WIDTH}")
+    left, right = _format_size(10 ** min_x), _format_size(10 ** max_x)
+    lines.append(f"{'':>{LABEL_WIDTH + 2}}{left}{right:>{CHART_WIDTH - len(left)}}")
+    lines.append(f"{'':>{LABEL_WIDTH + 2}}" + "  ".join(f"{sym} {name}" for sym, name in symbols.items()))
+    return "\n".join(lines)
+
+
+def _format_size(size: float) -> str:
+    if size >= 1024 * 1024:
+        return f"{size / 1024 / 1024:.1f}MB"
+    return f"{size / 1024:.0f}KB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 처리 단계 크기 확장성 벤치마크")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"원문 크기 목록 (default: {DEFAULT_SIZES})")
+    parser.add_argument("--seed", type=int, default=0, help="합성 이슈 시드")
+    parser.add_argument("--drop-rate", type=float, default=DEFAULT_DROP_RATE, help="번역본에서 뺄 링크 비율")
+    parser.add_argument("--budget", type=float, default=0.5, help="크기/단계별 시간 측정 예산 (초)")
+    parser.add_argument(
+        "--max-exponent",
+        type=float,
+        default=DEFAULT_MAX_EXPONENT,
+        help=f"초선형 판정 스케일링 지수 (default: {DEFAULT_MAX_EXPONENT})",
+    )
+    parser.add_argument("--check", action="store_true", help="초선형 단계나 누락 검출 오류가 있으면 exit 1")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    rows = []
+    for size in sizes:
+        raw = generate_issue(size, args.seed)
+        cases, dropped, found = build_cases(raw, args.seed, args.drop_rate)
+        for stage, func in cases.items():
+            rows.append({
+                "stage": stage,
+                "size_bytes": len(raw.encode("utf-8")),
+                "seconds": measure_time(func, args.budget),
+                "peak_bytes": measure_memory(func),
+                "dropped_links": dropped,
+                "detected_links": found,
+            })
+        print(f"measured {_format_size(size)}", file=sys.stderr)
+
+    stages = list(dict.fromkeys(row["stage"] for row in rows))
+    exponents = {}
+    for stage in stages:
+        stage_rows = [r for r in rows if r["stage"] == stage]
+        exponents[stage] = {
+            "time": fit_exponent([r["size_bytes"] for r in stage_rows], [r["seconds"] for r in stage_rows]),
+            "memory": fit_exponent([r["size_bytes"] for r in stage_rows], [r["peak_bytes"] for r in stage_rows]),
+        }
+    superlinear = [s for s, e in exponents.items() if e["time"] > args.max_exponent or e["memory"] > args.max_exponent]
+    miscounted = sorted({r["size_bytes"] for r in rows if r["dropped_links"] != r["detected_links"]})
+
+    if args.json:
+        print(json.dumps({"rows": rows, "exponents": exponents, "superlinear": superlinear}, indent=2))
+    else:
+        print(f"{'stage':<18} {'size':>8} {'time':>11} {'peak mem':>11} {'per MB':>10}")
+        for row in rows:
+            per_mb = row["seconds"] / (row["size_bytes"] / 1024 / 1024)
+            print(
+                f"{row['stage']:<18} {_format_size(row['size_bytes']):>8} {row['seconds'] * 1e3:>9.2f}ms "
+                f"{row['peak_bytes'] / 1024:>8.0f}KiB {per_mb * 1e3:>8.1f}ms"
+            )
+        print(f"\n{'stage':<18} {'time exp':>9} {'mem exp':>9}")
+        for stage, e in exponents.items():
+            mark = "  SUPERLINEAR" if stage in superlinear else ""
+            print(f"{stage:<18} {e['time']:>9.2f} {e['memory']:>9.2f}{mark}")
+
+        for title, key, unit, scale in (("Time", "seconds", "ms", 1e3), ("Peak memory", "peak_bytes", "KiB", 1 / 1024)):
+            series = {
+                stage: [(r["size_bytes"], r[key] * scale) for r in rows if r["stage"] == stage]
+                for stage in stages
+            }
+            print(f"\n{title} (log-log)\n{render_chart(series, unit)}")
+
+        if miscounted:
+            print(f"\nLink-drop detection mismatch at sizes: {', '.join(_format_size(s) for s in miscounted)}")
+
+    if args.check and (superlinear or miscounted):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+bench_speculative.py - 업스트림 초안 사전 번역 벤치마크
+로컬 bare 레포를 업스트림으로 두고 이슈 초안을 브랜치에 올린 뒤 ./main.sh --speculate로 미리 번역하고,
+같은 이슈가 main에 머지된 시점부터 최종 마크다운이 나올 때까지의 시간(머지 후 지연)을 비교합니다.
+
+- cold: 사전 번역 없이 머지 후 전체 번역
+- hit: 머지된 원문이 초안과 같음 (사전 번역 그대로 사용)
+- patched: 머지 전에 한 줄이 수정됨 (변경 구간만 부분 재번역)
+- discarded: 머지 전에 대부분 수정됨 (사전 번역 폐기 후 전체 번역)
+
+프로젝트(src, prompts)를 임시 디렉토리에 복사해 실행하므로 data/, output/을 건드리지 않습니다.
+Codex CLI 대신 프롬프트 크기에 비례해 지연되는 가짜 CLI를 씁니다
+(지연 = --base-latency + 프롬프트 바이트 / --throughput, 부분 재번역 프롬프트는 구간을 그대로 반환).
+
+사용법:
+    python3 benchmarks/bench_speculative.py
+    python3 benchmarks/bench_speculative.py --base-latency 2 --throughput 20000
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+ISSUE = PROJECT_ROOT / "examples" / "2026-01-16-chatgpt-ads.md"
+SLUG = "26-01-16-chatgpt-ads"
+ISSUES_PATH = "src/content/issues"
+
+FAKE_CODEX = """#!/usr/bin/env python3
+import re, sys, time, shutil
+args = sys.argv[1:]
+out = args[args.index("--output-last-message") + 1]
+prompt = sys.stdin.read()
+time.sleep({base} + len(prompt.encode("utf-8")) / {throughput})
+match = re.search(r"^<<<SEGMENT.*", prompt, re.M | re.S)
+if match:
+    open(out, "w", encoding="utf-8").write(match.group(0))
+else:
+    shutil.copy({issue!r}, out)
+"""
+
+FAKE_GH = "#!/bin/bash\nexit 0\n"
+
+
+def _run(cmd: list[str], cwd: Path, env: dict) -> None:
+    subprocess.run(cmd, cwd=cwd, env=env, check=True, capture_output=True)
+
+
+def _commit(seed: Path, env: dict, message: str) -> None:
+    _run(["git", "add", "-A"], seed, env)
+    _run(["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com", "commit", "-qm", message], seed, env)
+
+
+def setup(root: Path, args) -> dict:
+    """임시 프로젝트 복사본, 가짜 CLI, 업스트림 bare 레포를 만들고 실행 환경을 반환합니다."""
+    project = root / "project"
+    for name in ("src", "prompts"):
+        shutil.copytree(PROJECT_ROOT / name, project / name, ignore=shutil.ignore_patterns("__pycache__"))
+    (project / "config").mkdir()
+
+    bin_dir = root / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "codex").write_text(
+        FAKE_CODEX.format(base=args.base_latency, throughput=args.throughput, issue=str(ISSUE))
+    )
+    (bin_dir / "gh").write_text(FAKE_GH)
+    for path in bin_dir.iterdir():
+        path.chmod(0o755)
+
+    env = dict(
+        os.environ,
+        PATH=f"{bin_dir}:{os.environ['PATH']}",
+        CODEX_BIN=str(bin_dir / "codex"),
+        REVIEW_MODE="local",
+        TARGET_LANGS="ko",
+        SPECULATIVE_REMOTE=str(root / "upstream.git"),
+        HTTP_CASSETTE_MODE="off",
+        MAX_RETRIES="0",
+    )
+    env.pop("NEWSAUTO_RUN_ID", None)
+    return {"project": project, "env": env, "root": root}
+
+
+def init_upstream(ctx: dict, content: str) -> Path:
+    """초안 브랜치에 이슈를 올린 업스트림 bare 레포를 (다시) 만듭니다."""
+    root, env = ctx["root"], ctx["env"]
+    seed = root / "seed"
+    shutil.rmtree(seed, ignore_errors=True)
+    shutil.rmtree(root / "upstream.git", ignore_errors=True)
+    (seed / ISSUES_PATH).mkdir(parents=True)
+    _run(["git", "init", "-q", "-b", "main"], seed, env)
+    (seed / ISSUES_PATH / "26-01-14-older.md").write_text(ISSUE.read_text(encoding="utf-8"), encoding="utf-8")
+    _commit(seed, env, "base")
+    _run(["git", "checkout", "-qb", "draft"], seed, env)
+    (seed / ISSUES_PATH / f"{SLUG}.md").write_text(content, encoding="utf-8")
+    _commit(seed, env, "draft")
+    _run(["git", "clone", "-q", "--bare", str(seed), str(root / "upstream.git")], root, env)
+    return seed
+
+
+def reset_state(ctx: dict) -> None:
+    project = ctx["project"]
+    for name in ("data", "output"):
+        shutil.rmtree(project / name, ignore_errors=True)
+
+
+def main_sh(ctx: dict, *args: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [str(ctx["project"] / "src" / "main.sh"), *args],
+        env=ctx["env"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def land(ctx: dict, content: str) -> float:
+    """머지된 원문으로 일반 실행 (머지 후 지연, ms)"""
+    landed = ctx["root"] / "landed" / f"{SLUG}.md"
+    landed.parent.mkdir(exist_ok=True)
+    landed.write_text(content, encoding="utf-8")
+    return main_sh(ctx, "--url", f"file://{landed}", "--dry-run")
+
+
+def variants(original: str) -> dict[str, str]:
+    """시나리오별 머지된 원문"""
+    lines = original.split("\n")
+    patched = original.replace('"10배 더 많은 메시지"', '"10배 더 많은 메시지 (머지 전 수정)"', 1)
+    rewritten = "\n".join(f"{line} (수정)" if line.startswith("- ") else line for line in lines)
+    return {"hit": original, "patched": patched, "discarded": rewritten}
+
+
+def run(args) -> dict:
+    root = Path(tempfile.mkdtemp(prefix="bench-speculative-"))
+    try:
+        ctx = setup(root, args)
+        original = ISSUE.read_text(encoding="utf-8")
+        results = {}
+
+        reset_state(ctx)
+        results["cold"] = {"speculate_ms": 0.0, "landing_ms": round(land(ctx, original), 1), "outcome": "-"}
+
+        for name, landed in variants(original).items():
+            reset_state(ctx)
+            init_upstream(ctx, original)
+            speculate_ms = main_sh(ctx, "--speculate")
+            landing_ms = land(ctx, landed)
+            history = ctx["project"] / "data" / "speculative" / "history.jsonl"
+            entry = json.loads(history.read_text(encoding="utf-8").splitlines()[-1])
+            results[name] = {
+                "speculate_ms": round(speculate_ms, 1),
+                "landing_ms": round(landing_ms, 1),
+                "outcome": entry["outcome"],
+            }
+        return results
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="업스트림 초안 사전 번역 벤치마크")
+    parser.add_argument("--base-latency", type=float, default=1.0, help="가짜 Codex 호출당 기본 지연 (초)")
+    parser.add_argument("--throughput", type=float, default=20_000, help="가짜 Codex 프롬프트 처리 속도 (바이트/초)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    results = run(args)
+    expected = {"hit": "hit", "patched": "reconciled", "discarded": "discarded"}
+    mismatched = [name for name, outcome in expected.items() if results[name]["outcome"] != outcome]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        cold = results["cold"]["landing_ms"]
+        print(f"{'scenario':<10} {'speculate':>10} {'landing':>10} {'vs cold':>8}  outcome")
+        for name, r in results.items():
+            print(
+                f"{name:<10} {r['speculate_ms'] / 1000:>9.1f}s {r['landing_ms'] / 1000:>9.1f}s "
+                f"{r['landing_ms'] / cold:>7.2f}x  {r['outcome']}"
+            )
+        if mismatched:
+            print(f"\nUnexpected outcome: {', '.join(mismatched)}")
+
+    if mismatched:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
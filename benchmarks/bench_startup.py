@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py - 파이썬 도구 기동 시간 벤치마크
+main.sh가 한 번 실행될 때 반복하는 짧은 Python 호출(상태 기록, JSON 파싱 등)의
+cold(바이트코드 캐시 없음) / warm(캐시 있음) 기동 시간을 측정합니다.
+
+사용법:
+    python3 benchmarks/bench_startup.py
+    python3 benchmarks/bench_startup.py --runs 20 --json
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import statistics
+import subprocess
+import time
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SRC = PROJECT_ROOT / "src"
+NEWSAUTO = str(SRC / "newsauto.py")
+
+SAMPLE_JSON = json.dumps({"metadata": {"has_headline": True}, "links": ["a", "b", "c"]})
+
+# (케이스 이름, argv, stdin)
+CASES = [
+    ("state stats (script)", [sys.executable, str(SRC / "state" / "state_manager.py"), "stats"], None),
+    ("state stats (newsauto)", [sys.executable, NEWSAUTO, "state", "stats"], None),
+    (
+        "json parse x2 (python3 -c)",
+        [
+            "bash", "-c",
+            f'{sys.executable} -c "import sys, json; print(str(json.load(sys.stdin)[\'metadata\'][\'has_headline\']).lower())" <<< "$0" >/dev/null;'
+            f' {sys.executable} -c "import sys, json; print(len(json.load(sys.stdin)[\'links\']))" <<< "$0"',
+            SAMPLE_JSON,
+        ],
+        None,
+    ),
+    ("json parse x2 (newsauto json-get)", [sys.executable, NEWSAUTO, "json-get", "metadata.has_headline", "links|len"], SAMPLE_JSON),
+    (
+        "state stats x3 (3 processes)",
+        ["bash", "-c", f"for i in 1 2 3; do {sys.executable} {NEWSAUTO} state stats; done"],
+        None,
+    ),
+    ("state stats x3 (newsauto batch)", [sys.executable, NEWSAUTO, "batch"], "state stats\nstate stats\nstate stats\n"),
+]
+
+
+def run_once(argv: list[str], stdin: str, env: dict) -> float:
+    start = time.perf_counter()
+    subprocess.run(argv, input=stdin, text=True, env=env, cwd=PROJECT_ROOT,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure(argv: list[str], stdin: str, runs: int) -> dict:
+    """cold: 매번 빈 바이트코드 캐시 / warm: 미리 채운 캐시"""
+    base_env = {k: v for k, v in os.environ.items() if not k.startswith("NEWSAUTO_")}
+
+    cold = []
+    for _ in range(runs):
+        cache = tempfile.mkdtemp(prefix="newsauto-pycache-")
+        cold.append(run_once(argv, stdin, {**base_env, "PYTHONPYCACHEPREFIX": cache}))
+        shutil.rmtree(cache, ignore_errors=True)
+
+    cache = tempfile.mkdtemp(prefix="newsauto-pycache-")
+    env = {**base_env, "PYTHONPYCACHEPREFIX": cache}
+    run_once(argv, stdin, env)
+    warm = [run_once(argv, stdin, env) for _ in range(runs)]
+    shutil.rmtree(cache, ignore_errors=True)
+
+    return {"cold_ms": statistics.median(cold), "warm_ms": statistics.median(warm)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Python 도구 기동 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=10, help="케이스당 실행 횟수 (default: 10)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    results = {}
+    for name, argv, stdin in CASES:
+        if NEWSAUTO in argv or any(NEWSAUTO in a for a in argv):
+            if not Path(NEWSAUTO).exists():
+                continue
+        results[name] = measure(argv, stdin, args.runs)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'case':<36} {'cold':>9} {'warm':>9}   (median of {args.runs})")
+    for name, r in results.items():
+        print(f"{name:<36} {r['cold_ms']:>7.1f}ms {r['warm_ms']:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
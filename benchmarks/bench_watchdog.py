@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+bench_watchdog.py - LLM CLI 감시 실행 벤치마크
+멈추거나 엇나가는 가짜 Codex CLI를 resilience.exec_command(감시 실행 + 재시도)로 실행해
+각 이상 동작을 얼마나 빨리 끊고 어떻게 재시도하는지 확인합니다.
+
+시나리오 (가짜 CLI는 codex exec처럼 프롬프트를 먼저 그대로 출력):
+- healthy: 진행 로그를 꾸준히 출력하고 정상 종료 (프롬프트에 실패 신호 문구가 있어도 종료되면 안 됨)
+- hang: 몇 줄 출력 후 응답 없음 → stall로 종료, 백오프 후 재시도
+- endless: 진행 로그를 계속 출력하며 끝나지 않음 → timeout으로 종료
+- offtrack: 번역 대신 로컬 파일 경로를 출력 → 즉시 재시도, 두 번째 시도는 정상
+- fatal: 사용량 한도 오류 후 응답 없음 → 재시도하지 않음
+- orphan: 하위 프로세스를 띄운 채 멈춤 → 프로세스 그룹 전체 종료 확인
+
+감시 없이 실행했다면 걸렸을 시간(--hang초)과 비교합니다.
+
+사용법:
+    python3 benchmarks/bench_watchdog.py
+    python3 benchmarks/bench_watchdog.py --stall 1 --timeout 4 --hang 120
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+FAKE_CODEX = """#!/usr/bin/env python3
+import os, sys, time, subprocess
+mode, hang, state = sys.argv[1], float(sys.argv[2]), sys.argv[3]
+prompt = sys.stdin.read()
+print(prompt, flush=True)
+
+attempt = int(open(state).read()) + 1 if os.path.exists(state) else 1
+open(state, "w").write(str(attempt))
+
+def progress(seconds):
+    end = time.time() + seconds
+    while time.time() < end:
+        print("thinking...", flush=True)
+        time.sleep(0.2)
+
+if mode == "healthy" or (mode == "offtrack" and attempt > 1):
+    progress(1.0)
+    print("codex: translation complete", flush=True)
+    sys.exit(0)
+if mode == "hang":
+    progress(0.5)
+    time.sleep(hang)
+elif mode == "endless":
+    progress(hang)
+elif mode == "offtrack":
+    progress(0.5)
+    print("I saved the translation to workspace/output/translated.md", flush=True)
+    progress(hang)
+elif mode == "fatal":
+    print("ERROR: You've hit your usage limit. Upgrade to Pro or try again later.", flush=True)
+    time.sleep(hang)
+elif mode == "orphan":
+    child = subprocess.Popen(["sleep", str(hang)])
+    open(state + ".child", "w").write(str(child.pid))
+    progress(0.5)
+    time.sleep(hang)
+sys.exit(1)
+"""
+
+# 기사 본문에 흔히 나오는 실패 신호 문구 (프롬프트 재출력으로는 종료되면 안 됨)
+PROMPT = """다음 원문을 번역하세요.
+
+- Users complain: "You've hit your usage limit" after two prompts on the free tier
+- The agent wrote its notes to final.md before opening a PR
+"""
+
+# 시나리오별 기대 결과 (종료 원인, 시도 횟수, 성공 여부)
+EXPECTED = {
+    "healthy": (None, 1, True),
+    "hang": ("stall", 2, False),
+    "endless": ("timeout", 2, False),
+    "offtrack": (None, 2, True),
+    "fatal": ("usage_limit", 1, False),
+    "orphan": ("stall", 2, False),
+}
+
+
+def _pid_alive(pid: int) -> bool:
+    """종료 후 아직 회수되지 않은 좀비 프로세스는 살아있지 않은 것으로 봅니다."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        return Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[-1].split()[0] != "Z"
+    except FileNotFoundError:
+        return not Path("/proc/self").exists()
+
+
+def run_scenario(resilience, fake: Path, work_dir: Path, mode: str, hang: float) -> dict:
+    state = work_dir / f"{mode}.attempts"
+    prompt = work_dir / "prompt.txt"
+    prompt.write_text(PROMPT, encoding="utf-8")
+    output = work_dir / f"{mode}.log"
+    reason_file = work_dir / f"{mode}.reason"
+    resilience.reset()
+
+    start = time.perf_counter()
+    exit_code = resilience.exec_command(
+        "codex", [str(fake), mode, str(hang), str(state)], prompt, output, reason_path=reason_file
+    )
+    elapsed = time.perf_counter() - start
+
+    reason = reason_file.read_text(encoding="utf-8").strip() if reason_file.exists() else ""
+    child_file = Path(f"{state}.child")
+    orphan_alive = child_file.exists() and _pid_alive(int(child_file.read_text()))
+    return {
+        "exit_code": exit_code,
+        "attempts": int(state.read_text()) if state.exists() else 0,
+        "reason": reason,
+        "elapsed_s": round(elapsed, 2),
+        "orphan_alive": orphan_alive,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM CLI 감시 실행 벤치마크")
+    parser.add_argument("--stall", type=float, default=2.0, help="무진행 제한 (초)")
+    parser.add_argument("--timeout", type=float, default=5.0, help="벽시계 제한 (초)")
+    parser.add_argument("--hang", type=float, default=60.0, help="가짜 CLI가 멈춰 있는 시간 (초)")
+    parser.add_argument("--retry-delay", type=float, default=2.0, help="백오프 기본 대기 (초)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-watchdog-"))
+    # 모듈 import 전에 설정해야 적용됨
+    os.environ.update(
+        RESILIENCE_DIR=str(work_dir / "resilience"),
+        METRICS_DIR=str(work_dir / "metrics"),
+        ALERTS_DIR=str(work_dir / "alerts"),
+        CODEX_TIMEOUT=str(args.timeout),
+        CODEX_STALL_TIMEOUT=str(args.stall),
+        WATCHDOG_POLL_INTERVAL="0.2",
+        MAX_RETRIES="1",
+        RETRY_DELAY=str(args.retry_delay),
+    )
+    from lib import resilience
+
+    fake = work_dir / "fake-codex"
+    fake.write_text(FAKE_CODEX)
+    fake.chmod(0o755)
+
+    results = {mode: run_scenario(resilience, fake, work_dir, mode, args.hang) for mode in EXPECTED}
+
+    failures = []
+    for mode, (killed, attempts, ok) in EXPECTED.items():
+        r = results[mode]
+        if (r["exit_code"] == 0) != ok or r["attempts"] != attempts or r["orphan_alive"]:
+            failures.append(mode)
+        elif killed and not r["reason"].startswith(killed):
+            failures.append(mode)
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print(f"Limits: stall {args.stall}s, timeout {args.timeout}s; unsupervised hang {args.hang}s\n")
+        print(f"{'scenario':<9} {'exit':>4} {'tries':>5} {'elapsed':>8}  reason")
+        for mode, r in results.items():
+            print(f"{mode:<9} {r['exit_code']:>4} {r['attempts']:>5} {r['elapsed_s']:>7.1f}s  {r['reason'] or '-'}")
+        if failures:
+            print(f"\nUnexpected behavior: {', '.join(failures)}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
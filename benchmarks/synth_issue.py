@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+synth_issue.py - 합성 smol.ai 이슈 생성기
+시드 고정 난수로 smol.ai 원문 형태의 마크다운(frontmatter, Twitter/Reddit/Discord recap,
+Discord 상세 섹션)을 원하는 크기로 만들고, 같은 구조의 "번역본"을 링크 일부를 빠뜨린 채 만듭니다.
+같은 시드와 크기면 항상 같은 바이트를 생성하므로 벤치마크 결과를 실행 간에 비교할 수 있습니다.
+
+사용법:
+    python3 benchmarks/synth_issue.py --size 1M -o /tmp/issue.md
+    python3 benchmarks/synth_issue.py --size 200K --seed 3 -o /tmp/issue.md \\
+        --translated /tmp/translated.md --drop-rate 0.01
+"""
+
+import re
+import sys
+import random
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+
+DISCORD_MARKER = "# Discord: High level Discord summaries"
+LINK_RE = re.compile(r"\[([^\]]*?)\]\(([^)]+)\)")
+
+COMPANIES = ["OpenAI", "Anthropic", "Google DeepMind", "Meta", "Mistral", "DeepSeek", "Qwen", "NVIDIA", "Cursor", "Hugging Face"]
+MODELS = ["GPT-5.2", "Claude Opus 4.5", "Gemini 3 Pro", "Llama 5", "DeepSeek-V4", "Qwen3-Max", "FLUX.2 [klein]", "Codex"]
+TOPICS = ["agents", "inference cost", "fine-tuning", "quantization", "long context", "evals", "RL post-training", "tool use", "voice", "image generation"]
+HANDLES = ["sama", "karpathy", "swyx", "cursor_ai", "OpenAIDevs", "AnthropicAI", "GoogleDeepMind", "huggingface", "vllm_project", "ollama"]
+SUBREDDITS = ["/r/LocalLlama", "/r/localLLM", "/r/MachineLearning", "/r/OpenAI", "/r/ClaudeAI", "/r/StableDiffusion"]
+SERVERS = ["Latent Space", "Nous Research", "Unsloth AI", "LM Studio", "Cursor Community", "OpenRouter", "GPU MODE", "Eleuther"]
+VERBS = ["released", "benchmarked", "open-sourced", "announced", "previewed", "shipped", "priced", "deprecated"]
+DETAILS = [
+    "with a 2x speedup on consumer GPUs",
+    "scoring 63.3% on SWE-bench Verified",
+    "at $8/month for 10x more messages",
+    "supporting 1M tokens of context",
+    "under an Apache-2.0 license",
+    "with day-one vLLM support",
+    "running in <13GB VRAM",
+    "after community reports of regressions",
+]
+HASHTAGS = ["#AI", "#LLM", "#OpenSource", "#Agents", "#GPU"]
+
+KO_WORDS = ["모델", "출시", "성능", "추론", "비용", "커뮤니티", "에이전트", "벤치마크", "공개", "지원", "개선", "발표"]
+
+
+def parse_size(value: str) -> int:
+    """'10K', '2.5M', '300' 같은 크기 표기를 바이트로 변환합니다."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([KkMm]?)[Bb]?", value.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value}")
+    number, unit = float(match.group(1)), match.group(2).upper()
+    return int(number * {"": 1, "K": 1024, "M": 1024 * 1024}[unit])
+
+
+class _Writer:
+    """재현 가능한 문장/링크 생성 (URL은 생성 순서 번호로 고유하게)"""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.link_id = 0
+
+    def url(self, kind: str) -> str:
+        self.link_id += 1
+        n = self.link_id
+        if kind == "tweet":
+            return f"https://twitter.com/{self.rng.choice(HANDLES)}/status/{2011500000000000000 + n}"
+        if kind == "reddit":
+            return f"https://www.reddit.com/r/LocalLLaMA/comments/{n:07x}/"
+        if kind == "discord":
+            return f"https://discord.com/channels/{1000 + n % 97}/{n}"
+        return f"https://example.com/{self.rng.choice(TOPICS).replace(' ', '-')}/{n}"
+
+    def sentence(self) -> str:
+        r = self.rng
+        return f"{r.choice(COMPANIES)} {r.choice(VERBS)} {r.choice(MODELS)} {r.choice(DETAILS)}"
+
+    def tweet_bullet(self) -> str:
+        r = self.rng
+        sources = "; ".join(
+            f"[{r.choice(HANDLES)}]({self.url('tweet')})" for _ in range(r.randint(1, 3))
+        )
+        extra = f" @{r.choice(HANDLES)}" if r.random() < 0.4 else ""
+        tag = f" {r.choice(HASHTAGS)}" if r.random() < 0.2 else ""
+        return f"- **{r.choice(MODELS)} {r.choice(TOPICS)}**: {self.sentence()}{extra}{tag} ({sources})"
+
+    def reddit_bullet(self) -> str:
+        r = self.rng
+        return (
+            f"- **[{self.sentence()}]({self.url('reddit')})** (Activity: {r.randint(20, 2000)}): "
+            f"{self.sentence()}. Commenters compared it to {r.choice(MODELS)}."
+        )
+
+    def discord_bullet(self) -> str:
+        r = self.rng
+        link = f" ([link]({self.url('discord')}))" if r.random() < 0.7 else ""
+        return f"- **{r.choice(TOPICS).title()}**: {self.sentence()}; members debated {r.choice(TOPICS)}{link}"
+
+
+def _section(writer: _Writer, kind: str) -> str:
+    r = writer.rng
+    if kind == "twitter":
+        bullets = [writer.tweet_bullet() for _ in range(r.randint(3, 8))]
+        return f"## {r.choice(COMPANIES)} + {r.choice(TOPICS)}\n\n" + "\n".join(bullets)
+    if kind == "reddit":
+        bullets = [writer.reddit_bullet() for _ in range(r.randint(2, 6))]
+        return f"## {r.choice(SUBREDDITS)}\n\n" + "\n".join(bullets)
+    bullets = [writer.discord_bullet() for _ in range(r.randint(3, 8))]
+    return f"## {r.choice(SERVERS)}\n\n" + "\n".join(bullets)
+
+
+def generate_issue(size: int, seed: int = 0, headline: bool = True, discord_tail: float = 0.3) -> str:
+    """smol.ai 원문 형태의 합성 이슈 (약 size 바이트, 마지막 discord_tail 비율은 Discord 상세 섹션)"""
+    rng = random.Random(seed)
+    writer = _Writer(rng)
+
+    title = f"{rng.choice(COMPANIES)} {rng.choice(VERBS)} {rng.choice(MODELS)}" if headline else "not much happened today"
+    head = (
+        "---\n"
+        f'title: "{title}"\n'
+        "date: 2026-01-16T05:44:39.731046Z\n"
+        "description: >-\n"
+        f"  {writer.sentence()}\n"
+        "companies:\n" + "".join(f"  - {c.lower().replace(' ', '-')}\n" for c in rng.sample(COMPANIES, 4)) +
+        "---\n\n"
+        f"**{title}**\n\n>\n\n"
+        "AI News for 1/15/2026-1/16/2026. We checked 12 subreddits, 544 Twitters and 24 Discords "
+        "(205 channels, and 4966 messages) for you. Estimated reading time saved (at 200wpm): 430 minutes.\n\n"
+    )
+    if headline:
+        head += f"{writer.sentence()} ([announcement]({writer.url('web')})). {writer.sentence()}.\n\n"
+
+    body_budget = max(0, int(size * (1 - discord_tail)) - len(head.encode("utf-8")))
+    parts = [head]
+    recaps = [("# AI Twitter Recap", "twitter", 0.45), ("# AI Reddit Recap", "reddit", 0.25), ("# AI Discord Recap", "discord", 0.30)]
+    for heading, kind, share in recaps:
+        parts.append(f"---\n\n{heading}\n\n")
+        written = 0
+        while written < body_budget * share or written == 0:
+            section = _section(writer, kind) + "\n\n"
+            parts.append(section)
+            written += len(section.encode("utf-8"))
+
+    text = "".join(parts)
+    if discord_tail > 0:
+        tail = [f"---\n\n{DISCORD_MARKER}\n\n"]
+        written = len(text.encode("utf-8"))
+        while written < size:
+            section = _section(writer, "discord") + "\n\n"
+            tail.append(section)
+            written += len(section.encode("utf-8"))
+        text += "".join(tail)
+    return text
+
+
+@dataclass
+class Translation:
+    text: str
+    dropped: list[str]  # 빠뜨린 링크 URL (검증기가 찾아야 할 정답)
+
+
+def _fake_korean(text: str, rng: random.Random) -> str:
+    """링크/@username/#hashtag/activity/마크다운 기호는 유지하고 나머지 단어를 한국어 단어로 바꿉니다."""
+    def swap(word: str) -> str:
+        if not word or word[0] in "@#[(*-!>);:" or "](" in word or "activity" in word.lower() or any(ch.isdigit() for ch in word):
+            return word
+        return rng.choice(KO_WORDS)
+
+    out = []
+    for line in text.split("\n"):
+        if line.startswith("#") or not line.strip():
+            out.append(line)
+            continue
+        # 링크는 통째로 보존하고 링크 밖의 단어만 치환
+        pieces = []
+        last = 0
+        for match in LINK_RE.finditer(line):
+            pieces.append(" ".join(swap(w) for w in line[last:match.start()].split(" ")))
+            pieces.append(match.group(0))
+            last = match.end()
+        pieces.append(" ".join(swap(w) for w in line[last:].split(" ")))
+        out.append("".join(pieces))
+    return "\n".join(out)
+
+
+def generate_translation(content: str, seed: int = 0, drop_rate: float = 0.0) -> Translation:
+    """process_markdown을 거친 원문에서 최종 번역본 형태(frontmatter + 본문)를 만듭니다.
+
+    drop_rate 비율의 링크는 '[텍스트](URL)' 대신 '텍스트'만 남겨 누락시킵니다.
+    """
+    rng = random.Random(seed + 1)
+    dropped: list[str] = []
+
+    def drop(match: re.Match) -> str:
+        if rng.random() < drop_rate:
+            dropped.append(match.group(2))
+            return match.group(1)
+        return match.group(0)
+
+    body = LINK_RE.sub(drop, content)
+    body = _fake_korean(body, rng)
+    frontmatter = (
+        "---\n"
+        'title: "합성 이슈: 주요 AI 모델 출시와 커뮤니티 반응 정리"\n'
+        "summary:\n" + "".join(f'  - "{rng.choice(KO_WORDS)} 관련 합성 요약 문장 {i} 번째 항목입니다"\n' for i in range(1, 6)) +
+        "date: 2026-01-16\n"
+        'originalUrl: "https://news.smol.ai/issues/26-01-16-synthetic/"\n'
+        "hasHeadline: true\n"
+        'headline: "합성 이슈: 주요 AI 모델 출시와 커뮤니티 반응 정리"\n'
+        "---\n\n"
+    )
+    return Translation(frontmatter + body + "\n", dropped)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시드 고정 합성 smol.ai 이슈 생성")
+    parser.add_argument("--size", type=parse_size, default=parse_size("100K"), help="원문 크기 (예: 10K, 2M)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--no-headline", action="store_true", help="헤드라인 없는 날 (not much happened)")
+    parser.add_argument("--discord-tail", type=float, default=0.3, help="Discord 상세 섹션 비율 (0 = 없음)")
+    parser.add_argument("-o", "--output", type=Path, help="원문 출력 파일 (없으면 stdout)")
+    parser.add_argument("--translated", type=Path, help="번역본 출력 파일")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="번역본에서 뺄 링크 비율")
+    args = parser.parse_args()
+
+    issue = generate_issue(args.size, args.seed, not args.no_headline, args.discord_tail)
+    if args.output:
+        args.output.write_text(issue, encoding="utf-8")
+    else:
+        sys.stdout.write(issue)
+
+    if args.translated:
+        sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+        from crawler.fetch_page import process_markdown
+
+        content, _, links = process_markdown(issue)
+        translation = generate_translation(content, args.seed, args.drop_rate)
+        args.translated.write_text(translation.text, encoding="utf-8")
+        print(
+            f"{len(issue.encode('utf-8'))} bytes, {len(links)} links kept after cut, "
+            f"{len(translation.dropped)} dropped in translation",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
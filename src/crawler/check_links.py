@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+check_links.py - 외부 링크 생존 확인
+원문의 고유 링크를 HEAD(필요하면 GET)로 동시에 확인하고 결과를 TTL 캐시에 저장합니다.
+며칠 동안 반복해서 나오는 링크는 캐시로 처리하므로 새 링크만 요청합니다.
+
+- 동시 요청 수: LINKCHECK_MAX_PARALLEL (전체), LINKCHECK_PER_HOST (호스트별)
+- 같은 호스트의 요청 시작 간격: LINKCHECK_HOST_INTERVAL초 이상
+- 결과: ok | redirected | broken | blocked (봇 차단/속도 제한, 경고하지 않음) | skipped | unchecked (오프라인, 속도 제한 예산 소진, 브레이커 열림: 캐시하지 않음)
+- 캐시 TTL: 정상 결과 LINKCHECK_TTL_HOURS, 실패 결과 LINKCHECK_RETRY_HOURS (일시 장애일 수 있음)
+
+깨진 링크와 다른 호스트로 옮겨진 링크는 --warnings 파일에 한 줄씩 요약해 PR 본문 경고로 남깁니다.
+"""
+
+import os
+import sys
+import re
+import json
+import time
+import fcntl
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.client import HTTPException
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.cassette import CassetteMiss  # noqa: E402
+from lib.profiling import add_profile_argument  # noqa: E402
+from lib.ratelimit import RateLimited, urlopen  # noqa: E402
+from lib.resilience import CircuitOpenError  # noqa: E402
+
+LINKCHECK_DIR = Path(os.environ.get("LINKCHECK_DIR") or PROJECT_ROOT / "data" / "linkcheck")
+CACHE_FILE = LINKCHECK_DIR / "cache.json"
+LOCK_FILE = LINKCHECK_DIR / "cache.lock"
+
+MAX_PARALLEL = int(os.environ.get("LINKCHECK_MAX_PARALLEL", 32))
+PER_HOST = int(os.environ.get("LINKCHECK_PER_HOST", 4))
+HOST_INTERVAL = float(os.environ.get("LINKCHECK_HOST_INTERVAL", 0.1))
+TIMEOUT = float(os.environ.get("LINKCHECK_TIMEOUT", 10))
+TTL_HOURS = float(os.environ.get("LINKCHECK_TTL_HOURS", 168))
+RETRY_HOURS = float(os.environ.get("LINKCHECK_RETRY_HOURS", 12))
+# 로그인/JS 앱이라 응답 코드로 생존을 판단할 수 없는 호스트 (공백 구분)
+SKIP_HOSTS = set(os.environ.get("LINKCHECK_SKIP_HOSTS", "x.com twitter.com").split())
+
+# fetch_page.process_markdown과 같은 링크 패턴
+LINK_RE = re.compile(r"\[[^\]]*?\]\(([^)]+)\)")
+
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; smol-ai-news-automation/1.0; link checker)",
+    "Accept": "*/*",
+}
+
+# HEAD를 지원하지 않거나 HEAD만 막는 서버는 GET(첫 바이트만)으로 다시 확인
+HEAD_FALLBACK_CODES = {400, 403, 404, 405, 501}
+# 봇 차단/속도 제한: 링크가 죽었다고 볼 수 없음
+BLOCKED_CODES = {401, 403, 429, 999}
+
+# 이 수 이상 확인했는데 모두 연결 오류면 오프라인으로 판단
+OFFLINE_MIN_LINKS = 5
+# 경고에 나열할 최대 링크 수
+MAX_LISTED = 10
+
+OK = "ok"
+REDIRECTED = "redirected"
+BROKEN = "broken"
+BLOCKED = "blocked"
+SKIPPED = "skipped"
+UNCHECKED = "unchecked"
+
+
+# ============================================
+# 캐시
+# ============================================
+
+@contextmanager
+def cache_lock():
+    """캐시 파일 배타 잠금 (동시에 실행된 파이프라인이 결과를 덮어쓰지 않도록)"""
+    LINKCHECK_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def load_cache() -> dict:
+    if not CACHE_FILE.exists():
+        return {}
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+
+def _ttl(entry: dict) -> float:
+    hours = TTL_HOURS if entry["status"] in (OK, REDIRECTED) else RETRY_HOURS
+    return hours * 3600
+
+
+def is_fresh(entry: dict, now: float) -> bool:
+    return now - entry.get("checked_at", 0) < _ttl(entry)
+
+
+def save_results(results: list[dict]) -> int:
+    """새로 확인한 결과를 캐시에 합치고 만료된 항목을 정리합니다. 정리한 항목 수를 반환합니다."""
+    now = time.time()
+    with cache_lock():
+        cache = load_cache()
+        for entry in results:
+            cache[entry["url"]] = {k: v for k, v in entry.items() if k != "url"}
+        before = len(cache)
+        cache = {url: entry for url, entry in cache.items() if is_fresh(entry, now)}
+        tmp = CACHE_FILE.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(CACHE_FILE)
+    return before - len(cache)
+
+
+# ============================================
+# 링크 확인
+# ============================================
+
+def extract_links(markdown: str) -> list[str]:
+    """마크다운의 http(s) 링크를 처음 나온 순서대로 중복 없이 반환합니다."""
+    seen = {}
+    for raw in LINK_RE.findall(markdown):
+        url = raw.strip().split()[0] if raw.strip() else ""
+        if url.startswith(("http://", "https://")):
+            seen.setdefault(url, None)
+    return list(seen)
+
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def _skipped(host: str) -> bool:
+    host = host.split(":")[0]
+    return any(host == skip or host.endswith("." + skip) for skip in SKIP_HOSTS)
+
+
+def _normalized(url: str) -> str:
+    """http→https, www., 끝 슬래시 차이만 있는 리디렉션은 같은 링크로 봅니다."""
+    parts = urlsplit(url)
+    host = parts.netloc.lower().removeprefix("www.")
+    return f"{host}{parts.path.rstrip('/')}?{parts.query}"
+
+
+class HostGate:
+    """호스트별 동시 요청 수와 요청 시작 간격 제한"""
+
+    def __init__(self, per_host: int, interval: float):
+        self.per_host = per_host
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.semaphores: dict[str, threading.Semaphore] = {}
+        self.next_at: dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, host: str):
+        """호스트별 동시 요청 수 제한"""
+        with self.lock:
+            semaphore = self.semaphores.setdefault(host, threading.Semaphore(self.per_host))
+        with semaphore:
+            yield
+
+    def pace(self, host: str):
+        """같은 호스트에 마지막으로 요청을 시작한 뒤 interval초가 지날 때까지 대기"""
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_at.get(host, 0.0))
+            self.next_at[host] = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _request(url: str, method: str, timeout: float) -> tuple[int, str]:
+    headers = dict(REQUEST_HEADERS)
+    if method == "GET":
+        headers["Range"] = "bytes=0-0"
+    request = Request(url, headers=headers, method=method)
+    with urlopen(request, timeout=timeout, priority="low") as response:
+        return response.status, response.geturl()
+
+
+def check_url(url: str, timeout: float = TIMEOUT, pace: Optional[Callable[[], None]] = None) -> dict:
+    """링크 하나를 확인합니다 (HEAD → 필요하면 GET, 요청마다 pace()로 간격 조절)."""
+    entry = {"url": url, "status": UNCHECKED, "code": None, "final_url": None, "error": None}
+    for method in ("HEAD", "GET"):
+        if pace:
+            pace()
+        try:
+            code, final_url = _request(url, method, timeout)
+            entry.update(code=code, final_url=final_url, error=None)
+            break
+        except HTTPError as e:
+            entry.update(code=e.code, final_url=e.geturl() or url, error=f"HTTP {e.code}")
+            if e.code not in HEAD_FALLBACK_CODES:
+                break
+        except CassetteMiss:
+            # 재생 모드에서 기록되지 않은 링크는 확인하지 않음 (캐시에도 남기지 않음)
+            entry["error"] = "not in cassette"
+            return entry
+        except (RateLimited, CircuitOpenError) as e:
+            # 속도 제한 예산 소진/브레이커 열림은 링크 상태가 아님 (URLError보다 먼저, 캐시에도 남기지 않음)
+            entry.update(code=None, error=str(e.reason)[:200])
+            return entry
+        except HTTPException as e:
+            # HEAD에 응답 없이 연결을 끊는 서버가 있어 GET으로 한 번 더 확인
+            entry.update(code=None, error=str(e)[:200] or type(e).__name__)
+        except (URLError, OSError, ValueError) as e:
+            # DNS 실패, 연결 거부, 시간 초과는 GET으로 바꿔도 같음
+            reason = getattr(e, "reason", e)
+            entry.update(code=None, error=str(reason)[:200] or type(e).__name__)
+            break
+
+    code = entry["code"]
+    if code is None:
+        entry["status"] = BROKEN
+    elif code in BLOCKED_CODES:
+        entry["status"] = BLOCKED
+    elif code >= 400:
+        entry["status"] = BROKEN
+    elif _normalized(entry["final_url"]) != _normalized(url):
+        entry["status"] = REDIRECTED
+    else:
+        entry["status"] = OK
+    entry["checked_at"] = time.time()
+    return entry
+
+
+def _interleave_by_host(urls: list[str]) -> list[str]:
+    """같은 호스트가 연달아 나오지 않도록 섞어 호스트 제한에 걸린 작업자가 다른 호스트를 막지 않게 합니다."""
+    buckets: dict[str, list[str]] = {}
+    for url in urls:
+        buckets.setdefault(host_of(url), []).append(url)
+    queues = sorted(buckets.values(), key=len, reverse=True)
+    ordered = []
+    for i in range(len(queues[0]) if queues else 0):
+        ordered.extend(queue[i] for queue in queues if i < len(queue))
+    return ordered
+
+
+def check_links(
+    urls: list[str],
+    max_parallel: int = MAX_PARALLEL,
+    per_host: int = PER_HOST,
+    host_interval: float = HOST_INTERVAL,
+    timeout: float = TIMEOUT,
+    use_cache: bool = True,
+) -> dict:
+    """고유 링크를 캐시 → 동시 요청 순으로 확인하고 결과와 통계를 반환합니다."""
+    start = time.perf_counter()
+    now = time.time()
+    unique = list(dict.fromkeys(urls))
+    cache = load_cache() if use_cache else {}
+
+    results: dict[str, dict] = {}
+    pending = []
+    for url in unique:
+        cached = cache.get(url)
+        if _skipped(host_of(url)):
+            results[url] = {"url": url, "status": SKIPPED, "code": None, "final_url": None, "error": None}
+        elif cached and is_fresh(cached, now):
+            results[url] = {"url": url, **cached, "cached": True}
+        else:
+            pending.append(url)
+
+    gate = HostGate(per_host, host_interval)
+
+    def run(url: str) -> dict:
+        host = host_of(url)
+        with gate.slot(host):
+            return check_url(url, timeout, pace=lambda: gate.pace(host))
+
+    checked = []
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, max_parallel)) as executor:
+            checked = list(executor.map(run, _interleave_by_host(pending)))
+    # 응답을 하나도 받지 못했으면 링크가 아니라 점검하는 쪽의 네트워크 문제로 봄 (경고/캐시하지 않음)
+    if len(checked) >= OFFLINE_MIN_LINKS and all(entry["code"] is None for entry in checked):
+        for entry in checked:
+            entry["status"] = UNCHECKED
+    for entry in checked:
+        results[entry["url"]] = entry
+
+    fresh = [entry for entry in checked if entry["status"] != UNCHECKED]
+    pruned = save_results(fresh) if use_cache and fresh else 0
+
+    links = [results[url] for url in unique]
+    stats = {
+        "unique": len(unique),
+        "cached": sum(1 for entry in links if entry.get("cached")),
+        "checked": len(fresh),
+        "pruned": pruned,
+    }
+    for status in (OK, REDIRECTED, BROKEN, BLOCKED, SKIPPED, UNCHECKED):
+        stats[status] = sum(1 for entry in links if entry["status"] == status)
+    stats["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return {"links": links, "stats": stats}
+
+
+# ============================================
+# 경고 요약
+# ============================================
+
+def moved_host(entry: dict) -> bool:
+    """다른 호스트로 옮겨진 리디렉션 (도메인 이전/주차 페이지 가능성)"""
+    if entry["status"] != REDIRECTED or not entry.get("final_url"):
+        return False
+    return host_of(entry["url"]).removeprefix("www.") != host_of(entry["final_url"]).removeprefix("www.")
+
+
+def format_warnings(report: dict) -> list[str]:
+    """pipeline_warnings.txt에 추가할 경고 줄"""
+    warnings = []
+    broken = [entry for entry in report["links"] if entry["status"] == BROKEN]
+    if broken:
+        listed = ", ".join(f"{e['url']} ({e['error'] or e['code']})" for e in broken[:MAX_LISTED])
+        more = f" 외 {len(broken) - MAX_LISTED}개" if len(broken) > MAX_LISTED else ""
+        warnings.append(f"깨진 링크 {len(broken)}개: {listed}{more}")
+    moved = [entry for entry in report["links"] if moved_host(entry)]
+    if moved:
+        listed = ", ".join(f"{e['url']} → {e['final_url']}" for e in moved[:MAX_LISTED])
+        more = f" 외 {len(moved) - MAX_LISTED}개" if len(moved) > MAX_LISTED else ""
+        warnings.append(f"다른 호스트로 리디렉션된 링크 {len(moved)}개: {listed}{more}")
+    return warnings
+
+
+def format_summary(report: dict) -> str:
+    stats = report["stats"]
+    lines = [
+        f"Links: {stats['unique']} unique ({stats['cached']} cached, {stats['checked']} checked, "
+        f"{stats['skipped']} skipped) in {stats['elapsed_ms'] / 1000:.1f}s",
+        f"  ok {stats['ok']}, redirected {stats['redirected']}, broken {stats['broken']}, "
+        f"blocked {stats['blocked']}, unchecked {stats['unchecked']}",
+    ]
+    for entry in report["links"]:
+        if entry["status"] == BROKEN:
+            lines.append(f"  ✗ {entry['url']} ({entry['error'] or entry['code']})")
+        elif moved_host(entry):
+            lines.append(f"  → {entry['url']} → {entry['final_url']}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원문 외부 링크 생존 확인")
+    add_profile_argument(parser)
+    parser.add_argument("source", nargs="?", type=Path, help="마크다운 파일 (없으면 --url 사용)")
+    parser.add_argument("--url", action="append", default=[], help="확인할 링크 (반복 가능)")
+    parser.add_argument("-o", "--output", type=Path, help="전체 결과 JSON 저장 경로")
+    parser.add_argument("--warnings", type=Path, help="경고 줄을 쓸 파일 (깨진/이전된 링크가 없으면 빈 파일)")
+    parser.add_argument("--no-cache", action="store_true", help="캐시를 읽거나 쓰지 않음")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    urls = list(args.url)
+    if args.source:
+        urls += extract_links(args.source.read_text(encoding="utf-8"))
+    if not urls:
+        parser.error("source 또는 --url이 필요합니다")
+
+    report = check_links(urls, use_cache=not args.no_cache)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.warnings:
+        warnings = format_warnings(report)
+        args.warnings.write_text("".join(f"{line}\n" for line in warnings), encoding="utf-8")
+
+    if args.json:
+        print(json.dumps(report["stats"] if args.output else report, indent=2, ensure_ascii=False))
+    else:
+        print(format_summary(report))
+
+
+if __name__ == "__main__":
+    from lib.profiling import run_main
+    run_main("check_links", main)
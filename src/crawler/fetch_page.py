@@ -6,13 +6,17 @@ GitHub 레포지토리에서 마크다운 파일을 가져와 처리합니다.
 기존 smol.ai HTML 크롤링에서 GitHub raw 마크다운 직접 가져오기로 변경되었습니다.
 """
 
+import os
 import sys
 import re
 import json
+import time
+import codecs
 import argparse
 from pathlib import Path
-from urllib.request import urlopen, Request
+from urllib.request import Request
 from urllib.error import URLError, HTTPError
+from http.client import IncompleteRead
 from typing import Optional
 from datetime import datetime
 
@@ -20,22 +24,53 @@ from datetime import datetime
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
+from lib.profiling import add_profile_argument  # noqa: E402
+from lib.ratelimit import PRIORITIES, urlopen  # noqa: E402
+from lib.resilience import read_url, run_with_retry  # noqa: E402
+
 # 검증 기준
 MIN_CONTENT_LENGTH = 1000  # 최소 콘텐츠 길이 (문자)
 MIN_LINK_COUNT = 5  # 최소 링크 개수
 
+# 이 줄 이후의 Discord 상세 섹션(사이트용)은 사용하지 않음
+CUT_MARKER_RE = re.compile(r"^# Discord: High level Discord summaries\s*$", re.MULTILINE)
+HEADING_RE = re.compile(r"^#{1,6}\s")
+
+# 스트리밍 읽기 단위 (바이트)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+REQUEST_HEADERS = {
+    "User-Agent": "smol-ai-news-automation/1.0",
+    "Accept": "text/plain",
+}
+
 
 def fetch_raw_markdown(url: str) -> str:
-    """GitHub raw URL에서 마크다운 파일을 가져옵니다."""
-    headers = {
-        "User-Agent": "smol-ai-news-automation/1.0",
-        "Accept": "text/plain",
-    }
-    request = Request(url, headers=headers)
+    """GitHub raw URL에서 마크다운 파일 전체를 가져옵니다 (일시적 오류는 재시도)."""
+    request = Request(url, headers=REQUEST_HEADERS)
+
+    try:
+        return read_url(request, timeout=60).decode("utf-8")
+    except HTTPError as e:
+        print(f"HTTP Error: {e.code} - {e.reason}", file=sys.stderr)
+        sys.exit(1)
+    except URLError as e:
+        print(f"URL Error: {e.reason}", file=sys.stderr)
+        sys.exit(1)
+
 
+def stream_raw_markdown(url: str, stop_marker: re.Pattern = CUT_MARKER_RE) -> tuple[str, dict]:
+    """마크다운을 스트리밍으로 가져오다가 stop_marker 줄이 나오면 연결을 닫습니다.
+
+    응답을 청크 단위로 읽어 점진적으로 디코딩하고 줄 단위로 마커를 확인하므로,
+    잘라낼 꼬리 부분(대부분의 Discord 상세 섹션)은 내려받지도 메모리에 올리지도 않습니다.
+    읽는 도중 연결이 끊기면 처음부터 다시 받습니다 (재시도 정책).
+
+    Returns:
+        (마커 이전까지의 원문, {"bytes_read", "truncated", "first_section_ms", "elapsed_ms"})
+    """
     try:
-        with urlopen(request, timeout=60) as response:
-            return response.read().decode("utf-8")
+        return run_with_retry(url, lambda: _stream_once(url, stop_marker))
     except HTTPError as e:
         print(f"HTTP Error: {e.code} - {e.reason}", file=sys.stderr)
         sys.exit(1)
@@ -44,6 +79,50 @@ def fetch_raw_markdown(url: str) -> str:
         sys.exit(1)
 
 
+def _stream_once(url: str, stop_marker: re.Pattern) -> tuple[str, dict]:
+    """stream_raw_markdown의 한 번의 시도"""
+    request = Request(url, headers=REQUEST_HEADERS)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    kept: list[str] = []
+    pending = ""
+    bytes_read = 0
+    truncated = False
+    first_section_ms = None
+    start = time.perf_counter()
+
+    with urlopen(request, timeout=60) as response:
+        while not truncated:
+            chunk = response.read(STREAM_CHUNK_SIZE)
+            bytes_read += len(chunk)
+            pending += decoder.decode(chunk, final=not chunk)
+
+            lines = pending.split("\n")
+            # 마지막 조각은 아직 줄이 끝나지 않았을 수 있으므로 다음 청크까지 보류
+            pending = lines.pop() if chunk else ""
+            for line in lines:
+                if stop_marker.match(line):
+                    truncated = True
+                    break
+                if first_section_ms is None and HEADING_RE.match(line):
+                    first_section_ms = (time.perf_counter() - start) * 1000
+                kept.append(line)
+
+            if not chunk:
+                # read(n)는 Content-Length보다 일찍 끊겨도 예외 없이 b""를 반환하므로 직접 확인
+                remaining = getattr(response, "length", None)
+                if remaining:
+                    raise IncompleteRead(b"", remaining)
+                break
+
+    stats = {
+        "bytes_read": bytes_read,
+        "truncated": truncated,
+        "first_section_ms": round(first_section_ms, 1) if first_section_ms is not None else None,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+    return "\n".join(kept) + ("\n" if truncated else ""), stats
+
+
 def strip_frontmatter(raw_content: str) -> tuple[str, dict]:
     """YAML frontmatter를 분리하여 본문과 메타데이터를 반환합니다.
 
@@ -98,12 +177,7 @@ def process_markdown(raw_content: str) -> tuple[str, str, list[str]]:
     content = content.strip()
 
     # 너무 긴 Discord 상세 섹션(사이트용)을 잘라내고 핵심 뉴스레터만 유지
-    content = re.split(
-        r"^# Discord: High level Discord summaries\s*$",
-        content,
-        maxsplit=1,
-        flags=re.MULTILINE,
-    )[0].rstrip()
+    content = CUT_MARKER_RE.split(content, maxsplit=1)[0].rstrip()
     # 다음 섹션을 위해 붙은 마지막 구분선이 남아있으면 제거
     content = re.sub(r"(\n---\s*)+\Z", "\n", content).strip()
 
@@ -193,13 +267,34 @@ def validate_content(content: str, links: list[str], url: str) -> dict:
     }
 
 
-def fetch_and_convert(url: str, output_path: Optional[Path] = None) -> dict:
+def fetch_and_convert(
+    url: str,
+    output_path: Optional[Path] = None,
+    full: bool = False,
+    raw_output: Optional[Path] = None,
+) -> dict:
     """URL에서 마크다운을 가져와 처리합니다.
 
+    기본은 Discord 상세 섹션 마커에서 다운로드를 멈추는 스트리밍 경로입니다.
+    full=True 또는 raw_output 지정 시 원문 전체를 내려받습니다 (원문 보관용).
+
     Returns:
         메타데이터와 콘텐츠를 포함한 딕셔너리
     """
-    raw_content = fetch_raw_markdown(url)
+    if full or raw_output:
+        start = time.perf_counter()
+        raw_content = fetch_raw_markdown(url)
+        fetch_stats = {
+            "bytes_read": len(raw_content.encode("utf-8")),
+            "truncated": False,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+        if raw_output:
+            raw_output.parent.mkdir(parents=True, exist_ok=True)
+            raw_output.write_text(raw_content, encoding="utf-8")
+    else:
+        raw_content, fetch_stats = stream_raw_markdown(url)
+
     content, title, links = process_markdown(raw_content)
     url_metadata = extract_metadata_from_url(url)
 
@@ -217,6 +312,7 @@ def fetch_and_convert(url: str, output_path: Optional[Path] = None) -> dict:
         "content": content,
         "links": links,
         "validation": validation,
+        "fetch": fetch_stats,
     }
 
     if output_path:
@@ -231,6 +327,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="GitHub 마크다운 파일을 가져와 처리합니다."
     )
+    add_profile_argument(parser)
     parser.add_argument(
         "url",
         help="GitHub raw 마크다운 URL"
@@ -250,10 +347,33 @@ def main():
         action="store_true",
         help="검증만 수행"
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Discord 상세 섹션까지 원문 전체를 내려받기 (기본: 마커에서 중단)"
+    )
+    parser.add_argument(
+        "--raw-output",
+        type=Path,
+        help="원문 전체를 보관할 경로 (--full 포함)"
+    )
+    parser.add_argument(
+        "--priority",
+        choices=PRIORITIES,
+        help="GitHub 속도 제한 예산 우선순위 (default: GITHUB_PRIORITY 또는 normal, 백필은 low)"
+    )
 
     args = parser.parse_args()
 
-    result = fetch_and_convert(args.url, args.output if not args.validate_only else None)
+    if args.priority:
+        os.environ["GITHUB_PRIORITY"] = args.priority
+
+    result = fetch_and_convert(
+        args.url,
+        args.output if not args.validate_only else None,
+        full=args.full,
+        raw_output=args.raw_output,
+    )
 
     # 검증 결과 출력
     validation = result["validation"]
@@ -296,4 +416,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    from lib.profiling import run_main
+    run_main("fetch_page", main)
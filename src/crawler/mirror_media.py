@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+mirror_media.py - 이미지/미디어 미러링
+원문이 핫링크하는 이미지와 동영상을 동시에 내려받아 내용 해시(SHA-256) 기준으로 한 번만 저장하고,
+최종 마크다운의 링크를 web 레포에 함께 발행되는 미러 경로로 바꿉니다.
+
+- fetch: 원문의 미디어 링크를 내려받아 저장소(MEDIA_DIR/objects/<해시 앞 2자>/<해시><확장자>)에 넣고 보고서 작성
+  이미 받은 URL은 다시 받지 않고, 다른 URL이라도 내용이 같으면 같은 객체를 가리킴
+- rewrite: 보고서를 기준으로 final.md의 미디어 링크를 MEDIA_URL_PREFIX 경로로 바꾸고
+  발행할 파일 목록(media_files.json: web 레포 경로 → 로컬 객체)을 작업 디렉토리에 저장
+- files: 작업 디렉토리들의 media_files.json을 git_publish --file 형식(repo/path=local/path)으로 출력
+- restore: rewrite의 반대. 게시된 final.md의 미러 경로를 원문 URL로 되돌림
+  (--sync에서 원문 구간과 번역 구간을 URL로 대응시키기 전에, URL 색인 기준)
+
+크기 제한(MEDIA_MAX_BYTES, 이슈당 MEDIA_MAX_TOTAL_BYTES)을 넘거나 허용되지 않은 형식(SVG 등)이면
+원래 링크를 그대로 둡니다.
+"""
+
+import os
+import sys
+import re
+import json
+import time
+import fcntl
+import hashlib
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.error import URLError, HTTPError
+from urllib.request import Request
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from crawler.check_links import HostGate, host_of  # noqa: E402
+from lib.profiling import add_profile_argument  # noqa: E402
+from lib.ratelimit import urlopen  # noqa: E402
+from lib.resilience import run_with_retry  # noqa: E402
+
+MEDIA_DIR = Path(os.environ.get("MEDIA_DIR") or PROJECT_ROOT / "data" / "media")
+OBJECTS_DIR = MEDIA_DIR / "objects"
+INDEX_FILE = MEDIA_DIR / "index.json"
+LOCK_FILE = MEDIA_DIR / "index.lock"
+
+# web 레포 안의 저장 경로와 사이트에서의 URL 경로
+WEB_PATH = os.environ.get("MEDIA_WEB_PATH", "public/ainews/media").strip("/")
+URL_PREFIX = os.environ.get("MEDIA_URL_PREFIX", "/ainews/media").rstrip("/")
+
+MAX_BYTES = int(os.environ.get("MEDIA_MAX_BYTES", 10 * 1024 * 1024))
+MAX_TOTAL_BYTES = int(os.environ.get("MEDIA_MAX_TOTAL_BYTES", 100 * 1024 * 1024))
+MAX_PARALLEL = int(os.environ.get("MEDIA_MAX_PARALLEL", 8))
+PER_HOST = int(os.environ.get("MEDIA_PER_HOST", 4))
+TIMEOUT = float(os.environ.get("MEDIA_TIMEOUT", 30))
+
+CHUNK_SIZE = 64 * 1024
+
+# ![alt](url "title") 과 <img|video|source src="url">
+IMAGE_RE = re.compile(r"(!\[[^\]]*\]\(\s*<?)(https?://[^\s)>]+)")
+TAG_SRC_RE = re.compile(r"""(<(?:img|video|source)\b[^>]*?\bsrc=["'])(https?://[^"']+)""", re.IGNORECASE)
+
+# rewrite가 넣은 미러 경로 (restore용, 마크다운 이미지와 태그 src를 한 정규식으로 위치 순서대로)
+MIRROR_RE = re.compile(
+    r"""(!\[[^\]]*\]\(\s*<?|<(?:img|video|source)\b[^>]*?\bsrc=["'])(""" + re.escape(URL_PREFIX) + r"""/[^\s)>"']+)""",
+    re.IGNORECASE,
+)
+
+# 미러링할 형식 (SVG는 스크립트를 담을 수 있어 사이트 도메인에서 제공하지 않음)
+EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/avif": ".avif",
+    "video/mp4": ".mp4",
+    "video/webm": ".webm",
+}
+
+REQUEST_HEADERS = {
+    "User-Agent": "smol-ai-news-automation/1.0",
+    "Accept": ", ".join(EXTENSIONS) + ";q=0.9, */*;q=0.1",
+}
+
+MIRRORED = "mirrored"   # 새로 내려받음
+CACHED = "cached"       # 이전 실행에서 받은 URL
+FAILED = "failed"
+SKIPPED = "skipped"     # 이슈 전체 크기 제한 초과
+
+
+class MediaError(Exception):
+    """미러링할 수 없는 미디어 (원래 링크 유지)"""
+
+
+class BudgetExceeded(MediaError):
+    """이슈 미디어 예산(MEDIA_MAX_TOTAL_BYTES) 초과로 받지 않음"""
+
+
+# ============================================
+# 객체 저장소
+# ============================================
+
+@contextmanager
+def index_lock():
+    """URL 색인 배타 잠금 (동시에 실행된 파이프라인이 색인을 덮어쓰지 않도록)"""
+    MEDIA_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def load_index() -> dict:
+    if not INDEX_FILE.exists():
+        return {}
+    try:
+        return json.loads(INDEX_FILE.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+
+def object_name(sha256: str, ext: str) -> str:
+    return f"{sha256[:2]}/{sha256}{ext}"
+
+
+def object_path(sha256: str, ext: str) -> Path:
+    return OBJECTS_DIR / object_name(sha256, ext)
+
+
+def _extension(content_type: str) -> str:
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type not in EXTENSIONS:
+        raise MediaError(f"unsupported type: {media_type or 'unknown'}")
+    return EXTENSIONS[media_type]
+
+
+def _download_once(
+    url: str, max_bytes: int, timeout: float, reserve: Optional[Callable[[int], None]] = None
+) -> dict:
+    """응답을 임시 파일로 받으며 해시를 계산하고, 같은 내용의 객체가 없을 때만 저장소로 옮깁니다.
+
+    reserve가 있으면 본문을 읽기 전에 예상 크기(Content-Length, 없으면 max_bytes)로 호출합니다.
+    """
+    request = Request(url, headers=REQUEST_HEADERS)
+    OBJECTS_DIR.mkdir(parents=True, exist_ok=True)
+    with urlopen(request, timeout=timeout, priority="low") as response:
+        ext = _extension(response.headers.get("Content-Type", ""))
+        declared = int(response.headers.get("Content-Length") or 0)
+        if declared > max_bytes:
+            raise MediaError(f"too large: {declared} bytes")
+        if reserve:
+            reserve(declared or max_bytes)
+
+        digest = hashlib.sha256()
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=OBJECTS_DIR, prefix=".tmp-", delete=False) as tmp:
+            try:
+                while chunk := response.read(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise MediaError(f"too large: over {max_bytes} bytes")
+                    digest.update(chunk)
+                    tmp.write(chunk)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+
+    sha256 = digest.hexdigest()
+    target = object_path(sha256, ext)
+    stored = not target.exists()
+    if stored:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp.name, target)
+    else:
+        os.unlink(tmp.name)
+    return {"sha256": sha256, "ext": ext, "bytes": size, "stored": stored}
+
+
+def download(
+    url: str,
+    max_bytes: int = MAX_BYTES,
+    timeout: float = TIMEOUT,
+    reserve: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """미디어 하나를 내려받습니다 (일시적 오류는 재시도, 형식/크기 제한은 재시도하지 않음)."""
+    def once():
+        try:
+            return _download_once(url, max_bytes, timeout, reserve)
+        except MediaError as e:
+            # 정상 응답이므로 브레이커 실패로 세지 않도록 값으로 돌려받아 다시 발생
+            return e
+
+    result = run_with_retry(url, once)
+    if isinstance(result, MediaError):
+        raise result
+    return result
+
+
+# ============================================
+# 링크 추출/교체
+# ============================================
+
+def extract_media(markdown: str) -> list[str]:
+    """마크다운 이미지와 img/video/source 태그의 원격 URL을 처음 나온 순서대로 중복 없이 반환합니다."""
+    seen = {}
+    for pattern in (IMAGE_RE, TAG_SRC_RE):
+        for match in pattern.finditer(markdown):
+            seen.setdefault((match.start(2), match.group(2)), None)
+    return list(dict.fromkeys(url for _, url in sorted(seen)))
+
+
+def mirror_url(entry: dict) -> str:
+    return f"{URL_PREFIX}/{object_name(entry['sha256'], entry['ext'])}"
+
+
+def rewrite(markdown: str, mirrored: dict[str, dict]) -> tuple[str, dict[str, str]]:
+    """미러링된 URL을 사이트 경로로 바꿉니다. (새 마크다운, {web 레포 경로: 로컬 객체 경로})"""
+    files: dict[str, str] = {}
+
+    def replace(match: re.Match) -> str:
+        entry = mirrored.get(match.group(2))
+        if not entry:
+            return match.group(0)
+        name = object_name(entry["sha256"], entry["ext"])
+        files[f"{WEB_PATH}/{name}"] = str(OBJECTS_DIR / name)
+        return match.group(1) + mirror_url(entry)
+
+    for pattern in (IMAGE_RE, TAG_SRC_RE):
+        markdown = pattern.sub(replace, markdown)
+    return markdown, files
+
+
+def restore(markdown: str, source: str, index: dict) -> tuple[str, int]:
+    """rewrite의 반대: 미러 경로를 source(원문)의 URL로 되돌립니다. (새 마크다운, 되돌린 링크 수)
+
+    내용이 같은 URL이 여러 개면 같은 미러 경로가 되므로, 원문에 나온 순서대로 하나씩 대응시킵니다.
+    색인에 없거나 원문에 없는 미러 경로는 그대로 둡니다.
+    """
+    originals: dict[str, list[str]] = {}
+    occurrences = sorted(
+        (match.start(2), match.group(2)) for pattern in (IMAGE_RE, TAG_SRC_RE) for match in pattern.finditer(source)
+    )
+    for _, url in occurrences:
+        entry = index.get(url)
+        if entry:
+            originals.setdefault(mirror_url(entry), []).append(url)
+
+    used: dict[str, int] = {}
+    restored = 0
+
+    def replace(match: re.Match) -> str:
+        nonlocal restored
+        urls = originals.get(match.group(2))
+        if not urls:
+            return match.group(0)
+        n = used.get(match.group(2), 0)
+        used[match.group(2)] = n + 1
+        restored += 1
+        return match.group(1) + urls[min(n, len(urls) - 1)]
+
+    return MIRROR_RE.sub(replace, markdown), restored
+
+
+# ============================================
+# 동시 미러링
+# ============================================
+
+def fetch_media(
+    urls: list[str],
+    max_parallel: int = MAX_PARALLEL,
+    per_host: int = PER_HOST,
+    max_bytes: int = MAX_BYTES,
+    max_total_bytes: int = MAX_TOTAL_BYTES,
+    timeout: float = TIMEOUT,
+) -> dict:
+    """URL 색인 → 동시 다운로드 순으로 미디어를 저장소에 넣고 결과와 통계를 반환합니다."""
+    start = time.perf_counter()
+    unique = list(dict.fromkeys(urls))
+    index = load_index()
+
+    results: dict[str, dict] = {}
+    pending = []
+    for url in unique:
+        known = index.get(url)
+        if known and object_path(known["sha256"], known["ext"]).exists():
+            results[url] = {"url": url, "status": CACHED, **known}
+        else:
+            pending.append(url)
+
+    gate = HostGate(per_host, 0.0)
+
+    # 예산은 다운로드 시작 전에 예약하고 (병렬 작업자가 함께 통과해 초과하지 않도록)
+    # 끝나면 실제 크기로 정산, 실패하면 반환
+    budget_lock = threading.Lock()
+    budget = {"bytes": 0}
+    exceeded = f"issue media budget ({max_total_bytes} bytes) exceeded"
+
+    def run(url: str) -> dict:
+        held = {"bytes": 0}
+
+        def reserve(amount: int):
+            with budget_lock:
+                # 재시도하면 이전 시도의 예약을 새 예약으로 바꿈
+                budget["bytes"] -= held["bytes"]
+                held["bytes"] = 0
+                if budget["bytes"] >= max_total_bytes:
+                    raise BudgetExceeded(exceeded)
+                budget["bytes"] += amount
+                held["bytes"] = amount
+
+        with budget_lock:
+            if budget["bytes"] >= max_total_bytes:
+                return {"url": url, "status": SKIPPED, "error": exceeded}
+        entry = None
+        try:
+            with gate.slot(host_of(url)):
+                entry = download(url, max_bytes, timeout, reserve)
+        except BudgetExceeded as e:
+            return {"url": url, "status": SKIPPED, "error": str(e)}
+        except HTTPError as e:
+            return {"url": url, "status": FAILED, "error": f"HTTP {e.code}"}
+        except (MediaError, URLError, OSError, ValueError) as e:
+            return {"url": url, "status": FAILED, "error": str(getattr(e, "reason", e))[:200]}
+        finally:
+            with budget_lock:
+                budget["bytes"] += (entry["bytes"] if entry else 0) - held["bytes"]
+        return {"url": url, "status": MIRRORED, **entry}
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, max_parallel)) as executor:
+            for entry in executor.map(run, pending):
+                results[entry["url"]] = entry
+
+    fetched = [results[url] for url in pending if results[url]["status"] == MIRRORED]
+    if fetched:
+        now = datetime.now().isoformat(timespec="seconds")
+        with index_lock():
+            index = load_index()
+            for entry in fetched:
+                index[entry["url"]] = {
+                    "sha256": entry["sha256"], "ext": entry["ext"], "bytes": entry["bytes"], "fetched_at": now,
+                }
+            tmp = INDEX_FILE.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(index, indent=1, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(INDEX_FILE)
+
+    media = [results[url] for url in unique]
+    ok = [entry for entry in media if entry["status"] in (MIRRORED, CACHED)]
+    referenced = sum(entry["bytes"] for entry in ok)
+    # 같은 이슈 안에서 다른 URL이 같은 객체를 가리키면 한 번만 저장된 것으로 셈
+    stored_objects = {entry["sha256"]: entry["bytes"] for entry in fetched if entry["stored"]}
+    stored = sum(stored_objects.values())
+    stats = {
+        "found": len(unique),
+        "mirrored": sum(1 for entry in media if entry["status"] == MIRRORED),
+        "cached": sum(1 for entry in media if entry["status"] == CACHED),
+        "failed": sum(1 for entry in media if entry["status"] in (FAILED, SKIPPED)),
+        "objects": len({entry["sha256"] for entry in ok}),
+        "referenced_bytes": referenced,
+        "downloaded_bytes": sum(entry["bytes"] for entry in fetched),
+        "stored_bytes": stored,
+        "dedup_saved_bytes": referenced - stored,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+    return {"media": media, "stats": stats}
+
+
+def format_warnings(report: dict) -> list[str]:
+    """pipeline_warnings.txt에 추가할 경고 줄"""
+    failed = [entry for entry in report["media"] if entry["status"] in (FAILED, SKIPPED)]
+    if not failed:
+        return []
+    listed = ", ".join(f"{entry['url']} ({entry['error']})" for entry in failed[:10])
+    more = f" 외 {len(failed) - 10}개" if len(failed) > 10 else ""
+    return [f"미러링하지 못한 미디어 {len(failed)}개 (원본 링크 유지): {listed}{more}"]
+
+
+def format_summary(report: dict) -> str:
+    stats = report["stats"]
+    lines = [
+        f"Media: {stats['found']} found ({stats['mirrored']} downloaded, {stats['cached']} cached, "
+        f"{stats['failed']} failed) in {stats['elapsed_ms'] / 1000:.1f}s",
+        f"  {stats['objects']} objects, {stats['referenced_bytes']:,} bytes referenced, "
+        f"{stats['stored_bytes']:,} stored, {stats['dedup_saved_bytes']:,} saved by dedup",
+    ]
+    for entry in report["media"]:
+        if entry["status"] in (FAILED, SKIPPED):
+            lines.append(f"  ✗ {entry['url']} ({entry['error']})")
+    return "\n".join(lines)
+
+
+def load_media_files(work_dir: Path) -> dict[str, Path]:
+    """작업 디렉토리의 media_files.json (없으면 빈 매핑)"""
+    manifest = Path(work_dir) / "media_files.json"
+    if not manifest.exists():
+        return {}
+    return {repo_path: Path(local) for repo_path, local in json.loads(manifest.read_text(encoding="utf-8")).items()}
+
+
+# ============================================
+# CLI
+# ============================================
+
+def cmd_fetch(args) -> int:
+    urls = extract_media(args.source.read_text(encoding="utf-8"))
+    report = fetch_media(urls)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.warnings:
+        args.warnings.write_text("".join(f"{line}\n" for line in format_warnings(report)), encoding="utf-8")
+    if args.json:
+        print(json.dumps(report["stats"] if args.output else report, indent=2, ensure_ascii=False))
+    else:
+        print(format_summary(report))
+    return 0
+
+
+def cmd_rewrite(args) -> int:
+    report = json.loads(args.report.read_text(encoding="utf-8"))
+    mirrored = {
+        entry["url"]: entry
+        for entry in report["media"]
+        if entry["status"] in (MIRRORED, CACHED) and object_path(entry["sha256"], entry["ext"]).exists()
+    }
+    content, files = rewrite(args.final.read_text(encoding="utf-8"), mirrored)
+    args.final.write_text(content, encoding="utf-8")
+    files_out = args.files_out or args.final.parent / "media_files.json"
+    files_out.write_text(json.dumps(files, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Rewrote {len(files)} media link target(s) in {args.final}")
+    return 0
+
+
+def cmd_restore(args) -> int:
+    content, restored = restore(
+        args.final.read_text(encoding="utf-8"), args.source.read_text(encoding="utf-8"), load_index()
+    )
+    args.final.write_text(content, encoding="utf-8")
+    print(f"Restored {restored} media link(s) in {args.final}")
+    return 0
+
+
+def cmd_files(args) -> int:
+    """발행할 미디어 파일 (repo/path=local/path, 여러 언어가 같은 객체를 쓰면 한 번만)"""
+    files: dict[str, Path] = {}
+    for work_dir in args.work_dirs:
+        files.update(load_media_files(work_dir))
+    for repo_path, local in sorted(files.items()):
+        print(f"{repo_path}={local}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지/미디어 미러링")
+    add_profile_argument(parser)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    fetch_parser = subparsers.add_parser("fetch", help="원문의 미디어를 내려받아 저장소에 저장")
+    fetch_parser.add_argument("source", type=Path, help="원문 마크다운")
+    fetch_parser.add_argument("-o", "--output", type=Path, help="보고서 JSON 저장 경로")
+    fetch_parser.add_argument("--warnings", type=Path, help="경고 줄을 쓸 파일 (실패가 없으면 빈 파일)")
+    fetch_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    rewrite_parser = subparsers.add_parser("rewrite", help="final.md의 미디어 링크를 미러 경로로 교체")
+    rewrite_parser.add_argument("final", type=Path, help="최종 마크다운 (제자리 수정)")
+    rewrite_parser.add_argument("--report", type=Path, required=True, help="fetch 보고서 JSON")
+    rewrite_parser.add_argument("--files-out", type=Path, help="발행 파일 목록 (기본: final.md 옆 media_files.json)")
+
+    files_parser = subparsers.add_parser("files", help="발행할 미디어 파일 매핑 출력")
+    files_parser.add_argument("work_dirs", type=Path, nargs="+", help="media_files.json이 있는 작업 디렉토리")
+
+    restore_parser = subparsers.add_parser("restore", help="final.md의 미러 경로를 원문 URL로 되돌림")
+    restore_parser.add_argument("final", type=Path, help="게시된 마크다운 (제자리 수정)")
+    restore_parser.add_argument("--source", type=Path, required=True, help="그 번역의 원문 마크다운")
+
+    args = parser.parse_args()
+    handlers = {"fetch": cmd_fetch, "rewrite": cmd_rewrite, "files": cmd_files, "restore": cmd_restore}
+    sys.exit(handlers[args.command](args))
+
+
+if __name__ == "__main__":
+    from lib.profiling import run_main
+    run_main("mirror_media", main)
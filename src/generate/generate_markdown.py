@@ -14,6 +14,8 @@ from datetime import datetime
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
+from lib.profiling import add_profile_argument  # noqa: E402
+
 
 def _parse_yaml_simple(fm_content: str) -> dict:
     """간단한 YAML 파싱 (복잡한 중첩은 미지원)"""
@@ -167,6 +169,38 @@ def validate_links(original: str, translated: str) -> tuple[bool, list[str]]:
     return len(missing) == 0 and len(extra) == 0, issues
 
 
+def validate_final_markdown(path: Path) -> list[str]:
+    """최종 마크다운 파일을 검증합니다 (main.sh의 기존 셸 검증과 같은 기준).
+
+    Returns:
+        오류 메시지 목록 (비어 있으면 유효)
+    """
+    if not path.is_file():
+        return ["파일이 존재하지 않음"]
+
+    content = path.read_text(encoding="utf-8").rstrip("\n")
+    lines = content.split("\n")
+    errors = []
+
+    # Frontmatter 확인 (앞 5줄 안에 ---)
+    if not any(line.startswith("---") for line in lines[:5]):
+        errors.append("Frontmatter 없음")
+
+    # summary 필드 확인
+    if not re.search(r"^summary:", content, re.MULTILINE):
+        errors.append("summary 필드 없음")
+
+    # 최소 길이 확인
+    if len(lines) < 50:
+        errors.append(f"콘텐츠가 너무 짧음 ({len(lines)}줄)")
+
+    # 로컬 경로 참조 감지
+    if re.search(r"workspace/.*\.md|translated\.md|retranslated\.md", content):
+        errors.append("로컬 파일 경로 참조 감지")
+
+    return errors
+
+
 def assemble_final_markdown(
     translated_content: str,
     metadata: dict = None,
@@ -198,6 +232,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="번역된 콘텐츠를 최종 마크다운 파일로 조립합니다."
     )
+    add_profile_argument(parser)
     parser.add_argument(
         "translated_file",
         type=Path,
@@ -271,4 +306,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    from lib.profiling import run_main
+    run_main("generate_markdown", main)
@@ -14,6 +14,8 @@ from datetime import datetime
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
+from lib.profiling import add_profile_argument  # noqa: E402
+
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
     """마크다운에서 frontmatter를 파싱합니다."""
@@ -161,6 +163,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="번역된 콘텐츠에서 YouTube 영상용 템플릿을 생성합니다."
     )
+    add_profile_argument(parser)
     parser.add_argument(
         "input_file",
         type=Path,
@@ -221,4 +224,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    from lib.profiling import run_main
+    run_main("generate_youtube", main)
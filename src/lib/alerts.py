@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+alerts.py - 추가 전용(append-only) 알림 저장소
+알림을 JSONL 세그먼트에 추가만 하고, 고정 길이 오프셋 인덱스로 조회합니다.
+
+- data/alerts/segment-NNNNNN.jsonl: 알림/반복/확인 이벤트 (한 줄에 하나, 수정하지 않음)
+- data/alerts/index.bin: 알림 ID별 고정 길이 레코드 (세그먼트, 오프셋, 길이, 반복 횟수, 마지막 발생 시각, 확인 여부)
+- data/alerts/state.json: 미확인 개수, 중복 제거/속도 제한 윈도우 (작은 상태)
+
+같은 fingerprint(level + title + context)가 ALERT_DEDUP_WINDOW 안에 다시 발생하면
+새 알림을 만들지 않고 기존 알림의 반복 횟수만 올립니다.
+같은 제목의 새 알림이 ALERT_RATE_WINDOW 안에 ALERT_RATE_LIMIT개를 넘으면
+가장 최근 알림에 합산(suppressed)합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+import struct
+import hashlib
+import argparse
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+ALERTS_DIR = Path(os.environ.get("ALERTS_DIR") or PROJECT_ROOT / "data" / "alerts")
+INDEX_FILE = ALERTS_DIR / "index.bin"
+STATE_FILE = ALERTS_DIR / "state.json"
+LOCK_FILE = ALERTS_DIR / "alerts.lock"
+LEGACY_FILE = ALERTS_DIR.parent / "alerts.json"  # 이전 형식 (최초 1회 가져옴)
+
+SEGMENT_MAX_BYTES = int(os.environ.get("ALERT_SEGMENT_MAX_BYTES", 1024 * 1024))
+DEDUP_WINDOW = int(os.environ.get("ALERT_DEDUP_WINDOW", 3600))
+RATE_LIMIT = int(os.environ.get("ALERT_RATE_LIMIT", 10))
+RATE_WINDOW = int(os.environ.get("ALERT_RATE_WINDOW", 3600))
+
+# 인덱스 레코드: segment(u32) offset(u64) length(u32) count(u32) last_ts(u32) acked(u8)
+INDEX_RECORD = struct.Struct("<IQIIIB3x")
+
+LEVELS = ["info", "warning", "error", "critical"]
+
+
+@contextmanager
+def store_lock():
+    """저장소 전체 배타 잠금"""
+    ALERTS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def fingerprint(level: str, title: str, context: str = "") -> str:
+    """알림 fingerprint (같은 원인의 반복 알림을 묶는 키)"""
+    return hashlib.sha1(f"{level}\0{title}\0{context}".encode("utf-8")).hexdigest()[:16]
+
+
+def _segment_path(number: int) -> Path:
+    return ALERTS_DIR / f"segment-{number:06d}.jsonl"
+
+
+def _active_segment() -> int:
+    """현재 쓰기 세그먼트 번호 (가득 차면 다음 번호)"""
+    segments = sorted(ALERTS_DIR.glob("segment-*.jsonl"))
+    if not segments:
+        return 1
+    number = int(segments[-1].stem.split("-")[1])
+    if segments[-1].stat().st_size >= SEGMENT_MAX_BYTES:
+        number += 1
+    return number
+
+
+def _append_event(event: dict) -> tuple[int, int, int]:
+    """세그먼트에 이벤트를 추가하고 (세그먼트 번호, 오프셋, 길이)를 반환합니다."""
+    number = _active_segment()
+    data = (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+    with open(_segment_path(number), "ab") as f:
+        offset = f.tell()
+        f.write(data)
+    return number, offset, len(data)
+
+
+def _load_state() -> dict:
+    if not STATE_FILE.exists():
+        return {"unacked": 0, "fingerprints": {}, "rate": {}}
+    try:
+        return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {"unacked": 0, "fingerprints": {}, "rate": {}}
+
+
+def _save_state(state: dict):
+    tmp = STATE_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(STATE_FILE)
+
+
+def _prune_state(state: dict, now: int):
+    """윈도우가 지난 fingerprint/속도 제한 기록을 정리합니다."""
+    state["fingerprints"] = {
+        fp: entry for fp, entry in state["fingerprints"].items()
+        if now - entry["last_ts"] < DEDUP_WINDOW
+    }
+    rate = {}
+    for title, stamps in state["rate"].items():
+        recent = [ts for ts in stamps if now - ts < RATE_WINDOW]
+        if recent:
+            rate[title] = recent
+    state["rate"] = rate
+
+
+def alert_count() -> int:
+    """저장된 알림 수 (= 다음 알림 ID - 1)"""
+    if not INDEX_FILE.exists():
+        return 0
+    return INDEX_FILE.stat().st_size // INDEX_RECORD.size
+
+
+def _read_index(index_file, alert_id: int) -> tuple:
+    index_file.seek((alert_id - 1) * INDEX_RECORD.size)
+    return INDEX_RECORD.unpack(index_file.read(INDEX_RECORD.size))
+
+
+def _write_index(index_file, alert_id: int, record: tuple):
+    index_file.seek((alert_id - 1) * INDEX_RECORD.size)
+    index_file.write(INDEX_RECORD.pack(*record))
+
+
+def _bump(alert_id: int, now: int) -> tuple[int, bool]:
+    """기존 알림의 반복 횟수를 올립니다.
+
+    확인한 알림이 다시 발생하면 미확인으로 되돌립니다 (계속되는 장애가 다시 알려지도록).
+
+    Returns:
+        (새 반복 횟수, 미확인으로 되돌렸는지)
+    """
+    with open(INDEX_FILE, "r+b") as f:
+        segment, offset, length, count, _, acked = _read_index(f, alert_id)
+        count += 1
+        _write_index(f, alert_id, (segment, offset, length, count, now, 0))
+    _append_event({"type": "repeat", "id": alert_id, "ts": now})
+    return count, bool(acked)
+
+
+def append(
+    level: str,
+    title: str,
+    message: str,
+    context: str = "",
+    fp: Optional[str] = None,
+    now: Optional[int] = None,
+) -> dict:
+    """알림을 추가합니다.
+
+    Returns:
+        {"outcome": "new" | "repeat" | "suppressed", "id": 알림 ID, "count": 반복 횟수}
+    """
+    now = int(now if now is not None else time.time())
+    fp = fp or fingerprint(level, title, context)
+
+    with store_lock():
+        _import_legacy()
+        state = _load_state()
+        _prune_state(state, now)
+
+        # 1. 중복 제거: 같은 fingerprint가 윈도우 안에 있으면 반복 횟수만 증가
+        existing = state["fingerprints"].get(fp)
+        if existing:
+            count, reopened = _bump(existing["id"], now)
+            existing["last_ts"] = now
+            if reopened:
+                state["unacked"] = state.get("unacked", 0) + 1
+            _save_state(state)
+            return {"outcome": "repeat", "id": existing["id"], "count": count}
+
+        # 2. 속도 제한: 같은 제목의 새 알림이 너무 많으면 가장 최근 알림에 합산
+        stamps = state["rate"].setdefault(title, [])
+        last_id = state.setdefault("last_by_title", {}).get(title)
+        if len(stamps) >= RATE_LIMIT and last_id:
+            count, reopened = _bump(last_id, now)
+            state["fingerprints"][fp] = {"id": last_id, "last_ts": now}
+            if reopened:
+                state["unacked"] = state.get("unacked", 0) + 1
+            _save_state(state)
+            return {"outcome": "suppressed", "id": last_id, "count": count}
+
+        # 3. 새 알림
+        alert_id = alert_count() + 1
+        event = {
+            "type": "alert",
+            "id": alert_id,
+            "timestamp": datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S"),
+            "level": level,
+            "title": title,
+            "message": message,
+            "context": context,
+            "fingerprint": fp,
+        }
+        segment, offset, length = _append_event(event)
+        with open(INDEX_FILE, "ab") as f:
+            f.write(INDEX_RECORD.pack(segment, offset, length, 1, now, 0))
+
+        stamps.append(now)
+        state["last_by_title"][title] = alert_id
+        state["fingerprints"][fp] = {"id": alert_id, "last_ts": now}
+        state["unacked"] = state.get("unacked", 0) + 1
+        _save_state(state)
+        return {"outcome": "new", "id": alert_id, "count": 1}
+
+
+def _import_legacy():
+    """기존 data/alerts.json을 한 번만 가져옵니다 (잠금 안에서 호출)."""
+    if alert_count() > 0 or not LEGACY_FILE.exists():
+        return
+    try:
+        legacy = json.loads(LEGACY_FILE.read_text(encoding="utf-8")).get("alerts", [])
+    except (json.JSONDecodeError, AttributeError):
+        return
+
+    state = _load_state()
+    with open(INDEX_FILE, "ab") as index_file:
+        for i, a in enumerate(legacy, 1):
+            try:
+                ts = int(datetime.strptime(a["timestamp"], "%Y-%m-%d %H:%M:%S").timestamp())
+            except (KeyError, ValueError):
+                ts = 0
+            event = {
+                "type": "alert",
+                "id": i,
+                "timestamp": a.get("timestamp", ""),
+                "level": a.get("level", "info"),
+                "title": a.get("title", ""),
+                "message": a.get("message", ""),
+                "context": a.get("context", ""),
+                "fingerprint": fingerprint(a.get("level", "info"), a.get("title", ""), a.get("context", "")),
+            }
+            segment, offset, length = _append_event(event)
+            acked = 1 if a.get("acknowledged") else 0
+            index_file.write(INDEX_RECORD.pack(segment, offset, length, 1, ts, acked))
+            state["unacked"] = state.get("unacked", 0) + (1 - acked)
+    _save_state(state)
+
+
+def get(alert_id: int) -> Optional[dict]:
+    """알림 ID로 알림을 조회합니다 (인덱스 → 세그먼트 오프셋 직접 읽기)."""
+    if alert_id < 1 or alert_id > alert_count():
+        return None
+    with open(INDEX_FILE, "rb") as f:
+        segment, offset, length, count, last_ts, acked = _read_index(f, alert_id)
+    with open(_segment_path(segment), "rb") as f:
+        f.seek(offset)
+        alert = json.loads(f.read(length))
+    alert.pop("type", None)
+    alert["count"] = count
+    alert["last_seen"] = datetime.fromtimestamp(last_ts).strftime("%Y-%m-%d %H:%M:%S") if last_ts else alert["timestamp"]
+    alert["acknowledged"] = bool(acked)
+    return alert
+
+
+def recent(limit: int = 5, unacked_only: bool = False, level: Optional[str] = None) -> list[dict]:
+    """최근 알림을 최신순으로 반환합니다 (인덱스를 뒤에서부터 읽음)."""
+    results = []
+    alert_id = alert_count()
+    if not alert_id:
+        return results
+
+    with open(INDEX_FILE, "rb") as f:
+        while alert_id >= 1 and len(results) < limit:
+            record = _read_index(f, alert_id)
+            if not (unacked_only and record[5]):
+                alert = get(alert_id)
+                if alert and (level is None or alert["level"] == level):
+                    results.append(alert)
+            alert_id -= 1
+    return results
+
+
+def unacknowledged_count() -> int:
+    """미확인 알림 수 (state.json에 유지되는 카운터)"""
+    if not STATE_FILE.exists() and LEGACY_FILE.exists():
+        with store_lock():
+            _import_legacy()
+    return _load_state().get("unacked", 0)
+
+
+def acknowledge(alert_ids: Optional[list[int]] = None) -> int:
+    """알림을 확인 처리합니다. alert_ids가 None이면 전체를 확인합니다.
+
+    Returns:
+        새로 확인 처리된 알림 수
+    """
+    with store_lock():
+        _import_legacy()
+        total = alert_count()
+        ids = range(1, total + 1) if alert_ids is None else [i for i in alert_ids if 1 <= i <= total]
+        acked_ids = []
+
+        if total:
+            with open(INDEX_FILE, "r+b") as f:
+                for alert_id in ids:
+                    segment, offset, length, count, last_ts, acked = _read_index(f, alert_id)
+                    if acked:
+                        continue
+                    _write_index(f, alert_id, (segment, offset, length, count, last_ts, 1))
+                    acked_ids.append(alert_id)
+
+        if acked_ids:
+            _append_event({"type": "ack", "ids": acked_ids, "ts": int(time.time())})
+            state = _load_state()
+            state["unacked"] = max(0, state.get("unacked", 0) - len(acked_ids))
+            _save_state(state)
+        return len(acked_ids)
+
+
+def format_alert(alert: dict) -> str:
+    ack = "✓" if alert["acknowledged"] else "○"
+    repeat = f" (x{alert['count']}, last {alert['last_seen']})" if alert["count"] > 1 else ""
+    return (
+        f"{ack} #{alert['id']} [{alert['timestamp']}] [{alert['level']}] {alert['title']}{repeat}\n"
+        f"  {alert['message']}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="추가 전용 알림 저장소를 기록/조회합니다."
+    )
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # append 명령
+    append_parser = subparsers.add_parser("append", help="알림 추가 (중복 제거/속도 제한 적용)")
+    append_parser.add_argument("--level", required=True, choices=LEVELS, help="알림 레벨")
+    append_parser.add_argument("--title", required=True, help="알림 제목")
+    append_parser.add_argument("--message", default="", help="알림 내용")
+    append_parser.add_argument("--context", default="", help="컨텍스트 (URL, slug 등)")
+    append_parser.add_argument("--fingerprint", help="중복 판정 키 (기본: level+title+context)")
+
+    # list 명령
+    list_parser = subparsers.add_parser("list", help="최근 알림 목록 (최신순)")
+    list_parser.add_argument("-n", "--limit", type=int, default=5, help="표시 개수 (default: 5)")
+    list_parser.add_argument("--unacked", action="store_true", help="미확인 알림만")
+    list_parser.add_argument("--level", choices=LEVELS, help="레벨 필터")
+    list_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    # count 명령
+    subparsers.add_parser("count", help="미확인 알림 수")
+
+    # ack 명령
+    ack_parser = subparsers.add_parser("ack", help="알림 확인 처리")
+    ack_parser.add_argument("ids", nargs="*", type=int, help="알림 ID")
+    ack_parser.add_argument("--all", action="store_true", help="모든 알림 확인")
+
+    args = parser.parse_args()
+
+    if args.command == "append":
+        result = append(args.level, args.title, args.message, args.context, args.fingerprint)
+        print(f"{result['outcome']} {result['id']} {result['count']}")
+
+    elif args.command == "list":
+        alerts = recent(args.limit, args.unacked, args.level)
+        if args.json:
+            print(json.dumps(alerts, indent=2, ensure_ascii=False))
+        elif not alerts:
+            print("No alerts found.")
+        else:
+            for alert in alerts:
+                print(format_alert(alert))
+
+    elif args.command == "count":
+        print(unacknowledged_count())
+
+    elif args.command == "ack":
+        if not args.all and not args.ids:
+            parser.error("ack requires alert IDs or --all")
+        acked = acknowledge(None if args.all else args.ids)
+        print(f"Acknowledged {acked} alert(s)")
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
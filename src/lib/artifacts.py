@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+artifacts.py - 콘텐츠 주소 기반 작업 산출물 저장소
+실행이 끝난 작업 디렉토리(OUTPUT_DIR/<slug>, 언어별 하위 디렉토리 포함)의 파일을 내용 해시(sha256)로 중복 제거하고
+lzma(기본) 또는 gzip으로 압축해 보관합니다.
+
+- data/artifacts/objects/<hash[:2]>/<hash>.xz|.gz: 압축된 파일 내용 (같은 내용은 한 번만 저장)
+- data/artifacts/manifests/<slug>/<run_id>.json: 실행별 파일 목록 (이름 → 해시, 크기, 보존 등급)
+
+보존 정책 (gc):
+- final 등급 (ARTIFACT_KEEP_FOREVER: final.md, youtube.txt, original.md, raw.md): 영구 보관
+  (original.md는 게시 후 원문 변경 추적에 필요)
+- 그 외 중간 산출물: ARTIFACT_INTERMEDIATE_DAYS일 후 매니페스트에서 제거
+- 모든 파일이 보관된 작업 디렉토리는 ARTIFACT_WORKDIR_DAYS일 후 비움 (필요 시 restore로 복원)
+- 어떤 매니페스트도 참조하지 않는 객체는 삭제
+
+비워진 작업 디렉토리의 파일은 read_artifact/restore로 투명하게 다시 읽을 수 있습니다.
+"""
+
+import os
+import sys
+import gzip
+import json
+import lzma
+import time
+import fcntl
+import hashlib
+import argparse
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.metrics import current_run_id, percentile  # noqa: E402
+
+ARTIFACTS_DIR = Path(os.environ.get("ARTIFACTS_DIR") or PROJECT_ROOT / "data" / "artifacts")
+OBJECTS_DIR = ARTIFACTS_DIR / "objects"
+MANIFESTS_DIR = ARTIFACTS_DIR / "manifests"
+LOCK_FILE = ARTIFACTS_DIR / "store.lock"
+OUTPUT_DIR = Path(os.environ.get("OUTPUT_DIR") or PROJECT_ROOT / "output")
+
+CODEC = os.environ.get("ARTIFACT_CODEC", "lzma")
+KEEP_FOREVER = set(os.environ.get("ARTIFACT_KEEP_FOREVER", "final.md youtube.txt original.md raw.md").split())
+INTERMEDIATE_DAYS = int(os.environ.get("ARTIFACT_INTERMEDIATE_DAYS", 30))
+WORKDIR_DAYS = int(os.environ.get("ARTIFACT_WORKDIR_DAYS", 7))
+
+CODECS = {
+    "lzma": (".xz", lambda data: lzma.compress(data, preset=6), lzma.decompress),
+    "gzip": (".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0), gzip.decompress),
+}
+
+
+@contextmanager
+def store_lock():
+    """저장소 배타 잠금 (archive와 gc가 동시에 객체를 쓰고 지우지 않도록)"""
+    ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def retention_class(name: str) -> str:
+    """보존 등급 (언어별 하위 디렉토리의 파일도 파일명으로 판단, 예: ja/final.md)"""
+    return "final" if Path(name).name in KEEP_FOREVER else "intermediate"
+
+
+def _work_files(work_dir: Path) -> dict[str, Path]:
+    """작업 디렉토리의 파일 (하위 디렉토리 포함, 상대 경로 → 경로)"""
+    return {
+        path.relative_to(work_dir).as_posix(): path
+        for path in sorted(work_dir.rglob("*"))
+        if path.is_file() and not any(part.startswith(".") for part in path.relative_to(work_dir).parts)
+    }
+
+
+def _object_path(digest: str) -> Optional[Path]:
+    """해시에 해당하는 저장 객체 경로 (코덱과 무관하게 찾음)"""
+    for ext, _, _ in CODECS.values():
+        path = OBJECTS_DIR / digest[:2] / f"{digest}{ext}"
+        if path.exists():
+            return path
+    return None
+
+
+def put_object(data: bytes) -> tuple[str, bool]:
+    """내용을 저장하고 (해시, 새로 저장했는지)를 반환합니다."""
+    digest = hashlib.sha256(data).hexdigest()
+    if _object_path(digest):
+        return digest, False
+
+    ext, compress, _ = CODECS[CODEC]
+    path = OBJECTS_DIR / digest[:2] / f"{digest}{ext}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    tmp.write_bytes(compress(data))
+    tmp.replace(path)
+    return digest, True
+
+
+def get_object(digest: str) -> bytes:
+    path = _object_path(digest)
+    if path is None:
+        raise FileNotFoundError(f"Artifact object not found: {digest}")
+    for ext, _, decompress in CODECS.values():
+        if path.name.endswith(ext):
+            return decompress(path.read_bytes())
+    raise ValueError(f"Unknown object codec: {path}")
+
+
+def load_manifest(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _manifest_files(slug: Optional[str] = None) -> list[Path]:
+    """매니페스트 파일 목록 (생성 시각 오래된 순, gc가 다시 써도 순서 유지)"""
+    pattern = f"{slug}/*.json" if slug else "*/*.json"
+    return sorted(MANIFESTS_DIR.glob(pattern), key=lambda p: (load_manifest(p)["created_at"], p.name))
+
+
+def _write_manifest(path: Path, manifest: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(path)
+
+
+def archive(slug: str, work_dir: Path, run_id: Optional[str] = None) -> dict:
+    """작업 디렉토리의 파일을 저장소에 보관하고 실행 매니페스트를 기록합니다."""
+    run_id = run_id or current_run_id()
+    files = {}
+    new_bytes = 0
+
+    with store_lock():
+        for name, path in _work_files(Path(work_dir)).items():
+            data = path.read_bytes()
+            digest, created = put_object(data)
+            stored = _object_path(digest).stat().st_size
+            if created:
+                new_bytes += stored
+            files[name] = {
+                "hash": digest,
+                "size": len(data),
+                "stored_size": stored,
+                "class": retention_class(name),
+            }
+
+        manifest = {
+            "slug": slug,
+            "run_id": run_id,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "work_dir": str(Path(work_dir).resolve()),
+            "files": files,
+        }
+        _write_manifest(MANIFESTS_DIR / slug / f"{run_id}.json", manifest)
+
+    manifest["new_stored_bytes"] = new_bytes
+    return manifest
+
+
+def find_artifact(slug: str, name: str) -> Optional[dict]:
+    """slug의 가장 최근 매니페스트에서 name 항목을 찾습니다."""
+    for path in reversed(_manifest_files(slug)):
+        entry = load_manifest(path)["files"].get(name)
+        if entry:
+            return entry
+    return None
+
+
+def read_artifact(slug: str, name: str, work_dir: Optional[Path] = None) -> bytes:
+    """작업 디렉토리에 파일이 있으면 그대로, 없으면 저장소에서 읽습니다 (read-through)."""
+    if work_dir and (Path(work_dir) / name).is_file():
+        return (Path(work_dir) / name).read_bytes()
+
+    entry = find_artifact(slug, name)
+    if entry is None:
+        raise FileNotFoundError(f"Artifact not found: {slug}/{name}")
+    return get_object(entry["hash"])
+
+
+def restore(slug: str, work_dir: Path, names: Optional[list[str]] = None) -> list[str]:
+    """비워진 작업 디렉토리에 가장 최근 실행의 파일을 되살립니다 (이미 있는 파일은 건드리지 않음).
+
+    Returns:
+        복원된 파일 이름 목록
+    """
+    manifests = _manifest_files(slug)
+    if not manifests:
+        return []
+
+    # 이전 실행에만 있던 파일(예: 지난번 pipeline_warnings.txt)은 되살리지 않음
+    manifest = load_manifest(manifests[-1])
+
+    # 언어별 하위 디렉토리(예: <slug>/ja)를 복원할 때는 해당 접두사의 파일만 대상
+    work_dir = Path(work_dir)
+    root = Path(manifest.get("work_dir") or work_dir)
+    prefix = ""
+    if work_dir.resolve() != root and work_dir.resolve().is_relative_to(root):
+        prefix = work_dir.resolve().relative_to(root).as_posix() + "/"
+
+    restored = []
+    for key, entry in sorted(manifest["files"].items()):
+        if not key.startswith(prefix):
+            continue
+        name = key[len(prefix):]
+        if names is not None and name not in names:
+            continue
+        target = work_dir / name
+        if target.exists():
+            continue
+        try:
+            data = get_object(entry["hash"])
+        except FileNotFoundError:
+            continue  # 보존 기간이 지나 삭제된 중간 산출물
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        restored.append(name)
+    return restored
+
+
+def gc(now: Optional[datetime] = None, dry_run: bool = False) -> dict:
+    """보존 정책을 적용합니다."""
+    now = now or datetime.now()
+    intermediate_cutoff = now - timedelta(days=INTERMEDIATE_DAYS)
+    workdir_cutoff = (now - timedelta(days=WORKDIR_DAYS)).timestamp()
+    result = {"expired_entries": 0, "evicted_files": 0, "evicted_bytes": 0, "deleted_objects": 0, "freed_bytes": 0}
+
+    with store_lock():
+        referenced = set()
+        archived_by_dir: dict[str, dict[str, set]] = {}
+
+        # 1. 기간이 지난 중간 산출물을 매니페스트에서 제거
+        for path in _manifest_files():
+            manifest = load_manifest(path)
+            created = datetime.fromisoformat(manifest["created_at"])
+            if created < intermediate_cutoff:
+                expired = [n for n, e in manifest["files"].items() if e["class"] != "final"]
+                if expired:
+                    result["expired_entries"] += len(expired)
+                    for name in expired:
+                        del manifest["files"][name]
+                    if not dry_run:
+                        _write_manifest(path, manifest)
+
+            for name, entry in manifest["files"].items():
+                referenced.add(entry["hash"])
+                archived_by_dir.setdefault(manifest.get("work_dir", ""), {}).setdefault(name, set()).add(entry["hash"])
+
+        # 2. 오래된 작업 디렉토리에서 보관이 확인된 파일을 비움
+        if OUTPUT_DIR.exists():
+            for work_dir in OUTPUT_DIR.iterdir():
+                archived = archived_by_dir.get(str(work_dir.resolve()))
+                if not work_dir.is_dir() or not archived:
+                    continue
+                files = _work_files(work_dir)
+                if not files or max(p.stat().st_mtime for p in files.values()) > workdir_cutoff:
+                    continue
+                for name, path in files.items():
+                    if hashlib.sha256(path.read_bytes()).hexdigest() in archived.get(name, ()):
+                        result["evicted_files"] += 1
+                        result["evicted_bytes"] += path.stat().st_size
+                        if not dry_run:
+                            path.unlink()
+
+        # 3. 참조되지 않는 객체 삭제
+        if OBJECTS_DIR.exists():
+            for path in OBJECTS_DIR.glob("*/*"):
+                digest = path.name.split(".")[0]
+                if digest not in referenced:
+                    result["deleted_objects"] += 1
+                    result["freed_bytes"] += path.stat().st_size
+                    if not dry_run:
+                        path.unlink()
+
+    return result
+
+
+def _dir_bytes(path: Path) -> int:
+    if not path.exists():
+        return 0
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def report(samples: int = 20) -> dict:
+    """디스크 사용량과 읽기 지연 시간을 보고합니다."""
+    logical = 0
+    unique: dict[str, int] = {}
+    runs = 0
+    for path in _manifest_files():
+        runs += 1
+        for entry in load_manifest(path)["files"].values():
+            logical += entry["size"]
+            unique[entry["hash"]] = entry["size"]
+
+    stored = _dir_bytes(OBJECTS_DIR)
+
+    # 읽기 지연: 최근 객체를 압축 해제까지 포함해 읽는 시간
+    latencies = []
+    for digest in list(unique)[-samples:]:
+        start = time.perf_counter()
+        try:
+            get_object(digest)
+        except FileNotFoundError:
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "runs": runs,
+        "objects": len(unique),
+        "logical_bytes": logical,
+        "unique_bytes": sum(unique.values()),
+        "stored_bytes": stored,
+        "manifest_bytes": _dir_bytes(MANIFESTS_DIR),
+        "output_dir_bytes": _dir_bytes(OUTPUT_DIR),
+        "read_p50_ms": percentile(latencies, 50),
+        "read_p95_ms": percentile(latencies, 95),
+        "codec": CODEC,
+    }
+
+
+def format_report(r: dict) -> str:
+    def kib(n):
+        return f"{n / 1024:,.1f} KiB"
+
+    dedup = r["logical_bytes"] / r["unique_bytes"] if r["unique_bytes"] else 0
+    ratio = r["unique_bytes"] / r["stored_bytes"] if r["stored_bytes"] else 0
+    return "\n".join([
+        f"Runs archived:        {r['runs']}",
+        f"Objects:              {r['objects']}",
+        f"Logical size:         {kib(r['logical_bytes'])}",
+        f"Unique size:          {kib(r['unique_bytes'])} (dedup {dedup:.2f}x)",
+        f"Stored ({r['codec']}):         {kib(r['stored_bytes'])} (compression {ratio:.2f}x)",
+        f"Manifests:            {kib(r['manifest_bytes'])}",
+        f"Work directories:     {kib(r['output_dir_bytes'])}",
+        f"Read latency:         p50 {r['read_p50_ms']:.2f}ms, p95 {r['read_p95_ms']:.2f}ms",
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="작업 산출물을 중복 제거/압축해 보관하고 보존 정책을 적용합니다."
+    )
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # archive 명령
+    archive_parser = subparsers.add_parser("archive", help="작업 디렉토리 보관")
+    archive_parser.add_argument("slug", help="이슈 slug")
+    archive_parser.add_argument("work_dir", type=Path, help="작업 디렉토리")
+    archive_parser.add_argument("--run-id", help="실행 ID (기본: NEWSAUTO_RUN_ID)")
+
+    # cat 명령
+    cat_parser = subparsers.add_parser("cat", help="보관된 파일 출력 (read-through)")
+    cat_parser.add_argument("slug", help="이슈 slug")
+    cat_parser.add_argument("name", help="파일 이름 (예: original.md)")
+    cat_parser.add_argument("--work-dir", type=Path, help="먼저 확인할 작업 디렉토리")
+
+    # restore 명령
+    restore_parser = subparsers.add_parser("restore", help="비워진 작업 디렉토리 복원")
+    restore_parser.add_argument("slug", help="이슈 slug")
+    restore_parser.add_argument("work_dir", type=Path, help="복원할 디렉토리")
+    restore_parser.add_argument("names", nargs="*", help="복원할 파일 (기본: 전체)")
+
+    # gc 명령
+    gc_parser = subparsers.add_parser("gc", help="보존 정책 적용")
+    gc_parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 결과만 출력")
+
+    # report 명령
+    report_parser = subparsers.add_parser("report", help="디스크 사용량/읽기 지연 보고")
+    report_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    args = parser.parse_args()
+
+    if args.command == "archive":
+        manifest = archive(args.slug, args.work_dir, args.run_id)
+        print(
+            f"Archived {len(manifest['files'])} file(s) for {args.slug} "
+            f"(+{manifest['new_stored_bytes']} bytes stored)"
+        )
+
+    elif args.command == "cat":
+        try:
+            sys.stdout.buffer.write(read_artifact(args.slug, args.name, args.work_dir))
+        except FileNotFoundError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+
+    elif args.command == "restore":
+        restored = restore(args.slug, args.work_dir, args.names or None)
+        print(f"Restored {len(restored)} file(s): {', '.join(restored) or '-'}")
+
+    elif args.command == "gc":
+        result = gc(dry_run=args.dry_run)
+        print(json.dumps(result, indent=2))
+
+    elif args.command == "report":
+        r = report()
+        print(json.dumps(r, indent=2) if args.json else format_report(r))
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
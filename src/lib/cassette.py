@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+cassette.py - HTTP 기록/재생 (cassette)
+check_feed/fetch_page의 HTTP 요청과 응답(상태, 헤더, 본문, 타이밍)을 파일에 기록하고,
+네트워크 없이 같은 응답을 재생합니다. 수집 단계 벤치마크와 회귀(예: 목록 형식 변경)를
+GitHub에 접속하지 않고 결정적으로 재현하기 위한 도구입니다.
+
+환경 변수:
+    HTTP_CASSETTE: cassette 파일 경로 (.gz로 끝나면 gzip 압축)
+    HTTP_CASSETTE_MODE: off (기본) | record | replay
+    HTTP_CASSETTE_LATENCY: 재생 시 기록된 지연 시간 배율 (기본 0 = 지연 없음, 1 = 기록된 그대로)
+    HTTP_CASSETTE_BANDWIDTH: 재생 시 본문 전송 속도 제한 (바이트/초, 0 = 제한 없음)
+
+파일은 JSON Lines입니다 (첫 줄 {"version": 2}, 이후 요청마다 한 줄, .gz는 줄마다 gzip 멤버 하나).
+기록은 요청마다 파일 잠금 후 한 줄만 덧붙이므로 (요청 수와 무관하게 일정한 비용) 파이프라인의 여러 프로세스가
+같은 cassette에 기록할 수 있습니다. 예전 형식(version 1, JSON 문서 하나)도 읽습니다.
+인증 요청 헤더와 Set-Cookie 응답 헤더는 기록하지 않습니다.
+재생은 (method, URL)별로 기록된 순서대로 응답하고, 모두 소진하면 마지막 응답을 반복합니다.
+기록에 없는 요청은 CassetteMiss(URLError)로 즉시 실패합니다 (재생 중 실제 네트워크 접속 없음).
+
+사용법:
+    HTTP_CASSETTE=data/cassettes/feed.json.gz HTTP_CASSETTE_MODE=record newsauto check-feed
+    HTTP_CASSETTE=data/cassettes/feed.json.gz HTTP_CASSETTE_MODE=replay newsauto check-feed
+    newsauto cassette show data/cassettes/feed.json.gz
+"""
+
+import io
+import os
+import sys
+import json
+import gzip
+import time
+import fcntl
+import base64
+import argparse
+import threading
+from datetime import datetime
+from http.client import HTTPMessage
+from pathlib import Path
+from typing import Optional
+from urllib.error import URLError, HTTPError
+from urllib.request import Request, urlopen as _urlopen
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+MODES = ["off", "record", "replay"]
+FORMAT_VERSION = 2
+
+# 기록하지 않는 요청 헤더 (인증 정보)
+REDACTED_HEADERS = {"authorization", "cookie", "proxy-authorization"}
+# 기록하지 않는 응답 헤더 (세션 쿠키)
+REDACTED_RESPONSE_HEADERS = {"set-cookie", "set-cookie2"}
+
+
+class CassetteMiss(URLError):
+    """재생할 기록이 없는 요청 (재시도해도 결과가 같으므로 즉시 실패)"""
+
+
+def _settings() -> tuple[str, Optional[Path]]:
+    mode = os.environ.get("HTTP_CASSETTE_MODE", "off")
+    path = os.environ.get("HTTP_CASSETTE")
+    if mode not in MODES:
+        raise ValueError(f"Unknown HTTP_CASSETTE_MODE: {mode}")
+    if mode != "off" and not path:
+        raise ValueError("HTTP_CASSETTE_MODE requires HTTP_CASSETTE")
+    return mode, Path(path) if path else None
+
+
+# ============================================
+# cassette 파일
+# ============================================
+
+def _read_lines(path: Path) -> list[str]:
+    opener = gzip.open if path.suffix == ".gz" else open
+    lines = []
+    with opener(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                lines.append(line)
+        except EOFError:
+            # 기록 중 끊긴 마지막 gzip 멤버: 앞의 완전한 기록만 사용
+            pass
+    return lines
+
+
+def load(path: Path) -> dict:
+    if not path.exists():
+        return {"version": FORMAT_VERSION, "entries": []}
+    version = FORMAT_VERSION
+    entries = []
+    for line in _read_lines(path):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # 기록 중 끊긴 마지막 줄
+            continue
+        if "entries" in record:
+            # version 1: JSON 문서 하나
+            return record
+        if "method" in record:
+            entries.append(record)
+        else:
+            version = record.get("version", version)
+    return {"version": version, "entries": entries}
+
+
+def _encode_line(path: Path, record: dict) -> bytes:
+    data = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    if path.suffix == ".gz":
+        # mtime=0: 같은 내용이면 같은 바이트 (cassette를 git에 넣어도 diff가 생기지 않음)
+        data = gzip.compress(data, mtime=0)
+    return data
+
+
+def save(path: Path, cassette: dict):
+    """cassette를 원자적으로 교체합니다 (현재 형식으로 다시 씀)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_encode_line(path, {"version": FORMAT_VERSION}))
+        for entry in cassette["entries"]:
+            f.write(_encode_line(path, entry))
+    tmp.replace(path)
+
+
+def _encode_body(body: bytes) -> tuple[str, str]:
+    try:
+        return body.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        return base64.b64encode(body).decode("ascii"), "base64"
+
+
+def _decode_body(entry: dict) -> bytes:
+    if entry.get("body_encoding") == "base64":
+        return base64.b64decode(entry["body"])
+    return entry.get("body", "").encode("utf-8")
+
+
+def _is_legacy(path: Path) -> bool:
+    """version 1 파일인지 (현재 형식은 첫 줄이 짧은 머리말이라 첫 줄만 읽음)"""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        first = f.readline()
+    try:
+        return "entries" in json.loads(first)
+    except json.JSONDecodeError:
+        return False
+
+
+def _append(path: Path, entry: dict):
+    """다른 프로세스의 기록과 섞이지 않도록 잠금 후 한 줄을 덧붙입니다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if path.exists() and path.stat().st_size and _is_legacy(path):
+                # 예전 형식 파일에 이어 기록: 한 번만 현재 형식으로 바꿈
+                save(path, load(path))
+            with open(path, "ab") as f:
+                if f.tell() == 0:
+                    f.write(_encode_line(path, {"version": FORMAT_VERSION}))
+                f.write(_encode_line(path, entry))
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+# ============================================
+# 재생 응답
+# ============================================
+
+class ReplayResponse:
+    """urlopen 응답을 흉내 내는 객체 (read/length/headers/status, with 문 지원)
+
+    latency > 0이면 첫 바이트까지 기록된 시간 * latency를 기다리고, 본문은 기록된 전송 시간
+    (또는 bandwidth)에 비례해 나눠 읽을 때마다 기다립니다.
+    """
+
+    def __init__(self, entry: dict, latency: float = 0.0, bandwidth: float = 0.0):
+        self.url = entry["url"]
+        self.status = entry["status"]
+        self.reason = entry.get("reason", "")
+        self.headers = _headers(entry.get("headers", []))
+        self._body = io.BytesIO(_decode_body(entry))
+        self.length = len(self._body.getvalue())
+        transfer_ms = max(0.0, entry.get("elapsed_ms", 0.0) - entry.get("ttfb_ms", 0.0))
+        self._seconds_per_byte = 0.0
+        if bandwidth > 0:
+            self._seconds_per_byte = 1.0 / bandwidth
+        elif latency > 0 and self.length:
+            self._seconds_per_byte = transfer_ms * latency / 1000 / self.length
+        if latency > 0:
+            time.sleep(entry.get("ttfb_ms", 0.0) * latency / 1000)
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        data = self._body.read() if amt is None or amt < 0 else self._body.read(amt)
+        self.length -= len(data)
+        if data and self._seconds_per_byte:
+            time.sleep(len(data) * self._seconds_per_byte)
+        return data
+
+    def getcode(self) -> int:
+        return self.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def close(self):
+        self._body.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _headers(pairs: list) -> HTTPMessage:
+    message = HTTPMessage()
+    for name, value in pairs:
+        message[name] = value
+    return message
+
+
+def _raise_recorded(entry: dict, latency: float, bandwidth: float):
+    """기록된 오류 응답을 다시 발생시킵니다."""
+    if "error" in entry:
+        raise URLError(entry["error"])
+    if entry["status"] >= 400:
+        if latency > 0:
+            time.sleep(entry.get("ttfb_ms", 0.0) * latency / 1000)
+        body = io.BytesIO(_decode_body(entry))
+        raise HTTPError(entry["url"], entry["status"], entry.get("reason", ""), _headers(entry.get("headers", [])), body)
+
+
+class Player:
+    """cassette 하나를 (method, URL)별 순서대로 재생 (프로세스 안에서 위치 유지)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.queues: dict[tuple[str, str], list[dict]] = {}
+        for entry in load(path)["entries"]:
+            self.queues.setdefault((entry["method"], entry["url"]), []).append(entry)
+        self.positions = {key: 0 for key in self.queues}
+
+    def next(self, method: str, url: str) -> dict:
+        key = (method, url)
+        with self.lock:
+            entries = self.queues.get(key)
+            if not entries:
+                raise CassetteMiss(f"no cassette entry for {method} {url} in {self.path}")
+            position = self.positions[key]
+            self.positions[key] = min(position + 1, len(entries) - 1)
+            return entries[position]
+
+
+_player: Optional[Player] = None
+
+
+def _get_player(path: Path) -> Player:
+    global _player
+    if _player is None or _player.path != path:
+        _player = Player(path)
+    return _player
+
+
+# ============================================
+# urlopen 대체
+# ============================================
+
+def urlopen(request: Request, timeout: float):
+    """urllib.request.urlopen 대신 사용 (HTTP_CASSETTE_MODE에 따라 기록/재생/통과)"""
+    mode, path = _settings()
+    if mode == "off":
+        return _urlopen(request, timeout=timeout)
+
+    method = request.get_method()
+    url = request.full_url
+
+    if mode == "replay":
+        latency = float(os.environ.get("HTTP_CASSETTE_LATENCY", 0) or 0)
+        bandwidth = float(os.environ.get("HTTP_CASSETTE_BANDWIDTH", 0) or 0)
+        entry = _get_player(path).next(method, url)
+        _raise_recorded(entry, latency, bandwidth)
+        return ReplayResponse(entry, latency, bandwidth)
+
+    # record: 실제 요청 후 응답 전체를 기록하고 기록된 내용으로 응답
+    entry = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "method": method,
+        "url": url,
+        "request_headers": [
+            [name, value] for name, value in request.header_items()
+            if name.lower() not in REDACTED_HEADERS
+        ],
+    }
+    start = time.perf_counter()
+    try:
+        response = _urlopen(request, timeout=timeout)
+    except HTTPError as e:
+        response = e
+    except URLError as e:
+        entry.update(error=str(e.reason), elapsed_ms=round((time.perf_counter() - start) * 1000, 1))
+        _append(path, entry)
+        raise
+
+    ttfb_ms = (time.perf_counter() - start) * 1000
+    with response:
+        body = response.read()
+    body_text, encoding = _encode_body(body)
+    entry.update(
+        status=response.status if not isinstance(response, HTTPError) else response.code,
+        reason=response.reason,
+        headers=[
+            [name, value] for name, value in response.headers.items()
+            if name.lower() not in REDACTED_RESPONSE_HEADERS
+        ],
+        body=body_text,
+        body_encoding=encoding,
+        ttfb_ms=round(ttfb_ms, 1),
+        elapsed_ms=round((time.perf_counter() - start) * 1000, 1),
+    )
+    _append(path, entry)
+    _raise_recorded(entry, 0.0, 0.0)
+    return ReplayResponse(entry)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="HTTP 기록/재생 cassette 조회"
+    )
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    show_parser = subparsers.add_parser("show", help="기록된 요청 목록")
+    show_parser.add_argument("cassette", type=Path, help="cassette 파일")
+    show_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력 (본문 제외)")
+
+    args = parser.parse_args()
+
+    if args.command == "show":
+        entries = load(args.cassette)["entries"]
+        rows = [
+            {
+                "method": e["method"],
+                "url": e["url"],
+                "status": e.get("status", "error"),
+                "bytes": len(_decode_body(e)) if "body" in e else 0,
+                "ttfb_ms": e.get("ttfb_ms"),
+                "elapsed_ms": e.get("elapsed_ms"),
+            }
+            for e in entries
+        ]
+        if args.json:
+            print(json.dumps(rows, indent=2, ensure_ascii=False))
+            return
+        for row in rows:
+            print(
+                f"{row['method']:<5} {str(row['status']):<6} {row['bytes']:>10}B "
+                f"{row['ttfb_ms'] or 0:>8.1f}ms {row['elapsed_ms'] or 0:>8.1f}ms  {row['url']}"
+            )
+        print(f"\n{len(rows)} request(s)")
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
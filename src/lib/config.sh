@@ -16,40 +16,203 @@ export CONFIG_DIR="$PROJECT_ROOT/config"
 # 상태 파일
 export PROCESSED_FILE="$DATA_DIR/processed.json"
 
+# 처리 임대 / 실행 잠금 (src/state/state_manager.py claim/heartbeat/reclaim)
+# - STATE_LEASE_TTL: heartbeat 없이 이 시간(초)이 지나면 다음 실행이 in_progress 이슈를 회수
+# - STATE_HEARTBEAT_INTERVAL: 처리 중 임대를 연장하는 간격 (초, STATE_LEASE_TTL보다 충분히 짧게)
+# - STATE_MAX_ATTEMPTS: 회수 후 재시도할 최대 점유 횟수 (넘으면 failed)
+# - RUN_LOCK_WAIT: 다른 실행이 잠금을 잡고 있을 때 기다릴 시간 (초, 0이면 바로 종료)
+export STATE_LEASE_TTL=900
+export STATE_HEARTBEAT_INTERVAL=60
+export STATE_MAX_ATTEMPTS=3
+export RUN_LOCK_FILE="$DATA_DIR/run.lock"
+export RUN_LOCK_WAIT=0
+
+# 메트릭 디렉토리 (metrics.jsonl, Prometheus textfile)
+export METRICS_DIR="$DATA_DIR/metrics"
+
+# 트레이스 디렉토리 (실행별 스팬 파일)
+export TRACES_DIR="$DATA_DIR/traces"
+
+# 알림 저장소
+# - ALERT_DEDUP_WINDOW: 같은 알림이 이 시간(초) 안에 반복되면 하나로 합침
+# - ALERT_RATE_LIMIT / ALERT_RATE_WINDOW: 같은 제목의 새 알림을 윈도우(초)당 최대 N개로 제한
+export ALERTS_DIR="$DATA_DIR/alerts"
+export ALERT_DEDUP_WINDOW=3600
+export ALERT_RATE_LIMIT=10
+export ALERT_RATE_WINDOW=3600
+
+# 원문 전체 보관 (true: Discord 상세 섹션까지 내려받아 작업 디렉토리에 raw.md로 저장)
+export FETCH_FULL_ARCHIVE="${FETCH_FULL_ARCHIVE:-false}"
+
+# 작업 산출물 저장소 (내용 해시로 중복 제거 + 압축)
+# - ARTIFACT_CODEC: lzma | gzip
+# - ARTIFACT_INTERMEDIATE_DAYS: 중간 산출물 보존 기간 (final.md 등은 영구 보관)
+# - ARTIFACT_WORKDIR_DAYS: 보관이 끝난 작업 디렉토리를 비우기까지의 기간
+export ARTIFACTS_DIR="$DATA_DIR/artifacts"
+export ARTIFACT_CODEC="lzma"
+export ARTIFACT_INTERMEDIATE_DAYS=30
+export ARTIFACT_WORKDIR_DAYS=7
+
 # Web 레포지토리 경로
 export WEB_REPO_PATH="${WEB_REPO_PATH:-/home/jonhpark/workspace/web}"
 export AINEWS_CONTENT_PATH="$WEB_REPO_PATH/src/content/ainews"
 
+# 발행 설정
+# - PUBLISH_BACKEND: plumbing (bare 미러, 체크아웃 미사용) | worktree (web 레포 체크아웃 사용)
+# - WEB_REMOTE_URL: 비어있으면 web 레포의 origin URL 사용
+export PUBLISH_BACKEND="plumbing"
+export WEB_REMOTE_URL="${WEB_REMOTE_URL:-}"
+export WEB_MIRROR_PATH="$DATA_DIR/web-mirror.git"
+
+# 발행 모드
+# - PUBLISH_MODE: direct (이슈마다 PR) | queue (발행 큐에 쌓아 묶어서 PR)
+# - PUBLISH_QUEUE_MAX_BATCH: 이 개수 이상 쌓이면 플러시 (0: 사용 안 함)
+# - PUBLISH_QUEUE_WINDOW: 가장 오래된 항목이 이 시간(초) 이상 대기하면 플러시 (0: 사용 안 함)
+export PUBLISH_MODE="direct"
+export PUBLISH_QUEUE_MAX_BATCH=5
+export PUBLISH_QUEUE_WINDOW=21600
+
 # GitHub 소스 URL (RSS 피드 대신 GitHub 레포지토리에서 직접 가져옴)
 export GITHUB_SOURCE_REPO="smol-ai/ainews-web-2025"
 export GITHUB_ISSUES_PATH="src/content/issues"
 
+# GitHub 요청 속도 제한 (lib/ratelimit.py, 프로세스 간 공유 예산: data/ratelimit/)
+# - GITHUB_API_TOKEN: 선택, config.env에 설정 (gh CLI가 쓰는 GITHUB_TOKEN과 별도라 발행 권한에 영향 없음)
+# - GITHUB_RATE_RESERVE: normal 우선순위 요청이 새 이슈 확인용으로 남겨둘 예산
+# - GITHUB_RATE_MAX_WAIT: 예산이 바닥났을 때 리셋까지 기다릴 최대 초 (넘으면 즉시 실패)
+export GITHUB_API_TOKEN="${GITHUB_API_TOKEN:-}"
+export GITHUB_RATE_RESERVE=5
+export GITHUB_RATE_MAX_WAIT=900
+
 # 모델 설정
 export CODEX_MODEL="gpt-5.4"
 export CODEX_REASONING_EFFORT="medium"
 export CLAUDE_MODEL="opus"
 
+# 번역 모델 라우팅 (src/translate/routing.py): 이슈 크기/성격에 따라 Codex 모델과 추론 강도 선택
+# - ROUTING_TIERS: 가벼운 것부터 "이름=모델:추론강도" (비우면 CODEX_MODEL / CODEX_REASONING_EFFORT),
+#   리뷰 실패 후 재번역은 다음 단계로 올림
+# - ROUTING_RULES: "단계: 조건 ...; ..." 위에서부터 첫 번째로 모든 조건이 맞는 규칙 사용
+#   신호: headline (true|false), tokens (추정 토큰), length (글자 수), links (링크 수)
+# - ROUTING_DEFAULT_TIER: 맞는 규칙이 없을 때의 단계
+export ROUTING_ENABLED=true
+export ROUTING_TIERS="light=:low standard=: heavy=:high"
+export ROUTING_RULES="light: headline=false tokens<40000; heavy: headline=true tokens>=80000"
+export ROUTING_DEFAULT_TIER="standard"
+
+# 병렬 번역 후보 (src/translate/hedge.py, 리뷰 실패 후 재번역 대신 후보를 동시에 번역/검토해 먼저 통과한 것 사용)
+# - HEDGE_CANDIDATES: route(라우팅 단계) | escalate(다음 단계) | 단계 이름, "@프롬프트"로 프롬프트 변형
+#   같은 (모델, 추론 강도, 프롬프트) 후보는 하나로 합치고, 서로 다른 후보가 둘 미만이면 병렬 실행하지 않음
+# Codex 호출이 후보 수만큼 늘어나므로 기본은 꺼 둠 (결과/줄어든 시간: newsauto hedge report)
+export HEDGE_ENABLED=false
+export HEDGE_CANDIDATES="route escalate"
+
 # CLI 경로
 export CODEX_BIN="${CODEX_BIN:-$(command -v codex 2>/dev/null || echo /home/jonhpark/.npm-global/bin/codex)}"
 export CLAUDE_BIN="${CLAUDE_BIN:-/home/jonhpark/.local/bin/claude}"
 
-# 재시도 설정
+# 재시도 설정 (HTTP 요청, Codex/Claude 호출 - lib/resilience.py)
+# 대기 시간은 RETRY_DELAY부터 2배씩 증가 (RETRY_MAX_DELAY 상한, jitter 포함)
 export MAX_RETRIES=3
 export RETRY_DELAY=5
+export RETRY_MAX_DELAY=120
+
+# 서킷 브레이커: 엔드포인트별 연속 실패가 임계값에 도달하면 쿨다운(초) 동안 호출하지 않음
+export BREAKER_FAILURE_THRESHOLD=5
+export BREAKER_COOLDOWN=600
+# half-open 시험 호출이 결과를 남기지 않을 때 새 시험 호출을 허용하기까지의 시간 (Codex 호출보다 길게)
+export BREAKER_PROBE_TIMEOUT=3600
+
+# LLM CLI 감시 실행 (lib/watchdog.py): 제한을 넘기거나 알려진 실패 신호가 출력되면 조기 종료 후 재시도
+# - *_TIMEOUT: 호출 1회의 벽시계 제한 (초, 0: 사용 안 함)
+# - *_STALL_TIMEOUT: 출력 로그/결과 파일이 자라지 않는 시간 제한 (claude --print는 끝에서만 출력하므로 0)
+export CODEX_TIMEOUT=1800
+export CODEX_STALL_TIMEOUT=300
+export CLAUDE_TIMEOUT=900
+export CLAUDE_STALL_TIMEOUT=0
 
 # 번역 검토 재시도
 export MAX_REVIEW_RETRIES=1
 
+# 용어집 검사 (src/review/glossary.py, local_review가 보호 용어 누락/금지 표기를 FAIL로, 지정 번역어 미사용을 경고로 보고)
+# - GLOSSARY_FILE: 모든 언어 공통 용어집 (탭 구분, 형식은 파일 머리말 참고)
+#   같은 폴더의 glossary.<CONTENT_LANG>.tsv (예: glossary.ko.tsv)를 함께 읽어 언어별 지정 번역어 적용
+# - GLOSSARY_CACHE_DIR: 용어집 내용별로 만들어 둔 오토마톤 캐시
+export GLOSSARY_ENABLED=true
+export GLOSSARY_FILE="$CONFIG_DIR/glossary.tsv"
+export GLOSSARY_CACHE_DIR="$DATA_DIR/glossary"
+
 # 프롬프트 파일
 export TRANSLATE_WITH_LINKS_PROMPT="$PROMPTS_DIR/translate-with-links.txt"
 export TRANSLATE_NO_HEADLINE_PROMPT="$PROMPTS_DIR/translate-no-headline.txt"
 export REVIEW_LINKS_PROMPT="$PROMPTS_DIR/review-links.txt"
+export TRANSLATE_DELTA_PROMPT="$PROMPTS_DIR/translate-delta.txt"
+export REVIEW_SECTION_PROMPT="$PROMPTS_DIR/review-section.txt"
+
+# 섹션 단위 검토 (REVIEW_MODE=chunked): 의심 없는 섹션 중 Claude로 보낼 표본 비율, 동시 호출 수,
+# 호출당 섹션 묶음 바이트 상한
+export REVIEW_SAMPLE_RATE=0.2
+export REVIEW_MAX_PARALLEL=4
+export REVIEW_BATCH_BYTES=32768
+
+# 원문 변경분 부분 재번역 (--sync): 바뀐 원문 비율이 이 값을 넘으면 전체 재번역
+export DELTA_MAX_CHANGED_RATIO=0.5
+
+# 사전 번역 (./main.sh --speculate, src/rss/speculate.py): 업스트림 PR/브랜치의 이슈 초안을 미리 번역
+# - SPECULATIVE_REMOTE: 감시할 업스트림 git 원격 (로컬 bare 레포 경로도 가능)
+# - SPECULATIVE_BASE: 정식 이슈가 머지되는 브랜치 (이 브랜치에 없는 이슈 파일만 사전 번역)
+# - SPECULATIVE_MAX_CHANGED_RATIO: 머지된 원문이 초안에서 이 비율 이상 바뀌면 사전 번역을 버리고 전체 번역
+# - SPECULATIVE_MAX_AGE_DAYS: 머지되지 않은 사전 번역 보관 기간
+export SPECULATIVE_DIR="$DATA_DIR/speculative"
+export SPECULATIVE_MIRROR="$DATA_DIR/upstream.git"
+export SPECULATIVE_REMOTE="${SPECULATIVE_REMOTE:-https://github.com/$GITHUB_SOURCE_REPO.git}"
+export SPECULATIVE_BASE="main"
+export SPECULATIVE_MAX_CHANGED_RATIO=0.3
+export SPECULATIVE_MAX_AGE_DAYS=14
+
+# 외부 링크 생존 확인 (src/crawler/check_links.py, 결과 캐시: data/linkcheck/)
+# - LINKCHECK_MAX_PARALLEL / LINKCHECK_PER_HOST: 전체 / 호스트별 동시 요청 수
+# - LINKCHECK_HOST_INTERVAL: 같은 호스트에 요청을 시작하는 최소 간격 (초)
+# - LINKCHECK_TTL_HOURS / LINKCHECK_RETRY_HOURS: 정상 / 실패 결과 캐시 유지 시간
+# - LINKCHECK_SKIP_HOSTS: 응답 코드로 생존을 판단할 수 없는 호스트 (공백 구분)
+export LINKCHECK_ENABLED=true
+export LINKCHECK_DIR="$DATA_DIR/linkcheck"
+export LINKCHECK_MAX_PARALLEL=32
+export LINKCHECK_PER_HOST=4
+export LINKCHECK_HOST_INTERVAL=0.1
+export LINKCHECK_TIMEOUT=10
+export LINKCHECK_TTL_HOURS=168
+export LINKCHECK_RETRY_HOURS=12
+export LINKCHECK_SKIP_HOSTS="x.com twitter.com"
+
+# 이미지/미디어 미러링 (src/crawler/mirror_media.py, 저장소: data/media/, 내용 해시 기준으로 한 번만 저장)
+# - MEDIA_WEB_PATH / MEDIA_URL_PREFIX: web 레포 안의 저장 경로 / 사이트에서의 URL 경로
+# - MEDIA_MAX_BYTES / MEDIA_MAX_TOTAL_BYTES: 파일당 / 이슈당 크기 제한 (넘으면 원본 링크 유지)
+export MEDIA_MIRROR_ENABLED=true
+export MEDIA_DIR="$DATA_DIR/media"
+export MEDIA_WEB_PATH="public/ainews/media"
+export MEDIA_URL_PREFIX="/ainews/media"
+export MEDIA_MAX_BYTES=10485760
+export MEDIA_MAX_TOTAL_BYTES=104857600
+export MEDIA_MAX_PARALLEL=8
+export MEDIA_PER_HOST=4
+export MEDIA_TIMEOUT=30
+
+# 번역 대상 언어 (공백 구분, 한 번 크롤링한 원문을 언어별로 동시에 번역/검토/생성)
+# - ko: prompts/*.txt 사용, 작업 디렉토리 OUTPUT_DIR/<slug>
+# - 그 외: prompts/<lang>/에 같은 이름의 프롬프트 세트 필요, 작업 디렉토리 OUTPUT_DIR/<slug>/<lang>
+export TARGET_LANGS="${TARGET_LANGS:-ko}"
 
 # 환경 변수 파일 로드 (존재하는 경우)
 if [[ -f "$CONFIG_DIR/config.env" ]]; then
     source "$CONFIG_DIR/config.env"
 fi
 
+# 통합 Python CLI (src/newsauto.py): newsauto <command> [args...]
+newsauto() {
+    python3 "$PROJECT_ROOT/src/newsauto.py" "$@"
+}
+
 # 필수 디렉토리 생성
 ensure_directories() {
     mkdir -p "$DATA_DIR" "$OUTPUT_DIR" "$LOGS_DIR"
@@ -64,7 +227,7 @@ check_dependencies() {
         missing+=("codex ($CODEX_BIN)")
     fi
 
-    # Claude CLI는 REVIEW_MODE가 claude/auto일 때만 필수
+    # Claude CLI는 REVIEW_MODE가 claude/auto/chunked일 때만 필수
     if [[ "$review_mode" != "local" ]]; then
         if [[ ! -x "$CLAUDE_BIN" ]]; then
             missing+=("claude ($CLAUDE_BIN)")
@@ -87,14 +250,45 @@ check_dependencies() {
     return 0
 }
 
-# 프롬프트 파일 확인
+# 언어별 프롬프트 파일 경로
+# 인자: <lang> <ko 프롬프트 경로> (ko는 그대로, 그 외는 prompts/<lang>/<같은 파일명>)
+lang_prompt_file() {
+    local lang="$1"
+    local ko_prompt="$2"
+
+    if [[ "$lang" == "ko" ]]; then
+        echo "$ko_prompt"
+    else
+        echo "$PROMPTS_DIR/$lang/$(basename "$ko_prompt")"
+    fi
+}
+
+# 언어별 작업 디렉토리
+# 인자: <work_dir> <lang> (ko는 work_dir 그대로, 그 외는 work_dir/<lang>)
+lang_work_dir() {
+    local work_dir="$1"
+    local lang="$2"
+
+    if [[ "$lang" == "ko" ]]; then
+        echo "$work_dir"
+    else
+        echo "$work_dir/$lang"
+    fi
+}
+
+# 프롬프트 파일 확인 (TARGET_LANGS의 모든 언어)
 check_prompts() {
     local missing=()
+    local lang prompt
 
-    for prompt in "$TRANSLATE_WITH_LINKS_PROMPT" "$TRANSLATE_NO_HEADLINE_PROMPT" "$REVIEW_LINKS_PROMPT"; do
-        if [[ ! -f "$prompt" ]]; then
-            missing+=("$prompt")
-        fi
+    for lang in $TARGET_LANGS; do
+        for prompt in "$TRANSLATE_WITH_LINKS_PROMPT" "$TRANSLATE_NO_HEADLINE_PROMPT" "$REVIEW_LINKS_PROMPT" "$TRANSLATE_DELTA_PROMPT" \
+                "$REVIEW_SECTION_PROMPT"; do
+            prompt=$(lang_prompt_file "$lang" "$prompt")
+            if [[ ! -f "$prompt" ]]; then
+                missing+=("$prompt")
+            fi
+        done
     done
 
     if [[ ${#missing[@]} -gt 0 ]]; then
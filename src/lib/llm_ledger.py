@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+llm_ledger.py - LLM 호출 장부
+Codex/Claude 호출마다 slug, 단계(translate, retranslate, delta, hedge, review), 모델,
+추정 입력/출력 토큰, 지연 시간, 결과를 data/metrics/llm_ledger.jsonl에 기록하고
+일자/모델/단계별로 집계합니다.
+
+토큰 수는 토크나이저 없이 추정합니다: ASCII는 4자당 1토큰, 그 외(한글 등)는 1자당 1토큰.
+절대값보다는 프롬프트 변경 등으로 인한 상대적 증감을 보기 위한 값입니다.
+"""
+
+import os
+import sys
+import json
+import fcntl
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.metrics import METRICS_DIR, percentile, current_run_id  # noqa: E402
+
+LEDGER_FILE = METRICS_DIR / "llm_ledger.jsonl"
+
+# hedge: 병렬 번역의 두 번째 이후 후보 (첫 후보는 translate, translate/hedge.py)
+STAGES = ["translate", "retranslate", "delta", "hedge", "review"]
+OUTCOMES = ["ok", "pass", "fail", "invalid", "error"]
+GROUP_KEYS = ["day", "model", "stage", "slug", "route"]
+
+
+def estimate_tokens(text: str) -> int:
+    """문자 종류별 휴리스틱으로 토큰 수를 추정합니다."""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other_chars = len(text) - ascii_chars
+    return -(-ascii_chars // 4) + other_chars
+
+
+def _read_text(path: Optional[Path]) -> str:
+    if not path or not path.exists():
+        return ""
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def record(
+    stage: str,
+    model: str,
+    input_text: str,
+    output_text: str,
+    latency_ms: float,
+    outcome: str,
+    slug: Optional[str] = None,
+    **fields,
+) -> dict:
+    """LLM 호출 1건을 장부에 기록합니다."""
+    entry = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "run_id": current_run_id(),
+        "slug": slug or os.environ.get("NEWSAUTO_SLUG", ""),
+        "stage": stage,
+        "model": model,
+        "input_tokens": estimate_tokens(input_text),
+        "output_tokens": estimate_tokens(output_text),
+        "latency_ms": round(latency_ms, 1),
+        "outcome": outcome,
+    }
+    entry.update({k: v for k, v in fields.items() if v})
+
+    METRICS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LEDGER_FILE, "a", encoding="utf-8") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        fcntl.flock(f, fcntl.LOCK_UN)
+    return entry
+
+
+def load_entries(days: Optional[int] = None) -> list[dict]:
+    """장부 항목을 로드합니다 (days가 주어지면 최근 N일만)."""
+    if not LEDGER_FILE.exists():
+        return []
+
+    since = (datetime.now() - timedelta(days=days)).isoformat() if days else ""
+    entries = []
+    with open(LEDGER_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("ts", "") >= since:
+                entries.append(entry)
+    return entries
+
+
+def _group_value(entry: dict, key: str) -> str:
+    if key == "day":
+        return entry.get("ts", "")[:10]
+    return str(entry.get(key, "")) or "-"
+
+
+def aggregate(entries: list[dict], keys: list[str]) -> list[dict]:
+    """keys 조합별로 호출 수, 토큰 합계, 지연 시간을 집계합니다."""
+    groups: dict[tuple, list[dict]] = {}
+    for entry in entries:
+        group = tuple(_group_value(entry, key) for key in keys)
+        groups.setdefault(group, []).append(entry)
+
+    rows = []
+    for group, items in sorted(groups.items()):
+        latencies = [e.get("latency_ms", 0) for e in items]
+        row = dict(zip(keys, group))
+        row.update({
+            "calls": len(items),
+            "input_tokens": sum(e.get("input_tokens", 0) for e in items),
+            "output_tokens": sum(e.get("output_tokens", 0) for e in items),
+            "avg_input_tokens": sum(e.get("input_tokens", 0) for e in items) // len(items),
+            "p50_latency_ms": percentile(latencies, 50),
+            "p95_latency_ms": percentile(latencies, 95),
+            "failures": sum(1 for e in items if e.get("outcome") in ("fail", "invalid", "error")),
+        })
+        rows.append(row)
+    return rows
+
+
+def format_report(rows: list[dict], keys: list[str]) -> str:
+    """집계 결과를 표 형식 문자열로 변환합니다."""
+    if not rows:
+        return "No LLM calls recorded."
+
+    widths = {key: max(len(key), *(len(row[key]) for row in rows)) for key in keys}
+    header = " ".join(f"{key:<{widths[key]}}" for key in keys)
+    lines = [
+        f"{header} {'calls':>5} {'in_tok':>9} {'out_tok':>9} {'avg_in':>8} {'p50':>8} {'p95':>8} {'fail':>4}"
+    ]
+    for row in rows:
+        cols = " ".join(f"{row[key]:<{widths[key]}}" for key in keys)
+        lines.append(
+            f"{cols} {row['calls']:>5} {row['input_tokens']:>9} {row['output_tokens']:>9} "
+            f"{row['avg_input_tokens']:>8} {row['p50_latency_ms'] / 1000:>7.1f}s "
+            f"{row['p95_latency_ms'] / 1000:>7.1f}s {row['failures']:>4}"
+        )
+
+    total_in = sum(row["input_tokens"] for row in rows)
+    total_out = sum(row["output_tokens"] for row in rows)
+    lines.append(f"\nTotal: {sum(row['calls'] for row in rows)} call(s), ~{total_in} in / ~{total_out} out tokens")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="LLM 호출 장부를 기록/집계합니다."
+    )
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # record 명령
+    record_parser = subparsers.add_parser("record", help="LLM 호출 기록")
+    record_parser.add_argument("--stage", required=True, choices=STAGES, help="파이프라인 단계")
+    record_parser.add_argument("--model", required=True, help="모델 이름")
+    record_parser.add_argument("--reasoning-effort", help="추론 강도 (Codex)")
+    record_parser.add_argument("--route", help="라우팅 단계 (translate/routing.py)")
+    record_parser.add_argument("--input-file", type=Path, help="프롬프트 파일 (입력 토큰 추정)")
+    record_parser.add_argument("--output-file", type=Path, help="응답 파일 (출력 토큰 추정)")
+    record_parser.add_argument("--latency-ms", type=float, required=True, help="호출 지연 시간 (ms)")
+    record_parser.add_argument("--outcome", required=True, choices=OUTCOMES, help="호출 결과")
+    record_parser.add_argument("--slug", help="이슈 slug (기본: NEWSAUTO_SLUG)")
+
+    # report 명령
+    report_parser = subparsers.add_parser("report", help="일자/모델/단계별 집계")
+    report_parser.add_argument(
+        "--by",
+        default="day,model,stage",
+        help=f"집계 기준 (쉼표 구분, {'/'.join(GROUP_KEYS)}; default: day,model,stage)"
+    )
+    report_parser.add_argument("--days", type=int, help="최근 N일만 집계")
+    report_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(
+            args.stage,
+            args.model,
+            _read_text(args.input_file),
+            _read_text(args.output_file),
+            args.latency_ms,
+            args.outcome,
+            slug=args.slug,
+            reasoning_effort=args.reasoning_effort,
+            route=args.route,
+        )
+
+    elif args.command == "report":
+        keys = [key.strip() for key in args.by.split(",") if key.strip()]
+        unknown = [key for key in keys if key not in GROUP_KEYS]
+        if unknown:
+            parser.error(f"Unknown --by key(s): {', '.join(unknown)}")
+
+        rows = aggregate(load_entries(args.days), keys)
+        if args.json:
+            print(json.dumps(rows, indent=2, ensure_ascii=False))
+        else:
+            print(format_report(rows, keys))
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
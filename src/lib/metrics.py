@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+metrics.py - 단계별 메트릭 기록
+파이프라인 각 단계의 소요 시간, 입출력 바이트, 링크 수, LLM 실행 시간,
+종료 코드, 재시도 횟수를 구조화된 레코드로 남깁니다.
+
+- data/metrics/metrics.jsonl: 모든 레코드 (한 줄에 하나씩 추가)
+- data/metrics/news_automation.prom: Prometheus textfile collector 형식 (단계별 최신값)
+"""
+
+import os
+import sys
+import json
+import fcntl
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+METRICS_DIR = Path(os.environ.get("METRICS_DIR") or PROJECT_ROOT / "data" / "metrics")
+METRICS_FILE = METRICS_DIR / "metrics.jsonl"
+LATEST_FILE = METRICS_DIR / "latest.json"
+PROM_FILE = METRICS_DIR / "news_automation.prom"
+
+# Prometheus로 내보낼 숫자 필드: (필드명, 메트릭 이름, 설명)
+PROM_FIELDS = [
+    ("duration_ms", "newsauto_stage_duration_seconds", "Stage wall time in seconds"),
+    ("exit_code", "newsauto_stage_exit_code", "Stage exit code (0 = success)"),
+    ("input_bytes", "newsauto_stage_input_bytes", "Stage input size in bytes"),
+    ("output_bytes", "newsauto_stage_output_bytes", "Stage output size in bytes"),
+    ("download_bytes", "newsauto_stage_download_bytes", "Bytes downloaded from the source"),
+    ("prompt_bytes", "newsauto_stage_prompt_bytes", "LLM prompt size in bytes"),
+    ("link_count", "newsauto_stage_link_count", "Number of markdown links"),
+    ("llm_wall_ms", "newsauto_stage_llm_wall_seconds", "LLM subprocess wall time in seconds"),
+    ("retries", "newsauto_stage_retries", "Retry / re-translation count"),
+]
+
+
+def current_run_id() -> str:
+    """현재 실행 ID (NEWSAUTO_RUN_ID, 없으면 단독 실행용 ID)"""
+    return os.environ.get("NEWSAUTO_RUN_ID") or f"adhoc-{datetime.now().strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+
+
+def _coerce(value: str):
+    """CLI로 받은 값을 숫자로 변환할 수 있으면 변환합니다."""
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def record(
+    stage: str,
+    duration_ms: Optional[float] = None,
+    exit_code: int = 0,
+    run_id: Optional[str] = None,
+    slug: Optional[str] = None,
+    **fields,
+) -> dict:
+    """단계 메트릭 레코드를 기록하고 Prometheus 파일을 갱신합니다."""
+    entry = {
+        "ts": datetime.now().isoformat(timespec="milliseconds"),
+        "run_id": run_id or current_run_id(),
+        "slug": slug or os.environ.get("NEWSAUTO_SLUG", ""),
+        "stage": stage,
+        "exit_code": exit_code,
+    }
+    if duration_ms is not None:
+        entry["duration_ms"] = round(duration_ms, 1)
+    entry.update({k: v for k, v in fields.items() if v is not None})
+
+    METRICS_DIR.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(entry, ensure_ascii=False) + "\n"
+
+    with open(METRICS_FILE, "a", encoding="utf-8") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(line)
+        fcntl.flock(f, fcntl.LOCK_UN)
+
+    _update_latest(entry)
+    return entry
+
+
+def _update_latest(entry: dict):
+    """단계별 최신 레코드를 갱신하고 Prometheus 파일을 다시 씁니다."""
+    with open(METRICS_DIR / "latest.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        latest = {}
+        if LATEST_FILE.exists():
+            try:
+                latest = json.loads(LATEST_FILE.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                latest = {}
+
+        latest[entry["stage"]] = entry
+        tmp = LATEST_FILE.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(latest, indent=2, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(LATEST_FILE)
+
+        write_prometheus(latest)
+        fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def render_prometheus(latest: dict) -> str:
+    """단계별 최신 레코드를 Prometheus textfile 형식으로 변환합니다."""
+    lines = []
+    for field, name, help_text in PROM_FIELDS:
+        samples = []
+        for stage, entry in sorted(latest.items()):
+            value = entry.get(field)
+            if not isinstance(value, (int, float)):
+                continue
+            if field.endswith("_ms"):
+                value = value / 1000.0
+            samples.append(f'{name}{{stage="{stage}"}} {value}')
+        if samples:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(samples)
+
+    name = "newsauto_stage_last_run_timestamp_seconds"
+    lines.append(f"# HELP {name} Unix time of the last record for the stage")
+    lines.append(f"# TYPE {name} gauge")
+    for stage, entry in sorted(latest.items()):
+        ts = datetime.fromisoformat(entry["ts"]).timestamp()
+        lines.append(f'{name}{{stage="{stage}"}} {ts:.3f}')
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(latest: dict):
+    """Prometheus textfile을 원자적으로 교체합니다 (collector가 반쯤 쓴 파일을 읽지 않도록)."""
+    tmp = PROM_FILE.with_suffix(".prom.tmp")
+    tmp.write_text(render_prometheus(latest), encoding="utf-8")
+    tmp.replace(PROM_FILE)
+
+
+def load_records() -> list[dict]:
+    """metrics.jsonl의 모든 레코드를 로드합니다."""
+    if not METRICS_FILE.exists():
+        return []
+
+    records = []
+    with open(METRICS_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """nearest-rank 방식 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(-(-pct * len(ordered) // 100)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(records: list[dict], runs: int = 20) -> list[dict]:
+    """최근 N개 실행에서 단계별 소요 시간 p50/p95를 계산합니다."""
+    run_order = []
+    seen = set()
+    for r in reversed(records):
+        run_id = r.get("run_id")
+        if run_id not in seen:
+            seen.add(run_id)
+            run_order.append(run_id)
+        if len(run_order) >= runs:
+            break
+    recent_runs = set(run_order)
+
+    by_stage: dict[str, list[dict]] = {}
+    for r in records:
+        if r.get("run_id") in recent_runs and "duration_ms" in r:
+            by_stage.setdefault(r["stage"], []).append(r)
+
+    rows = []
+    for stage, items in by_stage.items():
+        durations = [r["duration_ms"] for r in items]
+        failures = sum(1 for r in items if r.get("exit_code", 0) != 0)
+        rows.append({
+            "stage": stage,
+            "count": len(items),
+            "p50_ms": percentile(durations, 50),
+            "p95_ms": percentile(durations, 95),
+            "total_ms": sum(durations),
+            "failures": failures,
+            "retries": sum(r.get("retries", 0) for r in items if isinstance(r.get("retries"), (int, float))),
+        })
+
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+
+def format_summary(rows: list[dict], runs: int) -> str:
+    """summary 결과를 표 형식 문자열로 변환합니다."""
+    if not rows:
+        return "No metrics recorded."
+
+    # 전체 대비 비율은 최상위 단계 기준 (하위 단계 'translate.codex' 등은 중복 합산하지 않음)
+    grand_total = sum(
+        row["total_ms"] for row in rows
+        if row["stage"] != "pipeline" and "." not in row["stage"]
+    ) or 1
+    lines = [
+        f"Stage durations over the last {runs} run(s):",
+        f"{'stage':<24} {'count':>5} {'p50':>9} {'p95':>9} {'share':>6} {'fail':>4} {'retry':>5}",
+    ]
+    for row in rows:
+        share = "" if row["stage"] == "pipeline" else f"{row['total_ms'] / grand_total:.0%}"
+        lines.append(
+            f"{row['stage']:<24} {row['count']:>5} "
+            f"{row['p50_ms'] / 1000:>8.2f}s {row['p95_ms'] / 1000:>8.2f}s "
+            f"{share:>6} {row['failures']:>4} {int(row['retries']):>5}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="파이프라인 단계별 메트릭을 기록/조회합니다."
+    )
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # record 명령
+    record_parser = subparsers.add_parser("record", help="단계 메트릭 기록")
+    record_parser.add_argument("stage", help="단계 이름 (예: crawl, translate)")
+    record_parser.add_argument("--duration-ms", type=float, help="소요 시간 (ms)")
+    record_parser.add_argument("--exit-code", type=int, default=0, help="종료 코드")
+    record_parser.add_argument("--run-id", help="실행 ID (기본: NEWSAUTO_RUN_ID)")
+    record_parser.add_argument("--slug", help="이슈 slug (기본: NEWSAUTO_SLUG)")
+    record_parser.add_argument(
+        "--field",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="추가 필드 (input_bytes, output_bytes, link_count, llm_wall_ms, retries 등)"
+    )
+
+    # summary 명령
+    summary_parser = subparsers.add_parser("summary", help="단계별 p50/p95 소요 시간")
+    summary_parser.add_argument("--runs", type=int, default=20, help="최근 실행 수 (default: 20)")
+    summary_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    # prom 명령
+    subparsers.add_parser("prom", help="Prometheus textfile 출력")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        fields = {}
+        for item in args.field:
+            key, sep, value = item.partition("=")
+            if not sep:
+                parser.error(f"Invalid --field (expected KEY=VALUE): {item}")
+            fields[key] = _coerce(value)
+        record(
+            args.stage,
+            duration_ms=args.duration_ms,
+            exit_code=args.exit_code,
+            run_id=args.run_id,
+            slug=args.slug,
+            **fields,
+        )
+
+    elif args.command == "summary":
+        rows = summarize(load_records(), args.runs)
+        if args.json:
+            print(json.dumps(rows, indent=2, ensure_ascii=False))
+        else:
+            print(format_summary(rows, args.runs))
+
+    elif args.command == "prom":
+        latest = {}
+        if LATEST_FILE.exists():
+            latest = json.loads(LATEST_FILE.read_text(encoding="utf-8"))
+        sys.stdout.write(render_prometheus(latest))
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/bin/bash
+# metrics.sh - 단계별 메트릭 기록 헬퍼
+# smol.ai 한국어 뉴스 자동 발행 시스템
+#
+# 사용법:
+#   metrics_init_run                           # 실행 ID 생성 (NEWSAUTO_RUN_ID)
+#   metrics_stage_start crawl
+#   metrics_stage_end crawl 0 output_bytes=1234 link_count=56
+#   llm_ledger_record translate gpt-5.4 prompt.txt out.md 4200 ok medium light
+#
+# 레코드는 src/lib/metrics.py가 data/metrics/에 기록합니다.
+# tracing.sh가 로드되어 있으면 같은 이름의 스팬도 함께 열고 닫습니다.
+
+_METRICS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+# 단계별 시작 시각 (ms)
+declare -A _METRICS_STAGE_START=()
+
+# 현재 시각 (ms)
+metrics_now_ms() {
+    echo $(( $(date +%s%N) / 1000000 ))
+}
+
+# 파일 크기 (바이트, 없으면 0)
+metrics_file_bytes() {
+    if [[ -f "$1" ]]; then
+        wc -c < "$1" | tr -d ' '
+    else
+        echo 0
+    fi
+}
+
+# 실행 ID 생성 (이미 있으면 유지하여 하위 스크립트와 공유)
+metrics_init_run() {
+    if [[ -z "$NEWSAUTO_RUN_ID" ]]; then
+        export NEWSAUTO_RUN_ID="$(date '+%Y%m%dT%H%M%S')-$$"
+    fi
+}
+
+# 단계 시작
+metrics_stage_start() {
+    _METRICS_STAGE_START["$1"]=$(metrics_now_ms)
+
+    if declare -F span_start > /dev/null; then
+        span_start "$1"
+    fi
+}
+
+# 단계 종료 및 기록
+# 인자: <stage> <exit_code> [key=value ...]
+metrics_stage_end() {
+    local stage="$1"
+    local exit_code="${2:-0}"
+    shift 2 || shift $#
+
+    local start="${_METRICS_STAGE_START[$stage]:-}"
+    local duration_args=()
+    if [[ -n "$start" ]]; then
+        duration_args=(--duration-ms "$(( $(metrics_now_ms) - start ))")
+        unset "_METRICS_STAGE_START[$stage]"
+    fi
+
+    local field_args=()
+    local field
+    for field in "$@"; do
+        field_args+=(--field "$field")
+    done
+
+    if declare -F span_end > /dev/null; then
+        span_end "$stage" "$exit_code" "$@"
+    fi
+
+    # 메트릭 기록 실패가 파이프라인을 멈추지 않도록 무시
+    python3 "$_METRICS_DIR/metrics.py" record "$stage" \
+        --exit-code "$exit_code" \
+        "${duration_args[@]}" \
+        "${field_args[@]}" 2>/dev/null || true
+}
+
+# LLM 호출 장부 기록 (src/lib/llm_ledger.py)
+# 인자: <stage> <model> <input_file> <output_file> <latency_ms> <outcome> [reasoning_effort] [route]
+llm_ledger_record() {
+    local effort_args=()
+    if [[ -n "${7:-}" ]]; then
+        effort_args=(--reasoning-effort "$7")
+    fi
+    if [[ -n "${8:-}" ]]; then
+        effort_args+=(--route "$8")
+    fi
+
+    python3 "$_METRICS_DIR/llm_ledger.py" record \
+        --stage "$1" \
+        --model "$2" \
+        --input-file "$3" \
+        --output-file "$4" \
+        --latency-ms "$5" \
+        --outcome "$6" \
+        "${effort_args[@]}" 2>/dev/null || true
+}
@@ -7,10 +7,14 @@
 _NOTIFY_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$_NOTIFY_DIR/config.sh"
 
-# 알림 파일 경로
-ALERT_FILE="$DATA_DIR/alerts.json"
+# 알림 저장소 (추가 전용 JSONL 세그먼트 + 오프셋 인덱스, src/lib/alerts.py)
+ALERTS_PY="$_NOTIFY_DIR/alerts.py"
 ALERT_LOG="$LOGS_DIR/alerts.log"
 
+# 마지막 log_alert 결과 (new | repeat | suppressed) 및 반복 횟수
+ALERT_OUTCOME=""
+ALERT_REPEAT_COUNT=0
+
 # 알림 레벨
 LEVEL_INFO="info"
 LEVEL_WARN="warning"
@@ -35,48 +39,18 @@ log_alert() {
     mkdir -p "$LOGS_DIR"
     echo "[$timestamp] [$level] $title: $message" >> "$ALERT_LOG"
 
-    # JSON 알림 파일에 추가
-    mkdir -p "$DATA_DIR"
-
-    local alert_json=$(cat <<EOF
-{
-  "timestamp": "$timestamp",
-  "level": "$level",
-  "title": "$title",
-  "message": "$message",
-  "context": "$context",
-  "acknowledged": false
-}
-EOF
-)
-
-    # alerts.json 업데이트
-    if [[ -f "$ALERT_FILE" ]]; then
-        # 기존 파일에 추가
-        local temp_file=$(mktemp)
-        python3 -c "
-import json
-import sys
-
-alert = json.loads('''$alert_json''')
-
-try:
-    with open('$ALERT_FILE', 'r') as f:
-        data = json.load(f)
-except:
-    data = {'alerts': []}
-
-data['alerts'].append(alert)
-
-# 최근 100개만 유지
-data['alerts'] = data['alerts'][-100:]
-
-with open('$ALERT_FILE', 'w') as f:
-    json.dump(data, f, indent=2, ensure_ascii=False)
-"
-    else
-        # 새 파일 생성
-        echo "{\"alerts\": [$alert_json]}" > "$ALERT_FILE"
+    # 알림 저장소에 추가 (같은 원인의 반복 알림은 하나로 합쳐져 횟수만 증가)
+    local result
+    result=$(python3 "$ALERTS_PY" append \
+        --level="$level" \
+        --title="$title" \
+        --message="$message" \
+        --context="$context" 2>/dev/null) || result="new 0 1"
+    read -r ALERT_OUTCOME _ ALERT_REPEAT_COUNT <<< "$result"
+
+    if [[ "$ALERT_OUTCOME" != "new" ]]; then
+        echo "[ALERT:$level] $title (repeat x$ALERT_REPEAT_COUNT, $ALERT_OUTCOME)" >&2
+        return 0
     fi
 
     # 콘솔에도 출력
@@ -128,7 +102,10 @@ This may indicate a network issue or site unavailability.
 EOF
 )
 
-    create_failure_issue "[Automation] Crawler Failure: $error" "$issue_body" "bug,automation"
+    # 장애가 이어지는 동안 반복된 알림은 이슈를 새로 만들지 않음
+    if [[ "$ALERT_OUTCOME" == "new" ]]; then
+        create_failure_issue "[Automation] Crawler Failure: $error" "$issue_body" "bug,automation"
+    fi
 }
 
 # 검증 실패 알림 (사이트 구조 변경 감지)
@@ -176,7 +153,9 @@ python3 src/crawler/fetch_page.py "$url" --validate-only
 EOF
 )
 
-    create_failure_issue "[Automation] Site Structure Change Detected" "$issue_body" "bug,automation,urgent"
+    if [[ "$ALERT_OUTCOME" == "new" ]]; then
+        create_failure_issue "[Automation] Site Structure Change Detected" "$issue_body" "bug,automation,urgent"
+    fi
 }
 
 # 번역 실패 알림
@@ -241,45 +220,18 @@ create_failure_issue() {
 
 # 미확인 알림 개수 반환
 get_unacknowledged_count() {
-    if [[ ! -f "$ALERT_FILE" ]]; then
-        echo "0"
-        return
-    fi
-
-    python3 -c "
-import json
-try:
-    with open('$ALERT_FILE', 'r') as f:
-        data = json.load(f)
-    count = sum(1 for a in data.get('alerts', []) if not a.get('acknowledged', False))
-    print(count)
-except:
-    print(0)
-"
+    python3 "$ALERTS_PY" count 2>/dev/null || echo "0"
 }
 
 # 최근 알림 표시
 show_recent_alerts() {
     local count="${1:-5}"
+    python3 "$ALERTS_PY" list -n "$count"
+}
 
-    if [[ ! -f "$ALERT_FILE" ]]; then
-        echo "No alerts found."
-        return
-    fi
-
-    python3 -c "
-import json
-try:
-    with open('$ALERT_FILE', 'r') as f:
-        data = json.load(f)
-    alerts = data.get('alerts', [])[-$count:]
-    for a in reversed(alerts):
-        ack = '✓' if a.get('acknowledged') else '○'
-        print(f\"{ack} [{a['timestamp']}] [{a['level']}] {a['title']}\")
-        print(f\"  {a['message']}\")
-except Exception as e:
-    print(f'Error: {e}')
-"
+# 알림 확인 처리 (ID 목록 또는 --all)
+acknowledge_alerts() {
+    python3 "$ALERTS_PY" ack "$@"
 }
 
 # 직접 실행 시 테스트
@@ -294,8 +246,12 @@ if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
         "count")
             echo "Unacknowledged alerts: $(get_unacknowledged_count)"
             ;;
+        "ack")
+            shift
+            acknowledge_alerts "${@:---all}"
+            ;;
         *)
-            echo "Usage: $0 {test|show [n]|count}"
+            echo "Usage: $0 {test|show [n]|count|ack [id...|--all]}"
             ;;
     esac
 fi
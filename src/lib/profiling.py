@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+profiling.py - 엔트리포인트 프로파일링 훅
+모든 Python 엔트리포인트에 공통 --profile 옵션을 제공합니다.
+
+- --profile PATH: cProfile 결과(pstats)를 PATH에, 요약(상위 함수 + tracemalloc 피크 메모리)을
+  PATH.txt에 저장합니다.
+- NEWSAUTO_PROFILE_DIR: 설정하면 코드/명령 수정 없이 모든 엔트리포인트를
+  <dir>/<name>-<timestamp>-<pid>.prof로 프로파일링합니다 (main.sh 전체 실행 분석용).
+
+cProfile/pstats/tracemalloc은 프로파일링할 때만 import합니다 (모든 엔트리포인트의 기동 비용).
+"""
+
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from lib.tracing import traced_main
+
+PROFILE_DIR_ENV = "NEWSAUTO_PROFILE_DIR"
+TOP_FUNCTIONS = 30
+
+
+def add_profile_argument(parser: argparse.ArgumentParser):
+    """파서에 공통 --profile 옵션을 추가합니다 (도움말 표시용, 실제 처리는 run_main)."""
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="PATH",
+        help="cProfile 결과(pstats)와 피크 메모리 요약(PATH.txt)을 저장"
+    )
+
+
+def _profile_path(name: str, argv: list[str]) -> Optional[Path]:
+    """argv의 --profile 또는 NEWSAUTO_PROFILE_DIR에서 프로파일 경로를 결정합니다."""
+    if not any(arg.startswith("--profile") for arg in argv) and not os.environ.get(PROFILE_DIR_ENV):
+        return None
+
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument("--profile", type=Path)
+    known, _ = pre_parser.parse_known_args(argv)
+    if known.profile:
+        return known.profile
+
+    profile_dir = os.environ.get(PROFILE_DIR_ENV)
+    if profile_dir:
+        stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        return Path(profile_dir) / f"{name}-{stamp}-{os.getpid()}.prof"
+    return None
+
+
+def format_report(profiler, wall_s: float, peak_bytes: int, name: str) -> str:
+    """프로파일 요약 텍스트를 생성합니다."""
+    import io
+    import pstats
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+
+    header = [
+        f"Entry point: {name}",
+        f"Argv: {' '.join(sys.argv[1:])}",
+        f"Wall time: {wall_s:.4f}s",
+        f"Peak traced memory: {peak_bytes / 1024:.1f} KiB",
+        "",
+    ]
+    return "\n".join(header) + stream.getvalue()
+
+
+def profile_call(func: Callable, path: Path, name: str):
+    """func를 cProfile + tracemalloc으로 실행하고 결과를 path에 저장합니다."""
+    import cProfile
+    import tracemalloc
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    try:
+        return profiler.runcall(func)
+    finally:
+        wall_s = time.perf_counter() - start
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        profiler.dump_stats(str(path))
+        report_path = path.with_name(path.name + ".txt")
+        report_path.write_text(format_report(profiler, wall_s, peak_bytes, name), encoding="utf-8")
+        print(
+            f"Profile saved: {path} (wall {wall_s:.3f}s, peak {peak_bytes / 1024:.1f} KiB)",
+            file=sys.stderr,
+        )
+
+
+def run_main(name: str, main_func: Callable):
+    """엔트리포인트를 트레이싱 스팬 안에서 실행하고, 요청 시 프로파일링합니다."""
+    path = _profile_path(name, sys.argv[1:])
+    if path is None:
+        return traced_main(name, main_func)
+    return traced_main(name, lambda: profile_call(main_func, path, name))
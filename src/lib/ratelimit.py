@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+ratelimit.py - GitHub 요청 속도 제한 관리 (rate-limit governor)
+check_feed/fetch_page 등 GitHub에 요청하는 모든 프로세스가 호스트별 예산(토큰 버킷)을
+data/ratelimit/buckets.json에서 파일 잠금으로 공유합니다.
+
+- 예산: 응답의 X-RateLimit-Limit/Remaining/Reset 헤더로 갱신하고, 요청마다 1개씩 미리 차감합니다
+  (동시에 실행 중인 다른 프로세스의 요청도 바로 반영됨). 같은 윈도우 안에서는 헤더와 로컬 값 중
+  작은 쪽을 씁니다.
+- 우선순위: high(새 이슈 확인)는 예산을 끝까지 쓸 수 있고, normal은 GITHUB_RATE_RESERVE개,
+  low(백필 등 대량 수집)는 그보다 많은 몫(한도의 25%)을 남겨둡니다. low는 남은 예산을 리셋 시각까지
+  고르게 나눠 쓰도록 요청 간격을 둡니다.
+- 예산이 바닥나면 리셋 시각까지 기다리고, GITHUB_RATE_MAX_WAIT초보다 오래 기다려야 하면
+  RateLimited(URLError)로 즉시 실패합니다 (재시도하지 않음, 알림 기록).
+- 403/429 속도 제한 응답(Remaining: 0 또는 Retry-After)은 예산에 반영한 뒤 기다렸다가 다시 보냅니다.
+  MAX_LIMITED_RETRIES회를 넘기면 RateLimited로 실패합니다 (resilience가 다시 재시도하지 않도록, 재시도는 이 층에서만).
+- 토큰: GITHUB_API_TOKEN이 있으면 Authorization 헤더로 보냅니다 (비인증 60회/시간 → 5000회/시간).
+  gh CLI가 쓰는 GITHUB_TOKEN과 분리해 발행 권한에 영향을 주지 않습니다.
+
+HTTP_CASSETTE_MODE=replay에서는 네트워크를 쓰지 않으므로 예산을 확인/갱신하지 않습니다.
+
+사용법:
+    newsauto ratelimit status
+    newsauto ratelimit probe          # /rate_limit 조회로 예산 갱신 (예산을 소모하지 않음)
+    newsauto ratelimit reset api.github.com
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import fcntl
+import argparse
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib import cassette  # noqa: E402
+from lib.metrics import METRICS_DIR  # noqa: E402
+
+RATELIMIT_DIR = Path(os.environ.get("RATELIMIT_DIR") or PROJECT_ROOT / "data" / "ratelimit")
+BUCKETS_FILE = RATELIMIT_DIR / "buckets.json"
+LOCK_FILE = RATELIMIT_DIR / "buckets.lock"
+PROM_FILE = METRICS_DIR / "newsauto_ratelimit.prom"
+
+# 예산을 관리할 호스트 (쉼표 구분)
+HOSTS = set(filter(None, os.environ.get("GITHUB_RATE_HOSTS", "api.github.com,raw.githubusercontent.com").split(",")))
+RESERVE = int(os.environ.get("GITHUB_RATE_RESERVE", 5))
+MAX_WAIT = float(os.environ.get("GITHUB_RATE_MAX_WAIT", 900))
+
+PRIORITIES = ["high", "normal", "low"]
+# low 우선순위가 남겨둘 몫 (한도 대비)
+LOW_RESERVE_RATIO = 0.25
+# 속도 제한 응답 후 다시 보내는 최대 횟수
+MAX_LIMITED_RETRIES = 2
+
+RATE_LIMIT_URL = "https://api.github.com/rate_limit"
+
+
+class RateLimited(URLError):
+    """예산이 바닥나 GITHUB_RATE_MAX_WAIT 안에 보낼 수 없음 (기존 URLError 처리 경로로 보고됨)"""
+
+    def __init__(self, host: str, wait: float):
+        super().__init__(f"rate limit budget exhausted for {host} (resets in {int(wait)}s)")
+        self.host = host
+        self.wait = wait
+
+
+# ============================================
+# 상태 저장소
+# ============================================
+
+@contextmanager
+def store_lock():
+    """예산 파일 배타 잠금 (여러 프로세스가 같은 호스트 예산을 차감)"""
+    RATELIMIT_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def load_buckets() -> dict:
+    if not BUCKETS_FILE.exists():
+        return {}
+    try:
+        return json.loads(BUCKETS_FILE.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+
+def _save_buckets(buckets: dict):
+    tmp = BUCKETS_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(buckets, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(BUCKETS_FILE)
+    write_prometheus(buckets)
+
+
+def _new_bucket() -> dict:
+    return {
+        "limit": None,
+        "remaining": None,
+        "reset": None,
+        "blocked_until": None,
+        "next_low_at": 0.0,
+        "requests_total": 0,
+        "throttled_total": 0,
+        "limited_total": 0,
+    }
+
+
+# ============================================
+# 예산 차감/갱신
+# ============================================
+
+def _floor(bucket: dict, priority: str) -> int:
+    """우선순위별로 남겨둘 예산"""
+    if priority == "high":
+        return 0
+    if priority == "normal":
+        return RESERVE
+    return max(RESERVE * 2, math.ceil(bucket["limit"] * LOW_RESERVE_RATIO))
+
+
+def reserve(host: str, priority: str, now: Optional[float] = None) -> float:
+    """요청 1회분 예산을 차감합니다. 바로 보낼 수 있으면 0, 아니면 기다려야 할 초를 반환합니다."""
+    now = now if now is not None else time.time()
+    with store_lock():
+        buckets = load_buckets()
+        bucket = buckets.setdefault(host, _new_bucket())
+
+        if bucket["blocked_until"] and now < bucket["blocked_until"]:
+            return bucket["blocked_until"] - now
+
+        # 헤더를 본 적이 있을 때만 예산 확인 (없으면 첫 응답으로 학습)
+        if bucket["limit"] is not None:
+            if bucket["reset"] is not None and now >= bucket["reset"]:
+                # 윈도우가 지남: 다시 채우고, 새 리셋 시각은 다음 응답 헤더로 알게 됨
+                bucket.update(remaining=bucket["limit"], reset=None, next_low_at=0.0)
+
+            spare = bucket["remaining"] - _floor(bucket, priority)
+            if spare <= 0:
+                # 리셋 시각을 모르면 (다른 프로세스의 응답을 기다리는 중) 잠깐 뒤 다시 확인
+                return max(bucket["reset"] - now, 0.01) if bucket["reset"] is not None else 1.0
+
+            if priority == "low" and bucket["reset"] is not None:
+                # 남은 몫을 리셋까지 고르게 나눠 씀 (버킷이 일정 속도로 채워지는 것과 같음)
+                if now < bucket["next_low_at"]:
+                    return bucket["next_low_at"] - now
+                bucket["next_low_at"] = now + (bucket["reset"] - now) / spare
+            bucket["remaining"] -= 1
+
+        bucket["requests_total"] += 1
+        _save_buckets(buckets)
+        return 0.0
+
+
+def _header_int(headers, name: str) -> Optional[int]:
+    value = headers.get(name) if headers else None
+    if value is None or not value.strip().isdigit():
+        return None
+    return int(value.strip())
+
+
+def _retry_after(headers, now: float) -> Optional[float]:
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limited(status: int, headers) -> bool:
+    """403/429 중 속도 제한 응답인지 (권한 부족 403과 구분)"""
+    if status == 429:
+        return True
+    return status == 403 and headers is not None and (
+        _header_int(headers, "X-RateLimit-Remaining") == 0 or headers.get("Retry-After") is not None
+    )
+
+
+def update(host: str, status: int, headers, now: Optional[float] = None):
+    """응답 헤더로 예산을 갱신합니다."""
+    now = now if now is not None else time.time()
+    limit = _header_int(headers, "X-RateLimit-Limit")
+    remaining = _header_int(headers, "X-RateLimit-Remaining")
+    reset = _header_int(headers, "X-RateLimit-Reset")
+    limited = is_rate_limited(status, headers)
+    if limit is None and not limited:
+        return
+
+    with store_lock():
+        buckets = load_buckets()
+        bucket = buckets.setdefault(host, _new_bucket())
+        if limit is not None and remaining is not None and reset is not None:
+            # 같은 윈도우면 다른 프로세스가 이미 차감한 몫을 유지
+            if bucket["reset"] == reset and bucket["remaining"] is not None:
+                remaining = min(remaining, bucket["remaining"])
+            elif bucket["reset"] != reset:
+                bucket["next_low_at"] = 0.0
+            bucket.update(limit=limit, remaining=remaining, reset=reset)
+        if limited:
+            bucket["limited_total"] += 1
+            retry_after = _retry_after(headers, now)
+            if retry_after is not None:
+                bucket["blocked_until"] = now + retry_after
+            elif bucket["reset"] and bucket["reset"] > now:
+                bucket["remaining"] = 0
+            else:
+                bucket["blocked_until"] = now + 60
+        _save_buckets(buckets)
+
+
+def _count_throttled(host: str):
+    with store_lock():
+        buckets = load_buckets()
+        buckets.setdefault(host, _new_bucket())["throttled_total"] += 1
+        _save_buckets(buckets)
+
+
+def acquire(
+    host: str,
+    priority: str = "normal",
+    max_wait: float = MAX_WAIT,
+    sleep: Callable[[float], None] = time.sleep,
+) -> float:
+    """예산을 얻을 때까지 기다립니다 (기다린 초를 반환). max_wait을 넘기면 RateLimited."""
+    waited = 0.0
+    throttled = False
+    while True:
+        wait = reserve(host, priority)
+        if wait <= 0:
+            return waited
+        if waited + wait > max_wait:
+            _alert_exhausted(host, priority, wait)
+            raise RateLimited(host, wait)
+        if not throttled:
+            _count_throttled(host)
+            throttled = True
+            print(f"[throttle] {host} priority={priority} wait={wait:.1f}s", file=sys.stderr)
+        sleep(wait)
+        waited += wait
+
+
+def _alert_exhausted(host: str, priority: str, wait: float):
+    """예산 부족으로 요청을 포기하면 알림 저장소에 기록 (같은 호스트는 중복 제거 윈도우로 묶임)"""
+    print(f"[rate_limited] {host} priority={priority} resets_in={int(wait)}s", file=sys.stderr)
+    try:
+        from lib.alerts import append
+        append(
+            "warning",
+            f"GitHub rate limit exhausted: {host}",
+            f"Skipped a {priority}-priority request; budget resets in {int(wait)}s. "
+            "Set GITHUB_API_TOKEN in config.env to raise the limit.",
+            context=host,
+        )
+    except OSError as e:
+        print(f"Failed to record alert: {e}", file=sys.stderr)
+
+
+def reset(hosts: Optional[list[str]] = None) -> int:
+    """저장된 예산을 지웁니다 (hosts가 없으면 전부). 지운 개수를 반환합니다."""
+    with store_lock():
+        buckets = load_buckets()
+        removed = [h for h in buckets if not hosts or h in hosts]
+        for host in removed:
+            del buckets[host]
+        _save_buckets(buckets)
+    return len(removed)
+
+
+# ============================================
+# urlopen 대체
+# ============================================
+
+def governed_host(url: str) -> Optional[str]:
+    """예산을 관리할 URL이면 호스트 (재생 중이거나 다른 호스트면 None)"""
+    # 재생은 네트워크를 쓰지 않음 (기록된 헤더로 실제 예산을 바꾸지 않도록)
+    if os.environ.get("HTTP_CASSETTE_MODE") == "replay":
+        return None
+    host = urlsplit(url).hostname
+    return host if host in HOSTS else None
+
+
+def urlopen(request: Request, timeout: float, priority: Optional[str] = None):
+    """cassette.urlopen 대신 사용 (GitHub 호스트면 예산 확인, 토큰 추가, 헤더로 예산 갱신)"""
+    host = governed_host(request.full_url)
+    if host is None:
+        return cassette.urlopen(request, timeout=timeout)
+
+    priority = priority or os.environ.get("GITHUB_PRIORITY") or "normal"
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown GitHub request priority: {priority}")
+
+    token = os.environ.get("GITHUB_API_TOKEN")
+    if token and not request.has_header("Authorization"):
+        request.add_header("Authorization", f"Bearer {token}")
+
+    attempt = 0
+    while True:
+        acquire(host, priority)
+        try:
+            response = cassette.urlopen(request, timeout=timeout)
+        except HTTPError as e:
+            update(host, e.code, e.headers)
+            if not is_rate_limited(e.code, e.headers):
+                raise
+            if attempt >= MAX_LIMITED_RETRIES:
+                raise RateLimited(host, _retry_after(e.headers, time.time()) or 0) from e
+            attempt += 1
+            print(f"[rate_limited_response] {host} HTTP {e.code}, waiting for budget", file=sys.stderr)
+            continue
+        update(host, response.status, response.headers)
+        return response
+
+
+# ============================================
+# 조회/내보내기
+# ============================================
+
+def render_prometheus(buckets: dict) -> str:
+    """호스트별 예산을 Prometheus textfile 형식으로 변환합니다."""
+    metrics = [
+        ("newsauto_ratelimit_limit", "Requests allowed per window", lambda b: b["limit"]),
+        ("newsauto_ratelimit_remaining", "Requests left in the current window", lambda b: b["remaining"]),
+        ("newsauto_ratelimit_reset_timestamp", "Window reset time (unix seconds)", lambda b: b["reset"]),
+        ("newsauto_ratelimit_requests_total", "Requests sent through the governor", lambda b: b["requests_total"]),
+        ("newsauto_ratelimit_throttled_total", "Requests delayed for budget", lambda b: b["throttled_total"]),
+        ("newsauto_ratelimit_limited_total", "Rate-limited (403/429) responses", lambda b: b["limited_total"]),
+    ]
+    lines = []
+    for name, help_text, value in metrics:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for host, bucket in sorted(buckets.items()):
+            if value(bucket) is not None:
+                lines.append(f'{name}{{host="{host}"}} {value(bucket)}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(buckets: dict):
+    METRICS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = PROM_FILE.with_suffix(".prom.tmp")
+    tmp.write_text(render_prometheus(buckets), encoding="utf-8")
+    tmp.replace(PROM_FILE)
+
+
+def format_status(buckets: dict, now: Optional[float] = None) -> str:
+    now = now if now is not None else time.time()
+    if not buckets:
+        return "No GitHub requests recorded."
+    lines = [f"{'host':<28} {'remaining':>10} {'limit':>6} {'reset':>8} {'requests':>9} {'throttled':>9} {'limited':>7}"]
+    for host, b in sorted(buckets.items()):
+        reset_in = f"{max(0, int(b['reset'] - now))}s" if b["reset"] is not None else "-"
+        if b["blocked_until"] and b["blocked_until"] > now:
+            reset_in = f"blk {int(b['blocked_until'] - now)}s"
+        lines.append(
+            f"{host:<28} {str(b['remaining'] if b['remaining'] is not None else '-'):>10} "
+            f"{str(b['limit'] or '-'):>6} {reset_in:>8} {b['requests_total']:>9} "
+            f"{b['throttled_total']:>9} {b['limited_total']:>7}"
+        )
+    return "\n".join(lines)
+
+
+def probe() -> dict:
+    """GET /rate_limit로 api.github.com 예산을 갱신합니다 (이 요청은 예산을 소모하지 않음)."""
+    request = Request(RATE_LIMIT_URL, headers={
+        "User-Agent": "smol-ai-news-automation/1.0",
+        "Accept": "application/vnd.github.v3+json",
+    })
+    token = os.environ.get("GITHUB_API_TOKEN")
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    with cassette.urlopen(request, timeout=30) as response:
+        core = json.loads(response.read().decode("utf-8"))["resources"]["core"]
+    host = urlsplit(RATE_LIMIT_URL).hostname
+    with store_lock():
+        buckets = load_buckets()
+        bucket = buckets.setdefault(host, _new_bucket())
+        bucket.update(limit=core["limit"], remaining=core["remaining"], reset=core["reset"])
+        _save_buckets(buckets)
+    return core
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="GitHub 요청 속도 제한 예산 조회/관리"
+    )
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    status_parser = subparsers.add_parser("status", help="호스트별 남은 예산")
+    status_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    subparsers.add_parser("probe", help="GitHub /rate_limit 조회로 api.github.com 예산 갱신")
+
+    reset_parser = subparsers.add_parser("reset", help="저장된 예산 지우기")
+    reset_parser.add_argument("hosts", nargs="*", help="호스트 (없으면 전부)")
+
+    args = parser.parse_args()
+
+    if args.command == "status":
+        buckets = load_buckets()
+        if args.json:
+            print(json.dumps(buckets, indent=2, ensure_ascii=False))
+        else:
+            print(format_status(buckets))
+
+    elif args.command == "probe":
+        try:
+            core = probe()
+        except (URLError, KeyError, json.JSONDecodeError) as e:
+            print(f"Probe failed: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"api.github.com: {core['remaining']}/{core['limit']} remaining, resets in {max(0, core['reset'] - int(time.time()))}s")
+
+    elif args.command == "reset":
+        count = reset(args.hosts or None)
+        print(f"Cleared {count} bucket(s)")
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,545 @@
+#!/usr/bin/env python3
+"""
+resilience.py - 재시도 정책과 서킷 브레이커
+HTTP 요청과 LLM CLI 호출에 지수 백오프 재시도와 엔드포인트별 서킷 브레이커를 적용합니다.
+
+- 재시도: 최대 MAX_RETRIES회. n번째 재시도 전 대기 시간은 RETRY_DELAY * 2^(n-1)
+  (RETRY_MAX_DELAY 상한)의 절반 + 나머지 절반 범위의 jitter입니다.
+  429/503 응답에 Retry-After(초 또는 HTTP 날짜)가 있으면 그 값을 따릅니다 (상한 동일).
+  404 같은 4xx는 재시도하지 않고 브레이커 실패로도 세지 않습니다 (엔드포인트는 살아 있음).
+- 서킷 브레이커: 엔드포인트(호스트 또는 codex/claude)별 연속 실패가 BREAKER_FAILURE_THRESHOLD회에
+  도달하면 open, BREAKER_COOLDOWN초 동안은 호출하지 않고 즉시 실패합니다.
+  쿨다운이 지나면 호출 하나만 시험(half-open)해 성공하면 closed, 실패하면 다시 open.
+  시험 호출이 끝나기 전의 다른 호출은 open과 같이 즉시 실패합니다
+  (시험 호출이 BREAKER_PROBE_TIMEOUT초 안에 결과를 남기지 않으면 죽은 것으로 보고 새 시험 호출 허용).
+  GitHub 속도 제한 응답(403/429)은 lib/ratelimit.py가 예산에 맞춰 재시도하므로 여기서는 다시 재시도하지 않습니다.
+  상태는 data/resilience/breakers.json에 저장되어 cron 실행 사이에도 유지됩니다.
+- 모니터링: data/resilience/events.jsonl (retry, give_up, breaker_open, breaker_close, short_circuit)
+  data/metrics/newsauto_resilience.prom (엔드포인트별 브레이커 상태/누적 재시도 수)
+  브레이커가 열리면 알림 저장소에도 warning 알림을 남깁니다.
+- 감시 실행: Codex/Claude CLI는 lib/watchdog.py 아래에서 실행되어 제한 시간 초과, 무진행, 실패 신호가
+  보이면 조기 종료됩니다 (watchdog 이벤트). fatal 신호는 재시도하지 않고, offtrack은 대기 없이 재시도합니다.
+
+사용법:
+    newsauto resilience exec codex --stdin prompt.txt --output log.txt --reason-file reason.txt -- codex exec ...
+    newsauto resilience status
+    newsauto resilience events --limit 20
+    newsauto resilience reset api.github.com
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+import random
+import argparse
+from http.client import HTTPException
+from contextlib import contextmanager
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.cassette import CassetteMiss  # noqa: E402
+from lib.ratelimit import RateLimited, urlopen  # noqa: E402
+from lib.metrics import METRICS_DIR, current_run_id  # noqa: E402
+from lib.watchdog import FATAL, OFFTRACK, Outcome, supervise  # noqa: E402
+
+RESILIENCE_DIR = Path(os.environ.get("RESILIENCE_DIR") or PROJECT_ROOT / "data" / "resilience")
+BREAKERS_FILE = RESILIENCE_DIR / "breakers.json"
+EVENTS_FILE = RESILIENCE_DIR / "events.jsonl"
+LOCK_FILE = RESILIENCE_DIR / "breakers.lock"
+PROM_FILE = METRICS_DIR / "newsauto_resilience.prom"
+
+MAX_RETRIES = int(os.environ.get("MAX_RETRIES", 3))
+RETRY_DELAY = float(os.environ.get("RETRY_DELAY", 5))
+RETRY_MAX_DELAY = float(os.environ.get("RETRY_MAX_DELAY", 120))
+FAILURE_THRESHOLD = int(os.environ.get("BREAKER_FAILURE_THRESHOLD", 5))
+COOLDOWN = int(os.environ.get("BREAKER_COOLDOWN", 600))
+PROBE_TIMEOUT = int(os.environ.get("BREAKER_PROBE_TIMEOUT", 3600))
+
+# 재시도할 HTTP 상태 코드 (일시적 오류)
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+# CLI가 브레이커 open으로 실행하지 않았을 때의 종료 코드 (sysexits EX_TEMPFAIL)
+EXIT_CIRCUIT_OPEN = 75
+
+# 감시 실행이 명령을 조기 종료했을 때의 종료 코드 (coreutils timeout과 같음)
+EXIT_WATCHDOG = 124
+
+STATES = ["closed", "half_open", "open"]
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(URLError):
+    """브레이커가 열려 있어 호출하지 않음 (기존 URLError 처리 경로로 보고됨)"""
+
+    def __init__(self, endpoint: str, retry_in: int):
+        super().__init__(f"circuit open for {endpoint} (retry in {retry_in}s)")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class CommandFailed(Exception):
+    """외부 명령이 0이 아닌 코드로 종료됨 (exec 재시도용)"""
+
+    def __init__(self, returncode: int):
+        super().__init__(f"exit code {returncode}")
+        self.returncode = returncode
+
+
+class WatchdogKilled(CommandFailed):
+    """감시 실행이 명령을 조기 종료했거나 실패 원인을 신호로 분류함"""
+
+    def __init__(self, outcome: Outcome):
+        super().__init__(EXIT_WATCHDOG if outcome.killed else outcome.returncode)
+        self.outcome = outcome
+
+    def __str__(self) -> str:
+        return f"watchdog {self.outcome.reason}"
+
+
+# ============================================
+# 상태 저장소
+# ============================================
+
+@contextmanager
+def store_lock():
+    """브레이커 상태 파일 배타 잠금 (여러 프로세스가 같은 엔드포인트를 갱신)"""
+    RESILIENCE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def load_breakers() -> dict:
+    if not BREAKERS_FILE.exists():
+        return {}
+    try:
+        return json.loads(BREAKERS_FILE.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+
+def _save_breakers(breakers: dict):
+    tmp = BREAKERS_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(breakers, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(BREAKERS_FILE)
+    write_prometheus(breakers)
+
+
+def _new_breaker() -> dict:
+    return {"state": "closed", "failures": 0, "opened_at": None, "retries_total": 0, "opens_total": 0}
+
+
+def _log_event(event: str, endpoint: str, **fields):
+    """재시도/브레이커 이벤트를 기록하고 stderr에 한 줄 출력합니다."""
+    entry = {
+        "ts": datetime.now().isoformat(timespec="milliseconds"),
+        "run_id": current_run_id(),
+        "event": event,
+        "endpoint": endpoint,
+        **{k: v for k, v in fields.items() if v is not None},
+    }
+    RESILIENCE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(EVENTS_FILE, "a", encoding="utf-8") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        fcntl.flock(f, fcntl.LOCK_UN)
+
+    detail = " ".join(f"{k}={v}" for k, v in fields.items() if v is not None)
+    print(f"[{event}] {endpoint} {detail}".rstrip(), file=sys.stderr)
+
+
+# ============================================
+# 서킷 브레이커
+# ============================================
+
+def before_call(endpoint: str, now: Optional[float] = None):
+    """호출 전 브레이커 확인 (open이고 쿨다운 중이면 CircuitOpenError)"""
+    now = now if now is not None else time.time()
+    with store_lock():
+        breakers = load_breakers()
+        breaker = breakers.get(endpoint)
+        if not breaker or breaker["state"] == "closed":
+            return
+
+        if breaker["state"] == "open":
+            remaining = int(breaker["opened_at"] + COOLDOWN - now)
+        else:
+            # 다른 호출이 시험 중 (시험 호출이 죽었으면 PROBE_TIMEOUT 뒤에 새로 허용)
+            remaining = int((breaker.get("probe_at") or 0) + PROBE_TIMEOUT - now)
+        if remaining > 0:
+            _log_event("short_circuit", endpoint, retry_in=remaining)
+            raise CircuitOpenError(endpoint, remaining)
+
+        # 쿨다운이 지났으면 시험 호출 1회 허용
+        breaker.update(state="half_open", probe_at=now)
+        _save_breakers(breakers)
+
+
+def release_probe(endpoint: str):
+    """시험 호출이 성공/실패를 가리지 못하고 끝남 (재생 기록 없음, 속도 제한): 다음 호출이 바로 다시 시험"""
+    with store_lock():
+        breakers = load_breakers()
+        breaker = breakers.get(endpoint)
+        if breaker and breaker["state"] == "half_open":
+            breaker.update(state="open", probe_at=None)
+            _save_breakers(breakers)
+
+
+def record_success(endpoint: str):
+    """성공: 연속 실패를 초기화하고 열려 있던 브레이커를 닫습니다."""
+    with store_lock():
+        breakers = load_breakers()
+        breaker = breakers.get(endpoint)
+        if not breaker or (breaker["state"] == "closed" and breaker["failures"] == 0):
+            return
+        if breaker["state"] != "closed":
+            _log_event("breaker_close", endpoint)
+        breaker.update(state="closed", failures=0, opened_at=None, probe_at=None)
+        _save_breakers(breakers)
+
+
+def record_failure(endpoint: str, error: str, retried: bool, now: Optional[float] = None):
+    """실패: 연속 실패를 세고 임계값(half-open이면 즉시)에서 브레이커를 엽니다."""
+    now = now if now is not None else time.time()
+    opened = False
+    with store_lock():
+        breakers = load_breakers()
+        breaker = breakers.setdefault(endpoint, _new_breaker())
+        breaker["failures"] += 1
+        if retried:
+            breaker["retries_total"] += 1
+        if breaker["state"] == "half_open" or (
+            breaker["state"] == "closed" and breaker["failures"] >= FAILURE_THRESHOLD
+        ):
+            breaker.update(state="open", opened_at=now, probe_at=None)
+            breaker["opens_total"] += 1
+            opened = True
+        _save_breakers(breakers)
+
+    if opened:
+        _log_event("breaker_open", endpoint, failures=breaker["failures"], cooldown=COOLDOWN, error=error)
+        _alert_breaker_open(endpoint, breaker["failures"], error)
+
+
+def _alert_breaker_open(endpoint: str, failures: int, error: str):
+    """브레이커가 열리면 알림 저장소에 기록 (같은 엔드포인트는 중복 제거 윈도우로 묶임)"""
+    try:
+        from lib.alerts import append
+        append(
+            "warning",
+            f"Circuit open: {endpoint}",
+            f"{failures} consecutive failures, pausing calls for {COOLDOWN}s. Last error: {error}",
+            context=endpoint,
+        )
+    except OSError as e:
+        print(f"Failed to record alert: {e}", file=sys.stderr)
+
+
+def reset(endpoints: Optional[list[str]] = None) -> int:
+    """브레이커를 닫습니다 (endpoints가 없으면 전부). 닫은 개수를 반환합니다."""
+    count = 0
+    with store_lock():
+        breakers = load_breakers()
+        for endpoint, breaker in breakers.items():
+            if endpoints and endpoint not in endpoints:
+                continue
+            if breaker["state"] != "closed" or breaker["failures"]:
+                breaker.update(state="closed", failures=0, opened_at=None, probe_at=None)
+                count += 1
+        _save_breakers(breakers)
+    return count
+
+
+# ============================================
+# 재시도 정책
+# ============================================
+
+def backoff_delay(attempt: int, base: float = RETRY_DELAY, cap: float = RETRY_MAX_DELAY) -> float:
+    """attempt번째 재시도 전 대기 시간 (지수 증가, 절반은 고정 + 절반은 jitter)"""
+    delay = min(cap, base * (2 ** (attempt - 1)))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def retry_after_seconds(error: HTTPError, now: Optional[float] = None) -> Optional[float]:
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 초 단위로 반환합니다."""
+    value = error.headers.get("Retry-After") if error.headers else None
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when - (now if now is not None else time.time()))
+
+
+def classify(error: BaseException) -> tuple[bool, str]:
+    """(재시도 가능 여부, 설명)"""
+    if isinstance(error, HTTPError):
+        return error.code in RETRYABLE_STATUS, f"HTTP {error.code}"
+    if isinstance(error, WatchdogKilled):
+        return error.outcome.kind != FATAL, str(error)
+    if isinstance(error, CommandFailed):
+        return True, str(error)
+    if isinstance(error, URLError):
+        return True, f"URL error: {error.reason}"
+    # 응답을 읽는 도중 끊긴 연결 (IncompleteRead 등), 소켓 타임아웃
+    return True, f"{type(error).__name__}: {error}"
+
+
+def call(
+    endpoint: str,
+    fn: Callable[[], T],
+    max_retries: int = MAX_RETRIES,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """fn을 재시도 정책과 브레이커 아래에서 실행합니다.
+
+    재시도할 수 없는 오류나 마지막 시도의 오류는 그대로 다시 발생시킵니다.
+    """
+    before_call(endpoint)
+    attempt = 0
+    while True:
+        try:
+            result = fn()
+        except (CassetteMiss, RateLimited):
+            # 재생 기록 없음/속도 제한 예산 부족: 재시도해도 결과가 같음
+            release_probe(endpoint)
+            raise
+        except (URLError, HTTPException, CommandFailed, ConnectionError, TimeoutError) as e:
+            retryable, description = classify(e)
+            if not retryable:
+                # 4xx: 엔드포인트는 응답하고 있으므로 브레이커 실패로 세지 않음
+                record_success(endpoint)
+                raise
+
+            will_retry = attempt < max_retries
+            record_failure(endpoint, description, retried=will_retry)
+            if not will_retry:
+                _log_event("give_up", endpoint, attempts=attempt + 1, error=description)
+                raise
+
+            attempt += 1
+            delay = backoff_delay(attempt)
+            if isinstance(e, HTTPError):
+                hinted = retry_after_seconds(e)
+                if hinted is not None:
+                    delay = min(hinted, RETRY_MAX_DELAY)
+            elif isinstance(e, WatchdogKilled) and e.outcome.kind == OFFTRACK:
+                # 엔드포인트 과부하가 아니라 이번 실행이 엇나간 것이므로 기다릴 필요 없음
+                delay = 0.0
+            _log_event("retry", endpoint, attempt=attempt, delay=round(delay, 2), error=description)
+            sleep(delay)
+            # 재시도 사이에 다른 프로세스가 브레이커를 열었으면 중단
+            before_call(endpoint)
+        else:
+            record_success(endpoint)
+            return result
+
+
+def endpoint_for(url: str) -> Optional[str]:
+    """URL의 브레이커 키 (http(s)가 아니면 None: 로컬 파일 등은 재시도하지 않음)"""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return None
+    return parts.hostname
+
+
+def read_url(request: Request, timeout: float, priority: Optional[str] = None) -> bytes:
+    """요청을 보내고 응답 본문 전체를 읽습니다 (http(s)면 재시도/브레이커, GitHub면 속도 제한 예산 적용)."""
+    def once() -> bytes:
+        with urlopen(request, timeout=timeout, priority=priority) as response:
+            return response.read()
+
+    endpoint = endpoint_for(request.full_url)
+    if endpoint is None:
+        return once()
+    return call(endpoint, once)
+
+
+def run_with_retry(url: str, fn: Callable[[], T]) -> T:
+    """URL 하나를 다루는 fn 전체(연결 + 스트리밍 읽기)를 재시도합니다."""
+    endpoint = endpoint_for(url)
+    if endpoint is None:
+        return fn()
+    return call(endpoint, fn)
+
+
+# ============================================
+# 외부 명령 (Codex/Claude CLI)
+# ============================================
+
+def exec_command(
+    endpoint: str,
+    command: list[str],
+    stdin_path: Optional[Path] = None,
+    output_path: Optional[Path] = None,
+    max_retries: int = MAX_RETRIES,
+    watch: Optional[list[Path]] = None,
+    reason_path: Optional[Path] = None,
+) -> int:
+    """명령을 감시 실행, 재시도 정책, 브레이커 아래에서 실행하고 마지막 종료 코드를 반환합니다.
+
+    output_path가 있으면 마지막 시도의 stdout+stderr를 그 파일에 씁니다 (없으면 그대로 통과).
+    watch는 출력 로그 외에 진행으로 볼 파일, reason_path에는 마지막 시도의 조기 종료 원인을 씁니다.
+    """
+    if reason_path:
+        Path(reason_path).write_text("", encoding="utf-8")
+
+    def once() -> int:
+        outcome = supervise(endpoint, command, stdin_path, output_path, watch)
+        if outcome.kind:
+            _log_event(
+                "watchdog", endpoint,
+                killed=outcome.killed, kind=outcome.kind, elapsed=round(outcome.elapsed, 1), reason=outcome.detail,
+            )
+            if output_path:
+                with open(output_path, "a", encoding="utf-8") as f:
+                    f.write(f"\n[watchdog] {outcome.reason}\n")
+            raise WatchdogKilled(outcome)
+        if outcome.returncode != 0:
+            raise CommandFailed(outcome.returncode)
+        return 0
+
+    try:
+        return call(endpoint, once, max_retries=max_retries)
+    except CommandFailed as e:
+        if isinstance(e, WatchdogKilled) and reason_path:
+            Path(reason_path).write_text(e.outcome.reason + "\n", encoding="utf-8")
+        return e.returncode
+    except CircuitOpenError as e:
+        print(f"Skipped: {e.reason}", file=sys.stderr)
+        return EXIT_CIRCUIT_OPEN
+
+
+# ============================================
+# 조회/내보내기
+# ============================================
+
+def render_prometheus(breakers: dict) -> str:
+    """엔드포인트별 브레이커 상태를 Prometheus textfile 형식으로 변환합니다."""
+    metrics = [
+        ("newsauto_breaker_state", "Circuit breaker state (0 = closed, 1 = half-open, 2 = open)",
+         lambda b: STATES.index(b["state"])),
+        ("newsauto_breaker_consecutive_failures", "Consecutive failures", lambda b: b["failures"]),
+        ("newsauto_retries_total", "Retries performed", lambda b: b["retries_total"]),
+        ("newsauto_breaker_opens_total", "Times the breaker opened", lambda b: b["opens_total"]),
+    ]
+    lines = []
+    for name, help_text, value in metrics:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for endpoint, breaker in sorted(breakers.items()):
+            lines.append(f'{name}{{endpoint="{endpoint}"}} {value(breaker)}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(breakers: dict):
+    METRICS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = PROM_FILE.with_suffix(".prom.tmp")
+    tmp.write_text(render_prometheus(breakers), encoding="utf-8")
+    tmp.replace(PROM_FILE)
+
+
+def recent_events(limit: int = 20) -> list[dict]:
+    if not EVENTS_FILE.exists():
+        return []
+    lines = EVENTS_FILE.read_text(encoding="utf-8").splitlines()[-limit:]
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def format_status(breakers: dict, now: Optional[float] = None) -> str:
+    now = now if now is not None else time.time()
+    if not breakers:
+        return "No endpoint failures recorded."
+    lines = [f"{'endpoint':<28} {'state':<10} {'failures':>8} {'retries':>8} {'opens':>6}  reopen"]
+    for endpoint, b in sorted(breakers.items()):
+        reopen = ""
+        if b["state"] == "open":
+            reopen = f"in {max(0, int(b['opened_at'] + COOLDOWN - now))}s"
+        lines.append(
+            f"{endpoint:<28} {b['state']:<10} {b['failures']:>8} {b['retries_total']:>8} {b['opens_total']:>6}  {reopen}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="재시도 정책과 엔드포인트별 서킷 브레이커"
+    )
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # exec 명령
+    exec_parser = subparsers.add_parser("exec", help="명령을 재시도/브레이커 아래에서 실행")
+    exec_parser.add_argument("endpoint", help="브레이커 키 (예: codex, claude)")
+    exec_parser.add_argument("--stdin", type=Path, help="명령의 표준 입력 파일 (시도마다 처음부터)")
+    exec_parser.add_argument("--output", type=Path, help="마지막 시도의 stdout+stderr 저장 파일")
+    exec_parser.add_argument("--max-retries", type=int, default=MAX_RETRIES, help="최대 재시도 횟수")
+    exec_parser.add_argument("--watch", type=Path, action="append", help="진행으로 볼 파일 (여러 번 지정 가능)")
+    exec_parser.add_argument("--reason-file", type=Path, help="조기 종료 원인을 기록할 파일")
+
+    # status 명령
+    status_parser = subparsers.add_parser("status", help="엔드포인트별 브레이커 상태")
+    status_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    # events 명령
+    events_parser = subparsers.add_parser("events", help="최근 재시도/브레이커 이벤트")
+    events_parser.add_argument("--limit", type=int, default=20, help="출력 개수")
+
+    # reset 명령
+    reset_parser = subparsers.add_parser("reset", help="브레이커 닫기")
+    reset_parser.add_argument("endpoints", nargs="*", help="엔드포인트 (없으면 전부)")
+
+    # exec의 실행할 명령은 -- 뒤 전부 (명령의 옵션을 argparse가 해석하지 않도록 먼저 분리)
+    argv = sys.argv[1:]
+    command = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, command = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+
+    if args.command == "exec":
+        if not command:
+            parser.error("exec requires a command after --")
+        sys.exit(exec_command(
+            args.endpoint, command, args.stdin, args.output, args.max_retries, args.watch, args.reason_file
+        ))
+
+    elif args.command == "status":
+        breakers = load_breakers()
+        if args.json:
+            print(json.dumps(breakers, indent=2, ensure_ascii=False))
+        else:
+            print(format_status(breakers))
+
+    elif args.command == "events":
+        for event in recent_events(args.limit):
+            print(json.dumps(event, ensure_ascii=False))
+
+    elif args.command == "reset":
+        count = reset(args.endpoints or None)
+        print(f"Closed {count} breaker(s)")
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+tracing.py - 실행 단위 트레이싱
+main.sh가 만든 트레이스 ID(NEWSAUTO_TRACE_ID)와 부모 스팬 ID(NEWSAUTO_PARENT_SPAN_ID)를
+환경 변수로 전달받아, 각 Python 엔트리포인트와 셸 래퍼가 스팬을
+data/traces/<trace_id>.jsonl에 기록합니다.
+
+export 명령은 Chrome trace / Perfetto(ui.perfetto.dev)에서 열 수 있는 JSON을 생성합니다.
+트레이스 ID가 없으면 (단독 실행) 아무것도 기록하지 않습니다.
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+import argparse
+from pathlib import Path
+from typing import Callable, Optional
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+TRACES_DIR = Path(os.environ.get("TRACES_DIR") or PROJECT_ROOT / "data" / "traces")
+
+TRACE_ID_ENV = "NEWSAUTO_TRACE_ID"
+PARENT_SPAN_ENV = "NEWSAUTO_PARENT_SPAN_ID"
+
+
+def new_span_id() -> str:
+    """16자리 hex 스팬 ID"""
+    return os.urandom(8).hex()
+
+
+def trace_file(trace_id: str) -> Path:
+    return TRACES_DIR / f"{trace_id}.jsonl"
+
+
+def _now_us() -> int:
+    return time.time_ns() // 1000
+
+
+def write_span(record: dict):
+    """스팬 레코드를 트레이스 파일에 추가합니다."""
+    TRACES_DIR.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with open(trace_file(record["trace_id"]), "a", encoding="utf-8") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(line)
+        fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class Span:
+    """스팬 컨텍스트 매니저
+
+    진입 시 NEWSAUTO_PARENT_SPAN_ID를 자신의 ID로 바꿔 하위 프로세스가 부모를 알 수 있게 하고,
+    종료 시 원래 값으로 되돌린 뒤 스팬을 기록합니다.
+    """
+
+    def __init__(self, name: str, **attrs):
+        self.name = name
+        self.attrs = attrs
+        self.trace_id = os.environ.get(TRACE_ID_ENV)
+        self.span_id = new_span_id()
+        self.parent_id = os.environ.get(PARENT_SPAN_ENV) or None
+        self.start_us = 0
+        self.status = "ok"
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.trace_id)
+
+    def set(self, **attrs):
+        """스팬 속성을 추가합니다."""
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        self.start_us = _now_us()
+        if self.enabled:
+            os.environ[PARENT_SPAN_ENV] = self.span_id
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_us = _now_us()
+        if not self.enabled:
+            return False
+
+        if self.parent_id:
+            os.environ[PARENT_SPAN_ENV] = self.parent_id
+        else:
+            os.environ.pop(PARENT_SPAN_ENV, None)
+
+        if exc_type is SystemExit:
+            code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+            self.attrs["exit_code"] = code
+            if code != 0:
+                self.status = "error"
+        elif exc_type is not None:
+            self.status = "error"
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+
+        try:
+            write_span({
+                "trace_id": self.trace_id,
+                "span_id": self.span_id,
+                "parent_id": self.parent_id,
+                "name": self.name,
+                "start_us": self.start_us,
+                "end_us": end_us,
+                "pid": os.getpid(),
+                "process": Path(sys.argv[0]).name or "python3",
+                "status": self.status,
+                "attrs": self.attrs,
+            })
+        except OSError:
+            pass  # 트레이스 기록 실패가 파이프라인을 멈추지 않도록 무시
+        return False
+
+
+def span(name: str, **attrs) -> Span:
+    """스팬을 생성합니다. `with span("fetch"): ...` 형태로 사용합니다."""
+    return Span(name, **attrs)
+
+
+def traced_main(name: str, main_func: Callable):
+    """엔트리포인트 main()을 스팬으로 감싸 실행하고 반환값을 돌려줍니다."""
+    with span(name, argv=" ".join(sys.argv[1:])):
+        return main_func()
+
+
+def load_spans(trace_id: str) -> list[dict]:
+    """트레이스 파일의 스팬을 로드합니다."""
+    path = trace_file(trace_id)
+    if not path.exists():
+        return []
+
+    spans = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+
+def latest_trace_id() -> Optional[str]:
+    """가장 최근에 수정된 트레이스 ID를 반환합니다."""
+    if not TRACES_DIR.exists():
+        return None
+    files = sorted(TRACES_DIR.glob("*.jsonl"), key=lambda p: p.stat().st_mtime)
+    return files[-1].stem if files else None
+
+
+def to_chrome_trace(spans: list[dict]) -> dict:
+    """스팬 목록을 Chrome trace event 형식으로 변환합니다.
+
+    프로세스(pid)마다 하나의 트랙이 되도록 process_name 메타데이터를 함께 기록합니다.
+    """
+    events = []
+    process_names = {}
+
+    for s in sorted(spans, key=lambda s: s["start_us"]):
+        pid = s.get("pid", 0)
+        process_names.setdefault(pid, s.get("process", str(pid)))
+        args = dict(s.get("attrs", {}))
+        args.update({
+            "span_id": s["span_id"],
+            "parent_id": s.get("parent_id"),
+            "status": s.get("status", "ok"),
+        })
+        events.append({
+            "name": s["name"],
+            "cat": "newsauto",
+            "ph": "X",
+            "ts": s["start_us"],
+            "dur": max(0, s["end_us"] - s["start_us"]),
+            "pid": pid,
+            "tid": pid,
+            "args": args,
+        })
+
+    for pid, name in process_names.items():
+        events.append({
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": pid,
+            "args": {"name": f"{name} ({pid})"},
+        })
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def format_tree(spans: list[dict]) -> str:
+    """스팬을 부모-자식 트리로 출력합니다. 각 스팬에서 가장 오래 걸린 자식을 *로 표시합니다."""
+    if not spans:
+        return "No spans recorded."
+
+    by_id = {s["span_id"]: s for s in spans}
+    children: dict[Optional[str], list[dict]] = {}
+    for s in spans:
+        parent = s.get("parent_id") if s.get("parent_id") in by_id else None
+        children.setdefault(parent, []).append(s)
+
+    origin = min(s["start_us"] for s in spans)
+    lines = []
+
+    def walk(parent_id: Optional[str], depth: int):
+        kids = sorted(children.get(parent_id, []), key=lambda s: s["start_us"])
+        longest = max(kids, key=lambda s: s["end_us"] - s["start_us"], default=None)
+        for s in kids:
+            dur_ms = (s["end_us"] - s["start_us"]) / 1000
+            offset_ms = (s["start_us"] - origin) / 1000
+            mark = "*" if s is longest and len(kids) > 1 else " "
+            status = "" if s.get("status", "ok") == "ok" else f" [{s['status']}]"
+            lines.append(
+                f"{offset_ms:>10.1f}ms {dur_ms:>10.1f}ms {mark} {'  ' * depth}{s['name']}{status}"
+            )
+            walk(s["span_id"], depth + 1)
+
+    lines.append(f"{'start':>12} {'duration':>12}   span")
+    walk(None, 0)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="실행 단위 트레이스를 조회/내보내기합니다."
+    )
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # export 명령
+    export_parser = subparsers.add_parser("export", help="Chrome trace / Perfetto JSON으로 내보내기")
+    export_parser.add_argument("trace_id", nargs="?", help="트레이스 ID (없으면 가장 최근)")
+    export_parser.add_argument("-o", "--output", type=Path, help="출력 파일 경로")
+
+    # tree 명령
+    tree_parser = subparsers.add_parser("tree", help="스팬 트리 출력")
+    tree_parser.add_argument("trace_id", nargs="?", help="트레이스 ID (없으면 가장 최근)")
+
+    # list 명령
+    subparsers.add_parser("list", help="트레이스 목록")
+
+    args = parser.parse_args()
+
+    if args.command in ("export", "tree"):
+        trace_id = args.trace_id or latest_trace_id()
+        spans = load_spans(trace_id) if trace_id else []
+        if not spans:
+            print(f"Trace not found: {trace_id}", file=sys.stderr)
+            sys.exit(1)
+
+        if args.command == "tree":
+            print(f"Trace: {trace_id}")
+            print(format_tree(spans))
+            return
+
+        output = json.dumps(to_chrome_trace(spans), ensure_ascii=False)
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(output, encoding="utf-8")
+            print(f"Saved to: {args.output}")
+        else:
+            print(output)
+
+    elif args.command == "list":
+        if not TRACES_DIR.exists():
+            print("No traces found.")
+            return
+        for path in sorted(TRACES_DIR.glob("*.jsonl"), key=lambda p: p.stat().st_mtime):
+            print(f"- {path.stem} ({len(load_spans(path.stem))} spans)")
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
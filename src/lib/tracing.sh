@@ -0,0 +1,149 @@
+#!/bin/bash
+# tracing.sh - 셸 스팬 기록 헬퍼
+# smol.ai 한국어 뉴스 자동 발행 시스템
+#
+# 사용법:
+#   trace_init_run                   # 트레이스 ID 생성 (NEWSAUTO_TRACE_ID)
+#   trace_script_begin translate.sh  # 스크립트 전체 스팬 (EXIT 시 trace_script_end 호출 필요)
+#   span_start crawl
+#   span_end crawl 0 output_bytes=1234
+#
+# 스팬은 data/traces/<trace_id>.jsonl에 기록되며, src/lib/tracing.py로 내보낼 수 있습니다.
+# NEWSAUTO_TRACE_ID가 없으면 (단독 실행) 아무것도 기록하지 않습니다.
+
+# 열린 스팬 스택 (이름, ID, 부모 ID, 시작 시각)
+_SPAN_NAMES=()
+_SPAN_IDS=()
+_SPAN_PARENTS=()
+_SPAN_STARTS=()
+
+# 현재 시각 (마이크로초)
+_trace_now_us() {
+    date +%s%6N
+}
+
+# 16자리 hex 스팬 ID
+_trace_new_id() {
+    od -An -N8 -tx1 /dev/urandom | tr -d ' \n'
+}
+
+# JSON 문자열 이스케이프
+_trace_json_escape() {
+    local s="$1"
+    s="${s//\\/\\\\}"
+    s="${s//\"/\\\"}"
+    s="${s//$'\n'/\\n}"
+    s="${s//$'\t'/\\t}"
+    printf '%s' "$s"
+}
+
+# 트레이스 ID 생성 (이미 있으면 유지, 기본값은 메트릭 실행 ID와 동일)
+trace_init_run() {
+    if [[ -z "$NEWSAUTO_TRACE_ID" ]]; then
+        export NEWSAUTO_TRACE_ID="${NEWSAUTO_RUN_ID:-$(date '+%Y%m%dT%H%M%S')-$$}"
+    fi
+    export TRACES_DIR="${TRACES_DIR:-$DATA_DIR/traces}"
+}
+
+# 스팬 시작
+span_start() {
+    [[ -z "$NEWSAUTO_TRACE_ID" ]] && return 0
+
+    local name="$1"
+    local span_id
+    span_id=$(_trace_new_id)
+
+    _SPAN_NAMES+=("$name")
+    _SPAN_IDS+=("$span_id")
+    _SPAN_PARENTS+=("${NEWSAUTO_PARENT_SPAN_ID:-}")
+    _SPAN_STARTS+=("$(_trace_now_us)")
+
+    # 하위 프로세스가 이 스팬을 부모로 사용
+    export NEWSAUTO_PARENT_SPAN_ID="$span_id"
+}
+
+# 스택 최상단 스팬을 닫고 기록
+# 인자: <exit_code> [key=value ...]
+_span_pop() {
+    local exit_code="${1:-0}"
+    shift || true
+
+    local top=$(( ${#_SPAN_IDS[@]} - 1 ))
+    [[ $top -lt 0 ]] && return 0
+
+    local name="${_SPAN_NAMES[$top]}"
+    local span_id="${_SPAN_IDS[$top]}"
+    local parent_id="${_SPAN_PARENTS[$top]}"
+    local start_us="${_SPAN_STARTS[$top]}"
+    local end_us
+    end_us=$(_trace_now_us)
+
+    unset "_SPAN_NAMES[$top]" "_SPAN_IDS[$top]" "_SPAN_PARENTS[$top]" "_SPAN_STARTS[$top]"
+
+    if [[ -n "$parent_id" ]]; then
+        export NEWSAUTO_PARENT_SPAN_ID="$parent_id"
+    else
+        unset NEWSAUTO_PARENT_SPAN_ID
+    fi
+
+    local status="ok"
+    [[ "$exit_code" != "0" ]] && status="error"
+
+    local attrs="\"exit_code\": $exit_code"
+    local kv key value
+    for kv in "$@"; do
+        key="${kv%%=*}"
+        value="${kv#*=}"
+        if [[ "$value" =~ ^-?[0-9]+(\.[0-9]+)?$ ]]; then
+            attrs+=", \"$(_trace_json_escape "$key")\": $value"
+        else
+            attrs+=", \"$(_trace_json_escape "$key")\": \"$(_trace_json_escape "$value")\""
+        fi
+    done
+
+    local parent_json="null"
+    [[ -n "$parent_id" ]] && parent_json="\"$parent_id\""
+
+    mkdir -p "$TRACES_DIR" 2>/dev/null || return 0
+    printf '{"trace_id": "%s", "span_id": "%s", "parent_id": %s, "name": "%s", "start_us": %s, "end_us": %s, "pid": %s, "process": "%s", "status": "%s", "attrs": {%s}}\n' \
+        "$NEWSAUTO_TRACE_ID" "$span_id" "$parent_json" "$(_trace_json_escape "$name")" \
+        "$start_us" "$end_us" "$BASHPID" "$(_trace_json_escape "${0##*/}")" "$status" "$attrs" \
+        >> "$TRACES_DIR/$NEWSAUTO_TRACE_ID.jsonl" 2>/dev/null || true
+}
+
+# 이름이 일치하는 스팬까지 닫기 (중간에 닫히지 않은 하위 스팬은 aborted로 기록)
+# 인자: <name> <exit_code> [key=value ...]
+span_end() {
+    [[ -z "$NEWSAUTO_TRACE_ID" ]] && return 0
+
+    local name="$1"
+    local exit_code="${2:-0}"
+    shift 2 || shift $#
+
+    local i found=false
+    for (( i=${#_SPAN_NAMES[@]}-1; i>=0; i-- )); do
+        if [[ "${_SPAN_NAMES[$i]}" == "$name" ]]; then
+            found=true
+            break
+        fi
+    done
+    [[ "$found" != "true" ]] && return 0
+
+    while [[ ${#_SPAN_NAMES[@]} -gt 0 ]] && [[ "${_SPAN_NAMES[-1]}" != "$name" ]]; do
+        _span_pop "$exit_code" status_detail=aborted
+    done
+    _span_pop "$exit_code" "$@"
+}
+
+# 스크립트 전체 스팬 시작
+trace_script_begin() {
+    span_start "$1"
+}
+
+# 열린 모든 스팬 닫기 (EXIT trap에서 호출)
+trace_script_end() {
+    local exit_code="${1:-0}"
+    while [[ ${#_SPAN_NAMES[@]} -gt 0 ]]; do
+        _span_pop "$exit_code"
+    done
+}
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+watchdog.py - LLM CLI 감시 실행
+Codex/Claude CLI를 벽시계 제한 시간과 무진행 제한 시간 아래에서 실행하고,
+출력 로그에 알려진 실패 신호가 나타나면 끝나기를 기다리지 않고 프로세스 그룹을 종료합니다.
+
+- timeout: 시작 후 <ENDPOINT>_TIMEOUT초가 지나면 종료 (0: 사용 안 함)
+- stall: 출력 로그와 감시 파일(--watch)이 <ENDPOINT>_STALL_TIMEOUT초 동안 자라지 않으면 종료
+  (claude --print처럼 끝에서만 출력하는 CLI는 0으로 두어 사용하지 않음)
+- signature: 새로 쓰인 로그 줄이 SIGNATURES의 패턴과 맞으면 종료
+  CLI가 프롬프트를 그대로 다시 출력하는 줄(원문 인용)은 검사하지 않아 기사 본문의 문구로 오탐하지 않음
+
+신호 종류에 따라 재시도 방식이 다릅니다 (lib/resilience.py):
+- fatal (사용량 한도, 인증, 컨텍스트 초과): 재시도해도 같으므로 재시도하지 않음
+- offtrack (번역 대신 로컬 파일 경로를 다루기 시작함): 대기 없이 즉시 재시도
+- transient (스트림 끊김, 서버 과부하) / timeout / stall: 기존 백오프로 재시도
+"""
+
+import os
+import re
+import time
+import signal
+import threading
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+POLL_INTERVAL = float(os.environ.get("WATCHDOG_POLL_INTERVAL", 1.0))
+KILL_GRACE = 5.0
+
+# 종료 원인별 재시도 방식
+FATAL = "fatal"
+OFFTRACK = "offtrack"
+TRANSIENT = "transient"
+
+# 엔드포인트별 실패 신호: (이름, 종류, 패턴)
+SIGNATURES: dict[str, list[tuple[str, str, re.Pattern]]] = {
+    "codex": [
+        ("usage_limit", FATAL, re.compile(r"you've hit your usage limit|usage limit reached|insufficient_quota", re.I)),
+        ("auth", FATAL, re.compile(r"401 Unauthorized|invalid api key|not logged in", re.I)),
+        ("context_overflow", FATAL, re.compile(r"context_length_exceeded|ran out of room in the model's context", re.I)),
+        ("local_path", OFFTRACK, re.compile(r"workspace/\S*\.md|\b(?:re)?translated\.md\b|\bfinal\.md\b")),
+        ("stream_error", TRANSIENT, re.compile(r"stream (?:error|disconnected)|exceeded retry limit", re.I)),
+    ],
+    "claude": [
+        ("usage_limit", FATAL, re.compile(r"credit balance is too low|usage limit reached", re.I)),
+        ("auth", FATAL, re.compile(r"invalid api key|please run /login", re.I)),
+        ("overloaded", TRANSIENT, re.compile(r"overloaded_error|API Error: 5\d\d", re.I)),
+    ],
+}
+
+
+@dataclass
+class Outcome:
+    """감시 실행 결과 (killed가 None이면 정상 종료)"""
+    returncode: int
+    killed: Optional[str] = None      # timeout | stall | 신호 이름
+    kind: Optional[str] = None        # fatal | offtrack | transient
+    detail: str = ""
+    elapsed: float = 0.0
+
+    @property
+    def reason(self) -> str:
+        return f"{self.killed}: {self.detail}" if self.killed else self.detail
+
+
+def limits_for(endpoint: str) -> tuple[float, float]:
+    """(벽시계 제한, 무진행 제한) 초 (<ENDPOINT>_TIMEOUT / <ENDPOINT>_STALL_TIMEOUT, 0은 사용 안 함)"""
+    prefix = re.sub(r"\W", "_", endpoint).upper()
+    return (
+        float(os.environ.get(f"{prefix}_TIMEOUT", 0) or 0),
+        float(os.environ.get(f"{prefix}_STALL_TIMEOUT", 0) or 0),
+    )
+
+
+def _progress_marker(paths: list[Path]) -> tuple:
+    marker = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            marker.append((stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            marker.append(None)
+    return tuple(marker)
+
+
+class _LogScanner:
+    """출력 로그에 새로 추가된 완성된 줄만 신호 패턴과 대조합니다."""
+
+    def __init__(self, path: Path, signatures: list, echoed: set[str]):
+        self.path = path
+        self.signatures = signatures
+        self.echoed = echoed
+        self.offset = 0
+        self.partial = b""
+
+    def scan(self, final: bool = False) -> Optional[tuple[str, str, str]]:
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                data = f.read()
+        except OSError:
+            return None
+        self.offset += len(data)
+        data = self.partial + data
+        lines = data.split(b"\n")
+        self.partial = b"" if final else lines.pop()
+        for raw in lines:
+            line = raw.decode("utf-8", "replace").strip()
+            if not line or line in self.echoed:
+                continue
+            for name, kind, pattern in self.signatures:
+                if pattern.search(line):
+                    return name, kind, line[:200]
+        return None
+
+
+def kill_group(process: subprocess.Popen):
+    """프로세스 그룹 종료 (CLI가 띄운 하위 프로세스 포함, 응답이 없으면 SIGKILL)"""
+    for sig, wait in ((signal.SIGTERM, KILL_GRACE), (signal.SIGKILL, None)):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            return
+        try:
+            process.wait(timeout=wait)
+            return
+        except subprocess.TimeoutExpired:
+            continue
+
+
+def _terminate(signum, frame):
+    """SIGTERM을 SystemExit로 바꿔 finally에서 CLI 프로세스 그룹까지 정리되게 함"""
+    raise SystemExit(128 + signum)
+
+
+def supervise(
+    endpoint: str,
+    command: list[str],
+    stdin_path: Optional[Path] = None,
+    output_path: Optional[Path] = None,
+    watch: Optional[list[Path]] = None,
+    timeout: Optional[float] = None,
+    stall_timeout: Optional[float] = None,
+) -> Outcome:
+    """명령을 감시하며 실행합니다.
+
+    output_path가 있으면 stdout+stderr를 그 파일에 쓰면서 진행/신호를 확인하고,
+    없으면 출력은 그대로 통과하고 벽시계 제한만 적용합니다.
+    """
+    default_timeout, default_stall = limits_for(endpoint)
+    timeout = default_timeout if timeout is None else timeout
+    stall_timeout = default_stall if stall_timeout is None else stall_timeout
+
+    echoed: set[str] = set()
+    if stdin_path and output_path:
+        prompt = Path(stdin_path).read_text(encoding="utf-8", errors="replace")
+        echoed = {line.strip() for line in prompt.splitlines() if line.strip()}
+
+    progress_paths = ([Path(output_path)] if output_path else []) + [Path(p) for p in watch or []]
+    scanner = _LogScanner(Path(output_path), SIGNATURES.get(endpoint, []), echoed) if output_path else None
+
+    stdin = open(stdin_path, "rb") if stdin_path else None
+    output = open(output_path, "wb") if output_path else None
+    start = time.monotonic()
+    process = None
+    # CLI는 별도 세션이라 감시 프로세스만 종료되면 고아로 남음 (병렬 후보 취소 등, translate/hedge.py)
+    main_thread = threading.current_thread() is threading.main_thread()
+    if main_thread:
+        previous_handler = signal.signal(signal.SIGTERM, _terminate)
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=stdin,
+            stdout=output,
+            stderr=subprocess.STDOUT if output else None,
+            start_new_session=True,
+        )
+        marker = _progress_marker(progress_paths)
+        last_progress = start
+        killed = None
+
+        while True:
+            try:
+                process.wait(timeout=POLL_INTERVAL)
+                break
+            except subprocess.TimeoutExpired:
+                pass
+            now = time.monotonic()
+
+            if scanner:
+                hit = scanner.scan()
+                if hit:
+                    name, kind, line = hit
+                    killed = (name, kind, line)
+                    break
+
+            current = _progress_marker(progress_paths)
+            if current != marker:
+                marker, last_progress = current, now
+
+            if timeout and now - start >= timeout:
+                killed = ("timeout", TRANSIENT, f"still running after {timeout:.0f}s")
+                break
+            if stall_timeout and progress_paths and now - last_progress >= stall_timeout:
+                killed = ("stall", TRANSIENT, f"no output for {stall_timeout:.0f}s")
+                break
+
+        if killed:
+            kill_group(process)
+            name, kind, detail = killed
+            return Outcome(process.returncode, name, kind, detail, time.monotonic() - start)
+
+        # 실패로 끝났으면 마지막에 쓰인 줄로 원인을 분류 (fatal이면 재시도하지 않도록)
+        if scanner and process.returncode != 0:
+            hit = scanner.scan(final=True)
+            if hit:
+                name, kind, line = hit
+                return Outcome(process.returncode, None, kind, f"{name}: {line}", time.monotonic() - start)
+        return Outcome(process.returncode, elapsed=time.monotonic() - start)
+    finally:
+        if process and process.poll() is None:
+            kill_group(process)
+        if main_thread:
+            signal.signal(signal.SIGTERM, previous_handler or signal.SIG_DFL)
+        for handle in (stdin, output):
+            if handle:
+                handle.close()
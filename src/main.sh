@@ -7,6 +7,10 @@
 #   ./main.sh --url <URL>        # 특정 URL 처리
 #   ./main.sh --check            # 새 이슈 확인만
 #   ./main.sh --dry-run          # PR 생성 없이 실행
+#   ./main.sh --flush            # 발행 큐를 즉시 PR로 발행
+#   ./main.sh --langs ko,ja      # 번역 대상 언어 지정 (기본: TARGET_LANGS)
+#   ./main.sh --url <URL> --sync # 게시 후 수정된 원문의 변경분만 재번역해 반영
+#   ./main.sh --speculate        # 업스트림 PR/브랜치의 이슈 초안을 미리 번역 (머지 후 변경분만 대조)
 
 set -e
 
@@ -14,55 +18,71 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$SCRIPT_DIR/lib/config.sh"
 source "$SCRIPT_DIR/lib/logging.sh"
 source "$SCRIPT_DIR/lib/notify.sh"
+source "$SCRIPT_DIR/lib/metrics.sh"
+source "$SCRIPT_DIR/lib/tracing.sh"
 
 # 기본값
 DRY_RUN=false
 CHECK_ONLY=false
 TARGET_URL=""
 SKIP_REVIEW=false
+FLUSH_ONLY=false
+SYNC_MODE=false
+SPECULATE_MODE=false
 
 # 파이프라인 경고/실패 추적 (PR 본문에 표시용)
 PIPELINE_WARNINGS=()
 
-# final.md 검증 함수
+# final.md 검증 함수 (오류를 한 줄씩 출력, 유효하면 출력 없음)
 validate_final_markdown() {
-    local file="$1"
-    local errors=()
-
-    if [[ ! -f "$file" ]]; then
-        errors+=("파일이 존재하지 않음")
-    else
-        local content=$(cat "$file")
+    newsauto validate-final "$1"
+}
 
-        # Frontmatter 확인
-        if ! echo "$content" | head -5 | grep -q "^---"; then
-            errors+=("Frontmatter 없음")
-        fi
+# 실패 상태 기록 (--sync는 이미 게시된 이슈이므로 상태를 덮어쓰지 않음)
+# --speculate는 처리 상태 대신 사전 번역 기록에 남겨 같은 초안을 다시 시도하지 않음
+mark_failed() {
+    if [[ "$SYNC_MODE" == "true" ]]; then
+        return 0
+    fi
+    if [[ "$SPECULATE_MODE" == "true" ]]; then
+        newsauto speculate record "$SLUG" --ref "$DRAFT_REF" --blob "$DRAFT_BLOB" --status failed > /dev/null
+        return 0
+    fi
+    # 임대를 잃었으면 (만료 후 다른 실행이 회수) 그 실행의 상태를 덮어쓰지 않음
+    if ! lease_held; then
+        log_warn "Lease on $SLUG was lost. Not marking it failed."
+        return 0
+    fi
+    newsauto state mark "$SLUG" --status failed --error "$1"
+}
 
-        # summary 필드 확인
-        if ! echo "$content" | grep -q "^summary:"; then
-            errors+=("summary 필드 없음")
-        fi
+# 처리 임대 (LEASE_OWNER가 비어 있으면 점유하지 않은 실행: --sync, --speculate)
+LEASE_OWNER=""
+LEASE_HEARTBEAT_PID=""
 
-        # 최소 길이 확인
-        local line_count=$(echo "$content" | wc -l)
-        if [[ $line_count -lt 50 ]]; then
-            errors+=("콘텐츠가 너무 짧음 (${line_count}줄)")
-        fi
+# 임대를 아직 갖고 있는지 확인 (확인하면서 만료 시각도 연장)
+lease_held() {
+    [[ -z "$LEASE_OWNER" ]] || newsauto state heartbeat "$SLUG" --owner "$LEASE_OWNER" 2> /dev/null
+}
 
-        # 로컬 경로 참조 감지
-        if echo "$content" | grep -qE 'workspace/.*\.md|translated\.md|retranslated\.md'; then
-            errors+=("로컬 파일 경로 참조 감지")
+# 긴 단계(Codex 번역/검토 등) 동안 임대를 주기적으로 연장
+# 부모가 죽으면 연장을 멈춰 임대가 만료되고, 다음 실행이 회수함
+start_lease_heartbeat() {
+    local parent_pid=$$
+    (
+        # 실행 잠금을 물려받지 않도록 닫음 (부모가 죽은 뒤 잠금이 남지 않게)
+        if [[ -n "$RUN_LOCK_FD" ]]; then
+            exec {RUN_LOCK_FD}>&-
         fi
-    fi
-
-    if [[ ${#errors[@]} -gt 0 ]]; then
-        for err in "${errors[@]}"; do
-            echo "$err"
+        while sleep "$STATE_HEARTBEAT_INTERVAL"; do
+            kill -0 "$parent_pid" 2> /dev/null || break
+            if ! newsauto state heartbeat "$SLUG" --owner "$LEASE_OWNER" 2> /dev/null; then
+                log_warn "Lease on $SLUG lost (owner $LEASE_OWNER)"
+                break
+            fi
         done
-        return 1
-    fi
-    return 0
+    ) &
+    LEASE_HEARTBEAT_PID=$!
 }
 
 # 인자 파싱
@@ -84,6 +104,22 @@ while [[ $# -gt 0 ]]; do
             SKIP_REVIEW=true
             shift
             ;;
+        --flush)
+            FLUSH_ONLY=true
+            shift
+            ;;
+        --langs)
+            TARGET_LANGS="${2//,/ }"
+            shift 2
+            ;;
+        --sync)
+            SYNC_MODE=true
+            shift
+            ;;
+        --speculate)
+            SPECULATE_MODE=true
+            shift
+            ;;
         -h|--help)
             echo "Usage: $0 [options]"
             echo ""
@@ -92,6 +128,10 @@ while [[ $# -gt 0 ]]; do
             echo "  --check          새 이슈 확인만"
             echo "  --dry-run        PR 생성 없이 실행"
             echo "  --skip-review    리뷰 단계 건너뛰기"
+            echo "  --flush          발행 큐를 즉시 PR로 발행"
+            echo "  --langs <codes>  번역 대상 언어 (쉼표 구분, 예: ko,ja)"
+            echo "  --sync           게시된 이슈의 원문 변경분만 재번역 (--url 필요)"
+            echo "  --speculate      업스트림 PR/브랜치의 이슈 초안을 미리 번역 (발행 없음)"
             echo "  -h, --help       도움말 표시"
             exit 0
             ;;
@@ -102,6 +142,46 @@ while [[ $# -gt 0 ]]; do
     esac
 done
 
+if [[ "$SYNC_MODE" == "true" ]] && [[ -z "$TARGET_URL" ]]; then
+    log_error "--sync requires --url"
+    exit 1
+fi
+
+if [[ "$SPECULATE_MODE" == "true" ]] && { [[ -n "$TARGET_URL" ]] || [[ "$SYNC_MODE" == "true" ]]; }; then
+    log_error "--speculate cannot be combined with --url or --sync"
+    exit 1
+fi
+
+# 사전 번역 실행은 메트릭/트레이스에서 구분되도록 실행 ID에 표시
+if [[ "$SPECULATE_MODE" == "true" ]] && [[ -z "$NEWSAUTO_RUN_ID" ]]; then
+    export NEWSAUTO_RUN_ID="speculative-$(date '+%Y%m%dT%H%M%S')-$$"
+fi
+
+# 실행 ID (메트릭 레코드와 트레이스를 실행 단위로 묶음)
+metrics_init_run
+trace_init_run
+trace_script_begin main.sh
+
+PIPELINE_STARTED=false
+
+# 종료 시 작업 산출물 보관, 전체 실행 시간 기록 및 열린 스팬 정리
+on_exit() {
+    local exit_code="$1"
+    if [[ -n "$LEASE_HEARTBEAT_PID" ]]; then
+        kill "$LEASE_HEARTBEAT_PID" 2> /dev/null || true
+    fi
+    if [[ "$PIPELINE_STARTED" == "true" ]]; then
+        # 성공/실패와 무관하게 이번 실행의 산출물을 보관 (실패 분석용 중간 산출물 포함)
+        # 사전 번역은 게시본이 아니므로 보관하지 않음 (--sync가 초안을 게시 원문으로 오인하지 않도록)
+        if [[ -d "$WORK_DIR" ]] && [[ "$SPECULATE_MODE" != "true" ]]; then
+            newsauto artifacts archive "$SLUG" "$WORK_DIR" > /dev/null 2>&1 || true
+        fi
+        metrics_stage_end pipeline "$exit_code"
+    fi
+    trace_script_end "$exit_code"
+}
+trap 'on_exit $?' EXIT
+
 # 의존성 확인
 ensure_directories
 if ! check_dependencies; then
@@ -114,18 +194,122 @@ if ! check_prompts; then
     exit 1
 fi
 
+# 실행 잠금: cron 실행이 겹치면 나중 실행은 바로 종료 (--check/--flush는 상태를 바꾸지 않거나 자체 잠금 사용)
+# 사전 번역은 처리 상태를 건드리지 않으므로 별도 잠금을 써서 일반 실행과 동시에 돌 수 있음
+RUN_LOCK_FD=""
+if [[ "$CHECK_ONLY" != "true" ]] && [[ "$FLUSH_ONLY" != "true" ]]; then
+    if command -v flock &> /dev/null; then
+        run_lock_file="$RUN_LOCK_FILE"
+        if [[ "$SPECULATE_MODE" == "true" ]]; then
+            run_lock_file="${RUN_LOCK_FILE%.lock}-speculate.lock"
+        fi
+        exec {RUN_LOCK_FD}> "$run_lock_file"
+        if ! flock -w "$RUN_LOCK_WAIT" "$RUN_LOCK_FD"; then
+            log_info "Another run holds $run_lock_file. Exiting."
+            exit 0
+        fi
+    else
+        log_warn "flock not found. Running without the run lock (leases still prevent double processing)."
+    fi
+fi
+
+# 산출물 보존 정책 적용 (오래된 중간 산출물/작업 디렉토리 정리)
+newsauto artifacts gc > /dev/null 2>&1 || log_warn "Artifact store gc failed"
+
+# 발행 큐 플러시 (결과 PR URL 출력, 플러시하지 않았으면 빈 출력)
+flush_publish_queue() {
+    local flush_json
+    flush_json=$(newsauto publish-queue flush --json "$@") || return 1
+
+    if [[ "$flush_json" == "null" ]]; then
+        return 0
+    fi
+
+    local pr_url slugs
+    {
+        read -r pr_url
+        read -r slugs
+    } < <(printf '%s' "$flush_json" | newsauto json-get pr_url 'slugs|join')
+
+    # stdout은 PR URL 전달용이므로 로그는 stderr로 출력
+    log_success "Publish queue flushed: $slugs" >&2
+    notify_pr_created "$slugs" "$pr_url" >&2
+    echo "$pr_url"
+}
+
+if [[ "$FLUSH_ONLY" == "true" ]]; then
+    log_step "발행 큐 플러시"
+    flush_publish_queue --force > /dev/null || {
+        log_error "Publish queue flush failed"
+        exit 1
+    }
+    log_step_done "발행 큐 플러시"
+    exit 0
+fi
+
+# 큐 모드: 시간 창이 지난 대기 항목이 있으면 먼저 발행
+if [[ "$PUBLISH_MODE" == "queue" ]] && [[ "$DRY_RUN" != "true" ]] && [[ "$CHECK_ONLY" != "true" ]] \
+        && [[ "$SPECULATE_MODE" != "true" ]]; then
+    flush_publish_queue > /dev/null || log_warn "Publish queue flush failed (will retry next run)"
+fi
+
+# 사전 번역할 업스트림 초안 확인 (main에 머지되면 쓰일 정식 URL로 처리하고 원문은 초안에서 읽음)
+if [[ "$SPECULATE_MODE" == "true" ]]; then
+    log_step "업스트림 초안 확인"
+
+    metrics_stage_start speculate_scan
+    scan_exit_code=0
+    draft_json=$(newsauto speculate scan --limit 1 --json) || scan_exit_code=$?
+    metrics_stage_end speculate_scan "$scan_exit_code"
+    if [[ $scan_exit_code -ne 0 ]]; then
+        log_error "Failed to fetch upstream refs"
+        exit 1
+    fi
+
+    if [[ -z "$draft_json" ]] || [[ "$draft_json" == "[]" ]]; then
+        log_info "No upstream drafts to speculate on."
+        exit 0
+    fi
+
+    {
+        read -r TARGET_URL
+        read -r DRAFT_REF
+        read -r DRAFT_BLOB
+    } < <(printf '%s' "$draft_json" | newsauto json-get 0.url 0.ref 0.blob)
+
+    log_info "Found upstream draft: $TARGET_URL ($DRAFT_REF)"
+fi
+
+# 만료된 임대 회수 (죽은 실행이 남긴 in_progress 이슈를 pending으로 되돌려 이번 확인에 다시 포함)
+if [[ "$CHECK_ONLY" != "true" ]] && [[ "$SPECULATE_MODE" != "true" ]]; then
+    while IFS=$'\t' read -r reclaimed_slug reclaimed_status reclaimed_owner; do
+        if [[ "$reclaimed_status" == "failed" ]]; then
+            log_warn "Lease expired: $reclaimed_slug (owner $reclaimed_owner). Max attempts reached, marked failed."
+        else
+            log_warn "Lease expired: $reclaimed_slug (owner $reclaimed_owner). Will retry."
+        fi
+    done < <(newsauto state reclaim)
+fi
+
 # 새 이슈 확인 (URL이 지정되지 않은 경우)
 if [[ -z "$TARGET_URL" ]]; then
     log_step "GitHub 소스 확인"
 
-    new_issue=$(python3 "$SCRIPT_DIR/rss/check_feed.py" --check --limit 1 --json)
+    metrics_stage_start check_feed
+    check_exit_code=0
+    new_issue=$(newsauto check-feed --check --limit 1 --json) || check_exit_code=$?
+    metrics_stage_end check_feed "$check_exit_code"
+    if [[ $check_exit_code -ne 0 ]]; then
+        log_error "Failed to check GitHub source"
+        exit 1
+    fi
 
     if [[ -z "$new_issue" ]] || [[ "$new_issue" == "[]" ]]; then
         log_info "No new issues found."
         exit 0
     fi
 
-    TARGET_URL=$(echo "$new_issue" | python3 -c "import sys, json; data=json.load(sys.stdin); print(data[0]['url'] if data else '')")
+    TARGET_URL=$(printf '%s' "$new_issue" | newsauto json-get 0.url)
 
     if [[ -z "$TARGET_URL" ]]; then
         log_info "No new issues to process."
@@ -146,215 +330,788 @@ if [[ -z "$SLUG" ]]; then
     SLUG=$(basename "$TARGET_URL")
 fi
 
+# 임대 점유 (--sync는 게시 상태 유지, --speculate는 기록하지 않음)
+# 다른 실행이 유효한 임대를 갖고 있으면 그 실행에 맡기고 종료
+if [[ "$SYNC_MODE" != "true" ]] && [[ "$SPECULATE_MODE" != "true" ]]; then
+    LEASE_OWNER="$HOSTNAME:$$:$NEWSAUTO_RUN_ID"
+    if ! newsauto state claim "$SLUG" --owner "$LEASE_OWNER" > /dev/null; then
+        log_info "$SLUG is being processed by another run. Exiting."
+        LEASE_OWNER=""
+        exit 0
+    fi
+fi
+
 # 로그 초기화
 init_log_file "$SLUG"
 
+if [[ -n "$LEASE_OWNER" ]]; then
+    start_lease_heartbeat
+fi
+
+# 전체 실행 시간 기록 (종료 코드 포함, on_exit에서 종료)
+export NEWSAUTO_SLUG="$SLUG"
+metrics_stage_start pipeline
+PIPELINE_STARTED=true
+
 log_info "Processing: $SLUG"
 log_info "URL: $TARGET_URL"
 
-# 작업 디렉토리 생성
+# 작업 디렉토리 생성 (사전 번역은 SPECULATIVE_DIR/<slug>에 새로 만들고 초안을 꺼내 둠)
 WORK_DIR="$OUTPUT_DIR/$SLUG"
+FETCH_URL="$TARGET_URL"
+if [[ "$SPECULATE_MODE" == "true" ]]; then
+    WORK_DIR="$SPECULATIVE_DIR/$SLUG"
+    rm -rf "$WORK_DIR"
+    mkdir -p "$WORK_DIR/draft"
+    newsauto speculate draft "$DRAFT_BLOB" -o "$WORK_DIR/draft/$SLUG.md"
+    FETCH_URL="file://$WORK_DIR/draft/$SLUG.md"
+fi
 mkdir -p "$WORK_DIR"
 
-# 상태 업데이트: 진행 중
-python3 "$SCRIPT_DIR/state/state_manager.py" mark "$SLUG" --status in_progress
+# --sync: 보관된 이전 원문 (작업 디렉토리가 비워졌으면 산출물 저장소에서 읽음)
+PREVIOUS_ORIGINAL="$WORK_DIR/original.prev.md"
+if [[ "$SYNC_MODE" == "true" ]]; then
+    if ! newsauto artifacts cat "$SLUG" original.md --work-dir "$WORK_DIR" > "$PREVIOUS_ORIGINAL" 2>/dev/null; then
+        log_warn "No archived original for $SLUG. Falling back to full translation."
+        rm -f "$PREVIOUS_ORIGINAL"
+        SYNC_MODE=false
+    fi
+fi
+
+# 사전 번역 결과가 있으면 초안 원문과 대조해 변경분만 반영 (--sync와 같은 경로)
+SPECULATIVE_WORK_DIR=""
+if [[ "$SYNC_MODE" != "true" ]] && [[ "$SPECULATE_MODE" != "true" ]]; then
+    if SPECULATIVE_WORK_DIR=$(newsauto speculate lookup "$SLUG" 2>/dev/null); then
+        cp "$SPECULATIVE_WORK_DIR/original.md" "$PREVIOUS_ORIGINAL"
+        log_info "Found speculative translation: $SPECULATIVE_WORK_DIR"
+    else
+        SPECULATIVE_WORK_DIR=""
+    fi
+fi
 
 # Step 1: 페이지 크롤링
 log_step "Step 1: 페이지 크롤링"
 ORIGINAL_FILE="$WORK_DIR/original.md"
 
+metrics_stage_start crawl
 crawl_exit_code=0
-python3 "$SCRIPT_DIR/crawler/fetch_page.py" "$TARGET_URL" -o "$ORIGINAL_FILE" || crawl_exit_code=$?
+# 원문 저장과 메타데이터(JSON) 출력을 한 번의 요청/프로세스로 처리
+# 기본은 Discord 상세 섹션 마커에서 다운로드 중단, FETCH_FULL_ARCHIVE=true면 원문 전체를 raw.md로 보관
+fetch_args=()
+if [[ "$FETCH_FULL_ARCHIVE" == "true" ]]; then
+    fetch_args=(--raw-output "$WORK_DIR/raw.md")
+fi
+metadata_json=$(newsauto fetch "$FETCH_URL" -o "$ORIGINAL_FILE" --json "${fetch_args[@]}") || crawl_exit_code=$?
+
+if [[ $crawl_exit_code -ne 0 ]]; then
+    metrics_stage_end crawl "$crawl_exit_code"
+fi
 
 if [[ $crawl_exit_code -eq 2 ]]; then
     # Exit code 2 = 검증 실패 (사이트 구조 변경 가능성)
     log_error "Content validation failed - site structure may have changed!"
     notify_validation_failure "$TARGET_URL" "Content validation failed. The smol.ai site structure may have changed."
-    python3 "$SCRIPT_DIR/state/state_manager.py" mark "$SLUG" --status failed --error "Validation failed - site structure changed"
+    mark_failed "Validation failed - site structure changed"
     exit 1
 elif [[ $crawl_exit_code -ne 0 ]]; then
     log_error "Failed to fetch page"
     notify_crawler_failure "$TARGET_URL" "HTTP or network error during crawling"
-    python3 "$SCRIPT_DIR/state/state_manager.py" mark "$SLUG" --status failed --error "Crawling failed"
+    mark_failed "Crawling failed"
     exit 1
 fi
 
 # 메타데이터 추출
-metadata_json=$(python3 "$SCRIPT_DIR/crawler/fetch_page.py" "$TARGET_URL" --json)
-HAS_HEADLINE=$(echo "$metadata_json" | python3 -c "import sys, json; print(str(json.load(sys.stdin)['metadata']['has_headline']).lower())")
+{
+    read -r HAS_HEADLINE
+    read -r LINK_COUNT
+    read -r DOWNLOAD_BYTES
+} < <(printf '%s' "$metadata_json" | newsauto json-get metadata.has_headline 'links|len' fetch.bytes_read)
+metrics_stage_end crawl 0 \
+    output_bytes="$(metrics_file_bytes "$ORIGINAL_FILE")" \
+    download_bytes="$DOWNLOAD_BYTES" \
+    link_count="$LINK_COUNT"
 
 log_info "Has headline: $HAS_HEADLINE"
 log_step_done "페이지 크롤링"
 
-# Step 2: Codex로 번역
-log_step "Step 2: Codex CLI 번역"
-TRANSLATED_FILE="$WORK_DIR/translated.md"
+# 외부 링크 생존 확인 (번역과 동시에 백그라운드 실행, 결과는 발행 전 경고로 반영)
+LINKCHECK_PID=""
+if [[ "$LINKCHECK_ENABLED" == "true" ]]; then
+    (
+        metrics_stage_start linkcheck
+        linkcheck_exit_code=0
+        newsauto check-links "$ORIGINAL_FILE" \
+            -o "$WORK_DIR/links.json" \
+            --warnings "$WORK_DIR/link_warnings.txt" > /dev/null || linkcheck_exit_code=$?
+        if [[ $linkcheck_exit_code -ne 0 ]]; then
+            metrics_stage_end linkcheck "$linkcheck_exit_code"
+            exit "$linkcheck_exit_code"
+        fi
+        {
+            read -r links_unique
+            read -r links_cached
+            read -r links_broken
+        } < <(newsauto json-get stats.unique stats.cached stats.broken < "$WORK_DIR/links.json")
+        metrics_stage_end linkcheck 0 \
+            unique="$links_unique" \
+            cached="$links_cached" \
+            broken="$links_broken"
+    ) &
+    LINKCHECK_PID=$!
+fi
+
+# 이미지/미디어 미러링 (번역과 동시에 백그라운드로 내려받고, 발행 전에 final.md 링크를 교체)
+MEDIA_PID=""
+if [[ "$MEDIA_MIRROR_ENABLED" == "true" ]]; then
+    (
+        metrics_stage_start media
+        media_exit_code=0
+        newsauto mirror-media fetch "$ORIGINAL_FILE" \
+            -o "$WORK_DIR/media_report.json" \
+            --warnings "$WORK_DIR/media_warnings.txt" > /dev/null || media_exit_code=$?
+        if [[ $media_exit_code -ne 0 ]]; then
+            metrics_stage_end media "$media_exit_code"
+            exit "$media_exit_code"
+        fi
+        {
+            read -r media_found
+            read -r media_downloaded_bytes
+            read -r media_stored_bytes
+            read -r media_saved_bytes
+        } < <(newsauto json-get stats.found stats.downloaded_bytes stats.stored_bytes stats.dedup_saved_bytes \
+            < "$WORK_DIR/media_report.json")
+        metrics_stage_end media 0 \
+            found="$media_found" \
+            download_bytes="$media_downloaded_bytes" \
+            stored_bytes="$media_stored_bytes" \
+            dedup_saved_bytes="$media_saved_bytes"
+    ) &
+    MEDIA_PID=$!
+fi
 
-"$SCRIPT_DIR/translate/translate.sh" "$ORIGINAL_FILE" "$HAS_HEADLINE" "$TRANSLATED_FILE" || {
-    log_error "Translation failed"
-    notify_translation_failure "$SLUG" "Codex CLI translation failed"
-    python3 "$SCRIPT_DIR/state/state_manager.py" mark "$SLUG" --status failed --error "Translation failed"
-    exit 1
+# Step 2~5: 언어별 번역/검토/생성
+# 한 번 크롤링한 원문(original.md + 메타데이터)을 공유 번들로 TARGET_LANGS의 각 언어를
+# 백그라운드에서 동시에 처리하므로 전체 소요 시간은 가장 느린 언어에 가깝습니다.
+read -r -a TARGET_LANG_LIST <<< "$TARGET_LANGS"
+
+# GitHub raw URL을 blob URL로 변환 (원문보기 링크용)
+ORIGINAL_URL="$TARGET_URL"
+if [[ "$TARGET_URL" == *"raw.githubusercontent.com"* ]]; then
+    ORIGINAL_URL=$(echo "$TARGET_URL" | sed 's|raw.githubusercontent.com/\([^/]*/[^/]*\)/\([^/]*\)/|github.com/\1/blob/\2/|')
+fi
+
+# 언어 처리 실패 사유 기록 (모든 언어가 끝난 뒤 main이 상태를 결정)
+record_language_failure() {
+    echo "$2" > "$1/failure.txt"
 }
 
-log_step_done "Codex CLI 번역"
+# 언어 처리 실패 사유 조회
+language_failure() {
+    local failure_file
+    failure_file="$(lang_work_dir "$WORK_DIR" "$1")/failure.txt"
+    if [[ -s "$failure_file" ]]; then
+        cat "$failure_file"
+    else
+        echo "Processing failed"
+    fi
+}
 
-# Step 3: Claude로 검토
-if [[ "$SKIP_REVIEW" != "true" ]]; then
-    log_step "Step 3: Claude Code 검토"
+# YouTube 템플릿 생성 (실패해도 계속 진행)
+# 인자: <lang_dir> <log_tag>
+generate_youtube_template() {
+    local lang_dir="$1"
+    local tag="$2"
+    local youtube_file="$lang_dir/youtube.txt"
+
+    log_step "${tag}Step 5: YouTube 템플릿 생성"
+
+    metrics_stage_start youtube
+    local youtube_exit_code=0
+    newsauto generate-youtube "$lang_dir/final.md" \
+        -o "$youtube_file" \
+        --original-url "$TARGET_URL" || {
+        youtube_exit_code=$?
+        log_warn "${tag}YouTube template generation failed (non-critical)"
+    }
+    metrics_stage_end youtube "$youtube_exit_code" output_bytes="$(metrics_file_bytes "$youtube_file")"
 
-    review_result=$("$SCRIPT_DIR/review/review.sh" "$ORIGINAL_FILE" "$TRANSLATED_FILE" 2>&1) || true
+    log_step_done "${tag}YouTube 템플릿 생성"
+}
 
-    if echo "$review_result" | grep -q "^PASS"; then
-        log_success "Review passed!"
+# 번역 모델 라우팅: ROUTE_TIER / ROUTE_MODEL / ROUTE_EFFORT 설정 (translate/routing.py)
+# 인자: newsauto route 하위 명령 (decide <file> ... | escalate --tier <tier> ...)
+# 라우팅이 실패하면 비워 두어 translate.sh가 CODEX_MODEL / CODEX_REASONING_EFFORT를 씀
+route_translation() {
+    ROUTE_TIER="" ROUTE_MODEL="" ROUTE_EFFORT=""
+    {
+        read -r ROUTE_TIER
+        read -r ROUTE_MODEL
+        read -r ROUTE_EFFORT
+    } < <(newsauto route "$@") || true
+    if [[ -n "$ROUTE_TIER" ]]; then
+        log_info "Route: $ROUTE_TIER ($ROUTE_MODEL, reasoning $ROUTE_EFFORT)"
     else
-        log_warn "Review failed. Attempting re-translation..."
-        PIPELINE_WARNINGS+=("리뷰 실패: 재번역 시도")
+        log_warn "Model routing failed. Using $CODEX_MODEL ($CODEX_REASONING_EFFORT)"
+    fi
+}
+
+# 라우팅 결과로 translate.sh 실행 (인자는 translate.sh와 같음)
+routed_translate() {
+    TRANSLATE_ROUTE="$ROUTE_TIER" TRANSLATE_MODEL="$ROUTE_MODEL" TRANSLATE_REASONING_EFFORT="$ROUTE_EFFORT" \
+        "$SCRIPT_DIR/translate/translate.sh" "$@"
+}
 
-        # 피드백을 포함하여 재번역 시도
-        FEEDBACK_FILE="$WORK_DIR/feedback.txt"
-        echo "$review_result" > "$FEEDBACK_FILE"
+# 병렬 후보 번역/검토 (translate/hedge.py): HEDGE_STATUS(pass | fallback | failed), HEDGE_TIER, HEDGE_SAVED_S 설정
+# 인자: <lang> <lang_dir> <output_file>
+hedged_translate() {
+    local lang="$1" lang_dir="$2" output_file="$3"
+    HEDGE_STATUS="" HEDGE_TIER="" HEDGE_SAVED_S=""
+    {
+        read -r HEDGE_STATUS
+        read -r HEDGE_TIER
+        read -r HEDGE_SAVED_S
+    } < <(newsauto hedge run "$ORIGINAL_FILE" --headline "$HAS_HEADLINE" --route "$ROUTE_TIER" \
+        --work-dir "$lang_dir/hedge" --output "$output_file" --lang "$lang") || true
+    [[ "$HEDGE_STATUS" == "pass" || "$HEDGE_STATUS" == "fallback" ]]
+}
 
-        # 재번역 (피드백 포함)
-        RETRANSLATED_FILE="$WORK_DIR/retranslated.md"
+# 한 언어의 번역 → 검토 → 최종 마크다운 → YouTube 템플릿 (백그라운드 서브셸에서 실행)
+# 인자: <lang>
+process_language() {
+    local lang="$1"
+    local lang_dir
+    lang_dir=$(lang_work_dir "$WORK_DIR" "$lang")
+
+    # 여러 언어를 동시에 처리할 때만 로그에 언어 표시
+    local tag="" label="$SLUG"
+    if [[ ${#TARGET_LANG_LIST[@]} -gt 1 ]]; then
+        tag="[$lang] "
+    fi
+    if [[ "$lang" != "ko" ]]; then
+        label="$SLUG ($lang)"
+    fi
 
-        # 피드백을 원문에 추가
-        cat "$ORIGINAL_FILE" > "$WORK_DIR/original_with_feedback.md"
-        echo "" >> "$WORK_DIR/original_with_feedback.md"
-        echo "## 이전 번역 피드백 (이 문제를 수정해주세요):" >> "$WORK_DIR/original_with_feedback.md"
-        echo "$review_result" >> "$WORK_DIR/original_with_feedback.md"
+    local warnings=()
+    mkdir -p "$lang_dir"
+    rm -f "$lang_dir/failure.txt"
+    export CONTENT_LANG="$lang"
 
-        retranslate_exit_code=0
-        "$SCRIPT_DIR/translate/translate.sh" "$WORK_DIR/original_with_feedback.md" "$HAS_HEADLINE" "$RETRANSLATED_FILE" || retranslate_exit_code=$?
+    # Step 2: Codex로 번역
+    log_step "${tag}Step 2: Codex CLI 번역"
+    local translated_file="$lang_dir/translated.md"
 
-        if [[ $retranslate_exit_code -ne 0 ]]; then
-            log_warn "Re-translation failed (exit code: $retranslate_exit_code). Using original translation."
-            PIPELINE_WARNINGS+=("재번역 실패: 원본 번역 사용")
-            # 재번역 실패 시 원본 번역 유지 (TRANSLATED_FILE 변경 없음)
+    # 조용한 날은 가벼운 설정, 큰 헤드라인 날은 기존 설정 이상 (리뷰 실패 시 재번역은 한 단계 올림)
+    route_translation decide "$ORIGINAL_FILE" --headline "$HAS_HEADLINE" --links "$LINK_COUNT" --lang "$lang"
+
+    # 병렬 후보 모드: 후보를 동시에 번역하고 끝나는 대로 검토 (Step 3 포함, 재번역 없음)
+    # 서로 다른 후보가 둘 미만이면 (예: 가장 무거운 단계에서 escalate) 기존 순차 재시도
+    local hedged=false
+    if [[ "$HEDGE_ENABLED" == "true" && "$SKIP_REVIEW" != "true" ]]; then
+        if newsauto hedge check --route "$ROUTE_TIER" > /dev/null; then
+            hedged=true
         else
-            # 재번역 성공 시 검토
-            review_result2=$("$SCRIPT_DIR/review/review.sh" "$ORIGINAL_FILE" "$RETRANSLATED_FILE" 2>&1) || true
+            log_warn "${tag}Hedging skipped: fewer than two distinct candidates (sequential retry)"
+        fi
+    fi
 
-            if echo "$review_result2" | grep -q "^PASS"; then
-                log_success "Re-translation passed review!"
-                TRANSLATED_FILE="$RETRANSLATED_FILE"
+    metrics_stage_start translate
+    if [[ "$hedged" == "true" ]]; then
+        hedged_translate "$lang" "$lang_dir" "$translated_file" || {
+            metrics_stage_end translate 1 lang="$lang" route="$ROUTE_TIER" hedge="${HEDGE_STATUS:-failed}" \
+                input_bytes="$(metrics_file_bytes "$ORIGINAL_FILE")"
+            log_error "${tag}Translation failed (all hedged candidates)"
+            notify_translation_failure "$label" "Codex CLI translation failed (all hedged candidates)"
+            record_language_failure "$lang_dir" "Translation failed"
+            return 1
+        }
+        if [[ "$HEDGE_STATUS" == "pass" ]]; then
+            log_success "${tag}Hedged candidate passed review ($HEDGE_TIER, ${HEDGE_SAVED_S}s saved vs sequential retry)"
+        else
+            log_warn "${tag}No hedged candidate passed review. Using the best-scoring one ($HEDGE_TIER)"
+            warnings+=("병렬 후보 모두 리뷰 실패: 문제가 가장 적은 후보 사용 ($HEDGE_TIER)")
+        fi
+    else
+        routed_translate "$ORIGINAL_FILE" "$HAS_HEADLINE" "$translated_file" || {
+            metrics_stage_end translate 1 lang="$lang" route="$ROUTE_TIER" input_bytes="$(metrics_file_bytes "$ORIGINAL_FILE")"
+            log_error "${tag}Translation failed"
+            notify_translation_failure "$label" "Codex CLI translation failed"
+            record_language_failure "$lang_dir" "Translation failed"
+            return 1
+        }
+    fi
+
+    local translate_fields=()
+    if [[ "$hedged" == "true" ]]; then
+        translate_fields=(route="$HEDGE_TIER" hedge="$HEDGE_STATUS" hedge_saved_s="$HEDGE_SAVED_S")
+    else
+        translate_fields=(route="$ROUTE_TIER")
+    fi
+    metrics_stage_end translate 0 \
+        lang="$lang" \
+        "${translate_fields[@]}" \
+        input_bytes="$(metrics_file_bytes "$ORIGINAL_FILE")" \
+        output_bytes="$(metrics_file_bytes "$translated_file")"
+
+    log_step_done "${tag}Codex CLI 번역"
+
+    # Step 3: Claude로 검토
+    if [[ "$hedged" == "true" ]]; then
+        log_info "${tag}Review done with hedged candidates"
+    elif [[ "$SKIP_REVIEW" != "true" ]]; then
+        log_step "${tag}Step 3: Claude Code 검토"
+
+        metrics_stage_start review
+        local review_retries=0 review_result review_result2
+        review_result=$("$SCRIPT_DIR/review/review.sh" "$ORIGINAL_FILE" "$translated_file" 2>&1) || true
+
+        if echo "$review_result" | grep -q "^PASS"; then
+            log_success "${tag}Review passed!"
+        else
+            log_warn "${tag}Review failed. Attempting re-translation..."
+            warnings+=("리뷰 실패: 재번역 시도")
+
+            # 피드백을 포함하여 재번역 시도
+            local feedback_file="$lang_dir/feedback.txt"
+            echo "$review_result" > "$feedback_file"
+
+            # 재번역 (피드백 포함)
+            local retranslated_file="$lang_dir/retranslated.md"
+            local feedback_original="$lang_dir/original_with_feedback.md"
+
+            # 피드백을 원문에 추가
+            cat "$ORIGINAL_FILE" > "$feedback_original"
+            echo "" >> "$feedback_original"
+            echo "## 이전 번역 피드백 (이 문제를 수정해주세요):" >> "$feedback_original"
+            echo "$review_result" >> "$feedback_original"
+
+            review_retries=$((review_retries + 1))
+            if [[ -n "$ROUTE_TIER" ]]; then
+                route_translation escalate --tier "$ROUTE_TIER" --lang "$lang"
+            fi
+            metrics_stage_start retranslate
+            local retranslate_exit_code=0
+            LLM_STAGE=retranslate routed_translate "$feedback_original" "$HAS_HEADLINE" "$retranslated_file" || retranslate_exit_code=$?
+            metrics_stage_end retranslate "$retranslate_exit_code" \
+                lang="$lang" \
+                route="$ROUTE_TIER" \
+                input_bytes="$(metrics_file_bytes "$feedback_original")" \
+                output_bytes="$(metrics_file_bytes "$retranslated_file")"
+
+            if [[ $retranslate_exit_code -ne 0 ]]; then
+                log_warn "${tag}Re-translation failed (exit code: $retranslate_exit_code). Using original translation."
+                warnings+=("재번역 실패: 원본 번역 사용")
+                # 재번역 실패 시 원본 번역 유지 (translated_file 변경 없음)
             else
-                log_warn "Re-translation also failed review. Comparing translations..."
-                PIPELINE_WARNINGS+=("재번역도 리뷰 실패")
-
-                # 재번역이 유효한지 검증
-                retrans_validation=$(validate_final_markdown "$RETRANSLATED_FILE" 2>&1) || true
-                orig_validation=$(validate_final_markdown "$TRANSLATED_FILE" 2>&1) || true
-
-                if [[ -z "$retrans_validation" ]]; then
-                    log_info "Re-translation is valid, using it."
-                    TRANSLATED_FILE="$RETRANSLATED_FILE"
-                elif [[ -z "$orig_validation" ]]; then
-                    log_info "Original translation is valid, keeping it."
-                    PIPELINE_WARNINGS+=("원본 번역 사용 (재번역 검증 실패)")
+                # 재번역 성공 시 검토
+                review_result2=$("$SCRIPT_DIR/review/review.sh" "$ORIGINAL_FILE" "$retranslated_file" 2>&1) || true
+
+                if echo "$review_result2" | grep -q "^PASS"; then
+                    log_success "${tag}Re-translation passed review!"
+                    translated_file="$retranslated_file"
                 else
-                    log_warn "Both translations have issues. Using original."
-                    PIPELINE_WARNINGS+=("원본 번역 사용 (둘 다 검증 실패)")
+                    log_warn "${tag}Re-translation also failed review. Comparing translations..."
+                    warnings+=("재번역도 리뷰 실패")
+
+                    # 재번역이 유효한지 검증
+                    local retrans_validation orig_validation
+                    retrans_validation=$(validate_final_markdown "$retranslated_file" 2>&1) || true
+                    orig_validation=$(validate_final_markdown "$translated_file" 2>&1) || true
+
+                    if [[ -z "$retrans_validation" ]]; then
+                        log_info "${tag}Re-translation is valid, using it."
+                        translated_file="$retranslated_file"
+                    elif [[ -z "$orig_validation" ]]; then
+                        log_info "${tag}Original translation is valid, keeping it."
+                        warnings+=("원본 번역 사용 (재번역 검증 실패)")
+                    else
+                        log_warn "${tag}Both translations have issues. Using original."
+                        warnings+=("원본 번역 사용 (둘 다 검증 실패)")
+                    fi
                 fi
             fi
         fi
+
+        metrics_stage_end review 0 \
+            lang="$lang" \
+            retries="$review_retries" \
+            output_bytes="$(metrics_file_bytes "$translated_file")"
+        log_step_done "${tag}Claude Code 검토"
+    else
+        log_info "${tag}Skipping review step"
     fi
 
-    log_step_done "Claude Code 검토"
-else
-    log_info "Skipping review step"
-fi
+    # Step 4: 최종 마크다운 생성
+    log_step "${tag}Step 4: 최종 마크다운 생성"
+    local final_file="$lang_dir/final.md"
+
+    metrics_stage_start generate
+    newsauto generate-markdown "$translated_file" \
+        -o "$final_file" \
+        --original-url "$ORIGINAL_URL" || {
+        metrics_stage_end generate 1 lang="$lang"
+        log_error "${tag}Markdown generation failed"
+        record_language_failure "$lang_dir" "Markdown generation failed"
+        return 1
+    }
 
-# Step 4: 최종 마크다운 생성
-log_step "Step 4: 최종 마크다운 생성"
-FINAL_FILE="$WORK_DIR/final.md"
+    # final.md 검증
+    local final_validation
+    final_validation=$(validate_final_markdown "$final_file" 2>&1) || true
+    if [[ -n "$final_validation" ]]; then
+        log_warn "${tag}Final markdown validation failed: $final_validation"
+        warnings+=("최종 마크다운 검증 실패: $final_validation")
+
+        # 원본 translated.md가 유효하면 그걸로 대체
+        local original_translated="$lang_dir/translated.md"
+        local orig_final_validation
+        orig_final_validation=$(validate_final_markdown "$original_translated" 2>&1) || true
+
+        if [[ -z "$orig_final_validation" ]]; then
+            log_info "${tag}Using original translated.md as final.md"
+            cp "$original_translated" "$final_file"
+            warnings+=("원본 번역으로 대체함")
+        else
+            log_warn "${tag}Original translation also invalid. Proceeding with best effort."
+            warnings+=("원본도 검증 실패 - 최선의 결과로 진행")
+        fi
+    fi
 
-# GitHub raw URL을 blob URL로 변환 (원문보기 링크용)
-ORIGINAL_URL="$TARGET_URL"
-if [[ "$TARGET_URL" == *"raw.githubusercontent.com"* ]]; then
-    ORIGINAL_URL=$(echo "$TARGET_URL" | sed 's|raw.githubusercontent.com/\([^/]*/[^/]*\)/\([^/]*\)/|github.com/\1/blob/\2/|')
-fi
+    metrics_stage_end generate 0 \
+        lang="$lang" \
+        input_bytes="$(metrics_file_bytes "$translated_file")" \
+        output_bytes="$(metrics_file_bytes "$final_file")"
 
-python3 "$SCRIPT_DIR/generate/generate_markdown.py" "$TRANSLATED_FILE" \
-    -o "$FINAL_FILE" \
-    --original-url "$ORIGINAL_URL" || {
-    log_error "Markdown generation failed"
-    python3 "$SCRIPT_DIR/state/state_manager.py" mark "$SLUG" --status failed --error "Markdown generation failed"
-    exit 1
+    log_step_done "${tag}최종 마크다운 생성"
+
+    # Step 5: YouTube 템플릿 생성 (한국어 채널용 템플릿이므로 ko만)
+    if [[ "$lang" == "ko" ]]; then
+        generate_youtube_template "$lang_dir" "$tag"
+    fi
+
+    # 경고는 언어별 작업 디렉토리에 기록 (PR 본문에 표시)
+    if [[ ${#warnings[@]} -gt 0 ]]; then
+        printf '%s\n' "${warnings[@]}" > "$lang_dir/pipeline_warnings.txt"
+    else
+        rm -f "$lang_dir/pipeline_warnings.txt"
+    fi
+}
+
+# 게시된 번역에 원문 변경분만 반영 (--sync, 백그라운드 서브셸에서 실행)
+# 사전 번역 결과가 있으면 게시본 대신 사전 번역을 머지된 원문과 대조 (SPECULATIVE_WORK_DIR)
+# 변경 구간을 번역본에서 찾을 수 없거나 부분 재번역이 실패하면 전체 번역으로 전환
+# 결과는 <lang_dir>/sync_status에 기록 (unchanged | patched | full)
+sync_language() {
+    local lang="$1"
+    local lang_dir
+    lang_dir=$(lang_work_dir "$WORK_DIR" "$lang")
+
+    local tag=""
+    if [[ ${#TARGET_LANG_LIST[@]} -gt 1 ]]; then
+        tag="[$lang] "
+    fi
+
+    mkdir -p "$lang_dir"
+    rm -f "$lang_dir/failure.txt" "$lang_dir/sync_status"
+    export CONTENT_LANG="$lang"
+
+    # 게시된 번역 (작업 디렉토리가 비워졌으면 산출물 저장소에서 복원) 또는 사전 번역
+    local max_ratio="$DELTA_MAX_CHANGED_RATIO"
+    if [[ -n "$SPECULATIVE_WORK_DIR" ]]; then
+        local speculative_lang_dir name
+        speculative_lang_dir=$(lang_work_dir "$SPECULATIVE_WORK_DIR" "$lang")
+        rm -f "$lang_dir/final.md" "$lang_dir/youtube.txt"
+        for name in final.md youtube.txt; do
+            if [[ -f "$speculative_lang_dir/$name" ]]; then
+                cp "$speculative_lang_dir/$name" "$lang_dir/$name"
+            fi
+        done
+        max_ratio="$SPECULATIVE_MAX_CHANGED_RATIO"
+    else
+        newsauto artifacts restore "$SLUG" "$lang_dir" final.md youtube.txt > /dev/null 2>&1 || true
+    fi
+    if [[ ! -f "$lang_dir/final.md" ]]; then
+        log_warn "${tag}No published or speculative translation found. Running full translation."
+        echo "full" > "$lang_dir/sync_status"
+        process_language "$lang"
+        return
+    fi
+
+    # 게시본은 미디어 링크가 미러 경로로 바뀌어 있으므로 이전 원문의 URL로 되돌려 구간을 대응시킴
+    # (발행 직전 mirror-media rewrite가 다시 교체)
+    newsauto mirror-media restore "$lang_dir/final.md" --source "$PREVIOUS_ORIGINAL" > /dev/null || \
+        log_warn "${tag}Media link restore failed. Segments with mirrored media may not map."
+
+    # Step 2: 원문 변경 구간과 번역본 대응 구간 계산
+    log_step "${tag}Step 2: 원문 변경분 확인"
+    local plan_json status reason changed inserted deleted
+    plan_json=$(newsauto delta plan "$PREVIOUS_ORIGINAL" "$ORIGINAL_FILE" "$lang_dir/final.md" \
+        -o "$lang_dir/delta_plan.json" \
+        --segments "$lang_dir/delta_source.md" \
+        --max-ratio "$max_ratio" \
+        --json) || plan_json='{"status": "full", "reason": "delta planning failed"}'
+    {
+        read -r status
+        read -r reason
+        read -r changed
+        read -r inserted
+        read -r deleted
+    } < <(echo "$plan_json" | newsauto json-get status reason changed inserted deleted)
+
+    if [[ "$status" == "unchanged" ]]; then
+        log_info "${tag}Upstream unchanged. Existing translation is up to date."
+        echo "unchanged" > "$lang_dir/sync_status"
+        return 0
+    fi
+    if [[ "$status" != "patchable" ]]; then
+        log_warn "${tag}Delta re-translation not applicable ($reason). Running full translation."
+        echo "full" > "$lang_dir/sync_status"
+        process_language "$lang"
+        return
+    fi
+
+    log_info "${tag}Changed: $changed, inserted: $inserted, deleted: $deleted"
+    log_step_done "${tag}원문 변경분 확인"
+
+    # Step 3: 변경 구간만 번역해 게시된 final.md에 반영
+    log_step "${tag}Step 3: 변경 구간 번역 및 반영"
+    local source_file="$lang_dir/delta_source.md"
+    local translated_file="$lang_dir/delta_translated.md"
+    local patched_file="$lang_dir/final.patched.md"
+
+    # 변경 구간만의 크기로 라우팅 (작은 수정은 가벼운 설정)
+    route_translation decide "$source_file" --headline "$HAS_HEADLINE" --links "$LINK_COUNT" --stage delta --lang "$lang"
+
+    metrics_stage_start delta
+    if TRANSLATE_MODE=delta LLM_STAGE=delta \
+            routed_translate "$source_file" "$HAS_HEADLINE" "$translated_file" \
+        && newsauto delta apply "$lang_dir/delta_plan.json" "$translated_file" "$lang_dir/final.md" \
+            -o "$patched_file" \
+        && [[ -z "$(validate_final_markdown "$patched_file" 2>&1)" ]]; then
+        mv "$patched_file" "$lang_dir/final.md"
+        metrics_stage_end delta 0 \
+            lang="$lang" \
+            input_bytes="$(metrics_file_bytes "$source_file")" \
+            output_bytes="$(metrics_file_bytes "$translated_file")"
+    else
+        metrics_stage_end delta 1 lang="$lang" input_bytes="$(metrics_file_bytes "$source_file")"
+        rm -f "$patched_file"
+        log_warn "${tag}Delta re-translation failed. Running full translation."
+        echo "full" > "$lang_dir/sync_status"
+        process_language "$lang"
+        return
+    fi
+
+    log_step_done "${tag}변경 구간 번역 및 반영"
+
+    if [[ "$lang" == "ko" ]]; then
+        generate_youtube_template "$lang_dir" "$tag"
+    fi
+
+    # 부분 재번역임을 PR 본문에 표시 (변경 구간 검토용)
+    local summary="원문 수정 반영"
+    if [[ -n "$SPECULATIVE_WORK_DIR" ]]; then
+        summary="사전 번역 대비 원문 변경 반영"
+    fi
+    echo "$summary (부분 재번역): 변경 $changed, 추가 $inserted, 삭제 $deleted" \
+        > "$lang_dir/pipeline_warnings.txt"
+    echo "patched" > "$lang_dir/sync_status"
 }
 
-# final.md 검증
-final_validation=$(validate_final_markdown "$FINAL_FILE" 2>&1) || true
-if [[ -n "$final_validation" ]]; then
-    log_warn "Final markdown validation failed: $final_validation"
-    PIPELINE_WARNINGS+=("최종 마크다운 검증 실패: $final_validation")
+# 언어별 전체 소요 시간은 language 단계로 기록 (하위 단계 스팬의 부모)
+LANG_HANDLER=process_language
+if [[ "$SYNC_MODE" == "true" ]] || [[ -n "$SPECULATIVE_WORK_DIR" ]]; then
+    LANG_HANDLER=sync_language
+fi
 
-    # 원본 translated.md가 유효하면 그걸로 대체
-    ORIGINAL_TRANSLATED="$WORK_DIR/translated.md"
-    orig_validation=$(validate_final_markdown "$ORIGINAL_TRANSLATED" 2>&1) || true
+LANG_PIDS=()
+for lang in "${TARGET_LANG_LIST[@]}"; do
+    (
+        trap 'metrics_stage_end language $? lang="$lang"' EXIT
+        metrics_stage_start language
+        "$LANG_HANDLER" "$lang"
+    ) &
+    LANG_PIDS+=("$!")
+done
 
-    if [[ -z "$orig_validation" ]]; then
-        log_info "Using original translated.md as final.md"
-        cp "$ORIGINAL_TRANSLATED" "$FINAL_FILE"
-        PIPELINE_WARNINGS+=("원본 번역으로 대체함")
+SUCCEEDED_LANGS=()
+FAILED_LANGS=()
+for i in "${!TARGET_LANG_LIST[@]}"; do
+    if wait "${LANG_PIDS[$i]}"; then
+        SUCCEEDED_LANGS+=("${TARGET_LANG_LIST[$i]}")
     else
-        log_warn "Original translation also invalid. Proceeding with best effort."
-        PIPELINE_WARNINGS+=("원본도 검증 실패 - 최선의 결과로 진행")
+        FAILED_LANGS+=("${TARGET_LANG_LIST[$i]}")
+    fi
+done
+
+# 미디어 미러링 대기 (사전 번역 실행도 저장소를 채워두도록 기다림, 링크 교체는 발행 직전에)
+MEDIA_READY=false
+if [[ -n "$MEDIA_PID" ]]; then
+    if wait "$MEDIA_PID"; then
+        MEDIA_READY=true
+        if [[ -s "$WORK_DIR/media_warnings.txt" ]]; then
+            mapfile -t media_warnings < "$WORK_DIR/media_warnings.txt"
+            PIPELINE_WARNINGS+=("${media_warnings[@]}")
+        fi
+    else
+        log_warn "Media mirroring failed. Publishing with original media links."
     fi
 fi
 
-log_step_done "최종 마크다운 생성"
+# 링크 확인 대기 (사전 번역 실행도 캐시를 채워두도록 기다림, 실패해도 발행은 계속)
+if [[ -n "$LINKCHECK_PID" ]]; then
+    if wait "$LINKCHECK_PID"; then
+        if [[ -s "$WORK_DIR/link_warnings.txt" ]]; then
+            mapfile -t link_warnings < "$WORK_DIR/link_warnings.txt"
+            PIPELINE_WARNINGS+=("${link_warnings[@]}")
+            log_warn "Link check: ${link_warnings[0]%%:*}"
+        fi
+    else
+        log_warn "Link check failed. Publishing without link warnings."
+    fi
+fi
 
-# Step 5: YouTube 템플릿 생성
-log_step "Step 5: YouTube 템플릿 생성"
-YOUTUBE_FILE="$WORK_DIR/youtube.txt"
+if [[ ${#SUCCEEDED_LANGS[@]} -eq 0 ]]; then
+    mark_failed "$(language_failure "${FAILED_LANGS[0]}")"
+    exit 1
+fi
 
-python3 "$SCRIPT_DIR/generate/generate_youtube.py" "$FINAL_FILE" \
-    -o "$YOUTUBE_FILE" \
-    --original-url "$TARGET_URL" || {
-    log_warn "YouTube template generation failed (non-critical)"
-}
+# 사전 번역: 성공한 언어만 기록하고 종료 (발행/상태 기록 없음, 실패한 언어는 머지 후 전체 번역)
+if [[ "$SPECULATE_MODE" == "true" ]]; then
+    for lang in "${FAILED_LANGS[@]}"; do
+        log_warn "Language $lang failed ($(language_failure "$lang")). Will translate after merge."
+        rm -f "$(lang_work_dir "$WORK_DIR" "$lang")/final.md"
+    done
+    newsauto speculate record "$SLUG" --ref "$DRAFT_REF" --blob "$DRAFT_BLOB" --langs "${SUCCEEDED_LANGS[@]}"
+    log_success "Speculative translation ready: $SLUG (${SUCCEEDED_LANGS[*]})"
+    finalize_log "success"
+    exit 0
+fi
 
-log_step_done "YouTube 템플릿 생성"
+# 일부 언어만 실패하면 성공한 언어만 발행하고 경고로 남김
+for lang in "${FAILED_LANGS[@]}"; do
+    failure=$(language_failure "$lang")
+    log_warn "Language $lang failed ($failure). Publishing: ${SUCCEEDED_LANGS[*]}"
+    PIPELINE_WARNINGS+=("$lang 처리 실패: $failure")
+done
+
+# --sync: 원문이 바뀌지 않은 언어는 다시 발행하지 않음
+if [[ "$SYNC_MODE" == "true" ]]; then
+    CHANGED_LANGS=()
+    for lang in "${SUCCEEDED_LANGS[@]}"; do
+        if [[ "$(cat "$(lang_work_dir "$WORK_DIR" "$lang")/sync_status" 2>/dev/null)" != "unchanged" ]]; then
+            CHANGED_LANGS+=("$lang")
+        fi
+    done
+    if [[ ${#CHANGED_LANGS[@]} -eq 0 ]]; then
+        log_success "Already in sync with upstream: $SLUG"
+        finalize_log "success"
+        exit 0
+    fi
+    SUCCEEDED_LANGS=("${CHANGED_LANGS[@]}")
+fi
+
+# 미러링된 미디어 링크를 사이트 경로로 교체 (발행 파일 목록: <lang_dir>/media_files.json)
+if [[ "$MEDIA_READY" == "true" ]]; then
+    for lang in "${SUCCEEDED_LANGS[@]}"; do
+        newsauto mirror-media rewrite "$(lang_work_dir "$WORK_DIR" "$lang")/final.md" \
+            --report "$WORK_DIR/media_report.json" > /dev/null || \
+            log_warn "Media link rewrite failed for $lang. Keeping original media links."
+    done
+fi
+
+# 언어 공통 경고는 첫 번째 성공 언어의 경고 파일에 추가
+PRIMARY_DIR=$(lang_work_dir "$WORK_DIR" "${SUCCEEDED_LANGS[0]}")
+if [[ ${#PIPELINE_WARNINGS[@]} -gt 0 ]]; then
+    printf '%s\n' "${PIPELINE_WARNINGS[@]}" >> "$PRIMARY_DIR/pipeline_warnings.txt"
+fi
+
+# 발행 전 임대 확인 (만료되어 다른 실행이 회수했으면 중복 발행하지 않음)
+if ! lease_held; then
+    log_error "Lease on $SLUG was lost. Another run owns it now. Skipping publish."
+    exit 1
+fi
 
 # Step 6: PR 생성
 if [[ "$DRY_RUN" == "true" ]]; then
     log_info "Dry run mode. Skipping PR creation."
     log_info "Output files:"
     log_info "  - Original: $ORIGINAL_FILE"
-    log_info "  - Translated: $TRANSLATED_FILE"
-    log_info "  - Final: $FINAL_FILE"
-    log_info "  - YouTube: $YOUTUBE_FILE"
+    for lang in "${SUCCEEDED_LANGS[@]}"; do
+        lang_dir=$(lang_work_dir "$WORK_DIR" "$lang")
+        log_info "  - Final ($lang): $lang_dir/final.md"
+        if [[ -f "$lang_dir/youtube.txt" ]]; then
+            log_info "  - YouTube ($lang): $lang_dir/youtube.txt"
+        fi
+    done
 
-    python3 "$SCRIPT_DIR/state/state_manager.py" mark "$SLUG" --status success
+    if [[ "$SYNC_MODE" != "true" ]]; then
+        newsauto state mark "$SLUG" --status success
+    fi
 else
     log_step "Step 6: PR 생성"
 
-    # 경고 정보를 환경변수로 전달
-    WARNINGS_FILE="$WORK_DIR/pipeline_warnings.txt"
-    if [[ ${#PIPELINE_WARNINGS[@]} -gt 0 ]]; then
-        printf '%s\n' "${PIPELINE_WARNINGS[@]}" > "$WARNINGS_FILE"
-        log_warn "Pipeline had ${#PIPELINE_WARNINGS[@]} warning(s)"
-    else
-        rm -f "$WARNINGS_FILE"
+    warning_count=0
+    for lang in "${SUCCEEDED_LANGS[@]}"; do
+        warnings_file="$(lang_work_dir "$WORK_DIR" "$lang")/pipeline_warnings.txt"
+        if [[ -f "$warnings_file" ]]; then
+            warning_count=$((warning_count + $(wc -l < "$warnings_file")))
+        fi
+    done
+    if [[ $warning_count -gt 0 ]]; then
+        log_warn "Pipeline had $warning_count warning(s)"
     fi
 
-    pr_output=$("$SCRIPT_DIR/publish/create_pr.sh" "$SLUG" "$WORK_DIR" 2>&1) || {
-        log_error "PR creation failed"
-        python3 "$SCRIPT_DIR/state/state_manager.py" mark "$SLUG" --status failed --error "PR creation failed"
-        exit 1
-    }
+    metrics_stage_start publish
+    if [[ "$PUBLISH_MODE" == "queue" ]]; then
+        # 큐 모드: 언어별 작업 디렉토리를 큐에 넣고 플러시 정책을 만족하면 묶어서 발행
+        {
+            for lang in "${SUCCEEDED_LANGS[@]}"; do
+                printf 'publish-queue enqueue %q %q --lang %q\n' "$SLUG" "$(lang_work_dir "$WORK_DIR" "$lang")" "$lang"
+            done
+            printf 'state mark %q --status queued\n' "$SLUG"
+        } | newsauto batch || {
+            log_error "Failed to enqueue for publishing"
+            mark_failed "Enqueue failed"
+            exit 1
+        }
+
+        pr_url=$(flush_publish_queue) || {
+            log_warn "Publish queue flush failed (will retry next run)"
+            pr_url=""
+        }
+        if [[ -z "$pr_url" ]]; then
+            log_info "Queued for batched publishing: $SLUG"
+        fi
+    else
+        pr_output=$("$SCRIPT_DIR/publish/create_pr.sh" "$SLUG" "$WORK_DIR" "${SUCCEEDED_LANGS[@]}" 2>&1) || {
+            metrics_stage_end publish 1
+            log_error "PR creation failed"
+            mark_failed "PR creation failed"
+            exit 1
+        }
 
-    # PR URL만 추출 (마지막 줄에서 https://로 시작하는 URL)
-    pr_url=$(echo "$pr_output" | grep -oE 'https://github\.com/[^ ]+' | tail -1)
+        # PR URL만 추출 (마지막 줄에서 https://로 시작하는 URL)
+        pr_url=$(echo "$pr_output" | grep -oE 'https://github\.com/[^ ]+' | tail -1)
 
-    log_success "PR created: $pr_url"
-    notify_pr_created "$SLUG" "$pr_url"
-    python3 "$SCRIPT_DIR/state/state_manager.py" mark "$SLUG" --status success --pr-url "$pr_url"
+        log_success "PR created: $pr_url"
+        notify_pr_created "$SLUG" "$pr_url"
+        newsauto state mark "$SLUG" --status success --pr-url "$pr_url"
+    fi
 
+    metrics_stage_end publish 0
     log_step_done "PR 생성"
 fi
 
+# 사전 번역 대조 결과 기록 (hit | reconciled | discarded) 후 사전 번역 삭제
+if [[ -n "$SPECULATIVE_WORK_DIR" ]]; then
+    speculative_statuses=()
+    for lang in "${TARGET_LANG_LIST[@]}"; do
+        status=$(cat "$(lang_work_dir "$WORK_DIR" "$lang")/sync_status" 2>/dev/null) || status="full"
+        speculative_statuses+=("$lang=$status")
+    done
+    newsauto speculate finish "$SLUG" "${speculative_statuses[@]}" || log_warn "Failed to record speculative outcome"
+fi
+
 # 완료
 log_separator
 log_success "Pipeline completed successfully!"
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+newsauto.py - 통합 CLI
+파이프라인의 모든 Python 도구를 하위 명령으로 제공하는 단일 엔트리포인트입니다.
+
+도구 모듈은 해당 하위 명령을 실행할 때만 import합니다 (lazy import).
+batch 명령은 여러 하위 명령을 한 프로세스에서 순서대로 실행해 인터프리터 기동 비용을 줄입니다.
+
+사용법:
+    newsauto.py <command> [args...]
+    newsauto.py state mark <slug> --status success
+    echo "$json" | newsauto.py json-get metadata.has_headline 'links|len'
+    printf 'state stats\\nmetrics summary\\n' | newsauto.py batch
+"""
+
+import os
+import sys
+import importlib
+from pathlib import Path
+
+# 하위 명령: (모듈, 트레이스 스팬 이름 (None이면 스팬 미기록), 설명)
+COMMANDS = {
+    "check-feed": ("rss.check_feed", "check_feed", "GitHub 소스에서 새 이슈 확인"),
+    "speculate": ("rss.speculate", "speculate", "업스트림 PR/브랜치 초안 사전 번역 관리"),
+    "fetch": ("crawler.fetch_page", "fetch_page", "GitHub 마크다운 가져오기/검증"),
+    "check-links": ("crawler.check_links", "check_links", "원문 외부 링크 생존 확인 (TTL 캐시)"),
+    "mirror-media": ("crawler.mirror_media", "mirror_media", "이미지/미디어 내용 해시 미러링 및 링크 교체"),
+    "generate-markdown": ("generate.generate_markdown", "generate_markdown", "최종 마크다운 생성"),
+    "generate-youtube": ("generate.generate_youtube", "generate_youtube", "YouTube 템플릿 생성"),
+    "local-review": ("review.local_review", "local_review", "오프라인 번역 검토"),
+    "chunked-review": ("review.chunked_review", "chunked_review", "섹션 단위 병렬 LLM 검토"),
+    "glossary": ("review.glossary", "glossary", "용어집 기반 용어 일관성 검증"),
+    "delta": ("translate.delta", "delta", "원문 변경분 부분 재번역 계획/패치"),
+    "route": ("translate.routing", "routing", "이슈 크기/성격별 번역 모델 라우팅"),
+    "hedge": ("translate.hedge", "hedge", "병렬 번역 후보 중 먼저 리뷰를 통과한 번역 사용"),
+    "state": ("state.state_manager", "state_manager", "실행 상태 관리"),
+    "publish-queue": ("publish.publish_queue", "publish_queue", "발행 큐 관리"),
+    "git-publish": ("publish.git_publish", "git_publish", "bare 미러에서 브랜치 발행"),
+    "metrics": ("lib.metrics", None, "단계별 메트릭 기록/조회"),
+    "trace": ("lib.tracing", None, "실행 트레이스 조회/내보내기"),
+    "alerts": ("lib.alerts", None, "알림 저장소 기록/조회/확인"),
+    "ledger": ("lib.llm_ledger", None, "LLM 호출 장부 기록/집계"),
+    "artifacts": ("lib.artifacts", "artifacts", "작업 산출물 보관/복원/보존 정책"),
+    "resilience": ("lib.resilience", None, "재시도/서킷 브레이커 실행 및 상태 조회"),
+    "cassette": ("lib.cassette", None, "HTTP 기록/재생 cassette 조회"),
+    "ratelimit": ("lib.ratelimit", None, "GitHub 속도 제한 예산 조회/관리"),
+}
+
+
+def _exit_code(result) -> int:
+    """main() 반환값 또는 SystemExit.code를 종료 코드로 변환합니다."""
+    if result is None:
+        return 0
+    if isinstance(result, int):
+        return result
+    print(result, file=sys.stderr)
+    return 1
+
+
+def cmd_json_get(args: list[str]) -> int:
+    """stdin의 JSON에서 경로 값을 한 줄씩 출력합니다.
+
+    경로는 점으로 구분하며 리스트 인덱스는 숫자로 씁니다 (예: 0.url, metadata.title).
+    '|len'은 길이를, '|join'은 리스트를 ", "로 이어 출력합니다.
+    값이 없으면 빈 줄을 출력합니다.
+    """
+    import json
+
+    if not args or args[0] in ("-h", "--help"):
+        print("Usage: newsauto json-get <path>[|len|join] ...", file=sys.stderr)
+        return 0 if args else 2
+
+    try:
+        data = json.load(sys.stdin)
+    except json.JSONDecodeError as e:
+        print(f"Invalid JSON: {e}", file=sys.stderr)
+        return 1
+
+    for expr in args:
+        path, _, fmt = expr.partition("|")
+        value = data
+        for key in filter(None, path.split(".")):
+            if isinstance(value, list) and key.lstrip("-").isdigit() and -len(value) <= int(key) < len(value):
+                value = value[int(key)]
+            elif isinstance(value, dict) and key in value:
+                value = value[key]
+            else:
+                value = None
+                break
+
+        if fmt == "len":
+            value = len(value) if value is not None else 0
+        elif fmt == "join":
+            value = ", ".join(str(v) for v in value) if value else ""
+        elif fmt:
+            print(f"Unknown filter: {fmt}", file=sys.stderr)
+            return 2
+
+        if value is None:
+            print("")
+        elif isinstance(value, bool):
+            print(str(value).lower())
+        elif isinstance(value, (dict, list)):
+            print(json.dumps(value, ensure_ascii=False))
+        else:
+            print(value)
+    return 0
+
+
+def cmd_validate_final(args: list[str]) -> int:
+    """최종 마크다운 검증 (오류를 한 줄씩 출력, 오류가 있으면 exit 1)"""
+    if len(args) != 1 or args[0] in ("-h", "--help"):
+        print("Usage: newsauto validate-final <file>", file=sys.stderr)
+        return 0 if args else 2
+
+    from generate.generate_markdown import validate_final_markdown
+
+    errors = validate_final_markdown(Path(args[0]))
+    for error in errors:
+        print(error)
+    return 1 if errors else 0
+
+
+def cmd_batch(args: list[str]) -> int:
+    """파일(또는 stdin)의 각 줄을 하위 명령으로 실행합니다.
+
+    빈 줄과 #으로 시작하는 줄은 건너뜁니다. 기본적으로 첫 실패에서 멈추고
+    그 종료 코드를 반환합니다 (--keep-going: 끝까지 실행 후 마지막 실패 코드 반환).
+    stdin을 명령 목록으로 쓰므로 json-get처럼 stdin을 읽는 명령은 batch에 넣을 수 없습니다.
+    """
+    import shlex
+
+    keep_going = "--keep-going" in args
+    sources = [a for a in args if a != "--keep-going"]
+    if sources and sources[0] != "-":
+        lines = Path(sources[0]).read_text(encoding="utf-8").splitlines()
+    else:
+        lines = sys.stdin.read().splitlines()
+
+    status = 0
+    for line in lines:
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        code = run_command(shlex.split(line))
+        sys.stdout.flush()
+        if code != 0:
+            status = code
+            if not keep_going:
+                break
+    return status
+
+
+BUILTINS = {
+    "json-get": (cmd_json_get, "stdin JSON에서 값 추출 (셸 인라인 파싱 대체)"),
+    "validate-final": (cmd_validate_final, "최종 마크다운 검증"),
+    "batch": (cmd_batch, "여러 하위 명령을 한 프로세스에서 실행"),
+}
+
+
+def usage() -> str:
+    lines = ["Usage: newsauto <command> [args...]", "", "Commands:"]
+    for name, (_, _, help_text) in COMMANDS.items():
+        lines.append(f"  {name:<20} {help_text}")
+    for name, (_, help_text) in BUILTINS.items():
+        lines.append(f"  {name:<20} {help_text}")
+    return "\n".join(lines)
+
+
+def run_command(argv: list[str]) -> int:
+    """하위 명령 하나를 현재 프로세스에서 실행하고 종료 코드를 반환합니다."""
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0 if argv else 2
+
+    name, args = argv[0], argv[1:]
+    if name in BUILTINS:
+        return BUILTINS[name][0](args)
+    if name not in COMMANDS:
+        print(f"Unknown command: {name}\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    module_name, span_name, _ = COMMANDS[name]
+    module = importlib.import_module(module_name)
+
+    saved_argv = sys.argv
+    sys.argv = [f"newsauto {name}", *args]
+    try:
+        if span_name:
+            from lib.profiling import run_main
+            result = run_main(span_name, module.main)
+        else:
+            result = module.main()
+    except SystemExit as e:
+        result = e.code
+    finally:
+        sys.argv = saved_argv
+    return _exit_code(result)
+
+
+def main() -> int:
+    # 도구 모듈(crawler.fetch_page 등)을 import할 수 있도록 src 추가
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+    return run_command(sys.argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
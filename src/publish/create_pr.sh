@@ -2,89 +2,71 @@
 # create_pr.sh - PR 생성 워크플로우
 # smol.ai 한국어 뉴스 자동 발행 시스템
 #
-# 사용법: ./create_pr.sh <slug> <work_dir>
+# 사용법: ./create_pr.sh <slug> <work_dir> [lang ...]
+#
+# lang: 발행할 언어 (기본: ko). ko는 <work_dir>, 그 외는 <work_dir>/<lang>의 final.md를
+#       web 레포의 ainews/<lang>/<slug>.md로 한 PR에 함께 발행합니다.
+#
+# PUBLISH_BACKEND:
+# - plumbing (default): bare 미러에서 git plumbing으로 커밋 생성 (web 레포 체크아웃 미사용)
+# - worktree: web 레포 체크아웃에서 브랜치 전환 후 커밋
 
 set -e
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$SCRIPT_DIR/../lib/config.sh"
 source "$SCRIPT_DIR/../lib/logging.sh"
+source "$SCRIPT_DIR/../lib/tracing.sh"
+
+trace_script_begin create_pr.sh
+trap 'trace_script_end $?' EXIT
 
 # 인자 확인
 if [[ $# -lt 2 ]]; then
-    echo "Usage: $0 <slug> <work_dir>" >&2
+    echo "Usage: $0 <slug> <work_dir> [lang ...]" >&2
     exit 1
 fi
 
 SLUG="$1"
 WORK_DIR="$2"
-
-# 파일 확인
-FINAL_FILE="$WORK_DIR/final.md"
-YOUTUBE_FILE="$WORK_DIR/youtube.txt"
-
-if [[ ! -f "$FINAL_FILE" ]]; then
-    log_error "Final markdown file not found: $FINAL_FILE"
-    exit 1
-fi
-
-# Web 레포 확인
-if [[ ! -d "$WEB_REPO_PATH" ]]; then
-    log_error "Web repository not found: $WEB_REPO_PATH"
-    exit 1
+shift 2
+LANGS=("$@")
+if [[ ${#LANGS[@]} -eq 0 ]]; then
+    LANGS=(ko)
 fi
 
-# Web 레포로 이동
-cd "$WEB_REPO_PATH"
-
-# 현재 브랜치 저장
-ORIGINAL_BRANCH=$(git rev-parse --abbrev-ref HEAD)
+# 파일 확인 (제목/요약은 첫 번째 언어 기준)
+for lang in "${LANGS[@]}"; do
+    lang_final="$(lang_work_dir "$WORK_DIR" "$lang")/final.md"
+    if [[ ! -f "$lang_final" ]]; then
+        log_error "Final markdown file not found: $lang_final"
+        exit 1
+    fi
+done
+FINAL_FILE="$(lang_work_dir "$WORK_DIR" "${LANGS[0]}")/final.md"
+YOUTUBE_FILE="$WORK_DIR/youtube.txt"
 
-# main 브랜치로 전환 및 최신화
-log_info "Switching to main branch..."
-git checkout main
-git pull origin main
+# 미러링된 미디어 (web 레포 경로=로컬 객체, 언어가 같은 객체를 쓰면 한 번만)
+LANG_DIRS=()
+for lang in "${LANGS[@]}"; do
+    LANG_DIRS+=("$(lang_work_dir "$WORK_DIR" "$lang")")
+done
+mapfile -t MEDIA_FILES < <(newsauto mirror-media files "${LANG_DIRS[@]}")
 
-# 새 브랜치 생성
+# 브랜치 이름 (날짜-slug)
 DATE_PREFIX=$(date +%Y%m%d)
 BRANCH_NAME="ainews/${DATE_PREFIX}-${SLUG}"
 
-log_info "Creating branch: $BRANCH_NAME"
-git checkout -b "$BRANCH_NAME" 2>/dev/null || {
-    # 브랜치가 이미 존재하면 삭제 후 재생성
-    git checkout main
-    git branch -D "$BRANCH_NAME" 2>/dev/null || true
-    git checkout -b "$BRANCH_NAME"
-}
-
-# 파일 복사
-AINEWS_KO_DIR="$AINEWS_CONTENT_PATH/ko"
-AINEWS_YOUTUBE_DIR="$AINEWS_CONTENT_PATH/youtube"
-
-mkdir -p "$AINEWS_KO_DIR"
-mkdir -p "$AINEWS_YOUTUBE_DIR"
-
 # 파일명 생성 (날짜-slug.md 형식)
 FILENAME="${SLUG}.md"
 
-log_info "Copying files..."
-cp "$FINAL_FILE" "$AINEWS_KO_DIR/$FILENAME"
-
-if [[ -f "$YOUTUBE_FILE" ]]; then
-    cp "$YOUTUBE_FILE" "$AINEWS_YOUTUBE_DIR/${SLUG}.txt"
-fi
-
-# 변경사항 커밋
-log_info "Committing changes..."
-git add "$AINEWS_CONTENT_PATH/"
-
 # frontmatter에서 제목 추출
 TITLE=$(grep "^title:" "$FINAL_FILE" | head -1 | sed 's/title: "//;s/"$//')
 if [[ -z "$TITLE" ]]; then
     TITLE="AI News - $SLUG"
 fi
 
-git commit -m "$(cat <<EOF
+COMMIT_MESSAGE="$(cat <<EOF
 feat(ainews): Add AI news - $SLUG
 
 $TITLE
@@ -94,9 +76,143 @@ Reviewed-By: Claude Opus <noreply@anthropic.com>
 EOF
 )"
 
-# 푸시
-log_info "Pushing to remote..."
-git push -u origin "$BRANCH_NAME"
+# web 레포 원격 URL (WEB_REMOTE_URL 미지정 시 web 레포의 origin 사용)
+resolve_remote_url() {
+    if [[ -n "$WEB_REMOTE_URL" ]]; then
+        echo "$WEB_REMOTE_URL"
+    elif [[ -d "$WEB_REPO_PATH" ]]; then
+        git -C "$WEB_REPO_PATH" remote get-url origin
+    fi
+}
+
+# plumbing 백엔드: bare 미러에서 커밋을 만들어 푸시 (web 레포 체크아웃은 건드리지 않음)
+publish_with_plumbing() {
+    local remote_url
+    remote_url=$(resolve_remote_url)
+    if [[ -z "$remote_url" ]]; then
+        log_error "Cannot resolve web remote URL (set WEB_REMOTE_URL or WEB_REPO_PATH)"
+        exit 1
+    fi
+
+    # web 레포 내 상대 경로 (예: src/content/ainews)
+    local content_prefix="${AINEWS_CONTENT_PATH#"$WEB_REPO_PATH"/}"
+    local file_args=()
+    local lang
+    for lang in "${LANGS[@]}"; do
+        file_args+=(--file "$content_prefix/$lang/$FILENAME=$(lang_work_dir "$WORK_DIR" "$lang")/final.md")
+    done
+    if [[ -f "$YOUTUBE_FILE" ]]; then
+        file_args+=(--file "$content_prefix/youtube/${SLUG}.txt=$YOUTUBE_FILE")
+    fi
+    local media_file
+    for media_file in "${MEDIA_FILES[@]}"; do
+        file_args+=(--file "$media_file")
+    done
+
+    local message_file
+    message_file=$(mktemp)
+    printf '%s\n' "$COMMIT_MESSAGE" > "$message_file"
+
+    log_info "Publishing via bare mirror: $WEB_MIRROR_PATH"
+    log_info "Creating branch: $BRANCH_NAME"
+    python3 "$SCRIPT_DIR/git_publish.py" \
+        --remote "$remote_url" \
+        --mirror "$WEB_MIRROR_PATH" \
+        --base main \
+        --branch "$BRANCH_NAME" \
+        "${file_args[@]}" \
+        --message-file "$message_file" >&2 || {
+        rm -f "$message_file"
+        log_error "Plumbing publish failed"
+        exit 1
+    }
+    rm -f "$message_file"
+
+    # gh가 web 레포를 찾을 수 있도록 GitHub 저장소 지정
+    local gh_repo
+    gh_repo=$(echo "$remote_url" | sed -nE 's#^(https://|git@|ssh://git@)github\.com[:/]([^/]+/[^/]+)$#\2#p' | sed 's/\.git$//')
+    if [[ -n "$gh_repo" ]]; then
+        export GH_REPO="$gh_repo"
+    elif [[ -d "$WEB_REPO_PATH" ]]; then
+        cd "$WEB_REPO_PATH"
+    fi
+}
+
+# worktree 백엔드: web 레포 체크아웃에서 직접 브랜치 생성 및 커밋
+publish_with_worktree() {
+    # Web 레포 확인
+    if [[ ! -d "$WEB_REPO_PATH" ]]; then
+        log_error "Web repository not found: $WEB_REPO_PATH"
+        exit 1
+    fi
+
+    # Web 레포로 이동
+    cd "$WEB_REPO_PATH"
+
+    # 현재 브랜치 저장 (PR 생성 후 복귀)
+    ORIGINAL_BRANCH=$(git rev-parse --abbrev-ref HEAD)
+
+    # main 브랜치로 전환 및 최신화
+    log_info "Switching to main branch..."
+    git checkout main
+    git pull origin main
+
+    # 새 브랜치 생성
+    log_info "Creating branch: $BRANCH_NAME"
+    git checkout -b "$BRANCH_NAME" 2>/dev/null || {
+        # 브랜치가 이미 존재하면 삭제 후 재생성
+        git checkout main
+        git branch -D "$BRANCH_NAME" 2>/dev/null || true
+        git checkout -b "$BRANCH_NAME"
+    }
+
+    # 파일 복사
+    local youtube_dir="$AINEWS_CONTENT_PATH/youtube"
+    local lang
+
+    mkdir -p "$youtube_dir"
+
+    log_info "Copying files..."
+    for lang in "${LANGS[@]}"; do
+        mkdir -p "$AINEWS_CONTENT_PATH/$lang"
+        cp "$(lang_work_dir "$WORK_DIR" "$lang")/final.md" "$AINEWS_CONTENT_PATH/$lang/$FILENAME"
+    done
+
+    if [[ -f "$YOUTUBE_FILE" ]]; then
+        cp "$YOUTUBE_FILE" "$youtube_dir/${SLUG}.txt"
+    fi
+
+    local media_file repo_path local_path
+    for media_file in "${MEDIA_FILES[@]}"; do
+        repo_path="${media_file%%=*}"
+        local_path="${media_file#*=}"
+        mkdir -p "$(dirname "$WEB_REPO_PATH/$repo_path")"
+        cp "$local_path" "$WEB_REPO_PATH/$repo_path"
+        git add "$WEB_REPO_PATH/$repo_path"
+    done
+
+    # 변경사항 커밋
+    log_info "Committing changes..."
+    git add "$AINEWS_CONTENT_PATH/"
+    git commit -m "$COMMIT_MESSAGE"
+
+    # 푸시
+    log_info "Pushing to remote..."
+    git push -u origin "$BRANCH_NAME"
+}
+
+case "$PUBLISH_BACKEND" in
+    plumbing)
+        publish_with_plumbing
+        ;;
+    worktree)
+        publish_with_worktree
+        ;;
+    *)
+        log_error "Unknown PUBLISH_BACKEND: $PUBLISH_BACKEND (expected: plumbing|worktree)"
+        exit 1
+        ;;
+esac
 
 # PR 생성
 log_info "Creating pull request..."
@@ -104,11 +220,21 @@ log_info "Creating pull request..."
 # frontmatter에서 summary 추출
 SUMMARY=$(grep -A 5 "^summary:" "$FINAL_FILE" | grep "^  - " | sed 's/^  - "//;s/"$//' | head -3)
 
-# 파이프라인 경고 확인
-WARNINGS_FILE="$WORK_DIR/pipeline_warnings.txt"
+# 파이프라인 경고 확인 (여러 언어면 언어 표시)
+WARNINGS_CONTENT=""
+for lang in "${LANGS[@]}"; do
+    WARNINGS_FILE="$(lang_work_dir "$WORK_DIR" "$lang")/pipeline_warnings.txt"
+    if [[ -f "$WARNINGS_FILE" ]]; then
+        if [[ ${#LANGS[@]} -gt 1 ]]; then
+            WARNINGS_CONTENT+="$(sed "s/^/[$lang] /" "$WARNINGS_FILE")"$'\n'
+        else
+            WARNINGS_CONTENT+="$(cat "$WARNINGS_FILE")"$'\n'
+        fi
+    fi
+done
+WARNINGS_CONTENT="${WARNINGS_CONTENT%$'\n'}"
 WARNINGS_SECTION=""
-if [[ -f "$WARNINGS_FILE" ]]; then
-    WARNINGS_CONTENT=$(cat "$WARNINGS_FILE")
+if [[ -n "$WARNINGS_CONTENT" ]]; then
     WARNINGS_SECTION="
 ## ⚠️ Pipeline Warnings
 
@@ -134,6 +260,7 @@ ${WARNINGS_SECTION}
 
 - **Translation**: Codex CLI ($CODEX_MODEL, reasoning: $CODEX_REASONING_EFFORT)
 - **Review**: Claude Opus
+- **Languages**: ${LANGS[*]}
 - **Source**: [Original Article](https://github.com/smol-ai/ainews-web-2025/blob/main/src/content/issues/${SLUG}.md)
 
 ## Checklist
@@ -151,9 +278,11 @@ EOF
     --base main \
     --head "$BRANCH_NAME")
 
-# main으로 복귀
-log_info "Switching back to main..."
-git checkout main
+# 원래 브랜치로 복귀 (worktree 백엔드만 해당)
+if [[ "$PUBLISH_BACKEND" == "worktree" ]]; then
+    log_info "Switching back to $ORIGINAL_BRANCH..."
+    git checkout "$ORIGINAL_BRANCH"
+fi
 
 # PR URL 출력
 echo "$PR_URL"
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+git_publish.py - 체크아웃 없는 퍼블리셔
+web 레포의 작업 트리를 건드리지 않고 bare 미러에서 git plumbing
+(hash-object / mktree / commit-tree)으로 커밋을 만든 뒤 브랜치를 푸시합니다.
+
+변경되는 경로의 트리만 다시 쓰므로 발행 시간은 web 레포 크기와 무관하며,
+개발자가 체크아웃해 둔 브랜치나 작업 중인 파일에는 영향을 주지 않습니다.
+"""
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.profiling import add_profile_argument  # noqa: E402
+
+DEFAULT_MIRROR = PROJECT_ROOT / "data" / "web-mirror.git"
+
+
+class PublishError(Exception):
+    """발행 실패"""
+
+
+def _git(mirror: Path, *args: str, input: Optional[bytes] = None) -> str:
+    """미러 레포에서 git 명령을 실행하고 stdout을 반환합니다."""
+    env = dict(os.environ)
+    # 커밋 작성자 지정 (선택사항, 없으면 git 전역 설정 사용)
+    name = os.environ.get("PUBLISH_GIT_NAME")
+    email = os.environ.get("PUBLISH_GIT_EMAIL")
+    if name:
+        env.setdefault("GIT_AUTHOR_NAME", name)
+        env.setdefault("GIT_COMMITTER_NAME", name)
+    if email:
+        env.setdefault("GIT_AUTHOR_EMAIL", email)
+        env.setdefault("GIT_COMMITTER_EMAIL", email)
+
+    result = subprocess.run(
+        ["git", "--git-dir", str(mirror), *args],
+        input=input,
+        capture_output=True,
+        env=env,
+    )
+    if result.returncode != 0:
+        raise PublishError(
+            f"git {' '.join(args)} failed: {result.stderr.decode('utf-8', 'replace').strip()}"
+        )
+    return result.stdout.decode("utf-8").strip()
+
+
+def ensure_mirror(mirror: Path, remote_url: str):
+    """bare 미러를 생성하거나 origin URL을 최신화합니다."""
+    if not (mirror / "HEAD").exists():
+        mirror.parent.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            ["git", "init", "--bare", "--quiet", str(mirror)],
+            check=True,
+            capture_output=True,
+        )
+
+    try:
+        current = _git(mirror, "remote", "get-url", "origin")
+    except PublishError:
+        current = None
+
+    if current is None:
+        _git(mirror, "remote", "add", "origin", remote_url)
+    elif current != remote_url:
+        _git(mirror, "remote", "set-url", "origin", remote_url)
+
+
+def fetch_base(mirror: Path, base: str) -> str:
+    """원격의 base 브랜치를 미러로 가져오고 커밋 SHA를 반환합니다."""
+    ref = f"refs/remotes/origin/{base}"
+    _git(mirror, "fetch", "--quiet", "--no-tags", "origin", f"+refs/heads/{base}:{ref}")
+    return _git(mirror, "rev-parse", "--verify", f"{ref}^{{commit}}")
+
+
+def hash_file(mirror: Path, path: Path) -> str:
+    """파일을 blob으로 저장하고 SHA를 반환합니다."""
+    return _git(mirror, "hash-object", "-w", "--", str(path))
+
+
+def _read_tree(mirror: Path, tree: Optional[str]) -> dict[str, tuple[str, str, str]]:
+    """트리 엔트리를 {name: (mode, type, sha)}로 반환합니다."""
+    if not tree:
+        return {}
+
+    entries = {}
+    output = _git(mirror, "ls-tree", "-z", tree)
+    for record in output.split("\0"):
+        if not record:
+            continue
+        meta, _, name = record.partition("\t")
+        mode, obj_type, sha = meta.split()
+        entries[name] = (mode, obj_type, sha)
+    return entries
+
+
+def _write_tree(mirror: Path, entries: dict[str, tuple[str, str, str]]) -> str:
+    """엔트리로 새 트리 객체를 만들고 SHA를 반환합니다."""
+    lines = [
+        f"{mode} {obj_type} {sha}\t{name}"
+        for name, (mode, obj_type, sha) in sorted(entries.items())
+    ]
+    data = "".join(line + "\0" for line in lines).encode("utf-8")
+    return _git(mirror, "mktree", "-z", input=data)
+
+
+def insert_blobs(mirror: Path, tree: Optional[str], blobs: dict[str, str]) -> str:
+    """트리에 blob들을 삽입한 새 트리 SHA를 반환합니다.
+
+    blobs는 {레포 내 경로: blob SHA} 형식이며, 변경된 경로의 하위 트리만 다시 씁니다.
+    """
+    entries = _read_tree(mirror, tree)
+
+    # 첫 경로 요소별로 묶어서 하위 트리는 한 번씩만 다시 씀
+    nested: dict[str, dict[str, str]] = {}
+    for path, sha in blobs.items():
+        head, _, rest = path.strip("/").partition("/")
+        if rest:
+            nested.setdefault(head, {})[rest] = sha
+        else:
+            entries[head] = ("100644", "blob", sha)
+
+    for name, sub_blobs in nested.items():
+        existing = entries.get(name)
+        if existing and existing[1] != "tree":
+            raise PublishError(f"Path conflict: '{name}' is not a directory")
+        sub_tree = existing[2] if existing else None
+        entries[name] = ("040000", "tree", insert_blobs(mirror, sub_tree, sub_blobs))
+
+    return _write_tree(mirror, entries)
+
+
+def commit_tree(mirror: Path, tree: str, parent: str, message: str) -> str:
+    """트리와 부모로 커밋 객체를 만들고 SHA를 반환합니다."""
+    return _git(mirror, "commit-tree", tree, "-p", parent, input=message.encode("utf-8"))
+
+
+def push_branch(mirror: Path, commit: str, branch: str):
+    """커밋을 원격 브랜치로 푸시합니다 (기존 브랜치는 덮어씀)."""
+    _git(mirror, "push", "--quiet", "origin", f"+{commit}:refs/heads/{branch}")
+
+
+def build_commits(
+    mirror: Path,
+    parent: str,
+    changesets: list[tuple[dict[str, Path], str]],
+) -> str:
+    """(파일 매핑, 커밋 메시지) 목록을 순서대로 커밋하고 마지막 커밋 SHA를 반환합니다."""
+    head = parent
+    for files, message in changesets:
+        tree = _git(mirror, "rev-parse", f"{head}^{{tree}}")
+        blobs = {repo_path: hash_file(mirror, local) for repo_path, local in files.items()}
+        new_tree = insert_blobs(mirror, tree, blobs)
+        if new_tree == tree:
+            continue
+        head = commit_tree(mirror, new_tree, head, message)
+
+    if head == parent:
+        raise PublishError("No changes to publish")
+    return head
+
+
+def publish(
+    remote_url: str,
+    branch: str,
+    files: dict[str, Path],
+    message: str,
+    base: str = "main",
+    mirror: Path = DEFAULT_MIRROR,
+) -> dict:
+    """파일들을 base 위에 한 커밋으로 올려 branch로 푸시합니다."""
+    return publish_changesets(remote_url, branch, [(files, message)], base, mirror)
+
+
+def publish_changesets(
+    remote_url: str,
+    branch: str,
+    changesets: list[tuple[dict[str, Path], str]],
+    base: str = "main",
+    mirror: Path = DEFAULT_MIRROR,
+) -> dict:
+    """여러 커밋을 base 위에 쌓아 branch로 푸시합니다."""
+    for files, _ in changesets:
+        for local in files.values():
+            if not Path(local).is_file():
+                raise PublishError(f"File not found: {local}")
+
+    ensure_mirror(mirror, remote_url)
+    base_sha = fetch_base(mirror, base)
+    commit = build_commits(mirror, base_sha, changesets)
+    push_branch(mirror, commit, branch)
+
+    return {
+        "branch": branch,
+        "base": base_sha,
+        "commit": commit,
+    }
+
+
+def resolve_remote_url() -> Optional[str]:
+    """web 레포 원격 URL을 반환합니다 (WEB_REMOTE_URL > web 레포 origin)."""
+    remote_url = os.environ.get("WEB_REMOTE_URL")
+    if remote_url:
+        return remote_url
+
+    web_repo = os.environ.get("WEB_REPO_PATH")
+    if web_repo and Path(web_repo).is_dir():
+        result = subprocess.run(
+            ["git", "-C", web_repo, "remote", "get-url", "origin"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    return None
+
+
+def github_repo_from_url(remote_url: str) -> Optional[str]:
+    """GitHub 원격 URL에서 OWNER/REPO를 추출합니다 (GitHub가 아니면 None)."""
+    match = re.match(
+        r"^(?:https://|git@|ssh://git@)github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$",
+        remote_url,
+    )
+    return match.group(1) if match else None
+
+
+def parse_file_mapping(values: list[str]) -> dict[str, Path]:
+    """'레포경로=로컬경로' 인자 목록을 딕셔너리로 변환합니다."""
+    files = {}
+    for value in values:
+        repo_path, sep, local = value.partition("=")
+        if not sep or not repo_path or not local:
+            raise PublishError(f"Invalid --file mapping (expected repo/path=local/path): {value}")
+        files[repo_path.strip("/")] = Path(local)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="web 레포 체크아웃 없이 git plumbing으로 커밋을 만들어 브랜치를 푸시합니다."
+    )
+    add_profile_argument(parser)
+    parser.add_argument(
+        "--remote",
+        required=True,
+        help="web 레포 원격 URL"
+    )
+    parser.add_argument(
+        "--branch",
+        required=True,
+        help="푸시할 브랜치 이름"
+    )
+    parser.add_argument(
+        "--file",
+        action="append",
+        default=[],
+        metavar="REPO_PATH=LOCAL_PATH",
+        help="커밋에 포함할 파일 (여러 번 지정 가능)"
+    )
+    parser.add_argument(
+        "--message-file",
+        type=Path,
+        required=True,
+        help="커밋 메시지 파일"
+    )
+    parser.add_argument(
+        "--base",
+        default="main",
+        help="기준 브랜치 (default: main)"
+    )
+    parser.add_argument(
+        "--mirror",
+        type=Path,
+        default=DEFAULT_MIRROR,
+        help=f"bare 미러 경로 (default: {DEFAULT_MIRROR})"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        files = parse_file_mapping(args.file)
+        if not files:
+            raise PublishError("No files to publish (use --file)")
+        message = args.message_file.read_text(encoding="utf-8")
+        result = publish(args.remote, args.branch, files, message, args.base, args.mirror)
+    except PublishError as e:
+        print(f"Publish Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(result["commit"])
+
+
+if __name__ == "__main__":
+    from lib.profiling import run_main
+    run_main("git_publish", main)
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+publish_queue.py - 발행 큐
+완료된 작업 디렉토리를 큐에 쌓아 두었다가, 플러시 정책(시간 창, 최대 배치 크기,
+수동)에 따라 여러 이슈를 하나의 브랜치/PR로 묶어 발행합니다.
+
+백필처럼 이슈가 몰릴 때 PR, Cloudflare Pages 빌드, 리뷰 알림이 이슈 수만큼
+생기지 않도록 합니다. 각 이슈는 브랜치 안에서 개별 커밋으로 남습니다.
+"""
+
+import os
+import sys
+import json
+import fcntl
+import argparse
+import subprocess
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.profiling import add_profile_argument  # noqa: E402
+
+from publish.git_publish import (  # noqa: E402
+    DEFAULT_MIRROR,
+    PublishError,
+    publish_changesets,
+    resolve_remote_url,
+    github_repo_from_url,
+)
+from generate.generate_markdown import parse_frontmatter  # noqa: E402
+from state.state_manager import ProcessStatus, update_status  # noqa: E402
+from lib.artifacts import restore  # noqa: E402
+from crawler.mirror_media import load_media_files  # noqa: E402
+
+DATA_DIR = PROJECT_ROOT / "data"
+QUEUE_FILE = DATA_DIR / "publish_queue.json"
+LOCK_FILE = DATA_DIR / "publish_queue.lock"
+
+DEFAULT_CONTENT_PREFIX = "src/content/ainews"
+
+# 발행에 필요한 작업 디렉토리 파일 (비워진 경우 산출물 저장소에서 복원)
+PUBLISH_FILES = ["final.md", "youtube.txt", "pipeline_warnings.txt", "media_files.json"]
+
+
+@contextmanager
+def queue_lock():
+    """큐 파일 동시 수정을 막기 위한 배타 잠금"""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def load_queue() -> dict:
+    """큐 파일을 로드합니다."""
+    if not QUEUE_FILE.exists():
+        return {"items": [], "last_flush": None}
+
+    try:
+        with open(QUEUE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        return {"items": [], "last_flush": None}
+
+
+def save_queue(queue: dict):
+    """큐 파일을 저장합니다."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    tmp_file = QUEUE_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(queue, f, indent=2, ensure_ascii=False)
+    tmp_file.replace(QUEUE_FILE)
+
+
+def enqueue(slug: str, work_dir: Path, lang: str = "ko") -> dict:
+    """작업 디렉토리를 큐에 추가합니다 (같은 slug/언어는 교체)."""
+    work_dir = Path(work_dir).resolve()
+    # 보존 정책으로 비워진 작업 디렉토리는 산출물 저장소에서 복원
+    restore(slug, work_dir, PUBLISH_FILES)
+    if not (work_dir / "final.md").is_file():
+        raise PublishError(f"Final markdown file not found: {work_dir / 'final.md'}")
+
+    item = {
+        "slug": slug,
+        "lang": lang,
+        "work_dir": str(work_dir),
+        "enqueued_at": datetime.now().isoformat(),
+    }
+
+    with queue_lock():
+        queue = load_queue()
+        queue["items"] = [
+            i for i in queue["items"]
+            if not (i["slug"] == slug and i.get("lang", "ko") == lang)
+        ]
+        queue["items"].append(item)
+        save_queue(queue)
+
+    return item
+
+
+def _oldest_age_seconds(items: list[dict], now: datetime) -> float:
+    oldest = min(datetime.fromisoformat(i["enqueued_at"]) for i in items)
+    return (now - oldest).total_seconds()
+
+
+def flush_reason(
+    items: list[dict],
+    max_batch: int = 0,
+    window: int = 0,
+    force: bool = False,
+    now: Optional[datetime] = None,
+) -> Optional[str]:
+    """플러시 정책을 평가해 플러시 사유를 반환합니다 (플러시 불필요 시 None)."""
+    if not items:
+        return None
+    if force:
+        return "manual"
+    if max_batch > 0 and len(items) >= max_batch:
+        return f"batch size reached ({len(items)}/{max_batch})"
+    if window > 0:
+        age = _oldest_age_seconds(items, now or datetime.now())
+        if age >= window:
+            return f"time window elapsed ({int(age)}s >= {window}s)"
+    return None
+
+
+def _read_item(item: dict) -> dict:
+    """큐 항목의 final.md와 경고 파일에서 PR 정보를 읽습니다."""
+    work_dir = Path(item["work_dir"])
+    restore(item["slug"], work_dir, PUBLISH_FILES)
+    final_content = (work_dir / "final.md").read_text(encoding="utf-8")
+    frontmatter, _ = parse_frontmatter(final_content)
+
+    title = str(frontmatter.get("title") or f"AI News - {item['slug']}")
+    summary = frontmatter.get("summary") or []
+    if not isinstance(summary, list):
+        summary = [str(summary)]
+
+    warnings_file = work_dir / "pipeline_warnings.txt"
+    warnings = []
+    if warnings_file.exists():
+        warnings = [
+            line.strip()
+            for line in warnings_file.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+
+    return {
+        **item,
+        "title": title,
+        "summary": summary[:3],
+        "warnings": warnings,
+    }
+
+
+def build_changesets(items: list[dict], content_prefix: str) -> list[tuple[dict[str, Path], str]]:
+    """큐 항목마다 하나의 커밋(파일 매핑, 메시지)을 만듭니다."""
+    changesets = []
+    for item in items:
+        work_dir = Path(item["work_dir"])
+        slug = item["slug"]
+        lang = item.get("lang", "ko")
+
+        files = {f"{content_prefix}/{lang}/{slug}.md": work_dir / "final.md"}
+        youtube_file = work_dir / "youtube.txt"
+        if youtube_file.exists():
+            files[f"{content_prefix}/youtube/{slug}.txt"] = youtube_file
+        files.update(load_media_files(work_dir))
+
+        message = (
+            f"feat(ainews): Add AI news - {slug}\n\n"
+            f"{item['title']}\n\n"
+            "Co-Authored-By: Codex CLI (gpt-5.2) <noreply@openai.com>\n"
+            "Reviewed-By: Claude Opus <noreply@anthropic.com>\n"
+        )
+        changesets.append((files, message))
+    return changesets
+
+
+def build_pr_title(items: list[dict]) -> str:
+    """배치 PR 제목을 생성합니다."""
+    if len(items) == 1:
+        return f"feat(ainews): {items[0]['title']}"
+    slugs = sorted(i["slug"] for i in items)
+    return f"feat(ainews): {len(items)}개 AI 뉴스 ({slugs[0]} ~ {slugs[-1]})"
+
+
+def build_pr_body(items: list[dict]) -> str:
+    """이슈별 요약과 파이프라인 경고를 모아 PR 본문을 생성합니다."""
+    model = os.environ.get("CODEX_MODEL", "")
+    effort = os.environ.get("CODEX_REASONING_EFFORT", "")
+
+    lines = [
+        "## Summary",
+        "",
+        f"자동 번역된 AI 뉴스 {len(items)}건입니다.",
+        "",
+    ]
+
+    for item in items:
+        lang_suffix = f" [{item['lang']}]" if item.get("lang", "ko") != "ko" else ""
+        lines.append(f"### {item['title']}{lang_suffix}")
+        lines.append("")
+        for s in item["summary"]:
+            lines.append(f"- {s}")
+        lines.append(
+            f"- **Source**: [Original Article](https://github.com/smol-ai/ainews-web-2025/blob/main/src/content/issues/{item['slug']}.md)"
+        )
+        lines.append("")
+
+    warned = [i for i in items if i["warnings"]]
+    if warned:
+        lines.append("## ⚠️ Pipeline Warnings")
+        lines.append("")
+        lines.append("파이프라인 실행 중 다음 문제가 발생했습니다:")
+        lines.append("")
+        for item in warned:
+            lines.append(f"**{item['slug']}**")
+            for w in item["warnings"]:
+                lines.append(f"- {w}")
+            lines.append("")
+        lines.append("**수동 검토 권장**")
+        lines.append("")
+
+    lines.extend([
+        "## Pipeline Info",
+        "",
+        f"- **Translation**: Codex CLI ({model}, reasoning: {effort})",
+        "- **Review**: Claude Opus",
+        f"- **Batch**: {', '.join(i['slug'] for i in items)}",
+        "",
+        "## Checklist",
+        "",
+        "- [ ] All source links preserved",
+        "- [ ] Translation quality acceptable",
+        "- [ ] Frontmatter correct",
+        "- [ ] No broken markdown",
+        "",
+        "---",
+        "",
+        "🤖 Generated with [news-automation](https://github.com/jonhpark/news-automation) pipeline",
+    ])
+    return "\n".join(lines)
+
+
+def create_pull_request(title: str, body: str, branch: str, remote_url: str) -> str:
+    """gh CLI로 PR을 생성하고 PR URL을 반환합니다."""
+    gh_bin = os.environ.get("GH_BIN", "gh")
+    env = dict(os.environ)
+    cwd = None
+
+    gh_repo = github_repo_from_url(remote_url)
+    if gh_repo:
+        env["GH_REPO"] = gh_repo
+    elif os.environ.get("WEB_REPO_PATH") and Path(os.environ["WEB_REPO_PATH"]).is_dir():
+        cwd = os.environ["WEB_REPO_PATH"]
+
+    result = subprocess.run(
+        [gh_bin, "pr", "create",
+         "--title", title,
+         "--body", body,
+         "--base", "main",
+         "--head", branch],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=cwd,
+    )
+    if result.returncode != 0:
+        raise PublishError(f"gh pr create failed: {result.stderr.strip() or result.stdout.strip()}")
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+
+
+def flush(
+    max_batch: int = 0,
+    window: int = 0,
+    force: bool = False,
+    mirror: Path = DEFAULT_MIRROR,
+) -> Optional[dict]:
+    """플러시 정책을 만족하면 큐 항목을 하나의 PR로 발행합니다.
+
+    Returns:
+        발행 결과 딕셔너리, 플러시하지 않았으면 None
+    """
+    with queue_lock():
+        queue = load_queue()
+        items = queue["items"]
+
+        # 푸시는 됐지만 PR 생성이 실패한 배치가 있으면 정책과 무관하게 같은 항목/브랜치로 재시도
+        pending = queue.get("pending")
+        pending_keys = {tuple(k) for k in pending["keys"]} if pending else set()
+        batch = [i for i in items if (i["slug"], i.get("lang", "ko")) in pending_keys]
+        if batch:
+            reason = f"retry pending PR ({pending['branch']})"
+        else:
+            pending = None
+            reason = flush_reason(items, max_batch, window, force)
+            if reason is None:
+                return None
+            batch = items[:max_batch] if max_batch > 0 else list(items)
+
+        remote_url = resolve_remote_url()
+        if not remote_url:
+            raise PublishError("Cannot resolve web remote URL (set WEB_REMOTE_URL or WEB_REPO_PATH)")
+
+        content_prefix = DEFAULT_CONTENT_PREFIX
+        web_repo = os.environ.get("WEB_REPO_PATH", "")
+        content_path = os.environ.get("AINEWS_CONTENT_PATH", "")
+        if web_repo and content_path.startswith(web_repo.rstrip("/") + "/"):
+            content_prefix = content_path[len(web_repo.rstrip("/")) + 1:]
+
+        details = [_read_item(i) for i in batch]
+
+        if pending:
+            branch = pending["branch"]
+        elif len(details) == 1:
+            branch = f"ainews/{datetime.now().strftime('%Y%m%d')}-{details[0]['slug']}"
+        else:
+            branch = f"ainews/batch-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+
+        published = publish_changesets(
+            remote_url,
+            branch,
+            build_changesets(details, content_prefix),
+            mirror=mirror,
+        )
+
+        # PR 생성 전에 푸시된 브랜치를 기록 (gh 실패 시 다음 플러시가 새 브랜치를 만들지 않도록)
+        queue["pending"] = {
+            "branch": branch,
+            "keys": [[i["slug"], i.get("lang", "ko")] for i in batch],
+            "pushed_at": datetime.now().isoformat(),
+        }
+        save_queue(queue)
+
+        pr_url = create_pull_request(
+            build_pr_title(details),
+            build_pr_body(details),
+            branch,
+            remote_url,
+        )
+
+        # 발행된 항목 제거
+        flushed = {(i["slug"], i.get("lang", "ko")) for i in batch}
+        queue["items"] = [
+            i for i in items if (i["slug"], i.get("lang", "ko")) not in flushed
+        ]
+        queue.pop("pending", None)
+        queue["last_flush"] = datetime.now().isoformat()
+        save_queue(queue)
+
+    for slug in sorted({i["slug"] for i in batch}):
+        update_status(slug, ProcessStatus.SUCCESS, pr_url=pr_url)
+
+    return {
+        "reason": reason,
+        "branch": branch,
+        "commit": published["commit"],
+        "pr_url": pr_url,
+        "slugs": [i["slug"] for i in batch],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="완료된 이슈를 큐에 쌓아 하나의 PR로 묶어 발행합니다."
+    )
+    add_profile_argument(parser)
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # enqueue 명령
+    enqueue_parser = subparsers.add_parser("enqueue", help="작업 디렉토리를 큐에 추가")
+    enqueue_parser.add_argument("slug", help="이슈 slug")
+    enqueue_parser.add_argument("work_dir", type=Path, help="final.md가 있는 작업 디렉토리")
+    enqueue_parser.add_argument("--lang", default="ko", help="언어 코드 (default: ko)")
+
+    # flush 명령
+    flush_parser = subparsers.add_parser("flush", help="정책을 만족하면 큐를 PR로 발행")
+    flush_parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=int(os.environ.get("PUBLISH_QUEUE_MAX_BATCH", "0") or 0),
+        help="이 개수 이상 쌓이면 플러시, 한 PR의 최대 항목 수 (0: 제한 없음)"
+    )
+    flush_parser.add_argument(
+        "--window",
+        type=int,
+        default=int(os.environ.get("PUBLISH_QUEUE_WINDOW", "0") or 0),
+        help="가장 오래된 항목이 이 시간(초) 이상 대기하면 플러시 (0: 사용 안 함)"
+    )
+    flush_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="정책과 무관하게 즉시 플러시"
+    )
+    flush_parser.add_argument(
+        "--mirror",
+        type=Path,
+        default=Path(os.environ.get("WEB_MIRROR_PATH") or DEFAULT_MIRROR),
+        help="bare 미러 경로"
+    )
+    flush_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="JSON 형식으로 출력"
+    )
+
+    # list 명령
+    subparsers.add_parser("list", help="대기 중인 항목 조회")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "enqueue":
+            item = enqueue(args.slug, args.work_dir, args.lang)
+            print(f"Enqueued '{item['slug']}' ({item['lang']})")
+
+        elif args.command == "flush":
+            result = flush(args.max_batch, args.window, args.force, args.mirror)
+            if args.json:
+                print(json.dumps(result, indent=2, ensure_ascii=False))
+            elif result is None:
+                print("Nothing to flush.")
+            else:
+                print(f"Flushed {len(result['slugs'])} item(s): {result['reason']}")
+                print(f"Branch: {result['branch']}")
+                print(result["pr_url"])
+
+        elif args.command == "list":
+            queue = load_queue()
+            if not queue["items"]:
+                print("Queue is empty.")
+            for item in queue["items"]:
+                print(f"- {item['slug']} [{item.get('lang', 'ko')}] (enqueued: {item['enqueued_at']})")
+            if queue.get("pending"):
+                print(f"Pending PR for pushed branch: {queue['pending']['branch']}")
+
+        else:
+            parser.print_help()
+
+    except PublishError as e:
+        print(f"Publish Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    from lib.profiling import run_main
+    run_main("publish_queue", main)
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+chunked_review.py - 섹션 단위 병렬 LLM 검토 (REVIEW_MODE=chunked)
+원문 전체와 번역본 전체를 한 프롬프트로 보내는 대신, 번역본을 제목(#~###) 단위 섹션으로 나누고
+링크 URL로 원문 구간을 대응시킨 뒤 로컬 기계 검증(local_review)을 섹션마다 실행합니다.
+Claude에는 의심 섹션과 일부 표본 섹션만 몇 개의 묶음으로 나눠 동시에 보내고, 묶음별 판정을
+main.sh가 기대하는 PASS / FAIL: 형식으로 합칩니다.
+
+- 전체 문서 기준 링크/메타데이터/frontmatter 검증이 실패하면 Claude를 호출하지 않고 FAIL
+- 의심 섹션: 섹션 단위 링크/메타데이터 위치 불일치, 용어집 금지 표기, 길이 비율 이상, 미번역 의심
+- 표본 섹션: 첫 섹션(헤드라인, frontmatter 포함) + 나머지 중 REVIEW_SAMPLE_RATE 비율
+  (섹션 내용 해시 순으로 골라 같은 번역본이면 항상 같은 섹션)
+
+환경 변수:
+    REVIEW_SAMPLE_RATE: 의심 없는 섹션 중 표본 검토 비율 (기본 0.2, 0이면 의심 섹션만)
+    REVIEW_MAX_PARALLEL: 동시에 실행할 Claude 호출 수 (기본 4)
+    REVIEW_BATCH_BYTES: 한 번의 Claude 호출에 묶어 보낼 섹션 (원문 + 번역) 바이트 상한 (기본 32768)
+
+종료 코드: 0 PASS, 1 FAIL, 2 Claude 호출 실패
+
+사용법:
+    chunked_review.py --original original.md --translated translated.md --prompt prompts/review-section.txt
+    chunked_review.py --original original.md --translated translated.md --plan [--json]
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import hashlib
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from collections import Counter
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.profiling import add_profile_argument  # noqa: E402
+from lib import llm_ledger, resilience  # noqa: E402
+from review.glossary import VARIANT  # noqa: E402
+from review.local_review import (  # noqa: E402
+    LINK_RE,
+    FRONTMATTER_RE,
+    Issue,
+    content_issues,
+    frontmatter_issues,
+    format_result,
+)
+
+SECTION_HEADING_RE = re.compile(r"^#{1,3}\s")
+FENCE_RE = re.compile(r"^```")
+LETTER_RE = re.compile(r"[^\W\d_]")
+
+SAMPLE_RATE = float(os.environ.get("REVIEW_SAMPLE_RATE", 0.2))
+MAX_PARALLEL = int(os.environ.get("REVIEW_MAX_PARALLEL", 4))
+BATCH_BYTES = int(os.environ.get("REVIEW_BATCH_BYTES", 32768))
+
+# 길이 비율/미번역 검사는 원문 구간이 이 글자 수 이상일 때만 (짧은 구간은 비율이 크게 흔들림)
+MIN_CHECK_CHARS = 200
+# 번역본/원문 글자 수 비율 (링크 URL 제외) 허용 범위
+MIN_LENGTH_RATIO = 0.25
+MAX_LENGTH_RATIO = 2.0
+# 번역본 글자 중 비ASCII 문자 비율이 이 값 미만이면 미번역 의심
+MIN_TRANSLATED_LETTER_RATIO = 0.1
+
+
+@dataclass
+class Chunk:
+    """번역본 섹션 하나와 대응하는 원문 구간"""
+    number: int
+    title: str
+    original: str
+    translated: str
+    flags: list[str] = field(default_factory=list)
+    sampled: bool = False
+
+    @property
+    def selected(self) -> bool:
+        return bool(self.flags) or self.sampled
+
+
+@dataclass
+class ReviewPlan:
+    frontmatter: str
+    chunks: list[Chunk]
+    issue: Issue
+
+    @property
+    def selected(self) -> list[Chunk]:
+        return [c for c in self.chunks if c.selected]
+
+
+def _split_frontmatter(text: str) -> tuple[str, str]:
+    match = FRONTMATTER_RE.match(text)
+    if not match:
+        return "", text
+    return text[: match.end()], text[match.end() :]
+
+
+def split_sections(body: str) -> list[str]:
+    """제목(#~###) 줄마다 섹션을 나눕니다 (코드펜스 안은 무시, 비어있는 머리말은 제외)."""
+    sections: list[list[str]] = [[]]
+    in_fence = False
+    for line in body.split("\n"):
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+        elif not in_fence and SECTION_HEADING_RE.match(line) and any(l.strip() for l in sections[-1]):
+            sections.append([])
+        sections[-1].append(line)
+    return ["\n".join(lines).strip("\n") for lines in sections if any(l.strip() for l in lines)]
+
+
+def align(original_sections: list[str], translated_sections: list[str]) -> list[int]:
+    """원문 섹션마다 대응하는 번역본 섹션 번호를 구합니다.
+
+    원문 섹션 링크 URL이 가장 많이 들어 있는 번역본 섹션에 대응시킵니다 (URL은 번역 규칙상 그대로).
+    링크가 없는 섹션은 앞 섹션 다음 위치로 보되, 다음 링크 섹션의 위치를 넘지 않게 합니다.
+    순서가 뒤집히지 않도록 앞 섹션보다 앞쪽에는 대응시키지 않습니다.
+    """
+    positions: dict[str, list[int]] = {}
+    for j, section in enumerate(translated_sections):
+        for url in LINK_RE.findall(section):
+            positions.setdefault(url, []).append(j)
+
+    last = max(len(translated_sections) - 1, 0)
+    anchors: list[int | None] = []
+    previous = 0
+    for section in original_sections:
+        votes = Counter(
+            j for url in LINK_RE.findall(section) for j in positions.get(url, []) if j >= previous
+        )
+        anchor = max(votes, key=lambda j: (votes[j], -j)) if votes else None
+        anchors.append(anchor)
+        if anchor is not None:
+            previous = anchor
+
+    # 링크 없는 섹션: 뒤에서부터 다음 링크 섹션 위치를 상한으로 채움
+    upper = last
+    limits = [0] * len(anchors)
+    for i in range(len(anchors) - 1, -1, -1):
+        if anchors[i] is not None:
+            upper = anchors[i]
+        limits[i] = upper
+
+    resolved = []
+    previous = -1
+    for anchor, limit in zip(anchors, limits):
+        if anchor is None:
+            anchor = min(previous + 1, limit)
+        anchor = max(anchor, previous, 0)
+        resolved.append(anchor)
+        previous = anchor
+    return resolved
+
+
+def _prose(text: str) -> str:
+    """링크 URL을 뺀 본문 (길이/문자 비율 계산용)"""
+    return LINK_RE.sub(lambda m: m.group(0)[: m.group(0).rfind("](")], text)
+
+
+def chunk_flags(original: str, translated: str) -> list[str]:
+    """섹션 단위 로컬 검증에서 걸린 항목 (Claude 검토 대상 선정용)"""
+    if not original.strip():
+        return ["대응하는 원문 구간 없음"]
+
+    flags = []
+    issue = content_issues(original, translated)
+    if issue.missing or issue.extra:
+        flags.append("섹션 간 링크 위치 불일치")
+    flags.extend(issue.other)
+    # 용어집은 금지 표기만 (보호 용어/지정 번역어 검사는 섹션 단위로 돌리면 거의 모든 섹션이 걸려 선정 의미가 없음)
+    flags.extend(v.message for v in issue.terms if v.kind == VARIANT)
+
+    original_prose = _prose(original)
+    translated_prose = _prose(translated)
+    if len(original_prose) >= MIN_CHECK_CHARS:
+        ratio = len(translated_prose) / len(original_prose)
+        if not MIN_LENGTH_RATIO <= ratio <= MAX_LENGTH_RATIO:
+            flags.append(f"원문 대비 길이 비율 이상: {ratio:.2f}")
+
+        letters = LETTER_RE.findall(translated_prose)
+        if letters and sum(1 for ch in letters if ord(ch) >= 128) / len(letters) < MIN_TRANSLATED_LETTER_RATIO:
+            flags.append("미번역 의심 (영문 비율 높음)")
+    return flags
+
+
+def _sample_key(chunk: Chunk) -> str:
+    return hashlib.sha1(chunk.translated.encode("utf-8")).hexdigest()
+
+
+def build_plan(original: str, translated: str, sample_rate: float = SAMPLE_RATE) -> ReviewPlan:
+    """전체 기계 검증, 섹션 대응, 의심/표본 섹션 선정"""
+    frontmatter, translated_body = _split_frontmatter(translated)
+    _, original_body = _split_frontmatter(original)
+
+    issue = content_issues(original_body, translated_body)
+    issue = Issue(
+        missing=issue.missing, extra=issue.extra, other=issue.other + frontmatter_issues(translated), terms=issue.terms
+    )
+
+    original_sections = split_sections(original_body)
+    translated_sections = split_sections(translated_body)
+    anchors = align(original_sections, translated_sections)
+
+    # 번역본 섹션별 (원문 구간, 번역 구간) 묶음. 대응하는 원문이 없는 번역 섹션(번역 중 섹션이 나뉜 경우)은
+    # 앞 묶음에 붙임 (첫 섹션이면 다음 묶음으로)
+    by_anchor: dict[int, list[str]] = {}
+    for section, anchor in zip(original_sections, anchors):
+        by_anchor.setdefault(anchor, []).append(section)
+
+    groups: list[tuple[list[str], list[str]]] = []
+    pending: list[str] = []
+    for j, section in enumerate(translated_sections):
+        matched = by_anchor.get(j)
+        if matched:
+            groups.append((matched, pending + [section]))
+            pending = []
+        elif groups:
+            groups[-1][1].append(section)
+        else:
+            pending.append(section)
+    if pending:
+        groups.append(([], pending))
+
+    chunks = []
+    for number, (originals, sections) in enumerate(groups, 1):
+        matched = "\n\n".join(originals)
+        section = "\n\n".join(sections)
+        chunks.append(Chunk(
+            number=number,
+            title=section.split("\n", 1)[0].strip() if SECTION_HEADING_RE.match(section) else "(머리말)",
+            original=matched,
+            translated=section,
+            flags=chunk_flags(matched, section),
+        ))
+
+    if chunks and sample_rate > 0:
+        chunks[0].sampled = True
+        unflagged = [c for c in chunks[1:] if not c.flags]
+        count = math.ceil(len(unflagged) * min(sample_rate, 1.0))
+        for chunk in sorted(unflagged, key=_sample_key)[:count]:
+            chunk.sampled = True
+
+    return ReviewPlan(frontmatter=frontmatter, chunks=chunks, issue=issue)
+
+
+def render_prompt(template: str, original: str, translated: str) -> str:
+    """review.sh와 같은 방식으로 placeholder를 치환합니다 (없으면 뒤에 붙임)."""
+    if "{original_content}" in template or "{translated_content}" in template:
+        return template.replace("{original_content}", original).replace("{translated_content}", translated)
+    return template + "\n\n### 원문:\n" + original + "\n\n### 번역본:\n" + translated
+
+
+def batch_chunks(chunks: list[Chunk], max_parallel: int = MAX_PARALLEL, max_bytes: int = BATCH_BYTES) -> list[list[Chunk]]:
+    """선정된 섹션을 순서대로 묶어 Claude 호출 수를 줄입니다.
+
+    묶음당 (원문 + 번역) 바이트 상한은 min(max_bytes, 전체 / max_parallel)이라
+    작은 섹션이 많아도 호출당 고정 지연이 쌓이지 않고, 큰 이슈는 max_parallel개 이상으로 나뉩니다.
+    """
+    sizes = [len(c.original.encode("utf-8")) + len(c.translated.encode("utf-8")) for c in chunks]
+    budget = min(max_bytes, math.ceil(sum(sizes) / max(max_parallel, 1)))
+
+    batches: list[list[Chunk]] = []
+    current: list[Chunk] = []
+    current_bytes = 0
+    for chunk, size in zip(chunks, sizes):
+        if current and current_bytes + size > budget:
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append(chunk)
+        current_bytes += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def batch_prompt(plan: ReviewPlan, batch: list[Chunk], template: str) -> str:
+    original = "\n\n".join(c.original for c in batch if c.original)
+    translated = "\n\n".join(c.translated for c in batch)
+    # 첫 섹션에는 title/summary 검토를 위해 frontmatter를 함께 보냄
+    if batch[0].number == 1:
+        translated = plan.frontmatter + translated
+    return render_prompt(template, original, translated)
+
+
+def _label(batch: list[Chunk]) -> str:
+    return ", ".join(str(c.number) for c in batch)
+
+
+@dataclass
+class BatchResult:
+    chunks: list[Chunk]
+    outcome: str
+    output: str
+    prompt_bytes: int
+    latency_ms: float
+
+
+def review_batch(batch: list[Chunk], prompt: str, command: list[str], model: str) -> BatchResult:
+    """섹션 묶음 하나를 Claude로 검토합니다 (재시도/브레이커는 lib/resilience.py)."""
+    with tempfile.TemporaryDirectory(prefix="chunked-review-") as tmp:
+        prompt_path = Path(tmp) / "prompt.txt"
+        output_path = Path(tmp) / "output.txt"
+        prompt_path.write_text(prompt, encoding="utf-8")
+
+        start = time.perf_counter()
+        exit_code = resilience.exec_command("claude", command, prompt_path, output_path)
+        latency_ms = (time.perf_counter() - start) * 1000
+        output = output_path.read_text(encoding="utf-8", errors="replace") if output_path.exists() else ""
+
+    stripped = output.strip()
+    if exit_code != 0:
+        outcome = "error"
+    elif stripped.startswith("PASS"):
+        outcome = "pass"
+    elif stripped.startswith("FAIL"):
+        outcome = "fail"
+    else:
+        outcome = "invalid"
+
+    llm_ledger.record(
+        "review", model, prompt, output, latency_ms, outcome,
+        mode="chunked", sections=_label(batch),
+    )
+    return BatchResult(batch, outcome, stripped, len(prompt.encode("utf-8")), latency_ms)
+
+
+def run_reviews(
+    plan: ReviewPlan,
+    batches: list[list[Chunk]],
+    template: str,
+    command: list[str],
+    model: str,
+    max_parallel: int = MAX_PARALLEL,
+) -> list[BatchResult]:
+    """섹션 묶음을 동시에 검토합니다 (결과는 섹션 순서)."""
+    if not batches:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(batches)))) as pool:
+        return list(pool.map(
+            lambda batch: review_batch(batch, batch_prompt(plan, batch, template), command, model),
+            batches,
+        ))
+
+
+def merge_results(results: list[BatchResult]) -> str:
+    """묶음별 판정을 PASS / FAIL: 형식으로 합칩니다 (묶음 출력의 ## 제목은 한 단계 내림)."""
+    failed = [r for r in results if r.outcome == "fail"]
+    if not failed:
+        return "PASS\n"
+
+    parts = [f"FAIL: 섹션 검토 실패 (섹션 {', '.join(_label(r.chunks) for r in failed)})"]
+    for r in failed:
+        summary, _, details = r.output.partition("\n")
+        parts.append(f"\n## 섹션 {_label(r.chunks)}: {' / '.join(c.title for c in r.chunks)}")
+        parts.append(f"- {summary.removeprefix('FAIL:').strip() or '검토 실패'}")
+        if details.strip():
+            parts.append("\n" + re.sub(r"^(#{2,5}) ", r"#\1 ", details.strip(), flags=re.MULTILINE))
+    return "\n".join(parts).rstrip() + "\n"
+
+
+def plan_stats(plan: ReviewPlan, batches: list[list[Chunk]], template: str) -> dict:
+    return {
+        "sections": len(plan.chunks),
+        "flagged": sum(1 for c in plan.chunks if c.flags),
+        "sampled": sum(1 for c in plan.chunks if c.sampled and not c.flags),
+        "reviewed": len(plan.selected),
+        "calls": len(batches),
+        "prompt_bytes": sum(len(batch_prompt(plan, b, template).encode("utf-8")) for b in batches),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="섹션 단위 병렬 LLM 검토")
+    add_profile_argument(parser)
+    parser.add_argument("--original", type=Path, required=True, help="원문 파일 경로")
+    parser.add_argument("--translated", type=Path, required=True, help="번역본 파일 경로")
+    parser.add_argument(
+        "--prompt",
+        type=Path,
+        default=Path(os.environ.get("REVIEW_SECTION_PROMPT") or PROJECT_ROOT / "prompts" / "review-section.txt"),
+        help="섹션 검토 프롬프트 템플릿",
+    )
+    parser.add_argument("--sample-rate", type=float, default=SAMPLE_RATE, help="의심 없는 섹션 표본 비율")
+    parser.add_argument("--max-parallel", type=int, default=MAX_PARALLEL, help="동시 Claude 호출 수")
+    parser.add_argument("--batch-bytes", type=int, default=BATCH_BYTES, help="호출당 섹션 묶음 바이트 상한")
+    parser.add_argument("--model", default=os.environ.get("CLAUDE_MODEL", "opus"), help="Claude 모델")
+    parser.add_argument("--claude-bin", default=os.environ.get("CLAUDE_BIN", "claude"), help="Claude CLI 경로")
+    parser.add_argument("--stats", type=Path, help="검토 통계를 JSON으로 저장할 파일")
+    parser.add_argument("--plan", action="store_true", help="Claude를 호출하지 않고 섹션 대응/선정 결과만 출력")
+    parser.add_argument("--json", action="store_true", help="--plan 결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    original = args.original.read_text(encoding="utf-8")
+    translated = args.translated.read_text(encoding="utf-8")
+    template = args.prompt.read_text(encoding="utf-8")
+
+    plan = build_plan(original, translated, args.sample_rate)
+    batches = batch_chunks(plan.selected, args.max_parallel, args.batch_bytes)
+    stats = plan_stats(plan, batches, template)
+    stats["full_prompt_bytes"] = len(render_prompt(template, original, translated).encode("utf-8"))
+
+    if args.plan:
+        if args.json:
+            print(json.dumps({
+                "stats": stats,
+                "local_ok": plan.issue.ok,
+                "chunks": [
+                    {
+                        "section": c.number,
+                        "title": c.title,
+                        "original_bytes": len(c.original.encode("utf-8")),
+                        "translated_bytes": len(c.translated.encode("utf-8")),
+                        "flags": c.flags,
+                        "sampled": c.sampled,
+                    }
+                    for c in plan.chunks
+                ],
+            }, indent=2, ensure_ascii=False))
+        else:
+            for c in plan.chunks:
+                mark = "FLAG" if c.flags else ("SAMPLE" if c.sampled else "-")
+                print(f"{c.number:>3} {mark:<6} {c.title[:60]}" + (f"  [{'; '.join(c.flags)}]" if c.flags else ""))
+            print(
+                f"\n{stats['reviewed']}/{stats['sections']} section(s) to review in {stats['calls']} call(s), "
+                f"{stats['prompt_bytes']:,}B of prompts (full review: {stats['full_prompt_bytes']:,}B)"
+            )
+        return 0
+
+    def write_stats(**fields):
+        if args.stats:
+            args.stats.write_text(json.dumps({**stats, **fields}, ensure_ascii=False), encoding="utf-8")
+
+    # 기계 검증 실패는 Claude 판정과 무관하게 FAIL (재번역 피드백은 local_review 형식)
+    if not plan.issue.ok:
+        print("Local pre-filter failed; skipping Claude section review", file=sys.stderr)
+        write_stats(reviewed=0, calls=0, prompt_bytes=0, prefilter="fail")
+        sys.stdout.write(format_result(plan.issue))
+        return 1
+
+    print(
+        f"Reviewing {stats['reviewed']}/{stats['sections']} section(s) "
+        f"({stats['flagged']} flagged, {stats['sampled']} sampled) in {stats['calls']} call(s), "
+        f"{stats['prompt_bytes']:,}B of prompts (full review: {stats['full_prompt_bytes']:,}B)",
+        file=sys.stderr,
+    )
+    start = time.perf_counter()
+    command = [args.claude_bin, "--print", "--model", args.model]
+    results = run_reviews(plan, batches, template, command, args.model, args.max_parallel)
+    write_stats(
+        llm_wall_ms=round((time.perf_counter() - start) * 1000, 1),
+        failed_sections=sum(len(r.chunks) for r in results if r.outcome == "fail"),
+    )
+
+    errors = [r for r in results if r.outcome in ("error", "invalid")]
+    if errors:
+        for r in errors:
+            print(f"Claude section review failed: 섹션 {_label(r.chunks)} ({r.outcome})", file=sys.stderr)
+            if r.output:
+                print(r.output, file=sys.stderr)
+        return 2
+
+    result = merge_results(results)
+    sys.stdout.write(result)
+    return 0 if result.startswith("PASS") else 1
+
+
+if __name__ == "__main__":
+    from lib.profiling import run_main
+    raise SystemExit(run_main("chunked_review", main))
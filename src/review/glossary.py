@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+glossary.py - 용어집 기반 용어 일관성 검증
+
+공통 용어집(GLOSSARY_FILE)과 번역 언어별 용어집(같은 폴더의 glossary.<CONTENT_LANG>.tsv)을 합쳐
+모든 표기를 접두사 트리 모양의 정규식 하나로 묶고, 원문과 번역본을 각각 한 번씩 훑습니다
+(훑기는 re 모듈의 C 구현이 하므로 용어가 늘어도 글자마다 파이썬 코드를 돌지 않음).
+
+용어집 형식 (# 주석, 빈 줄 무시):
+    OpenAI                          보호 용어: 원문에 있으면 번역본에도 그대로 있어야 함 (대소문자 구분)
+    fine-tuning<TAB>미세조정         지정 번역어: 원문에 있으면 번역본에 번역어가 있어야 함 (원문 용어는 대소문자 무시)
+    fine-tuning<TAB>미세조정<TAB>파인튜닝,파인 튜닝
+                                    세 번째 열: 원문에 용어가 있을 때 번역본에 쓰면 안 되는 표기
+
+보호 용어는 언어와 무관하므로 공통 용어집에, 지정 번역어/금지 표기는 언어별 용어집에 둡니다
+(같은 용어가 두 파일에 있으면 언어별 용어집의 줄을 씀). 언어별 용어집이 없는 언어는 보호 용어만 검사합니다.
+
+판정:
+- 보호 용어 누락, 금지 표기 사용: 위반 (local_review FAIL)
+- 지정 번역어 미사용: 경고 (문맥에 맞게 풀어 쓴 번역일 수 있어 FAIL로 보지 않음)
+
+영문자/숫자로 시작하거나 끝나는 용어는 단어 경계에서만 맞춥니다 ("GPT-5"는 "GPT-5.2"에 맞지만 "Meta"는 "Metadata"에 맞지 않음).
+한 위치에서는 가장 긴 표기를 맞추고, 그 표기 안에 온전히 들어 있는 다른 용어("Claude Code" 안의 "Claude")도 함께 셉니다.
+링크 URL은 검사하지 않습니다 (URL 보존은 local_review가 따로 검증).
+
+컴파일한 용어집은 용어집 내용 해시별로 GLOSSARY_CACHE_DIR에 저장해 두고, 프로세스 안에서는 한 번만 읽습니다.
+
+사용법:
+    glossary.py check --original original.md --translated translated.md [--lang ja] [--json]
+    glossary.py info [--glossary FILE] [--lang ja]
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import json
+import pickle
+import hashlib
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+GLOSSARY_FILE = Path(os.environ.get("GLOSSARY_FILE") or PROJECT_ROOT / "config" / "glossary.tsv")
+CACHE_DIR = Path(os.environ.get("GLOSSARY_CACHE_DIR") or PROJECT_ROOT / "data" / "glossary")
+CONTENT_LANG = os.environ.get("CONTENT_LANG", "ko")
+ENABLED = os.environ.get("GLOSSARY_ENABLED", "true") == "true"
+
+# 보고할 위반/경고 최대 개수 (재번역 피드백이 지나치게 길어지지 않도록)
+MAX_REPORTED = 20
+
+# 캐시 저장 형식이 바뀌면 올려서 예전 캐시를 무시
+CACHE_VERSION = 2
+
+URL_RE = re.compile(r"\]\([^)]*\)|https?://\S+")
+
+# 패턴 종류
+PROTECTED = "protected"
+SOURCE = "source"
+RENDERING = "rendering"
+VARIANT = "variant"
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _fold(text: str) -> str:
+    """길이를 바꾸지 않는 소문자 변환 (일치 위치를 원문 위치로 그대로 씀)
+
+    str.lower()가 길이를 바꾸는 글자("İ" 등)가 있을 때만 글자 단위로 변환합니다.
+    """
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+
+def _trie(patterns: list[str]) -> dict:
+    """접두사 트리 (글자 → 하위 노드, "" → 여기서 끝나는 패턴 번호)"""
+    root: dict = {}
+    for pid, pattern in enumerate(patterns):
+        node = root
+        for ch in pattern:
+            node = node.setdefault(ch, {})
+        node[""] = pid
+    return root
+
+
+def _trie_source(root: dict, patterns: list[str]) -> str:
+    """접두사 트리를 정규식으로 옮깁니다.
+
+    긴 표기를 먼저 시도하고 단어 경계 조건을 정규식 안에 넣어, 긴 표기가 경계에서 걸리면
+    같은 위치의 짧은 표기로 되돌아갑니다. 최상위 선택지는 첫 글자 리터럴로 시작해야 re가 첫 글자
+    집합으로 건너뛰므로, 시작 경계는 첫 글자 뒤에서 두 글자 뒤돌아보기로 확인합니다.
+    """
+
+    def emit(node: dict) -> str:
+        alts = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if "" in node:
+            alts.append("(?![a-z0-9])" if _is_word_char(patterns[node[""]][-1]) else "")
+        return alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+
+    alts = [
+        re.escape(ch) + ("(?<![a-z0-9].)" if _is_word_char(ch) else "") + emit(child)
+        for ch, child in sorted(root.items())
+    ]
+    return "|".join(alts) or "(?!)"
+
+
+def _contained(root: dict, patterns: list[str]) -> list[tuple[tuple[int, int], ...]]:
+    """패턴별로 그 안에 온전히 들어 있는 다른 패턴 (시작 오프셋, 패턴 번호)
+
+    단어 경계는 바깥 패턴 안의 글자로 판단합니다 (바깥 패턴의 시작/끝에 붙으면 바깥 패턴의 경계와 같음).
+    """
+    contained = []
+    for pid, pattern in enumerate(patterns):
+        inner = []
+        for offset in range(len(pattern)):
+            if offset and _is_word_char(pattern[offset]) and _is_word_char(pattern[offset - 1]):
+                continue
+            node = root
+            for end in range(offset, len(pattern)):
+                node = node.get(pattern[end])
+                if node is None:
+                    break
+                qid = node.get("")
+                if qid is None or qid == pid:
+                    continue
+                if end + 1 < len(pattern) and _is_word_char(pattern[end]) and _is_word_char(pattern[end + 1]):
+                    continue
+                inner.append((offset, qid))
+        contained.append(tuple(inner))
+    return contained
+
+
+@dataclass
+class Term:
+    """용어집 한 줄"""
+    term: str
+    rendering: str = ""
+    variants: tuple[str, ...] = ()
+
+    @property
+    def protected(self) -> bool:
+        return not self.rendering
+
+
+@dataclass(frozen=True)
+class Violation:
+    """용어집 검사 결과 한 건"""
+    kind: str
+    message: str
+
+    @property
+    def warning(self) -> bool:
+        """판정에 영향을 주지 않는 경고 (지정 번역어 미사용)"""
+        return self.kind == RENDERING
+
+
+@dataclass
+class Glossary:
+    terms: list[Term]
+    # 소문자로 바꾼 표기 (패턴 번호 순)
+    patterns: list[str]
+    # 패턴 번호 → [(종류, 용어 번호, 대소문자 구분 여부, 원래 표기)]
+    meanings: list[list[tuple[str, int, bool, str]]]
+    # 패턴 번호 → 그 안에 들어 있는 (시작 오프셋, 패턴 번호)
+    contained: list[tuple[tuple[int, int], ...]]
+    source: str
+
+    def __post_init__(self):
+        # 링크 URL을 먼저 맞춰 건너뜀 (따로 지우는 패스 없이 한 번 훑기로)
+        self.regex = re.compile(URL_RE.pattern + "|" + self.source)
+        self.pattern_ids = {pattern: pid for pid, pattern in enumerate(self.patterns)}
+
+    def count(self, text: str, kinds: tuple[str, ...]) -> dict[tuple[str, int, str], int]:
+        """텍스트에서 종류별 용어 출현 수 {(종류, 용어 번호, 표기): 횟수}"""
+        patterns, meanings, contained = self.patterns, self.meanings, self.contained
+        counts: dict[tuple[str, int, str], int] = {}
+        for match in self.regex.finditer(_fold(text)):
+            pid = self.pattern_ids.get(match.group())
+            if pid is None:
+                continue
+            start = match.start()
+            for pos, qid in ((start, pid), *((start + offset, qid) for offset, qid in contained[pid])):
+                for kind, index, case_sensitive, surface in meanings[qid]:
+                    if kind not in kinds:
+                        continue
+                    if case_sensitive and text[pos:pos + len(patterns[qid])] != surface:
+                        continue
+                    key = (kind, index, surface)
+                    counts[key] = counts.get(key, 0) + 1
+        return counts
+
+
+def parse_glossary(text: str) -> list[Term]:
+    """용어집 파일 내용을 파싱합니다 (같은 용어가 여러 번 나오면 마지막 줄 사용)."""
+    terms: dict[str, Term] = {}
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        cols = [col.strip() for col in line.split("\t")]
+        term = cols[0]
+        rendering = cols[1] if len(cols) > 1 else ""
+        variants = tuple(v.strip() for v in cols[2].split(",") if v.strip()) if len(cols) > 2 else ()
+        if term:
+            terms[term] = Term(term, rendering, variants)
+    return list(terms.values())
+
+
+def compile_glossary(terms: list[Term]) -> Glossary:
+    """용어 목록을 정규식 하나로 묶습니다 (모든 종류의 표기를 소문자로 바꿔 한 접두사 트리에)."""
+    patterns: list[str] = []
+    pattern_ids: dict[str, int] = {}
+    meanings: list[list[tuple[str, int, bool, str]]] = []
+
+    def add(surface: str, kind: str, index: int, case_sensitive: bool):
+        folded = _fold(surface)
+        pid = pattern_ids.get(folded)
+        if pid is None:
+            pid = pattern_ids[folded] = len(patterns)
+            patterns.append(folded)
+            meanings.append([])
+        meanings[pid].append((kind, index, case_sensitive, surface))
+
+    for index, term in enumerate(terms):
+        if term.protected:
+            add(term.term, PROTECTED, index, True)
+        else:
+            add(term.term, SOURCE, index, False)
+            add(term.rendering, RENDERING, index, True)
+            for variant in term.variants:
+                add(variant, VARIANT, index, True)
+    root = _trie(patterns)
+    return Glossary(
+        terms=terms,
+        patterns=patterns,
+        meanings=meanings,
+        contained=_contained(root, patterns),
+        source=_trie_source(root, patterns),
+    )
+
+
+def _to_state(glossary: Glossary) -> dict:
+    """캐시 저장용 기본 자료형 (클래스를 피클하지 않아 모듈 경로가 바뀌어도 읽힘)"""
+    return {
+        "terms": [(t.term, t.rendering, t.variants) for t in glossary.terms],
+        "patterns": glossary.patterns,
+        "meanings": glossary.meanings,
+        "contained": glossary.contained,
+        "source": glossary.source,
+    }
+
+
+def _from_state(state: dict) -> Glossary:
+    return Glossary(
+        terms=[Term(*t) for t in state["terms"]],
+        patterns=state["patterns"],
+        meanings=state["meanings"],
+        contained=state["contained"],
+        source=state["source"],
+    )
+
+
+def language_file(path: Path, lang: str) -> Path:
+    """공통 용어집 경로에 대응하는 언어별 용어집 경로 (glossary.tsv → glossary.<lang>.tsv)"""
+    return path.with_name(f"{path.stem}.{lang}{path.suffix}")
+
+
+# 프로세스 안 캐시: (공통 용어집 경로, 언어) → (파일별 (mtime_ns, size), Glossary)
+_LOADED: dict[tuple[Path, str], tuple[tuple, Glossary]] = {}
+
+
+def load_glossary(
+    path: Path = GLOSSARY_FILE, cache_dir: Path | None = CACHE_DIR, lang: str | None = CONTENT_LANG
+) -> Glossary | None:
+    """공통 용어집과 언어별 용어집을 합쳐 읽습니다 (둘 다 없으면 None).
+
+    같은 내용의 컴파일 결과는 cache_dir에 저장해 두고 다음 프로세스가 다시 만들지 않습니다.
+    """
+    files = [path] + ([language_file(path, lang)] if lang else [])
+    stats = []
+    for file in files:
+        try:
+            stat = file.stat()
+        except FileNotFoundError:
+            stats.append(None)
+            continue
+        stats.append((stat.st_mtime_ns, stat.st_size))
+    if not any(stats):
+        return None
+    key = (path, lang or "")
+    loaded = _LOADED.get(key)
+    if loaded and loaded[0] == tuple(stats):
+        return loaded[1]
+
+    raw = b"\n".join(file.read_bytes() for file, stat in zip(files, stats) if stat)
+    digest = hashlib.sha256(raw + f"v{CACHE_VERSION}".encode()).hexdigest()[:16]
+    cache_file = cache_dir / f"{digest}.pickle" if cache_dir else None
+    glossary = None
+    if cache_file and cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                glossary = _from_state(pickle.load(f))
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError, re.error):
+            glossary = None
+    if glossary is None:
+        glossary = compile_glossary(parse_glossary(raw.decode("utf-8")))
+        if cache_file:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_file, "wb") as f:
+                    pickle.dump(_to_state(glossary), f, protocol=pickle.HIGHEST_PROTOCOL)
+                tmp_file.replace(cache_file)
+            except OSError:
+                pass
+
+    _LOADED[key] = (tuple(stats), glossary)
+    return glossary
+
+
+def _truncate(violations: list[Violation]) -> list[Violation]:
+    if len(violations) <= MAX_REPORTED:
+        return violations
+    hidden = len(violations) - MAX_REPORTED
+    return violations[:MAX_REPORTED] + [Violation(violations[-1].kind, f"... 외 {hidden}건")]
+
+
+def check(original: str, translated: str, glossary: Glossary | None = None) -> list[Violation]:
+    """용어집 위반/경고 목록 (위반과 경고 각각 최대 MAX_REPORTED개 + 생략 표시)"""
+    if glossary is None:
+        if not ENABLED:
+            return []
+        glossary = load_glossary()
+        if glossary is None:
+            return []
+
+    in_original = glossary.count(original, (PROTECTED, SOURCE))
+    if not in_original:
+        return []
+    in_translated = glossary.count(translated, (PROTECTED, RENDERING, VARIANT))
+    rendered = {index for kind, index, _ in in_translated if kind == RENDERING}
+
+    violations = []
+    for (kind, index, surface), count in sorted(in_original.items(), key=lambda item: item[0][1]):
+        term = glossary.terms[index]
+        if kind == PROTECTED:
+            if not in_translated.get((PROTECTED, index, surface)):
+                violations.append(Violation(
+                    PROTECTED, f"보호 용어 누락: \"{term.term}\" (원문 {count}회, 번역본에 원문 표기 그대로 없음)"
+                ))
+            continue
+        if index not in rendered:
+            violations.append(Violation(RENDERING, f"지정 번역어 미사용: \"{term.term}\" → \"{term.rendering}\""))
+        for variant in term.variants:
+            used = in_translated.get((VARIANT, index, variant))
+            if used:
+                violations.append(Violation(
+                    VARIANT, f"금지 표기 사용: \"{variant}\" {used}회 (\"{term.term}\" → \"{term.rendering}\")"
+                ))
+
+    errors = [v for v in violations if not v.warning]
+    warnings = [v for v in violations if v.warning]
+    return _truncate(errors) + _truncate(warnings)
+
+
+def main():
+    from lib.profiling import add_profile_argument
+
+    parser = argparse.ArgumentParser(description="용어집 기반 용어 일관성 검증")
+    add_profile_argument(parser)
+    parser.add_argument("--glossary", type=Path, default=GLOSSARY_FILE, help=f"공통 용어집 파일 (기본: {GLOSSARY_FILE})")
+    parser.add_argument("--lang", default=CONTENT_LANG, help=f"번역 언어, glossary.<lang>.tsv를 함께 읽음 (기본: {CONTENT_LANG})")
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # check 명령
+    check_parser = subparsers.add_parser("check", help="원문/번역본 용어 검증 (위반 시 exit 1, 경고만 있으면 0)")
+    check_parser.add_argument("--original", type=Path, required=True, help="원문 파일 경로")
+    check_parser.add_argument("--translated", type=Path, required=True, help="번역본 파일 경로")
+    check_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    # info 명령
+    subparsers.add_parser("info", help="용어집 용어/패턴 수")
+
+    args = parser.parse_args()
+
+    glossary = load_glossary(args.glossary, lang=args.lang)
+    if args.command and glossary is None:
+        print(f"Glossary not found: {args.glossary}", file=sys.stderr)
+        return 1
+
+    if args.command == "check":
+        violations = check(
+            args.original.read_text(encoding="utf-8"),
+            args.translated.read_text(encoding="utf-8"),
+            glossary,
+        )
+        if args.json:
+            print(json.dumps(
+                [{"kind": v.kind, "warning": v.warning, "message": v.message} for v in violations],
+                indent=2, ensure_ascii=False,
+            ))
+        else:
+            for violation in violations:
+                print(f"- {'(경고) ' if violation.warning else ''}{violation.message}")
+        return 1 if any(not v.warning for v in violations) else 0
+
+    elif args.command == "info":
+        protected = sum(1 for term in glossary.terms if term.protected)
+        lang_file = language_file(args.glossary, args.lang)
+        print(f"Glossary: {args.glossary}" + (f" + {lang_file}" if lang_file.exists() else ""))
+        print(f"Terms: {len(glossary.terms)} ({protected} protected, {len(glossary.terms) - protected} renderings)")
+        print(f"Patterns: {len(glossary.patterns)}, regex: {len(glossary.source):,} chars")
+
+    else:
+        parser.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    from lib.profiling import run_main
+    raise SystemExit(run_main("glossary", main))
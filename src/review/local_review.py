@@ -6,9 +6,10 @@ Claude/LLM 없이도 다음 항목을 기계적으로 검증합니다:
 - 마크다운 링크(URL) 완전 보존 (가장 중요)
 - @username / #hashtag / activity count 보존
 - frontmatter 스키마(요약 5줄, 날짜 형식 등)
+- 용어집의 보호 용어/금지 표기 (glossary.py, 지정 번역어 미사용은 경고만)
 
 출력:
-- PASS
+- PASS (용어집 경고가 있으면 그 아래에 목록)
 - FAIL: ... (review-links.txt 형식과 유사)
 """
 
@@ -18,7 +19,8 @@ import argparse
 import re
 import sys
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 
 
 LINK_RE = re.compile(r"\[[^\]]*?\]\(([^)]+)\)")
@@ -37,10 +39,20 @@ class Issue:
     missing: dict[str, int]
     extra: dict[str, int]
     other: list[str]
+    # 용어집 검사 결과 (glossary.Violation, 경고 포함)
+    terms: list = field(default_factory=list)
+
+    @property
+    def term_errors(self) -> list[str]:
+        return [v.message for v in self.terms if not v.warning]
+
+    @property
+    def term_warnings(self) -> list[str]:
+        return [v.message for v in self.terms if v.warning]
 
     @property
     def ok(self) -> bool:
-        return not self.missing and not self.extra and not self.other
+        return not self.missing and not self.extra and not self.other and not self.term_errors
 
 
 def _parse_frontmatter(text: str) -> tuple[dict, str]:
@@ -114,7 +126,11 @@ def _fmt_url_list(url_counts: dict[str, int]) -> list[str]:
     return lines
 
 
-def review(original: str, translated: str) -> Issue:
+def content_issues(original: str, translated: str) -> Issue:
+    """본문 비교 검증 (링크, @username/#hashtag, activity count, 용어집)
+
+    frontmatter를 보지 않으므로 섹션 단위 비교에도 쓸 수 있습니다 (chunked_review.py).
+    """
     missing: dict[str, int] = {}
     extra: dict[str, int] = {}
     other: list[str] = []
@@ -146,11 +162,22 @@ def review(original: str, translated: str) -> Issue:
     if missing_activity:
         other.append(f"누락된 activity count: {', '.join(missing_activity)}")
 
-    # 4) Frontmatter 검증
+    # 4) 용어집 (보호 용어, 금지 표기, 지정 번역어는 경고)
+    from review.glossary import check as glossary_check
+
+    terms = glossary_check(original, translated)
+
+    return Issue(missing=missing, extra=extra, other=other, terms=terms)
+
+
+def frontmatter_issues(translated: str) -> list[str]:
+    """번역본 frontmatter 스키마 검증"""
+    other: list[str] = []
+
     fm, _ = _parse_frontmatter(translated)
     if not fm:
         other.append("Frontmatter(--- ... ---)를 찾을 수 없습니다.")
-        return Issue(missing=missing, extra=extra, other=other)
+        return other
 
     title = str(fm.get("title", "")).strip()
     if not title or "번역된" in title or "가장 흥미로운" in title:
@@ -180,12 +207,28 @@ def review(original: str, translated: str) -> Issue:
     if not headline:
         other.append("headline 필드가 비어있습니다.")
 
-    return Issue(missing=missing, extra=extra, other=other)
+    return other
+
+
+def review(original: str, translated: str) -> Issue:
+    issue = content_issues(original, translated)
+    return Issue(
+        missing=issue.missing,
+        extra=issue.extra,
+        other=issue.other + frontmatter_issues(translated),
+        terms=issue.terms,
+    )
+
+
+def _format_term_warnings(issue: Issue) -> list[str]:
+    if not issue.term_warnings:
+        return []
+    return ["\n## 용어집 경고 (판정에는 영향 없음)"] + [f"- {item}" for item in issue.term_warnings]
 
 
 def format_result(issue: Issue) -> str:
     if issue.ok:
-        return "PASS\n"
+        return "\n".join(["PASS"] + _format_term_warnings(issue)) + "\n"
 
     parts: list[str] = []
     reasons: list[str] = []
@@ -193,6 +236,8 @@ def format_result(issue: Issue) -> str:
         reasons.append("누락된 링크 존재")
     if issue.extra:
         reasons.append("추가된 링크 존재")
+    if issue.term_errors:
+        reasons.append("용어집 위반")
     if issue.other:
         reasons.append("기타 검증 실패")
 
@@ -208,6 +253,11 @@ def format_result(issue: Issue) -> str:
         for i, line in enumerate(_fmt_url_list(issue.extra), 1):
             parts.append(f"{i}. 번역본에만 존재: {line}")
 
+    if issue.term_errors:
+        parts.append("\n## 용어집 위반")
+        for item in issue.term_errors:
+            parts.append(f"- {item}")
+
     if issue.other:
         parts.append("\n## 기타 문제")
         for item in issue.other:
@@ -218,14 +268,20 @@ def format_result(issue: Issue) -> str:
         parts.append("- 누락된 URL을 번역본에 동일하게 추가하세요.")
     if issue.extra:
         parts.append("- 원문에 없는 링크를 번역본에서 제거하세요.")
+    if issue.term_errors:
+        parts.append("- 보호 용어는 원문 표기 그대로 두고, 금지 표기 대신 용어집의 지정 번역어를 쓰세요.")
     if issue.other:
         parts.append("- Frontmatter/메타데이터 규칙을 프롬프트대로 맞추세요.")
+    parts.extend(_format_term_warnings(issue))
 
     return "\n".join(parts).rstrip() + "\n"
 
 
 def main() -> int:
+    from lib.profiling import add_profile_argument
+
     parser = argparse.ArgumentParser(description="오프라인 번역 검토기")
+    add_profile_argument(parser)
     parser.add_argument("--original", required=True, help="원문 파일 경로")
     parser.add_argument("--translated", required=True, help="번역본 파일 경로")
     args = parser.parse_args()
@@ -239,5 +295,7 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from lib.profiling import run_main
+    raise SystemExit(run_main("local_review", main))
 
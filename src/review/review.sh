@@ -10,13 +10,23 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$SCRIPT_DIR/../lib/config.sh"
 source "$SCRIPT_DIR/../lib/logging.sh"
+source "$SCRIPT_DIR/../lib/metrics.sh"
+source "$SCRIPT_DIR/../lib/tracing.sh"
+
+trace_script_begin review.sh
+trap 'trace_script_end $?' EXIT
 
 # REVIEW_MODE:
 # - local (default): 오프라인 정적 검증
 # - claude: Claude CLI로 LLM 검토
 # - auto: Claude 시도 후 실패 시 local로 폴백
+# - chunked: 섹션별 local 검증 후 의심/표본 섹션만 Claude로 병렬 검토 (chunked_review.py)
 REVIEW_MODE="${REVIEW_MODE:-local}"
 
+# CONTENT_LANG: 번역본 언어 (기본: ko, 그 외는 prompts/<lang>/review-links.txt 사용)
+review_prompt=$(lang_prompt_file "${CONTENT_LANG:-ko}" "$REVIEW_LINKS_PROMPT")
+section_prompt=$(lang_prompt_file "${CONTENT_LANG:-ko}" "$REVIEW_SECTION_PROMPT")
+
 # 인자 확인
 if [[ $# -lt 2 ]]; then
     echo "Usage: $0 <original_file> <translated_file>" >&2
@@ -46,8 +56,8 @@ run_local_review() {
 
 run_claude_review() {
     # 프롬프트 파일 확인
-    if [[ ! -f "$REVIEW_LINKS_PROMPT" ]]; then
-        log_error "Review prompt not found: $REVIEW_LINKS_PROMPT"
+    if [[ ! -f "$review_prompt" ]]; then
+        log_error "Review prompt not found: $review_prompt"
         exit 1
     fi
 
@@ -62,10 +72,11 @@ run_claude_review() {
 
     # 임시 파일에 결합된 프롬프트 저장 (argv 길이 제한 회피)
     temp_prompt=$(mktemp)
-    trap 'rm -f "$temp_prompt"' EXIT
+    temp_result=$(mktemp)
+    trap 'exit_code=$?; rm -f "$temp_prompt" "$temp_result"; trace_script_end $exit_code' EXIT
 
     # 프롬프트 템플릿의 placeholder({original_content}, {translated_content})를 치환해 최종 프롬프트 생성
-    python3 - "$REVIEW_LINKS_PROMPT" "$original_file" "$translated_file" > "$temp_prompt" <<'PY'
+    python3 - "$review_prompt" "$original_file" "$translated_file" > "$temp_prompt" <<'PY'
 import sys
 
 prompt_path, original_path, translated_path = sys.argv[1:4]
@@ -91,12 +102,104 @@ else:
 sys.stdout.write(prompt)
 PY
 
-    # Claude 실행 (stdin으로 프롬프트 전달)
-    result=$("$CLAUDE_BIN" --print --model "$CLAUDE_MODEL" < "$temp_prompt" 2>&1) || {
-        log_error "Claude review failed"
+    # Claude 실행 (stdin으로 프롬프트 전달, 일시적 실패는 재시도 - lib/resilience.py)
+    # CLAUDE_TIMEOUT을 넘기거나 실패 신호가 보이면 감시 실행이 조기 종료 (lib/watchdog.py)
+    local prompt_bytes claude_start_ms claude_exit_code=0 watchdog_reason
+    prompt_bytes=$(metrics_file_bytes "$temp_prompt")
+    metrics_stage_start review.claude
+    claude_start_ms=$(metrics_now_ms)
+    newsauto resilience exec claude --stdin "$temp_prompt" --output "$temp_result" \
+        --reason-file "$temp_result.reason" -- \
+        "$CLAUDE_BIN" --print --model "$CLAUDE_MODEL" || claude_exit_code=$?
+    result=$(cat "$temp_result")
+    watchdog_reason=$(head -1 "$temp_result.reason" 2>/dev/null)
+    rm -f "$temp_result.reason"
+    local claude_wall_ms=$(( $(metrics_now_ms) - claude_start_ms ))
+    metrics_stage_end review.claude "$claude_exit_code" \
+        prompt_bytes="$prompt_bytes" \
+        output_bytes="$(printf '%s' "$result" | wc -c | tr -d ' ')" \
+        llm_wall_ms="$claude_wall_ms"
+
+    # LLM 장부 기록 (error: CLI 실패, pass/fail: 검토 결과)
+    local outcome=error
+    if [[ $claude_exit_code -eq 0 ]]; then
+        outcome=fail
+        if echo "$result" | grep -q "^PASS"; then
+            outcome=pass
+        fi
+    fi
+    printf '%s' "$result" > "$temp_result"
+    llm_ledger_record review "$CLAUDE_MODEL" "$temp_prompt" "$temp_result" "$claude_wall_ms" "$outcome"
+
+    if [[ $claude_exit_code -ne 0 ]]; then
+        if [[ -n "$watchdog_reason" ]]; then
+            log_error "Claude review stopped by watchdog ($watchdog_reason)"
+        else
+            log_error "Claude review failed"
+        fi
         echo "$result" >&2
         return 2
-    }
+    fi
+
+    # 결과 파싱
+    if echo "$result" | grep -q "^PASS"; then
+        log_success "Review passed!"
+        echo "PASS"
+        return 0
+    else
+        log_warn "Review failed"
+        echo "$result"
+        return 1
+    fi
+}
+
+run_chunked_review() {
+    # 프롬프트 파일 확인
+    if [[ ! -f "$section_prompt" ]]; then
+        log_error "Review prompt not found: $section_prompt"
+        exit 1
+    fi
+
+    # Claude CLI 확인
+    if [[ ! -x "$CLAUDE_BIN" ]]; then
+        log_error "Claude CLI not found: $CLAUDE_BIN"
+        exit 1
+    fi
+
+    log_info "Starting chunked review with Claude CLI"
+    log_info "Model: $CLAUDE_MODEL (sample rate: $REVIEW_SAMPLE_RATE, parallel: $REVIEW_MAX_PARALLEL)"
+
+    temp_stats=$(mktemp)
+    trap 'exit_code=$?; rm -f "$temp_stats"; trace_script_end $exit_code' EXIT
+
+    # 섹션별 Claude 호출은 chunked_review.py가 재시도/브레이커 아래에서 실행하고 LLM 장부에 기록
+    local review_exit_code=0
+    metrics_stage_start review.claude
+    result=$(python3 "$SCRIPT_DIR/chunked_review.py" \
+        --original "$original_file" \
+        --translated "$translated_file" \
+        --prompt "$section_prompt" \
+        --stats "$temp_stats") || review_exit_code=$?
+
+    local stats=()
+    if [[ -s "$temp_stats" ]]; then
+        mapfile -t stats < <(newsauto json-get sections reviewed calls prompt_bytes full_prompt_bytes llm_wall_ms \
+            < "$temp_stats")
+    fi
+    metrics_stage_end review.claude "$review_exit_code" \
+        mode=chunked \
+        sections="${stats[0]:-}" \
+        reviewed_sections="${stats[1]:-}" \
+        llm_calls="${stats[2]:-}" \
+        prompt_bytes="${stats[3]:-}" \
+        full_prompt_bytes="${stats[4]:-}" \
+        output_bytes="$(printf '%s' "$result" | wc -c | tr -d ' ')" \
+        llm_wall_ms="${stats[5]:-}"
+
+    if [[ $review_exit_code -eq 2 ]]; then
+        log_error "Claude review failed"
+        return 2
+    fi
 
     # 결과 파싱
     if echo "$result" | grep -q "^PASS"; then
@@ -117,6 +220,9 @@ case "$REVIEW_MODE" in
     claude)
         run_claude_review
         ;;
+    chunked)
+        run_chunked_review
+        ;;
     auto)
         # Claude를 먼저 시도하고, 실패/비정상 출력이면 local로 폴백
         if claude_out="$(run_claude_review 2>&1)"; then
@@ -133,7 +239,7 @@ case "$REVIEW_MODE" in
         fi
         ;;
     *)
-        log_error "Unknown REVIEW_MODE: $REVIEW_MODE (expected: local|claude|auto)"
+        log_error "Unknown REVIEW_MODE: $REVIEW_MODE (expected: local|claude|auto|chunked)"
         exit 1
         ;;
 esac
@@ -12,7 +12,7 @@ import json
 import argparse
 from datetime import datetime
 from pathlib import Path
-from urllib.request import urlopen, Request
+from urllib.request import Request
 from urllib.error import URLError, HTTPError
 import re
 
@@ -20,13 +20,20 @@ import re
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
+from lib.profiling import add_profile_argument  # noqa: E402
+from lib.resilience import read_url  # noqa: E402
+from state.state_manager import state_lock  # noqa: E402
+
 GITHUB_API_URL = "https://api.github.com/repos/smol-ai/ainews-web-2025/contents/src/content/issues"
 GITHUB_RAW_BASE = "https://raw.githubusercontent.com/smol-ai/ainews-web-2025/main/src/content/issues"
 PROCESSED_FILE = PROJECT_ROOT / "data" / "processed.json"
 
 
-def fetch_github_listing(url: str) -> list[dict]:
-    """GitHub API를 사용하여 이슈 파일 목록을 가져옵니다."""
+def fetch_github_listing(url: str, priority: str = "high") -> list[dict]:
+    """GitHub API를 사용하여 이슈 파일 목록을 가져옵니다 (일시적 오류는 재시도).
+
+    새 이슈 확인은 high 우선순위로 속도 제한 예산을 끝까지 쓸 수 있습니다 (lib/ratelimit.py).
+    """
     headers = {
         "User-Agent": "smol-ai-news-automation/1.0",
         "Accept": "application/vnd.github.v3+json",
@@ -34,8 +41,7 @@ def fetch_github_listing(url: str) -> list[dict]:
     request = Request(url, headers=headers)
 
     try:
-        with urlopen(request, timeout=30) as response:
-            return json.loads(response.read().decode("utf-8"))
+        return json.loads(read_url(request, timeout=30, priority=priority).decode("utf-8"))
     except HTTPError as e:
         print(f"HTTP Error: {e.code} - {e.reason}", file=sys.stderr)
         sys.exit(1)
@@ -86,29 +92,32 @@ def load_processed_state() -> dict:
 
 
 def save_processed_state(state: dict):
-    """처리된 이슈 상태를 저장합니다."""
+    """처리된 이슈 상태를 저장합니다 (호출하는 쪽이 state_lock을 잡고 있어야 함)."""
     PROCESSED_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(PROCESSED_FILE, "w") as f:
+    tmp_file = PROCESSED_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, "w") as f:
         json.dump(state, f, indent=2, ensure_ascii=False)
+    tmp_file.replace(PROCESSED_FILE)
 
 
 def mark_as_processed(slug: str, status: str = "success"):
     """이슈를 처리됨으로 표시합니다."""
-    state = load_processed_state()
+    with state_lock():
+        state = load_processed_state()
 
-    # 기존 항목 업데이트 또는 추가
-    processed_slugs = {item["slug"]: item for item in state["processed"]}
-    processed_slugs[slug] = {
-        "slug": slug,
-        "status": status,
-        "processed_at": datetime.now().isoformat()
-    }
+        # 기존 항목 업데이트 또는 추가
+        processed_slugs = {item["slug"]: item for item in state["processed"]}
+        processed_slugs[slug] = {
+            "slug": slug,
+            "status": status,
+            "processed_at": datetime.now().isoformat()
+        }
 
-    state["processed"] = list(processed_slugs.values())
-    state["last_check"] = datetime.now().isoformat()
+        state["processed"] = list(processed_slugs.values())
+        state["last_check"] = datetime.now().isoformat()
 
-    save_processed_state(state)
+        save_processed_state(state)
 
 
 def extract_date_from_slug(slug: str) -> str:
@@ -160,9 +169,11 @@ def get_unprocessed_issues(items: list[dict]) -> list[dict]:
     이전 날짜의 미처리 글은 무시됩니다.
 
     기준: processed.json의 success 상태인 항목 중 가장 최신 날짜
+    예외: 만료된 임대를 회수해 pending으로 되돌린 항목은 날짜와 관계없이 다시 포함
     """
     state = load_processed_state()
-    processed_slugs = {item["slug"] for item in state["processed"]}
+    pending_slugs = {item["slug"] for item in state["processed"] if item.get("status") == "pending"}
+    processed_slugs = {item["slug"] for item in state["processed"]} - pending_slugs
     latest_date = get_latest_processed_date(state)
 
     new_issues = []
@@ -172,7 +183,7 @@ def get_unprocessed_issues(items: list[dict]) -> list[dict]:
             continue
 
         # 최신 처리 날짜가 있으면, 그 이후 날짜만 포함
-        if latest_date:
+        if latest_date and item["slug"] not in pending_slugs:
             item_date = extract_date_from_slug(item["slug"])
             if item_date and item_date <= latest_date:
                 continue  # 이전 날짜는 건너뜀
@@ -192,9 +203,10 @@ def check_for_new_issues(limit: int = None) -> list[dict]:
     unprocessed = get_unprocessed_issues(items)
 
     # 상태 업데이트
-    state = load_processed_state()
-    state["last_check"] = datetime.now().isoformat()
-    save_processed_state(state)
+    with state_lock():
+        state = load_processed_state()
+        state["last_check"] = datetime.now().isoformat()
+        save_processed_state(state)
 
     if limit:
         return unprocessed[:limit]
@@ -205,6 +217,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="GitHub 레포지토리에서 새 이슈를 감지합니다."
     )
+    add_profile_argument(parser)
     parser.add_argument(
         "--check",
         action="store_true",
@@ -247,7 +260,7 @@ def main():
         return
 
     if args.list_all:
-        files = fetch_github_listing(GITHUB_API_URL)
+        files = fetch_github_listing(GITHUB_API_URL, priority="normal")
         items = parse_github_listing(files)
 
         if args.json:
@@ -286,4 +299,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    from lib.profiling import run_main
+    run_main("check_feed", main)
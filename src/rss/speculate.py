@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+speculate.py - 업스트림 초안 사전 번역 관리
+smol.ai 이슈는 main에 머지되기 전에 업스트림 레포의 PR이나 main 외 브랜치에 먼저 올라오는 경우가 많습니다.
+이 초안을 미리 가져와 번역해 두고(./main.sh --speculate), 정식 이슈가 main에 머지되면
+일반 실행이 사전 번역 결과를 --sync와 같은 방식으로 대조해 변경분만 반영합니다.
+
+- data/upstream.git: 업스트림 ref를 가져오는 bare 미러 (브랜치 + PR head, 최신 커밋만 shallow fetch)
+- data/speculative/<slug>/: 사전 번역 작업 디렉토리 (original.md, 언어별 final.md/youtube.txt, meta.json)
+- data/speculative/history.jsonl: 머지된 이슈별 대조 결과 (hit | reconciled | discarded)와 선행 시간
+
+main에 이미 있는 이슈, 처리 상태에 기록된 이슈, 최신 처리 날짜 이전 이슈는 check_feed와 같은 기준으로 제외합니다.
+SPECULATIVE_REMOTE를 로컬 bare 레포 경로로 지정하면 네트워크 없이 동작을 확인할 수 있습니다.
+"""
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.profiling import add_profile_argument  # noqa: E402
+from rss.check_feed import parse_github_listing, get_unprocessed_issues  # noqa: E402
+from state.state_manager import get_status  # noqa: E402
+
+SPECULATIVE_DIR = Path(os.environ.get("SPECULATIVE_DIR") or PROJECT_ROOT / "data" / "speculative")
+HISTORY_FILE = SPECULATIVE_DIR / "history.jsonl"
+MIRROR = Path(os.environ.get("SPECULATIVE_MIRROR") or PROJECT_ROOT / "data" / "upstream.git")
+REMOTE = os.environ.get("SPECULATIVE_REMOTE") or (
+    f"https://github.com/{os.environ.get('GITHUB_SOURCE_REPO', 'smol-ai/ainews-web-2025')}.git"
+)
+BASE = os.environ.get("SPECULATIVE_BASE", "main")
+ISSUES_PATH = os.environ.get("GITHUB_ISSUES_PATH", "src/content/issues").strip("/")
+MAX_AGE_DAYS = int(os.environ.get("SPECULATIVE_MAX_AGE_DAYS", 14))
+
+# 업스트림 ref는 refs/speculative/ 아래로 가져옴 (브랜치와 PR head를 한 번에)
+REF_PREFIX = "refs/speculative"
+REFSPECS = (
+    f"+refs/heads/*:{REF_PREFIX}/heads/*",
+    f"+refs/pull/*/head:{REF_PREFIX}/pull/*",
+)
+META_FILE = "meta.json"
+
+
+class SpeculateError(Exception):
+    """업스트림 미러 조작 실패"""
+
+
+def _git(*args: str) -> str:
+    """미러 레포에서 git 명령을 실행하고 stdout을 반환합니다."""
+    result = subprocess.run(["git", "--git-dir", str(MIRROR), *args], capture_output=True)
+    if result.returncode != 0:
+        raise SpeculateError(
+            f"git {' '.join(args)} failed: {result.stderr.decode('utf-8', 'replace').strip()}"
+        )
+    return result.stdout.decode("utf-8").strip()
+
+
+def fetch_refs():
+    """업스트림 브랜치와 PR head의 최신 커밋을 미러로 가져옵니다 (사라진 ref는 정리)."""
+    if not (MIRROR / "HEAD").exists():
+        MIRROR.parent.mkdir(parents=True, exist_ok=True)
+        subprocess.run(["git", "init", "--bare", "--quiet", str(MIRROR)], check=True, capture_output=True)
+
+    try:
+        current = _git("remote", "get-url", "origin")
+    except SpeculateError:
+        current = None
+    if current is None:
+        _git("remote", "add", "origin", REMOTE)
+    elif current != REMOTE:
+        _git("remote", "set-url", "origin", REMOTE)
+
+    # 트리 비교만 하므로 히스토리는 필요 없음
+    _git("fetch", "--quiet", "--prune", "--no-tags", "--depth", "1", "origin", *REFSPECS)
+
+
+def list_issue_files(ref: str) -> dict[str, str]:
+    """ref의 이슈 디렉토리 파일을 {파일명: blob SHA}로 반환합니다."""
+    output = _git("ls-tree", "-z", ref, "--", f"{ISSUES_PATH}/")
+    files = {}
+    for record in output.split("\0"):
+        if not record:
+            continue
+        meta, _, path = record.partition("\t")
+        _, obj_type, sha = meta.split()
+        if obj_type == "blob":
+            files[path.rsplit("/", 1)[-1]] = sha
+    return files
+
+
+def _upstream_refs() -> list[tuple[str, int]]:
+    """미러의 업스트림 ref 목록 [(ref, 커밋 시각)]"""
+    output = _git("for-each-ref", "--format=%(refname)%09%(committerdate:unix)", REF_PREFIX)
+    refs = []
+    for line in output.splitlines():
+        ref, _, committed = line.partition("\t")
+        refs.append((ref, int(committed or 0)))
+    return refs
+
+
+def load_meta(slug: str) -> Optional[dict]:
+    path = SPECULATIVE_DIR / slug / META_FILE
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return None
+
+
+def scan() -> list[dict]:
+    """main에 아직 없는 새 이슈 초안 목록을 반환합니다 (오래된 것부터).
+
+    같은 이슈가 여러 ref에 있으면 가장 최근에 커밋된 ref의 초안을 사용하며,
+    이미 같은 초안(blob)으로 사전 번역했거나 실패한 이슈는 제외합니다.
+    """
+    base_ref = f"{REF_PREFIX}/heads/{BASE}"
+    refs = _upstream_refs()
+    base_files = list_issue_files(base_ref) if any(ref == base_ref for ref, _ in refs) else {}
+
+    drafts: dict[str, dict] = {}
+    for ref, committed_at in refs:
+        if ref == base_ref:
+            continue
+        for name, blob in list_issue_files(ref).items():
+            if name in base_files:
+                continue
+            if name not in drafts or committed_at > drafts[name]["committed_at"]:
+                drafts[name] = {
+                    "ref": ref[len(REF_PREFIX) + 1:],
+                    "path": f"{ISSUES_PATH}/{name}",
+                    "blob": blob,
+                    "committed_at": committed_at,
+                }
+
+    candidates = []
+    for item in get_unprocessed_issues(parse_github_listing([{"name": name} for name in drafts])):
+        draft = drafts[f"{item['slug']}.md"]
+        meta = load_meta(item["slug"])
+        if meta and meta.get("blob") == draft["blob"]:
+            continue
+        candidates.append({
+            "slug": item["slug"],
+            "url": item["url"],
+            **draft,
+            "previous_status": meta.get("status") if meta else None,
+        })
+    return candidates
+
+
+def read_draft(blob: str) -> bytes:
+    """미러에서 초안 내용을 읽습니다."""
+    result = subprocess.run(
+        ["git", "--git-dir", str(MIRROR), "cat-file", "blob", blob],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise SpeculateError(f"Unknown draft blob: {blob}")
+    return result.stdout
+
+
+def work_dir(slug: str) -> Path:
+    return SPECULATIVE_DIR / slug
+
+
+def record(slug: str, ref: str, blob: str, status: str, langs: list[str]) -> dict:
+    """사전 번역 결과를 기록합니다 (ready: 대조에 사용 가능, failed: 같은 초안은 다시 시도하지 않음)."""
+    directory = work_dir(slug)
+    directory.mkdir(parents=True, exist_ok=True)
+    original = directory / "original.md"
+    meta = {
+        "slug": slug,
+        "ref": ref,
+        "blob": blob,
+        "status": status,
+        "langs": langs,
+        "original_sha256": hashlib.sha256(original.read_bytes()).hexdigest() if original.exists() else None,
+        "speculated_at": datetime.now().isoformat(),
+    }
+    (directory / META_FILE).write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding="utf-8")
+    return meta
+
+
+def lookup(slug: str) -> Optional[Path]:
+    """대조에 쓸 수 있는 사전 번역 작업 디렉토리 (없으면 None)"""
+    meta = load_meta(slug)
+    if not meta or meta.get("status") != "ready":
+        return None
+    directory = work_dir(slug)
+    if not (directory / "original.md").exists():
+        return None
+    return directory
+
+
+def finish(slug: str, lang_statuses: dict[str, str]) -> dict:
+    """정식 이슈 처리가 끝난 사전 번역을 기록하고 작업 디렉토리를 지웁니다.
+
+    언어별 대조 결과(unchanged | patched | full)로 이슈 결과를 정합니다:
+    모두 unchanged면 hit, full이 하나라도 있으면 discarded, 그 외는 reconciled.
+    """
+    meta = load_meta(slug) or {"slug": slug}
+    statuses = set(lang_statuses.values())
+    if "full" in statuses or not statuses:
+        outcome = "discarded"
+    elif statuses == {"unchanged"}:
+        outcome = "hit"
+    else:
+        outcome = "reconciled"
+
+    now = datetime.now()
+    entry = {
+        "slug": slug,
+        "outcome": outcome,
+        "langs": lang_statuses,
+        "ref": meta.get("ref"),
+        "speculated_at": meta.get("speculated_at"),
+        "landed_at": now.isoformat(),
+    }
+    if meta.get("speculated_at"):
+        entry["lead_seconds"] = round((now - datetime.fromisoformat(meta["speculated_at"])).total_seconds())
+
+    SPECULATIVE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    shutil.rmtree(work_dir(slug), ignore_errors=True)
+    return entry
+
+
+def prune(now: Optional[datetime] = None) -> list[str]:
+    """머지되지 않은 채 오래된 초안과 다른 경로로 처리가 끝난 이슈의 사전 번역을 지웁니다."""
+    now = now or datetime.now()
+    removed = []
+    if not SPECULATIVE_DIR.exists():
+        return removed
+    for directory in sorted(p for p in SPECULATIVE_DIR.iterdir() if p.is_dir()):
+        meta = load_meta(directory.name)
+        speculated_at = datetime.fromisoformat(meta["speculated_at"]) if meta and meta.get("speculated_at") else None
+        expired = speculated_at is None or now - speculated_at > timedelta(days=MAX_AGE_DAYS)
+        if expired or get_status(directory.name) in ("success", "queued"):
+            shutil.rmtree(directory, ignore_errors=True)
+            removed.append(directory.name)
+    return removed
+
+
+def load_history() -> list[dict]:
+    if not HISTORY_FILE.exists():
+        return []
+    entries = []
+    for line in HISTORY_FILE.read_text(encoding="utf-8").splitlines():
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return entries
+
+
+def status() -> dict:
+    """대기 중인 사전 번역과 대조 결과 집계"""
+    pending = []
+    if SPECULATIVE_DIR.exists():
+        for directory in sorted(p for p in SPECULATIVE_DIR.iterdir() if p.is_dir()):
+            meta = load_meta(directory.name)
+            if meta:
+                pending.append(meta)
+
+    history = load_history()
+    outcomes = {name: sum(1 for e in history if e.get("outcome") == name) for name in ("hit", "reconciled", "discarded")}
+    leads = sorted(e["lead_seconds"] for e in history if "lead_seconds" in e and e.get("outcome") != "discarded")
+    return {
+        "pending": pending,
+        "outcomes": outcomes,
+        "median_lead_seconds": leads[len(leads) // 2] if leads else None,
+    }
+
+
+def format_status(s: dict) -> str:
+    lines = [f"Pending speculative translations: {len(s['pending'])}"]
+    for meta in s["pending"]:
+        lines.append(f"  - {meta['slug']} [{meta.get('status')}] {meta.get('ref')} @ {meta.get('speculated_at')}")
+    outcomes = s["outcomes"]
+    lines.append(
+        f"Landed: {sum(outcomes.values())} (hit {outcomes['hit']}, reconciled {outcomes['reconciled']}, "
+        f"discarded {outcomes['discarded']})"
+    )
+    if s["median_lead_seconds"] is not None:
+        lines.append(f"Median lead time: {s['median_lead_seconds'] / 60:.0f} min")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="업스트림 PR/브랜치의 이슈 초안을 사전 번역하고 머지 후 대조합니다."
+    )
+    add_profile_argument(parser)
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # scan 명령
+    scan_parser = subparsers.add_parser("scan", help="업스트림 ref를 가져와 사전 번역할 초안 목록 출력")
+    scan_parser.add_argument("--limit", type=int, default=0, help="반환할 최대 초안 수 (0: 전체)")
+    scan_parser.add_argument("--no-fetch", action="store_true", help="미러를 갱신하지 않고 확인")
+    scan_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    # draft 명령
+    draft_parser = subparsers.add_parser("draft", help="초안 내용을 파일로 저장")
+    draft_parser.add_argument("blob", help="초안 blob SHA")
+    draft_parser.add_argument("-o", "--output", type=Path, required=True, help="출력 파일")
+
+    # record 명령
+    record_parser = subparsers.add_parser("record", help="사전 번역 결과 기록")
+    record_parser.add_argument("slug", help="이슈 slug")
+    record_parser.add_argument("--ref", required=True, help="초안을 가져온 ref")
+    record_parser.add_argument("--blob", required=True, help="초안 blob SHA")
+    record_parser.add_argument("--status", choices=["ready", "failed"], default="ready", help="결과")
+    record_parser.add_argument("--langs", nargs="*", default=[], help="번역한 언어")
+
+    # lookup 명령
+    lookup_parser = subparsers.add_parser("lookup", help="대조에 쓸 사전 번역 작업 디렉토리 출력 (없으면 exit 1)")
+    lookup_parser.add_argument("slug", help="이슈 slug")
+
+    # finish 명령
+    finish_parser = subparsers.add_parser("finish", help="대조 결과 기록 후 사전 번역 삭제")
+    finish_parser.add_argument("slug", help="이슈 slug")
+    finish_parser.add_argument("statuses", nargs="*", metavar="LANG=STATUS", help="언어별 결과 (예: ko=patched)")
+
+    # prune / status 명령
+    subparsers.add_parser("prune", help="오래되었거나 이미 처리된 사전 번역 삭제")
+    status_parser = subparsers.add_parser("status", help="대기 중인 사전 번역과 대조 결과 집계")
+    status_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "scan":
+            if not args.no_fetch:
+                fetch_refs()
+                prune()
+            candidates = scan()
+            if args.limit:
+                candidates = candidates[:args.limit]
+            if args.json:
+                print(json.dumps(candidates, indent=2, ensure_ascii=False))
+            elif not candidates:
+                print("No upstream drafts to speculate on.")
+            else:
+                for c in candidates:
+                    print(f"- {c['slug']}: {c['ref']} ({c['blob'][:12]})")
+
+        elif args.command == "draft":
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_bytes(read_draft(args.blob))
+
+        elif args.command == "record":
+            meta = record(args.slug, args.ref, args.blob, args.status, args.langs)
+            print(f"Recorded speculative translation: {args.slug} [{meta['status']}]")
+
+        elif args.command == "lookup":
+            directory = lookup(args.slug)
+            if directory is None:
+                sys.exit(1)
+            print(directory)
+
+        elif args.command == "finish":
+            lang_statuses = dict(s.split("=", 1) for s in args.statuses if "=" in s)
+            entry = finish(args.slug, lang_statuses)
+            print(f"Speculative translation {entry['outcome']}: {args.slug}")
+
+        elif args.command == "prune":
+            removed = prune()
+            print(f"Pruned {len(removed)} speculative translation(s): {', '.join(removed) or '-'}")
+
+        elif args.command == "status":
+            s = status()
+            print(json.dumps(s, indent=2, ensure_ascii=False) if args.json else format_status(s))
+
+        else:
+            parser.print_help()
+    except SpeculateError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    from lib.profiling import run_main
+    run_main("speculate", main)
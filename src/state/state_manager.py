@@ -2,13 +2,22 @@
 """
 state_manager.py - 상태 관리
 파이프라인 실행 상태를 관리합니다.
+
+처리 중인 이슈는 임대(lease)로 점유합니다:
+- claim: 소유자(실행 ID)와 만료 시각을 기록하고 in_progress로 표시 (다른 실행이 유효한 임대를 갖고 있으면 실패)
+- heartbeat: 긴 단계 동안 주기적으로 만료 시각을 연장 (임대를 잃었으면 실패)
+- reclaim: 만료된 임대(프로세스가 죽어 연장되지 않음)를 pending으로 되돌려 다음 실행이 다시 처리
+  STATE_MAX_ATTEMPTS번 점유했는데도 끝나지 않은 이슈는 failed로 표시해 무한 반복을 막음
 """
 
+import os
 import sys
 import json
+import fcntl
 import argparse
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
 
@@ -16,14 +25,23 @@ from typing import Optional
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
+from lib.profiling import add_profile_argument  # noqa: E402
+
 DATA_DIR = PROJECT_ROOT / "data"
 STATE_FILE = DATA_DIR / "processed.json"
+LOCK_FILE = DATA_DIR / "processed.lock"
+
+# 임대 유지 시간 (초): heartbeat 없이 이 시간이 지나면 다른 실행이 회수
+LEASE_TTL = int(os.environ.get("STATE_LEASE_TTL", 900))
+# 회수 후 다시 시도할 최대 점유 횟수
+MAX_ATTEMPTS = int(os.environ.get("STATE_MAX_ATTEMPTS", 3))
 
 
 class ProcessStatus(Enum):
     """처리 상태"""
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
+    QUEUED = "queued"
     SUCCESS = "success"
     FAILED = "failed"
     SKIPPED = "skipped"
@@ -57,12 +75,26 @@ def load_state() -> dict:
         }
 
 
+@contextmanager
+def state_lock():
+    """상태 파일 배타 잠금 (여러 실행이 같은 파일을 읽고 고쳐 쓰는 동안 덮어쓰지 않도록)"""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
 def save_state(state: dict):
-    """상태 파일을 저장합니다."""
+    """상태 파일을 저장합니다 (임시 파일 교체로 읽는 쪽이 쓰다 만 파일을 보지 않음)."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    with open(STATE_FILE, "w", encoding="utf-8") as f:
+    tmp_file = STATE_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
         json.dump(state, f, indent=2, ensure_ascii=False)
+    tmp_file.replace(STATE_FILE)
 
 
 def get_processed_slugs() -> set[str]:
@@ -92,8 +124,21 @@ def update_status(
     error: str = None,
     metadata: dict = None,
 ):
-    """slug의 상태를 업데이트합니다."""
-    state = load_state()
+    """slug의 상태를 업데이트합니다 (임대 정보는 지워짐)."""
+    with state_lock():
+        _update_status(load_state(), slug, status, pr_url, error, metadata)
+
+
+def _update_status(
+    state: dict,
+    slug: str,
+    status: ProcessStatus,
+    pr_url: str = None,
+    error: str = None,
+    metadata: dict = None,
+    extra: dict = None,
+):
+    """update_status의 본체 (호출하는 쪽이 state_lock을 잡고 있어야 함)"""
 
     # 기존 항목 찾기
     existing_idx = None
@@ -114,11 +159,15 @@ def update_status(
         entry["error"] = error
     if metadata:
         entry["metadata"] = metadata
+    if extra:
+        entry.update(extra)
 
     if existing_idx is not None:
-        # 기존 항목 업데이트
+        # 기존 항목 업데이트 (점유 횟수는 최종 상태가 정해질 때까지 유지)
         old_entry = state["processed"][existing_idx]
         entry["created_at"] = old_entry.get("created_at", entry["updated_at"])
+        if "attempts" in old_entry and status in (ProcessStatus.IN_PROGRESS, ProcessStatus.PENDING):
+            entry.setdefault("attempts", old_entry["attempts"])
         state["processed"][existing_idx] = entry
     else:
         # 새 항목 추가
@@ -172,37 +221,131 @@ def get_stats() -> dict:
     return state.get("stats", {})
 
 
+# ============================================
+# 임대 (lease)
+# ============================================
+
+def _find(state: dict, slug: str) -> Optional[dict]:
+    for item in state["processed"]:
+        if item["slug"] == slug:
+            return item
+    return None
+
+
+def lease_expires_at(item: dict) -> Optional[datetime]:
+    """in_progress 항목의 임대 만료 시각 (임대 이전 형식의 항목은 마지막 갱신 + LEASE_TTL)"""
+    if item.get("status") != ProcessStatus.IN_PROGRESS.value:
+        return None
+    lease = item.get("lease")
+    if lease:
+        return datetime.fromisoformat(lease["expires_at"])
+    return datetime.fromisoformat(item["updated_at"]) + timedelta(seconds=LEASE_TTL)
+
+
+def _new_lease(owner: str, ttl: int, now: datetime, claimed_at: Optional[str] = None) -> dict:
+    return {
+        "owner": owner,
+        "claimed_at": claimed_at or now.isoformat(),
+        "heartbeat_at": now.isoformat(),
+        "expires_at": (now + timedelta(seconds=ttl)).isoformat(),
+    }
+
+
+def claim(slug: str, owner: str, ttl: int = LEASE_TTL) -> tuple[bool, Optional[dict]]:
+    """slug를 점유합니다.
+
+    Returns:
+        (성공 여부, 실패 시 현재 임대 정보)
+    """
+    now = datetime.now()
+    with state_lock():
+        state = load_state()
+        item = _find(state, slug)
+        extra = {"attempts": 1}
+        if item:
+            expires_at = lease_expires_at(item)
+            lease = item.get("lease") or {}
+            if expires_at and expires_at > now and lease.get("owner") != owner:
+                return False, lease
+            extra["attempts"] = item.get("attempts", 0) + 1
+            if expires_at:
+                extra["reclaimed_from"] = lease.get("owner", "unknown")
+        extra["lease"] = _new_lease(owner, ttl, now)
+        _update_status(state, slug, ProcessStatus.IN_PROGRESS, extra=extra)
+    return True, None
+
+
+def heartbeat(slug: str, owner: str, ttl: int = LEASE_TTL) -> bool:
+    """임대 만료 시각을 연장합니다 (다른 실행에 회수되었거나 이미 끝났으면 False)."""
+    now = datetime.now()
+    with state_lock():
+        state = load_state()
+        item = _find(state, slug)
+        lease = (item or {}).get("lease")
+        if not item or item["status"] != ProcessStatus.IN_PROGRESS.value or not lease or lease["owner"] != owner:
+            return False
+        item["lease"] = _new_lease(owner, ttl, now, claimed_at=lease["claimed_at"])
+        item["updated_at"] = now.isoformat()
+        save_state(state)
+    return True
+
+
+def reclaim_expired(max_attempts: int = MAX_ATTEMPTS) -> list[dict]:
+    """만료된 임대를 회수합니다 (pending으로 되돌리거나, 점유 횟수를 다 썼으면 failed).
+
+    Returns:
+        회수한 항목 [{"slug", "owner", "status"}]
+    """
+    now = datetime.now()
+    reclaimed = []
+    with state_lock():
+        state = load_state()
+        for item in list(state["processed"]):
+            expires_at = lease_expires_at(item)
+            if not expires_at or expires_at > now:
+                continue
+            owner = (item.get("lease") or {}).get("owner", "unknown")
+            attempts = item.get("attempts", 1)
+            error = f"lease expired (owner {owner}, attempt {attempts})"
+            status = ProcessStatus.FAILED if attempts >= max_attempts else ProcessStatus.PENDING
+            _update_status(state, item["slug"], status, error=error)
+            reclaimed.append({"slug": item["slug"], "owner": owner, "status": status.value})
+    return reclaimed
+
+
 def reset_failed(slug: str = None):
     """실패한 항목을 재시도 가능하도록 리셋합니다."""
-    state = load_state()
+    with state_lock():
+        state = load_state()
 
-    if slug:
-        # 특정 slug만 리셋
-        state["processed"] = [
-            p for p in state["processed"] if p["slug"] != slug
-        ]
-    else:
-        # 모든 실패 항목 리셋
-        state["processed"] = [
-            p for p in state["processed"] if p["status"] != "failed"
-        ]
+        if slug:
+            # 특정 slug만 리셋
+            state["processed"] = [
+                p for p in state["processed"] if p["slug"] != slug
+            ]
+        else:
+            # 모든 실패 항목 리셋
+            state["processed"] = [
+                p for p in state["processed"] if p["status"] != "failed"
+            ]
 
-    # 통계 재계산
-    state["stats"]["total_processed"] = len(state["processed"])
-    state["stats"]["success_count"] = len([
-        p for p in state["processed"] if p["status"] == "success"
-    ])
-    state["stats"]["failed_count"] = len([
-        p for p in state["processed"] if p["status"] == "failed"
-    ])
+        # 통계 재계산
+        state["stats"]["total_processed"] = len(state["processed"])
+        state["stats"]["success_count"] = len([
+            p for p in state["processed"] if p["status"] == "success"
+        ])
+        state["stats"]["failed_count"] = len([
+            p for p in state["processed"] if p["status"] == "failed"
+        ])
 
-    save_state(state)
+        save_state(state)
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="파이프라인 실행 상태를 관리합니다."
     )
+    add_profile_argument(parser)
     subparsers = parser.add_subparsers(dest="command", help="명령")
 
     # status 명령
@@ -214,7 +357,7 @@ def main():
     mark_parser.add_argument("slug", help="설정할 slug")
     mark_parser.add_argument(
         "--status",
-        choices=["pending", "in_progress", "success", "failed", "skipped"],
+        choices=[s.value for s in ProcessStatus],
         required=True,
         help="설정할 상태"
     )
@@ -225,7 +368,7 @@ def main():
     list_parser = subparsers.add_parser("list", help="목록 조회")
     list_parser.add_argument(
         "--status",
-        choices=["pending", "in_progress", "success", "failed", "skipped"],
+        choices=[s.value for s in ProcessStatus],
         help="필터링할 상태"
     )
 
@@ -236,6 +379,25 @@ def main():
     reset_parser = subparsers.add_parser("reset", help="실패 항목 리셋")
     reset_parser.add_argument("slug", nargs="?", help="리셋할 slug (없으면 모두)")
 
+    # claim 명령
+    claim_parser = subparsers.add_parser("claim", help="임대 점유 (실패 시 exit 1)")
+    claim_parser.add_argument("slug", help="점유할 slug")
+    claim_parser.add_argument("--owner", required=True, help="임대 소유자 (실행 ID)")
+    claim_parser.add_argument("--ttl", type=int, default=LEASE_TTL, help=f"임대 유지 시간 초 (기본: {LEASE_TTL})")
+
+    # heartbeat 명령
+    heartbeat_parser = subparsers.add_parser("heartbeat", help="임대 연장 (임대를 잃었으면 exit 1)")
+    heartbeat_parser.add_argument("slug", help="연장할 slug")
+    heartbeat_parser.add_argument("--owner", required=True, help="임대 소유자 (실행 ID)")
+    heartbeat_parser.add_argument("--ttl", type=int, default=LEASE_TTL, help=f"임대 유지 시간 초 (기본: {LEASE_TTL})")
+
+    # reclaim 명령
+    reclaim_parser = subparsers.add_parser("reclaim", help="만료된 임대 회수")
+    reclaim_parser.add_argument(
+        "--max-attempts", type=int, default=MAX_ATTEMPTS,
+        help=f"이 횟수만큼 점유했으면 failed로 표시 (기본: {MAX_ATTEMPTS})"
+    )
+
     args = parser.parse_args()
 
     if args.command == "status":
@@ -262,7 +424,11 @@ def main():
             items = [i for i in items if i["status"] == args.status]
 
         for item in items:
-            print(f"- {item['slug']}: {item['status']}")
+            lease = item.get("lease")
+            if item["status"] == ProcessStatus.IN_PROGRESS.value and lease:
+                print(f"- {item['slug']}: {item['status']} (owner {lease['owner']}, expires {lease['expires_at']})")
+            else:
+                print(f"- {item['slug']}: {item['status']}")
 
     elif args.command == "stats":
         stats = get_stats()
@@ -277,9 +443,29 @@ def main():
         else:
             print("Reset all failed items")
 
+    elif args.command == "claim":
+        claimed, lease = claim(args.slug, args.owner, args.ttl)
+        if not claimed:
+            print(
+                f"'{args.slug}' is leased by {lease.get('owner', 'unknown')} until {lease.get('expires_at', '?')}",
+                file=sys.stderr
+            )
+            sys.exit(1)
+        print(f"Claimed '{args.slug}' for {args.owner}")
+
+    elif args.command == "heartbeat":
+        if not heartbeat(args.slug, args.owner, args.ttl):
+            print(f"Lease on '{args.slug}' lost by {args.owner}", file=sys.stderr)
+            sys.exit(1)
+
+    elif args.command == "reclaim":
+        for item in reclaim_expired(args.max_attempts):
+            print(f"{item['slug']}\t{item['status']}\t{item['owner']}")
+
     else:
         parser.print_help()
 
 
 if __name__ == "__main__":
-    main()
+    from lib.profiling import run_main
+    run_main("state_manager", main)
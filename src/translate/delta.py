@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+delta.py - 원문 변경분 부분 재번역
+게시 후 수정된 원문을 보관된 이전 원문과 섹션/불릿 단위로 비교해 바뀐 구간만 번역하고,
+게시된 final.md의 해당 부분만 교체합니다 (frontmatter와 바뀌지 않은 번역은 그대로 유지).
+
+원문 구간과 번역 구간은 링크 URL 목록으로 대응시킵니다 (번역 규칙상 URL은 1글자도 바뀌지 않음).
+대응시킬 수 없는 변경(링크 없는 문단/제목 등)이 있으면 전체 재번역(full)으로 판단합니다.
+
+사용법:
+    delta.py plan <old_original> <new_original> <final> -o plan.json --segments source.md [--json]
+    delta.py apply plan.json translated.md <final> -o final.md
+"""
+
+import os
+import re
+import sys
+import json
+import difflib
+import argparse
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.profiling import add_profile_argument  # noqa: E402
+
+LINK_RE = re.compile(r"\[[^\]]*?\]\(([^)]+)\)")
+HEADING_RE = re.compile(r"^#{1,6}\s")
+BULLET_RE = re.compile(r"^(?:[-*+]|\d+\.)\s")
+RULE_RE = re.compile(r"^(?:-{3,}|\*{3,}|_{3,})\s*$")
+FENCE_RE = re.compile(r"^```")
+FRONTMATTER_RE = re.compile(r"^---\s*\n.*?\n---\s*\n", re.DOTALL)
+SEGMENT_MARKER_RE = re.compile(r"^<<<SEGMENT (\d+)>>>\s*$", re.MULTILINE)
+
+# 바뀐 원문 비율이 이 값을 넘으면 부분 재번역 대신 전체 재번역
+MAX_CHANGED_RATIO = float(os.environ.get("DELTA_MAX_CHANGED_RATIO", 0.5))
+
+
+@dataclass
+class Segment:
+    kind: str  # heading | bullet | paragraph | rule
+    start: int  # 시작 줄 (포함)
+    end: int  # 끝 줄 (미포함)
+    text: str
+    blank_before: bool
+    blank_after: bool = False
+
+    @property
+    def links(self) -> tuple:
+        return tuple(sorted(LINK_RE.findall(self.text)))
+
+
+def _kind(line: str) -> str:
+    if HEADING_RE.match(line):
+        return "heading"
+    if RULE_RE.match(line):
+        return "rule"
+    if BULLET_RE.match(line):
+        return "bullet"
+    return "paragraph"
+
+
+def segment(text: str) -> list[Segment]:
+    """마크다운 본문을 제목/최상위 불릿(하위 불릿 포함)/문단/구분선 단위로 나눕니다."""
+    lines = text.split("\n")
+    segments: list[Segment] = []
+    blank = True
+    i = 0
+
+    while i < len(lines):
+        line = lines[i]
+        if not line.strip():
+            blank = True
+            i += 1
+            continue
+
+        # 빈 줄 뒤에 이어지는 들여쓴 줄은 앞 불릿의 하위 항목
+        if line[0].isspace() and segments and segments[-1].kind == "bullet":
+            prev = segments[-1]
+            while i < len(lines) and (not lines[i].strip() or lines[i][0].isspace()):
+                i += 1
+            while not lines[i - 1].strip():
+                i -= 1
+            prev.end = i
+            prev.text = "\n".join(lines[prev.start:prev.end])
+            blank = False
+            continue
+
+        start = i
+        kind = _kind(line)
+        i += 1
+        if FENCE_RE.match(line):
+            # 코드 펜스는 닫는 펜스까지 한 단위
+            kind = "paragraph"
+            while i < len(lines) and not FENCE_RE.match(lines[i]):
+                i += 1
+            i = min(i + 1, len(lines))
+        elif kind in ("bullet", "paragraph"):
+            while i < len(lines) and lines[i].strip():
+                nxt = lines[i]
+                if not nxt[0].isspace() and _kind(nxt) != "paragraph":
+                    break
+                if kind == "paragraph" and FENCE_RE.match(nxt):
+                    break
+                i += 1
+
+        if segments:
+            segments[-1].blank_after = blank
+        segments.append(Segment(kind, start, i, "\n".join(lines[start:i]), blank))
+        blank = False
+
+    return segments
+
+
+def split_frontmatter(content: str) -> tuple[str, str]:
+    """(frontmatter 원문 그대로, 본문)으로 나눕니다."""
+    match = FRONTMATTER_RE.match(content)
+    if not match:
+        return "", content
+    return content[:match.end()], content[match.end():]
+
+
+def map_segments(old: list[Segment], final: list[Segment]) -> dict[int, int]:
+    """원문 구간 → 번역 구간 대응 (링크 URL 목록이 같은 구간을 순서대로 짝지음)."""
+    old_groups: dict[tuple, list[int]] = defaultdict(list)
+    final_groups: dict[tuple, list[int]] = defaultdict(list)
+    for i, seg in enumerate(old):
+        if seg.links:
+            old_groups[seg.links].append(i)
+    for i, seg in enumerate(final):
+        if seg.links:
+            final_groups[seg.links].append(i)
+
+    mapping = {}
+    for key, olds in old_groups.items():
+        finals = final_groups.get(key, [])
+        # 개수가 다르면 (번역에서 합치거나 나눈 경우) 어느 쪽인지 알 수 없으므로 대응하지 않음
+        if len(olds) == len(finals):
+            mapping.update(zip(olds, finals))
+    return mapping
+
+
+def plan(old_original: str, new_original: str, final_content: str, max_ratio: float = MAX_CHANGED_RATIO) -> dict:
+    """이전/새 원문 차이를 게시된 번역에 적용할 작업 목록으로 만듭니다.
+
+    Returns:
+        status (unchanged | patchable | full), reason, stats, ops, sources를 담은 dict
+    """
+    old = segment(old_original)
+    new = segment(new_original)
+    _, final_body = split_frontmatter(final_content)
+    final = segment(final_body)
+    mapping = map_segments(old, final)
+
+    ops = []
+    sources: list[str] = []
+    unmapped = []
+    stats = {"old_segments": len(old), "new_segments": len(new), "changed": 0, "inserted": 0, "deleted": 0}
+
+    def add_source(j: int) -> int:
+        sources.append(new[j].text)
+        return len(sources) - 1
+
+    matcher = difflib.SequenceMatcher(None, [s.text for s in old], [s.text for s in new], autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+
+        olds, news = list(range(i1, i2)), list(range(j1, j2))
+        anchor = None  # 이 블록의 추가 구간을 넣을 위치 (번역 본문 줄 번호)
+
+        # 짝이 맞는 구간은 제자리 교체
+        for o, n in zip(olds, news):
+            if o not in mapping:
+                unmapped.append(old[o])
+                continue
+            f = final[mapping[o]]
+            ops.append({"op": "replace", "start": f.start, "end": f.end, "source": add_source(n)})
+            stats["changed"] += 1
+            anchor = ("after", f.end)
+
+        # 남는 이전 구간은 삭제
+        for o in olds[len(news):]:
+            if o not in mapping:
+                unmapped.append(old[o])
+                continue
+            f = final[mapping[o]]
+            ops.append({"op": "delete", "start": f.start, "end": f.end, "blank_before": f.blank_before})
+            stats["deleted"] += 1
+
+        # 남는 새 구간은 바로 앞(또는 바로 뒤) 원문 구간의 번역 옆에 추가
+        extra = news[len(olds):]
+        if not extra:
+            continue
+        if anchor is None:
+            if i1 > 0 and (i1 - 1) in mapping:
+                anchor = ("after", final[mapping[i1 - 1]].end)
+            elif i2 < len(old) and i2 in mapping:
+                anchor = ("before", final[mapping[i2]].start)
+        if anchor is None:
+            unmapped.append(new[extra[0]])
+            continue
+        for n in extra:
+            ops.append({
+                "op": "insert",
+                "at": anchor[1],
+                "side": anchor[0],
+                "source": add_source(n),
+                "blank_before": new[n].blank_before,
+                "blank_after": new[n].blank_after,
+            })
+            stats["inserted"] += 1
+
+    changed_bytes = sum(len(s.encode("utf-8")) for s in sources)
+    stats["source_bytes"] = changed_bytes
+    stats["original_bytes"] = len(new_original.encode("utf-8"))
+    stats["unmapped"] = len(unmapped)
+
+    if not ops and not unmapped:
+        status, reason = "unchanged", "원문 변경 없음"
+    elif unmapped:
+        first = unmapped[0].text.split("\n")[0][:80]
+        status, reason = "full", f"번역에서 대응 구간을 찾을 수 없음 ({len(unmapped)}개, 예: {first})"
+    elif stats["original_bytes"] and changed_bytes / stats["original_bytes"] > max_ratio:
+        status, reason = "full", f"변경 비율 {changed_bytes / stats['original_bytes']:.0%} > {max_ratio:.0%}"
+    else:
+        status, reason = "patchable", f"{len(sources)}개 구간 재번역"
+
+    return {"status": status, "reason": reason, "stats": stats, "ops": ops, "sources": sources}
+
+
+def format_segments(sources: list[str]) -> str:
+    """번역 요청용 구간 목록 (구간 표식 포함)"""
+    return "\n\n".join(f"<<<SEGMENT {i}>>>\n{text}" for i, text in enumerate(sources)) + "\n"
+
+
+def parse_segments(content: str) -> dict[int, str]:
+    """번역 결과에서 구간 표식별 텍스트를 추출합니다."""
+    parts = SEGMENT_MARKER_RE.split(content)
+    return {int(parts[i]): parts[i + 1].strip("\n") for i in range(1, len(parts) - 1, 2)}
+
+
+def apply(plan_data: dict, translated: dict[int, str], final_content: str) -> str:
+    """번역된 구간으로 게시된 final.md를 패치합니다.
+
+    Raises:
+        ValueError: 번역 구간이 없거나 링크가 원문 구간과 다를 때
+    """
+    from generate.generate_markdown import validate_links
+
+    sources = plan_data["sources"]
+    errors = []
+    for i, source in enumerate(sources):
+        if i not in translated or not translated[i].strip():
+            errors.append(f"구간 {i} 번역 없음")
+            continue
+        is_valid, issues = validate_links(source, translated[i])
+        if not is_valid:
+            errors.append(f"구간 {i} 링크 불일치: {'; '.join(issues)}")
+    if errors:
+        raise ValueError("\n".join(errors))
+
+    frontmatter, body = split_frontmatter(final_content)
+    lines = body.split("\n")
+
+    # 뒤쪽 작업부터 적용해야 앞쪽 줄 번호가 유지됨 (같은 위치의 추가는 역순으로 넣어 순서 유지)
+    def position(item):
+        index, op = item
+        return (op["at"] if op["op"] == "insert" else op["start"], index)
+
+    for _, op in sorted(enumerate(plan_data["ops"]), key=position, reverse=True):
+        if op["op"] == "replace":
+            lines[op["start"]:op["end"]] = translated[op["source"]].split("\n")
+        elif op["op"] == "delete":
+            start, end = op["start"], op["end"]
+            # 앞뒤 빈 줄이 겹치지 않도록 구간 앞 빈 줄도 함께 제거
+            if op["blank_before"] and start > 0 and not lines[start - 1].strip() \
+                    and (end >= len(lines) or not lines[end].strip()):
+                start -= 1
+            del lines[start:end]
+        else:
+            new_lines = translated[op["source"]].split("\n")
+            if op["side"] == "after" and op["blank_before"]:
+                new_lines = [""] + new_lines
+            if op["side"] == "before" and op["blank_after"]:
+                new_lines = new_lines + [""]
+            lines[op["at"]:op["at"]] = new_lines
+
+    return frontmatter + "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="원문 변경분만 번역해 게시된 final.md를 패치합니다."
+    )
+    add_profile_argument(parser)
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # plan 명령
+    plan_parser = subparsers.add_parser("plan", help="이전/새 원문 비교 및 패치 계획 생성")
+    plan_parser.add_argument("old_original", type=Path, help="보관된 이전 원문")
+    plan_parser.add_argument("new_original", type=Path, help="새로 가져온 원문")
+    plan_parser.add_argument("final", type=Path, help="게시된 번역 (final.md)")
+    plan_parser.add_argument("-o", "--output", type=Path, required=True, help="계획 파일 (JSON)")
+    plan_parser.add_argument("--segments", type=Path, required=True, help="번역할 구간 파일")
+    plan_parser.add_argument("--max-ratio", type=float, default=MAX_CHANGED_RATIO, help="전체 재번역으로 전환할 변경 비율")
+    plan_parser.add_argument("--json", action="store_true", help="요약을 JSON으로 출력")
+
+    # apply 명령
+    apply_parser = subparsers.add_parser("apply", help="번역된 구간으로 final.md 패치")
+    apply_parser.add_argument("plan", type=Path, help="계획 파일 (JSON)")
+    apply_parser.add_argument("translated", type=Path, help="번역된 구간 파일")
+    apply_parser.add_argument("final", type=Path, help="게시된 번역 (final.md)")
+    apply_parser.add_argument("-o", "--output", type=Path, required=True, help="패치된 출력 파일")
+
+    args = parser.parse_args()
+
+    if args.command == "plan":
+        result = plan(
+            args.old_original.read_text(encoding="utf-8"),
+            args.new_original.read_text(encoding="utf-8"),
+            args.final.read_text(encoding="utf-8"),
+            args.max_ratio,
+        )
+        args.output.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+        args.segments.write_text(format_segments(result["sources"]), encoding="utf-8")
+
+        summary = {"status": result["status"], "reason": result["reason"], **result["stats"]}
+        if args.json:
+            print(json.dumps(summary, ensure_ascii=False))
+        else:
+            print(f"{result['status']}: {result['reason']}")
+            print(
+                f"  changed {summary['changed']}, inserted {summary['inserted']}, deleted {summary['deleted']} "
+                f"({summary['source_bytes']} / {summary['original_bytes']} bytes)"
+            )
+
+    elif args.command == "apply":
+        plan_data = json.loads(args.plan.read_text(encoding="utf-8"))
+        translated = parse_segments(args.translated.read_text(encoding="utf-8"))
+        try:
+            patched = apply(plan_data, translated, args.final.read_text(encoding="utf-8"))
+        except ValueError as e:
+            print(f"FAIL: {e}", file=sys.stderr)
+            sys.exit(1)
+        args.output.write_text(patched, encoding="utf-8")
+        print(f"Patched {len(plan_data['ops'])} segment(s): {args.output}")
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    from lib.profiling import run_main
+    run_main("delta", main)
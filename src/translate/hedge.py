@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+hedge.py - 병렬 번역 후보 (hedged translation)
+리뷰 실패 후 재번역하는 대신 번역 후보 둘(이상)을 동시에 띄우고, 끝나는 대로 각각 검토해
+먼저 통과한 후보를 쓰고 나머지는 취소합니다. 모두 통과하지 못하면 local_review 점수가 나은 후보를 씁니다.
+
+후보는 HEDGE_CANDIDATES에 공백으로 나열합니다 (앞에 쓴 후보가 순차 실행 시 첫 번역):
+- route: 라우팅이 고른 단계 (translate/routing.py decide)
+- escalate: 그다음 단계 (순차 실행이라면 리뷰 실패 후 재번역에 쓸 단계)
+- 단계 이름: ROUTING_TIERS의 해당 단계
+뒤에 "@프롬프트"를 붙이면 그 후보만 다른 프롬프트로 번역합니다 (prompts/ 기준 파일 이름, 예: route@translate-alt.txt).
+같은 (모델, 추론 강도, 프롬프트)로 풀리는 후보는 하나만 씁니다. 가장 무거운 단계에서는 escalate가 route와 같으므로
+라우팅 단계보다 한 단계 가벼운 단계로 대신합니다. 서로 다른 후보가 둘 미만이면 병렬 실행하지 않습니다 (check 명령, main.sh는 순차 재시도).
+후보마다 work_dir/candidate-N 폴더를 Codex 작업 디렉토리(TRANSLATE_AGENT_DIR)로 줍니다.
+
+각 실행의 후보별 번역/검토 시간과 결과를 data/metrics/hedge.jsonl에 기록하고,
+같은 후보들을 순차(번역 → 검토 → 실패 시 다음 후보)로 돌렸을 때보다 줄어든 시간(saved_s)을 함께 남깁니다.
+뒤 후보가 먼저 통과해 앞 후보가 취소되면 앞 후보의 결과와 끝까지 걸린 시간을 모르므로,
+앞 후보가 취소 시점에 리뷰에 실패했다고 보고 계산한 추정값이며 estimated로 표시합니다.
+
+사용법:
+    hedge.py run original.md --headline true --route standard --work-dir DIR --output translated.md [--lang ko] [--json]
+    hedge.py check --route standard
+    hedge.py report [--days 30] [--json]
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+import argparse
+import subprocess
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.metrics import METRICS_DIR, current_run_id  # noqa: E402
+from lib.profiling import add_profile_argument  # noqa: E402
+from lib.watchdog import kill_group  # noqa: E402
+from translate import routing  # noqa: E402
+
+HEDGE_FILE = METRICS_DIR / "hedge.jsonl"
+
+CANDIDATES = os.environ.get("HEDGE_CANDIDATES", "route escalate")
+PROMPTS_DIR = Path(os.environ.get("PROMPTS_DIR") or PROJECT_ROOT / "prompts")
+POLL_INTERVAL = float(os.environ.get("HEDGE_POLL_INTERVAL", 0.5))
+
+TRANSLATE_COMMAND = [str(PROJECT_ROOT / "src" / "translate" / "translate.sh")]
+REVIEW_COMMAND = [str(PROJECT_ROOT / "src" / "review" / "review.sh")]
+
+# 후보 상태
+PENDING = "pending"
+TRANSLATING = "translating"
+REVIEWING = "reviewing"
+PASSED = "passed"
+FAILED_REVIEW = "failed_review"
+TRANSLATE_FAILED = "translate_failed"
+CANCELLED = "cancelled"
+
+
+class HedgeError(ValueError):
+    """HEDGE_CANDIDATES 형식 오류"""
+
+
+@dataclass
+class Candidate:
+    name: str
+    tier: str
+    model: str
+    effort: str
+    prompt: str = ""
+    state: str = PENDING
+    translate_s: Optional[float] = None
+    review_s: Optional[float] = None
+    elapsed_s: Optional[float] = None   # 취소/종료 시점까지 (시작 기준)
+    score: Optional[int] = None
+    output: str = ""
+    review_file: str = ""
+    _process: Optional[subprocess.Popen] = field(default=None, repr=False)
+    _started: float = field(default=0.0, repr=False)
+    _review_started: float = field(default=0.0, repr=False)
+
+
+def parse_candidates(spec: str, route_tier: str, tiers: Optional[dict] = None) -> list[Candidate]:
+    """후보 목록을 만듭니다 (route_tier가 비어 있으면 ROUTING_DEFAULT_TIER)."""
+    tiers = tiers if tiers is not None else routing.parse_tiers()
+    if not routing.ENABLED:
+        route = routing.decide({}, tiers, enabled=False)
+    elif route_tier in tiers:
+        route = {"tier": route_tier, **tiers[route_tier]}
+    else:
+        route = {"tier": routing.DEFAULT_TIER, **tiers.get(routing.DEFAULT_TIER, {"model": "", "effort": ""})}
+
+    # route보다 가벼운 단계 (무거운 것부터, escalate가 다른 후보와 겹칠 때 대신 쓸 단계)
+    names = list(tiers)
+    lower = [{"tier": n, **tiers[n]} for n in reversed(names[:names.index(route["tier"])])] if route["tier"] in names else []
+
+    candidates = []
+    seen = set()
+    for token in spec.split():
+        name, _, prompt = token.partition("@")
+        if name == "route":
+            decision = route
+        elif name == "escalate":
+            decision = routing.escalate(route["tier"], tiers)
+        elif name in tiers:
+            decision = {"tier": name, **tiers[name]}
+        else:
+            raise HedgeError(f"Unknown candidate {name!r} (route | escalate | {' | '.join(tiers)})")
+        if prompt and not Path(prompt).is_absolute():
+            prompt = str(PROMPTS_DIR / prompt)
+        if name == "escalate" and (decision["model"], decision["effort"], prompt) in seen:
+            decision = next(
+                (d for d in lower if (d["model"], d["effort"], prompt) not in seen),
+                decision,
+            )
+        key = (decision["model"], decision["effort"], prompt)
+        if key in seen:
+            continue
+        seen.add(key)
+        candidates.append(Candidate(token, decision["tier"], decision["model"], decision["effort"], prompt))
+    if len(candidates) < 2:
+        raise HedgeError(
+            f"HEDGE_CANDIDATES needs at least two distinct candidates (model, effort, prompt): {spec!r} "
+            f"resolves to {', '.join(f'{c.name}={c.tier}' for c in candidates) or 'nothing'}"
+        )
+    return candidates
+
+
+def review_score(original: str, translated: str) -> int:
+    """local_review 기준 문제 수 (낮을수록 좋음, 모두 리뷰 실패 시 후보 선택용)"""
+    from review.local_review import review
+
+    issue = review(original, translated)
+    return sum(issue.missing.values()) + sum(issue.extra.values()) + len(issue.other) + len(issue.terms)
+
+
+def _passed(review_output: str) -> bool:
+    # main.sh와 같은 판정 (출력 중 PASS로 시작하는 줄)
+    return any(line.startswith("PASS") for line in review_output.splitlines())
+
+
+def _spawn(command: list[str], log_path: Path, env: dict) -> subprocess.Popen:
+    with open(log_path, "wb") as log:
+        return subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, env=env, start_new_session=True)
+
+
+def sequential_estimate(candidates: list[Candidate]) -> tuple[float, bool]:
+    """같은 후보를 순서대로 번역 → 검토했을 때 걸렸을 시간 (값, 추정 여부)
+
+    앞 후보가 통과하면 거기서 끝나고, 실패하면 다음 후보를 이어서 돌립니다.
+    취소된 후보는 그때까지 쓴 시간에 실패한 것으로 봅니다 (추정).
+    """
+    total = 0.0
+    estimated = False
+    for candidate in candidates:
+        if candidate.state == CANCELLED:
+            total += candidate.elapsed_s or 0.0
+            estimated = True
+            continue
+        total += (candidate.translate_s or 0.0) + (candidate.review_s or 0.0)
+        if candidate.state == PASSED:
+            break
+    return total, estimated
+
+
+def run(
+    original_file: Path,
+    headline: str,
+    candidates: list[Candidate],
+    work_dir: Path,
+    translate_command: list[str] = TRANSLATE_COMMAND,
+    review_command: list[str] = REVIEW_COMMAND,
+    poll_interval: float = POLL_INTERVAL,
+) -> dict:
+    """후보를 동시에 번역하고 끝나는 대로 검토해 첫 통과 후보를 고릅니다.
+
+    Returns:
+        {"status": pass | fallback | failed, "winner": 후보 번호 또는 None, "wall_s", "sequential_s",
+         "saved_s", "estimated", "candidates": [...]}
+    """
+    work_dir.mkdir(parents=True, exist_ok=True)
+    start = time.monotonic()
+    for index, candidate in enumerate(candidates):
+        candidate.output = str(work_dir / f"candidate-{index + 1}.md")
+        candidate.review_file = str(work_dir / f"candidate-{index + 1}.review.txt")
+        # 이전 실행의 번역을 이번 후보 결과로 착각하지 않도록 지움
+        Path(candidate.output).unlink(missing_ok=True)
+        agent_dir = work_dir / f"candidate-{index + 1}"
+        agent_dir.mkdir(exist_ok=True)
+        env = dict(
+            os.environ,
+            TRANSLATE_ROUTE=candidate.tier,
+            TRANSLATE_MODEL=candidate.model,
+            TRANSLATE_REASONING_EFFORT=candidate.effort,
+            TRANSLATE_PROMPT_FILE=candidate.prompt,
+            TRANSLATE_AGENT_DIR=str(agent_dir),
+            LLM_STAGE="translate" if index == 0 else "hedge",
+        )
+        candidate._started = time.monotonic()
+        candidate._process = _spawn(
+            translate_command + [str(original_file), headline, candidate.output],
+            work_dir / f"candidate-{index + 1}.log", env,
+        )
+        candidate.state = TRANSLATING
+
+    winner = None
+    try:
+        while winner is None and any(c.state in (TRANSLATING, REVIEWING) for c in candidates):
+            time.sleep(poll_interval)
+            now = time.monotonic()
+            for index, candidate in enumerate(candidates):
+                if candidate.state not in (TRANSLATING, REVIEWING) or candidate._process.poll() is None:
+                    continue
+                if candidate.state == TRANSLATING:
+                    candidate.translate_s = round(now - candidate._started, 3)
+                    if candidate._process.returncode != 0 or not Path(candidate.output).exists():
+                        candidate.state = TRANSLATE_FAILED
+                        candidate.elapsed_s = candidate.translate_s
+                        continue
+                    candidate._review_started = now
+                    candidate._process = _spawn(
+                        review_command + [str(original_file), candidate.output],
+                        Path(candidate.review_file), dict(os.environ),
+                    )
+                    candidate.state = REVIEWING
+                else:
+                    candidate.review_s = round(now - candidate._review_started, 3)
+                    candidate.elapsed_s = round(now - candidate._started, 3)
+                    review_output = Path(candidate.review_file).read_text(encoding="utf-8", errors="replace")
+                    if _passed(review_output):
+                        candidate.state = PASSED
+                        winner = index
+                        break
+                    candidate.state = FAILED_REVIEW
+    finally:
+        # 먼저 통과한 후보가 있거나 중단되면 남은 번역/검토는 프로세스 그룹째 취소
+        now = time.monotonic()
+        for candidate in candidates:
+            if candidate.state in (TRANSLATING, REVIEWING):
+                kill_group(candidate._process)
+                candidate.state = CANCELLED
+                candidate.elapsed_s = round(now - candidate._started, 3)
+
+    wall_s = time.monotonic() - start
+    status = "pass"
+    if winner is None:
+        original = original_file.read_text(encoding="utf-8")
+        scored = []
+        for index, candidate in enumerate(candidates):
+            if candidate.state == FAILED_REVIEW:
+                candidate.score = review_score(original, Path(candidate.output).read_text(encoding="utf-8"))
+                scored.append((candidate.score, index))
+        status = "fallback" if scored else "failed"
+        winner = min(scored)[1] if scored else None
+
+    sequential_s, estimated = sequential_estimate(candidates)
+    return {
+        "status": status,
+        "winner": winner,
+        "wall_s": round(wall_s, 3),
+        "sequential_s": round(sequential_s, 3),
+        "saved_s": round(sequential_s - wall_s, 3),
+        "estimated": estimated,
+        "candidates": [
+            {f.name: getattr(c, f.name) for f in fields(c) if not f.name.startswith("_")} for c in candidates
+        ],
+    }
+
+
+def record_result(result: dict, lang: Optional[str] = None) -> dict:
+    """실행 결과를 hedge.jsonl에 기록합니다."""
+    entry = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "run_id": current_run_id(),
+        "slug": os.environ.get("NEWSAUTO_SLUG", ""),
+        "lang": lang or os.environ.get("CONTENT_LANG", "ko"),
+        **result,
+    }
+
+    METRICS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(HEDGE_FILE, "a", encoding="utf-8") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        fcntl.flock(f, fcntl.LOCK_UN)
+    return entry
+
+
+def load_results(days: Optional[int] = None) -> list[dict]:
+    """기록된 결과를 로드합니다 (days가 주어지면 최근 N일만)."""
+    if not HEDGE_FILE.exists():
+        return []
+
+    since = (datetime.now() - timedelta(days=days)).isoformat() if days else ""
+    entries = []
+    with open(HEDGE_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("ts", "") >= since:
+                entries.append(entry)
+    return entries
+
+
+def summarize(entries: list[dict]) -> dict:
+    """결과별 실행 수, 이긴 후보, 순차 실행 대비 줄어든 시간을 집계합니다."""
+    summary = {
+        "runs": len(entries),
+        "status": {},
+        "wins": {},
+        "cancelled": 0,
+        "wall_s": 0.0,
+        "sequential_s": 0.0,
+        "saved_s": 0.0,
+        "estimated": 0,
+    }
+    for entry in entries:
+        summary["status"][entry["status"]] = summary["status"].get(entry["status"], 0) + 1
+        if entry.get("winner") is not None:
+            name = entry["candidates"][entry["winner"]]["name"]
+            summary["wins"][name] = summary["wins"].get(name, 0) + 1
+        summary["cancelled"] += sum(1 for c in entry["candidates"] if c["state"] == CANCELLED)
+        for key in ("wall_s", "sequential_s", "saved_s"):
+            summary[key] = round(summary[key] + entry.get(key, 0.0), 3)
+        summary["estimated"] += 1 if entry.get("estimated") else 0
+    return summary
+
+
+def format_report(summary: dict) -> str:
+    """집계 결과를 문자열로 변환합니다."""
+    if not summary["runs"]:
+        return "No hedged translations recorded."
+
+    lines = [
+        f"Runs: {summary['runs']} ({', '.join(f'{k} {v}' for k, v in summary['status'].items())})",
+        f"Wins: {', '.join(f'{k} {v}' for k, v in summary['wins'].items()) or '-'}",
+        f"Cancelled candidates: {summary['cancelled']}",
+        f"Wall time: {summary['wall_s'] / 60:.1f}m, sequential retry: {summary['sequential_s'] / 60:.1f}m "
+        f"(saved {summary['saved_s'] / 60:.1f}m)",
+    ]
+    if summary["estimated"]:
+        lines.append(
+            f"  {summary['estimated']} run(s) cancelled an earlier candidate; "
+            "their sequential time assumes it failed when cancelled"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="번역 후보를 동시에 돌려 먼저 리뷰를 통과한 번역을 씁니다."
+    )
+    add_profile_argument(parser)
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # run 명령
+    run_parser = subparsers.add_parser(
+        "run", help="후보 번역/검토 (결과, 고른 후보 단계, 줄어든 초를 한 줄씩 출력, 고를 후보가 없으면 exit 1)"
+    )
+    run_parser.add_argument("content_file", type=Path, help="번역할 원문 파일")
+    run_parser.add_argument("--headline", choices=["true", "false"], required=True, help="헤드라인 유무")
+    run_parser.add_argument("--route", default="", help="라우팅이 고른 단계 (route 후보)")
+    run_parser.add_argument("--candidates", default=CANDIDATES, help=f"후보 목록 (기본: {CANDIDATES})")
+    run_parser.add_argument("--work-dir", type=Path, required=True, help="후보 번역/검토 결과 디렉토리")
+    run_parser.add_argument("--output", type=Path, required=True, help="고른 번역을 쓸 파일")
+    run_parser.add_argument("--lang", help="번역 대상 언어 (기본: CONTENT_LANG)")
+    run_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    # check 명령
+    check_parser = subparsers.add_parser(
+        "check", help="서로 다른 후보가 둘 이상인지 확인 (후보를 한 줄씩 출력, 아니면 exit 1)"
+    )
+    check_parser.add_argument("--route", default="", help="라우팅이 고른 단계 (route 후보)")
+    check_parser.add_argument("--candidates", default=CANDIDATES, help=f"후보 목록 (기본: {CANDIDATES})")
+
+    # report 명령
+    report_parser = subparsers.add_parser("report", help="결과/이긴 후보/줄어든 시간 집계")
+    report_parser.add_argument("--days", type=int, help="최근 N일만 집계")
+    report_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        try:
+            candidates = parse_candidates(args.candidates, args.route)
+        except (HedgeError, routing.RoutingError) as e:
+            print(f"Hedge failed: {e}", file=sys.stderr)
+            sys.exit(1)
+        result = run(args.content_file, args.headline, candidates, args.work_dir)
+        record_result(result, args.lang)
+        if result["winner"] is not None:
+            chosen = result["candidates"][result["winner"]]
+            args.output.write_bytes(Path(chosen["output"]).read_bytes())
+        if args.json:
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+        else:
+            chosen_tier = result["candidates"][result["winner"]]["tier"] if result["winner"] is not None else ""
+            print(result["status"])
+            print(chosen_tier)
+            print(f"{result['saved_s']:.1f}")
+        if result["status"] == "failed":
+            sys.exit(1)
+
+    elif args.command == "check":
+        try:
+            candidates = parse_candidates(args.candidates, args.route)
+        except (HedgeError, routing.RoutingError) as e:
+            print(f"Hedge skipped: {e}", file=sys.stderr)
+            sys.exit(1)
+        for candidate in candidates:
+            print(f"{candidate.name}\t{candidate.tier}\t{candidate.model}\t{candidate.effort}\t{candidate.prompt}")
+
+    elif args.command == "report":
+        summary = summarize(load_results(args.days))
+        if args.json:
+            print(json.dumps(summary, indent=2, ensure_ascii=False))
+        else:
+            print(format_report(summary))
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    from lib.profiling import run_main
+    run_main("hedge", main)
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+routing.py - 번역 모델 라우팅
+이슈(또는 부분 재번역 구간)의 크기와 성격에 따라 Codex 모델과 추론 강도를 고릅니다.
+"not much happened" 같은 조용한 날은 가벼운 설정으로 빨리 끝내고, 큰 헤드라인 날은 기존 설정 이상을 씁니다.
+
+신호 (fetch_page.validate_content와 같은 값 + 추정 토큰 수):
+- headline: 헤드라인 유무 (true | false)
+- tokens: 번역할 원문의 추정 토큰 수 (llm_ledger.estimate_tokens)
+- length: 원문 글자 수 (content_length)
+- links: 원문 링크 수 (link_count)
+
+단계(tier)는 ROUTING_TIERS에 가벼운 것부터 "이름=모델:추론강도"로 나열합니다.
+모델이나 추론 강도를 비우면 CODEX_MODEL / CODEX_REASONING_EFFORT를 씁니다.
+리뷰에 실패해 재번역할 때는 다음 단계로 올립니다 (마지막 단계면 그대로).
+
+규칙은 ROUTING_RULES에 "단계: 조건 조건; 단계: 조건" 형식으로 쓰며, 위에서부터 조건을 모두 만족하는 첫 규칙을 씁니다.
+조건은 "신호 연산자 값" (연산자: < <= > >= = !=), 맞는 규칙이 없으면 ROUTING_DEFAULT_TIER.
+
+결정은 data/metrics/routing.jsonl에 신호와 함께 기록합니다 (report로 단계별 분포/승격 횟수 집계).
+단계별 지연 시간/토큰은 LLM 장부에서 `ledger report --by route,stage`로 봅니다.
+
+사용법:
+    routing.py decide original.md --headline false --links 40 [--stage translate] [--lang ko] [--json]
+    routing.py escalate --tier light [--stage retranslate] [--lang ko]
+    routing.py report [--days 30] [--json]
+"""
+
+import os
+import re
+import sys
+import json
+import fcntl
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib.metrics import METRICS_DIR, current_run_id  # noqa: E402
+from lib.llm_ledger import estimate_tokens  # noqa: E402
+from lib.profiling import add_profile_argument  # noqa: E402
+
+ROUTING_FILE = METRICS_DIR / "routing.jsonl"
+
+ENABLED = os.environ.get("ROUTING_ENABLED", "true") == "true"
+TIERS = os.environ.get("ROUTING_TIERS", "light=:low standard=: heavy=:high")
+RULES = os.environ.get("ROUTING_RULES", "light: headline=false tokens<40000; heavy: headline=true tokens>=80000")
+DEFAULT_TIER = os.environ.get("ROUTING_DEFAULT_TIER", "standard")
+
+CONDITION_RE = re.compile(r"^(headline|tokens|length|links)(<=|>=|!=|<|>|=)(\S+)$")
+OPERATORS = {
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+}
+
+
+class RoutingError(ValueError):
+    """ROUTING_TIERS / ROUTING_RULES 형식 오류"""
+
+
+def parse_tiers(spec: str = TIERS) -> dict[str, dict]:
+    """ "이름=모델:추론강도 ..." → {이름: {"model", "effort"}} (가벼운 것부터 순서 유지)"""
+    tiers = {}
+    for item in spec.split():
+        name, sep, value = item.partition("=")
+        if not sep or not name:
+            raise RoutingError(f"Invalid tier: {item!r} (expected name=model:effort)")
+        model, _, effort = value.partition(":")
+        tiers[name] = {
+            "model": model or os.environ.get("CODEX_MODEL", ""),
+            "effort": effort or os.environ.get("CODEX_REASONING_EFFORT", ""),
+        }
+    if not tiers:
+        raise RoutingError("ROUTING_TIERS is empty")
+    return tiers
+
+
+def _parse_value(key: str, raw: str):
+    if key == "headline":
+        if raw not in ("true", "false"):
+            raise RoutingError(f"headline must be true or false: {raw!r}")
+        return raw == "true"
+    try:
+        return int(raw)
+    except ValueError:
+        raise RoutingError(f"{key} must be an integer: {raw!r}") from None
+
+
+def parse_rules(spec: str, tiers: dict[str, dict]) -> list[dict]:
+    """ "단계: 조건 조건; ..." → [{"tier", "conditions": [(신호, 연산자, 값)], "text"}]"""
+    rules = []
+    for text in filter(None, (part.strip() for part in spec.split(";"))):
+        tier, sep, body = text.partition(":")
+        tier = tier.strip()
+        if not sep or tier not in tiers:
+            raise RoutingError(f"Unknown tier in rule: {text!r}")
+        conditions = []
+        for token in body.split():
+            match = CONDITION_RE.match(token)
+            if not match:
+                raise RoutingError(f"Invalid condition {token!r} in rule {text!r}")
+            key, op, raw = match.groups()
+            conditions.append((key, op, _parse_value(key, raw)))
+        rules.append({"tier": tier, "conditions": conditions, "text": text})
+    return rules
+
+
+def collect_signals(content: str, has_headline: bool, link_count: int) -> dict:
+    """번역할 원문에서 라우팅 신호를 만듭니다."""
+    return {
+        "headline": has_headline,
+        "tokens": estimate_tokens(content),
+        "length": len(content),
+        "links": link_count,
+    }
+
+
+def decide(signals: dict, tiers: Optional[dict] = None, rules: Optional[list] = None,
+           default: str = DEFAULT_TIER, enabled: bool = ENABLED) -> dict:
+    """신호에 맞는 단계를 고릅니다.
+
+    Returns:
+        {"tier", "model", "effort", "rule"} (rule: 맞은 규칙, 기본 단계면 "default")
+    """
+    tiers = tiers if tiers is not None else parse_tiers()
+    if not enabled:
+        return {
+            "tier": "off",
+            "model": os.environ.get("CODEX_MODEL", ""),
+            "effort": os.environ.get("CODEX_REASONING_EFFORT", ""),
+            "rule": "disabled",
+        }
+    rules = rules if rules is not None else parse_rules(RULES, tiers)
+    if default not in tiers:
+        raise RoutingError(f"Unknown ROUTING_DEFAULT_TIER: {default!r}")
+
+    for rule in rules:
+        if all(OPERATORS[op](signals[key], value) for key, op, value in rule["conditions"]):
+            return {"tier": rule["tier"], **tiers[rule["tier"]], "rule": rule["text"]}
+    return {"tier": default, **tiers[default], "rule": "default"}
+
+
+def escalate(tier: str, tiers: Optional[dict] = None, enabled: bool = ENABLED) -> dict:
+    """리뷰 실패 후 재번역에 쓸 다음 단계 (마지막 단계거나 알 수 없는 단계면 가장 무거운 단계)"""
+    tiers = tiers if tiers is not None else parse_tiers()
+    if not enabled:
+        return decide({}, tiers, enabled=False)
+    names = list(tiers)
+    index = names.index(tier) + 1 if tier in names else len(names) - 1
+    name = names[min(index, len(names) - 1)]
+    return {"tier": name, **tiers[name], "rule": f"escalated from {tier}"}
+
+
+def record_decision(stage: str, decision: dict, signals: Optional[dict] = None,
+                    lang: Optional[str] = None) -> dict:
+    """라우팅 결정을 routing.jsonl에 기록합니다."""
+    entry = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "run_id": current_run_id(),
+        "slug": os.environ.get("NEWSAUTO_SLUG", ""),
+        "lang": lang or os.environ.get("CONTENT_LANG", "ko"),
+        "stage": stage,
+        **decision,
+    }
+    if signals:
+        entry["signals"] = signals
+
+    METRICS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(ROUTING_FILE, "a", encoding="utf-8") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        fcntl.flock(f, fcntl.LOCK_UN)
+    return entry
+
+
+def load_decisions(days: Optional[int] = None) -> list[dict]:
+    """기록된 결정을 로드합니다 (days가 주어지면 최근 N일만)."""
+    if not ROUTING_FILE.exists():
+        return []
+
+    since = (datetime.now() - timedelta(days=days)).isoformat() if days else ""
+    entries = []
+    with open(ROUTING_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("ts", "") >= since:
+                entries.append(entry)
+    return entries
+
+
+def summarize(entries: list[dict]) -> list[dict]:
+    """단계별 첫 결정 수, 승격 수, 토큰 범위를 집계합니다."""
+    rows: dict[str, dict] = {}
+    for entry in entries:
+        row = rows.setdefault(entry["tier"], {
+            "tier": entry["tier"], "routed": 0, "escalated_to": 0, "min_tokens": None, "max_tokens": 0,
+        })
+        if entry.get("stage") == "retranslate":
+            row["escalated_to"] += 1
+            continue
+        row["routed"] += 1
+        tokens = (entry.get("signals") or {}).get("tokens")
+        if tokens is not None:
+            row["min_tokens"] = tokens if row["min_tokens"] is None else min(row["min_tokens"], tokens)
+            row["max_tokens"] = max(row["max_tokens"], tokens)
+    return list(rows.values())
+
+
+def format_report(rows: list[dict]) -> str:
+    """집계 결과를 표 형식 문자열로 변환합니다."""
+    if not rows:
+        return "No routing decisions recorded."
+
+    lines = [f"{'tier':<10} {'routed':>6} {'escalated':>9} {'tokens':>17}"]
+    for row in rows:
+        tokens = f"{row['min_tokens']}-{row['max_tokens']}" if row["min_tokens"] is not None else "-"
+        lines.append(f"{row['tier']:<10} {row['routed']:>6} {row['escalated_to']:>9} {tokens:>17}")
+    return "\n".join(lines)
+
+
+def _print_decision(decision: dict, as_json: bool):
+    if as_json:
+        print(json.dumps(decision, ensure_ascii=False))
+    else:
+        print(decision["tier"])
+        print(decision["model"])
+        print(decision["effort"])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="이슈 크기/성격에 따라 번역 모델과 추론 강도를 고릅니다."
+    )
+    add_profile_argument(parser)
+    subparsers = parser.add_subparsers(dest="command", help="명령")
+
+    # decide 명령
+    decide_parser = subparsers.add_parser("decide", help="번역할 원문의 단계 결정 (단계, 모델, 추론 강도를 한 줄씩 출력)")
+    decide_parser.add_argument("content_file", type=Path, help="번역할 원문 파일")
+    decide_parser.add_argument("--headline", choices=["true", "false"], required=True, help="헤드라인 유무")
+    decide_parser.add_argument("--links", type=int, default=0, help="원문 링크 수")
+    decide_parser.add_argument("--stage", default="translate", help="기록할 단계 이름 (기본: translate)")
+    decide_parser.add_argument("--lang", help="번역 대상 언어 (기본: CONTENT_LANG)")
+    decide_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    # escalate 명령
+    escalate_parser = subparsers.add_parser("escalate", help="리뷰 실패 후 재번역에 쓸 다음 단계")
+    escalate_parser.add_argument("--tier", required=True, help="현재 단계")
+    escalate_parser.add_argument("--stage", default="retranslate", help="기록할 단계 이름 (기본: retranslate)")
+    escalate_parser.add_argument("--lang", help="번역 대상 언어 (기본: CONTENT_LANG)")
+    escalate_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    # report 명령
+    report_parser = subparsers.add_parser("report", help="단계별 결정/승격 집계")
+    report_parser.add_argument("--days", type=int, help="최근 N일만 집계")
+    report_parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "decide":
+            content = args.content_file.read_text(encoding="utf-8")
+            signals = collect_signals(content, args.headline == "true", args.links)
+            decision = decide(signals)
+            record_decision(args.stage, decision, signals, args.lang)
+            _print_decision(decision, args.json)
+
+        elif args.command == "escalate":
+            decision = escalate(args.tier)
+            record_decision(args.stage, decision, lang=args.lang)
+            _print_decision(decision, args.json)
+
+        elif args.command == "report":
+            rows = summarize(load_decisions(args.days))
+            if args.json:
+                print(json.dumps(rows, indent=2, ensure_ascii=False))
+            else:
+                print(format_report(rows))
+
+        else:
+            parser.print_help()
+    except (RoutingError, OSError) as e:
+        print(f"Routing failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    from lib.profiling import run_main
+    run_main("routing", main)
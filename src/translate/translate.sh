@@ -3,12 +3,25 @@
 # smol.ai 한국어 뉴스 자동 발행 시스템
 #
 # 사용법: ./translate.sh <content_file> <has_headline> [output_file]
+#
+# LLM_STAGE: LLM 장부에 기록할 단계 이름 (translate | retranslate | delta | hedge, 기본: translate)
+# CONTENT_LANG: 번역 대상 언어 (기본: ko, 그 외는 prompts/<lang>/ 프롬프트 사용)
+# TRANSLATE_MODE: full (기본, 문서 전체) | delta (<<<SEGMENT N>>> 구간만 번역, translate-delta.txt)
+# TRANSLATE_MODEL / TRANSLATE_REASONING_EFFORT: 라우팅이 고른 모델/추론 강도 (없으면 CODEX_MODEL / CODEX_REASONING_EFFORT)
+# TRANSLATE_ROUTE: 라우팅 단계 이름 (LLM 장부에 기록, translate/routing.py)
+# TRANSLATE_PROMPT_FILE: full 모드 프롬프트 대신 쓸 파일 (한국어 기준 경로, 병렬 후보의 프롬프트 변형, translate/hedge.py)
+# TRANSLATE_AGENT_DIR: Codex 작업 디렉토리 (에이전트 모드의 <lang>.md 위치, 기본: 원문 파일 폴더, 병렬 후보는 후보별 폴더)
 
 set -e
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$SCRIPT_DIR/../lib/config.sh"
 source "$SCRIPT_DIR/../lib/logging.sh"
+source "$SCRIPT_DIR/../lib/metrics.sh"
+source "$SCRIPT_DIR/../lib/tracing.sh"
+
+trace_script_begin translate.sh
+trap 'trace_script_end $?' EXIT
 
 # 인자 확인
 if [[ $# -lt 2 ]]; then
@@ -68,13 +81,21 @@ if [[ ! -f "$content_file" ]]; then
     exit 1
 fi
 
-# 프롬프트 선택
-if [[ "$has_headline" == "true" ]]; then
-    prompt_file="$TRANSLATE_WITH_LINKS_PROMPT"
-    log_info "Using prompt: translate-with-links.txt (headline day)"
+# 프롬프트 선택 (언어별 프롬프트 세트)
+content_lang="${CONTENT_LANG:-ko}"
+translate_mode="${TRANSLATE_MODE:-full}"
+if [[ "$translate_mode" == "delta" ]]; then
+    prompt_file=$(lang_prompt_file "$content_lang" "$TRANSLATE_DELTA_PROMPT")
+    log_info "Using prompt: translate-delta.txt (changed segments, $content_lang)"
+elif [[ -n "${TRANSLATE_PROMPT_FILE:-}" ]]; then
+    prompt_file=$(lang_prompt_file "$content_lang" "$TRANSLATE_PROMPT_FILE")
+    log_info "Using prompt: $(basename "$prompt_file") (prompt variant, $content_lang)"
+elif [[ "$has_headline" == "true" ]]; then
+    prompt_file=$(lang_prompt_file "$content_lang" "$TRANSLATE_WITH_LINKS_PROMPT")
+    log_info "Using prompt: translate-with-links.txt (headline day, $content_lang)"
 else
-    prompt_file="$TRANSLATE_NO_HEADLINE_PROMPT"
-    log_info "Using prompt: translate-no-headline.txt (no headline)"
+    prompt_file=$(lang_prompt_file "$content_lang" "$TRANSLATE_NO_HEADLINE_PROMPT")
+    log_info "Using prompt: translate-no-headline.txt (no headline, $content_lang)"
 fi
 
 # 프롬프트 파일 확인
@@ -89,15 +110,24 @@ if [[ ! -x "$CODEX_BIN" ]]; then
     exit 1
 fi
 
+# config.sh가 CODEX_MODEL을 다시 설정하므로 라우팅 결과는 별도 변수로 받음
+codex_model="${TRANSLATE_MODEL:-$CODEX_MODEL}"
+codex_effort="${TRANSLATE_REASONING_EFFORT:-$CODEX_REASONING_EFFORT}"
+route="${TRANSLATE_ROUTE:-}"
+
 log_info "Starting translation with Codex CLI"
-log_info "Model: $CODEX_MODEL"
-log_info "Reasoning Effort: $CODEX_REASONING_EFFORT"
+log_info "Model: $codex_model"
+log_info "Reasoning Effort: $codex_effort"
+if [[ -n "$route" ]]; then
+    log_info "Route: $route"
+fi
 
 # 임시 파일에 결합된 프롬프트 저장
 temp_prompt=$(mktemp)
 temp_last_message=$(mktemp)
 temp_logs=$(mktemp)
-trap 'rm -f "$temp_prompt" "$temp_last_message" "$temp_logs"' EXIT
+temp_reason=$(mktemp)
+trap 'exit_code=$?; rm -f "$temp_prompt" "$temp_last_message" "$temp_logs" "$temp_reason"; trace_script_end $exit_code' EXIT
 
 cat "$prompt_file" > "$temp_prompt"
 echo "" >> "$temp_prompt"
@@ -105,26 +135,83 @@ echo "## 원문 (아래 내용을 번역):" >> "$temp_prompt"
 echo "" >> "$temp_prompt"
 cat "$content_file" >> "$temp_prompt"
 
+# Codex가 에이전트 모드로 만들 수 있는 <lang>.md 파일 (예: ko.md)
+# 병렬 후보는 후보마다 다른 작업 디렉토리를 받아 서로의 <lang>.md를 감시하거나 가져가지 않음
+codex_dir_args=()
+if [[ -n "${TRANSLATE_AGENT_DIR:-}" ]]; then
+    output_dir="$TRANSLATE_AGENT_DIR"
+    mkdir -p "$output_dir"
+    codex_dir_args=(--cd "$output_dir")
+else
+    output_dir=$(dirname "$content_file")
+fi
+lang_file="$output_dir/$content_lang.md"
+# 이전 실행이 남긴 <lang>.md를 이번 결과로 착각하지 않도록 지움
+rm -f "$lang_file"
+
 # Codex 실행 (마지막 메시지를 파일로 저장)
-if ! "$CODEX_BIN" exec --full-auto \
+# 일시적 실패는 백오프 후 재시도, 연속 실패가 쌓이면 브레이커가 열려 호출하지 않음 (lib/resilience.py)
+# 제한 시간(CODEX_TIMEOUT)/무진행(CODEX_STALL_TIMEOUT)/실패 신호는 감시 실행이 조기 종료 (lib/watchdog.py)
+prompt_bytes=$(metrics_file_bytes "$temp_prompt")
+metrics_stage_start translate.codex
+codex_start_ms=$(metrics_now_ms)
+codex_exit_code=0
+newsauto resilience exec codex --stdin "$temp_prompt" --output "$temp_logs" \
+    --watch "$lang_file" --reason-file "$temp_reason" -- \
+    "$CODEX_BIN" exec --full-auto \
     --skip-git-repo-check \
+    "${codex_dir_args[@]}" \
     --color never \
-    -m "$CODEX_MODEL" \
-    -c "reasoning_effort=\"$CODEX_REASONING_EFFORT\"" \
+    -m "$codex_model" \
+    -c "reasoning_effort=\"$codex_effort\"" \
     --output-last-message "$temp_last_message" \
-    - < "$temp_prompt" > "$temp_logs" 2>&1; then
-    log_error "Codex translation failed"
+    - || codex_exit_code=$?
+codex_wall_ms=$(( $(metrics_now_ms) - codex_start_ms ))
+
+# 감시 실행이 조기 종료했으면 원인 (예: "stall: no output for 300s")
+watchdog_reason=$(head -1 "$temp_reason")
+watchdog_fields=()
+if [[ -n "$watchdog_reason" ]]; then
+    watchdog_fields=(watchdog="${watchdog_reason%%:*}")
+fi
+
+route_fields=()
+if [[ -n "$route" ]]; then
+    route_fields=(route="$route" reasoning_effort="$codex_effort")
+fi
+
+metrics_stage_end translate.codex "$codex_exit_code" \
+    prompt_bytes="$prompt_bytes" \
+    input_bytes="$(metrics_file_bytes "$content_file")" \
+    output_bytes="$(metrics_file_bytes "$temp_last_message")" \
+    llm_wall_ms="$codex_wall_ms" \
+    "${watchdog_fields[@]}" \
+    "${route_fields[@]}"
+
+# LLM 장부 기록 (단계, 모델, 추정 토큰, 지연 시간, 결과)
+llm_stage="${LLM_STAGE:-translate}"
+record_codex_call() {
+    llm_ledger_record "$llm_stage" "$codex_model" "$temp_prompt" "$1" \
+        "$codex_wall_ms" "$2" "$codex_effort" "$route"
+}
+
+if [[ $codex_exit_code -ne 0 ]]; then
+    record_codex_call "$temp_last_message" error
+    if [[ -n "$watchdog_reason" ]]; then
+        log_error "Codex translation stopped by watchdog ($watchdog_reason)"
+    else
+        log_error "Codex translation failed"
+    fi
     cat "$temp_logs" >&2
     exit 1
 fi
 
-# Codex가 ko.md 파일을 생성했는지 확인 (에이전트 모드 동작)
-output_dir=$(dirname "$content_file")
-ko_file="$output_dir/ko.md"
-
-if [[ -f "$ko_file" ]]; then
-    log_info "Codex created ko.md file, using that instead of last message"
-    extracted_content=$(cat "$ko_file")
+# Codex가 <lang>.md 파일(예: ko.md)을 생성했는지 확인 (에이전트 모드 동작)
+codex_output_file="$temp_last_message"
+if [[ -f "$lang_file" ]]; then
+    codex_output_file="$lang_file"
+    log_info "Codex created $content_lang.md file, using that instead of last message"
+    extracted_content=$(cat "$lang_file")
 else
     # Codex 결과 정리: 불필요한 코드펜스(```)로 감싸진 경우 제거
     extracted_content=$(python3 - "$temp_last_message" <<'PY'
@@ -142,12 +229,20 @@ PY
 )
 fi
 
-# 출력 검증
-if ! validate_translation_output "$extracted_content"; then
+# 출력 검증 (delta: 구간 표식만 확인, 구간별 링크는 delta.py apply에서 검증)
+if [[ "$translate_mode" == "delta" ]]; then
+    if ! grep -qE '^<<<SEGMENT [0-9]+>>>' <<< "$extracted_content"; then
+        record_codex_call "$codex_output_file" invalid
+        log_error "번역 출력 검증 실패: 구간 표식(<<<SEGMENT N>>>) 없음"
+        exit 2
+    fi
+elif ! validate_translation_output "$extracted_content"; then
+    record_codex_call "$codex_output_file" invalid
     log_error "번역 출력 검증 실패"
     # exit 2 = 검증 실패 (exit 1 = Codex 실행 실패와 구분)
     exit 2
 fi
+record_codex_call "$codex_output_file" ok
 
 # 출력
 if [[ -n "$output_file" ]]; then
@@ -0,0 +1,48 @@
+"""
+test_check_links.py - 외부 링크 생존 확인 테스트
+속도 제한/브레이커로 요청하지 못한 링크가 깨진 링크로 경고되거나 캐시되지 않는지 확인합니다.
+"""
+
+import sys
+from pathlib import Path
+from urllib.error import URLError
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from crawler import check_links  # noqa: E402
+from lib.ratelimit import RateLimited  # noqa: E402
+from lib.resilience import CircuitOpenError  # noqa: E402
+
+THROTTLED = "https://raw.githubusercontent.com/org/repo/main/README.md"
+GONE = "https://gone.example/page"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_links, "CACHE_FILE", tmp_path / "cache.json")
+    monkeypatch.setattr(check_links, "LOCK_FILE", tmp_path / "cache.lock")
+    monkeypatch.setattr(check_links, "LINKCHECK_DIR", tmp_path)
+
+
+@pytest.mark.parametrize("error", [
+    RateLimited("raw.githubusercontent.com", 30),
+    CircuitOpenError("raw.githubusercontent.com", 60),
+])
+def test_throttled_link_is_unchecked_and_not_cached(monkeypatch, error):
+    def request(url, method, timeout):
+        if url == THROTTLED:
+            raise error
+        raise URLError("Name or service not known")
+
+    monkeypatch.setattr(check_links, "_request", request)
+    report = check_links.check_links([THROTTLED, GONE], host_interval=0)
+
+    status = {entry["url"]: entry["status"] for entry in report["links"]}
+    assert status == {THROTTLED: check_links.UNCHECKED, GONE: check_links.BROKEN}
+
+    warnings = "\n".join(check_links.format_warnings(report))
+    assert GONE in warnings and THROTTLED not in warnings
+    assert list(check_links.load_cache()) == [GONE]
@@ -0,0 +1,69 @@
+"""
+test_hedge.py - 병렬 번역 후보 테스트
+후보마다 translate.sh처럼 LLM 장부를 기록하는 가짜 번역으로 hedge.run을 돌려
+모든 후보의 호출이 장부에 남는지 확인합니다.
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib import llm_ledger  # noqa: E402
+from translate import hedge, routing  # noqa: E402
+
+# translate.sh와 같이 LLM_STAGE/TRANSLATE_ROUTE로 장부를 기록 (기록 실패 시 번역 실패로 처리)
+FAKE_TRANSLATE = textwrap.dedent("""
+    import os, sys, subprocess
+    with open(sys.argv[3], "w") as f:
+        f.write(open(sys.argv[1]).read())
+    subprocess.run([
+        sys.executable, os.environ["LEDGER_SCRIPT"], "record",
+        "--stage", os.environ["LLM_STAGE"],
+        "--model", os.environ["TRANSLATE_MODEL"],
+        "--route", os.environ["TRANSLATE_ROUTE"],
+        "--input-file", sys.argv[1],
+        "--output-file", sys.argv[3],
+        "--latency-ms", "10",
+        "--outcome", "ok",
+    ], check=True)
+""")
+FAKE_REVIEW = "print('FAIL: 기타 검증 실패')\n"
+
+
+def test_hedged_run_records_one_ledger_row_per_candidate(tmp_path, monkeypatch):
+    metrics_dir = tmp_path / "metrics"
+    monkeypatch.setenv("METRICS_DIR", str(metrics_dir))
+    monkeypatch.setenv("LEDGER_SCRIPT", str(PROJECT_ROOT / "src" / "lib" / "llm_ledger.py"))
+    monkeypatch.setattr(llm_ledger, "LEDGER_FILE", metrics_dir / "llm_ledger.jsonl")
+
+    translate = tmp_path / "translate.py"
+    review = tmp_path / "review.py"
+    translate.write_text(FAKE_TRANSLATE)
+    review.write_text(FAKE_REVIEW)
+    original = tmp_path / "original.md"
+    original.write_text("# Title\n\nBody\n", encoding="utf-8")
+
+    candidates = hedge.parse_candidates("route escalate", routing.DEFAULT_TIER, routing.parse_tiers())
+    # 모든 후보가 검토에서 실패하므로 취소되지 않고 끝까지 번역됨
+    result = hedge.run(
+        original, "true", candidates, tmp_path / "work",
+        translate_command=[sys.executable, str(translate)],
+        review_command=[sys.executable, str(review)],
+        poll_interval=0.01,
+    )
+
+    assert result["status"] == "fallback"
+    assert all(c["state"] == hedge.FAILED_REVIEW for c in result["candidates"])
+
+    entries = llm_ledger.load_entries()
+    assert len(entries) == len(candidates)
+    assert [e["stage"] for e in entries].count("translate") == 1
+    assert sorted(e["route"] for e in entries) == sorted(c.tier for c in candidates)
+
+    rows = {row["stage"]: row["calls"] for row in llm_ledger.aggregate(entries, ["stage"])}
+    assert rows == {"translate": 1, "hedge": len(candidates) - 1}
+    report = llm_ledger.format_report(llm_ledger.aggregate(entries, ["stage"]), ["stage"])
+    assert report.splitlines()[1].startswith("hedge")
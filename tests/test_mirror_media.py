@@ -0,0 +1,65 @@
+"""
+test_mirror_media.py - 미디어 미러링 테스트
+병렬 다운로드가 이슈 미디어 예산(max_total_bytes)을 넘지 않는지 확인합니다.
+"""
+
+import sys
+import time
+import hashlib
+from pathlib import Path
+from urllib.error import URLError
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from crawler import mirror_media  # noqa: E402
+
+MB = 1024 * 1024
+
+
+@pytest.fixture(autouse=True)
+def media_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(mirror_media, "MEDIA_DIR", tmp_path)
+    monkeypatch.setattr(mirror_media, "OBJECTS_DIR", tmp_path / "objects")
+    monkeypatch.setattr(mirror_media, "INDEX_FILE", tmp_path / "index.json")
+    monkeypatch.setattr(mirror_media, "LOCK_FILE", tmp_path / "index.lock")
+
+
+def fake_download(declared: int, size: int, fail: set = frozenset()):
+    """Content-Length가 declared(0이면 없음)인 응답을 size바이트 받는 것처럼 동작하는 download"""
+    def download(url, max_bytes, timeout, reserve=None):
+        if reserve:
+            reserve(declared or max_bytes)
+        time.sleep(0.05)
+        if url in fail:
+            raise URLError("connection reset")
+        return {"sha256": hashlib.sha256(url.encode()).hexdigest(), "ext": "png", "bytes": size, "stored": True}
+    return download
+
+
+@pytest.mark.parametrize("declared", [MB, 0])
+def test_parallel_downloads_stay_within_budget(monkeypatch, declared):
+    monkeypatch.setattr(mirror_media, "download", fake_download(declared, MB))
+    urls = [f"https://cdn.example/{i}.png" for i in range(8)]
+
+    report = mirror_media.fetch_media(urls, max_parallel=8, per_host=8, max_bytes=MB, max_total_bytes=2 * MB)
+
+    stats = report["stats"]
+    assert stats["mirrored"] == 2
+    assert stats["downloaded_bytes"] <= 2 * MB
+    skipped = [e for e in report["media"] if e["status"] == mirror_media.SKIPPED]
+    assert len(skipped) == 6 and "budget" in skipped[0]["error"]
+
+
+def test_failed_download_releases_reservation(monkeypatch):
+    urls = [f"https://cdn.example/{i}.png" for i in range(3)]
+    # 실패한 첫 다운로드가 예산 전체를 예약했다가 돌려주므로 나머지는 받음
+    monkeypatch.setattr(mirror_media, "download", fake_download(0, MB // 2, fail={urls[0]}))
+
+    report = mirror_media.fetch_media(urls, max_parallel=1, max_bytes=2 * MB, max_total_bytes=2 * MB)
+
+    status = [e["status"] for e in report["media"]]
+    assert status == [mirror_media.FAILED, mirror_media.MIRRORED, mirror_media.MIRRORED]
+    assert report["stats"]["downloaded_bytes"] == MB
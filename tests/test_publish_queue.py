@@ -0,0 +1,195 @@
+"""
+test_publish_queue.py - 발행 큐 테스트
+로컬 bare 원격과 가짜 gh(GH_BIN)로 플러시 → 푸시 → PR 생성 흐름을 확인합니다.
+"""
+
+import sys
+import json
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from lib import artifacts  # noqa: E402
+from publish import publish_queue  # noqa: E402
+from publish.git_publish import PublishError  # noqa: E402
+from state import state_manager  # noqa: E402
+
+# 호출 인자를 GH_LOG에 남기고, GH_FAIL 파일이 있으면 실패하는 가짜 gh
+FAKE_GH = """#!/bin/sh
+printf '%s\\n' "$@" > "$GH_LOG.$(date +%s%N)"
+if [ -e "$GH_FAIL" ]; then
+    echo "HTTP 502: Bad Gateway" >&2
+    exit 1
+fi
+echo "https://example.test/pull/1"
+"""
+
+
+def git(*args: str, cwd: Path = None) -> str:
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    """큐/상태/산출물 경로를 임시 디렉토리로 돌리고 main 브랜치가 있는 bare 원격을 만듭니다."""
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(publish_queue, "DATA_DIR", data_dir)
+    monkeypatch.setattr(publish_queue, "QUEUE_FILE", data_dir / "publish_queue.json")
+    monkeypatch.setattr(publish_queue, "LOCK_FILE", data_dir / "publish_queue.lock")
+    monkeypatch.setattr(state_manager, "DATA_DIR", data_dir)
+    monkeypatch.setattr(state_manager, "STATE_FILE", data_dir / "processed.json")
+    monkeypatch.setattr(state_manager, "LOCK_FILE", data_dir / "processed.lock")
+    monkeypatch.setattr(artifacts, "ARTIFACTS_DIR", data_dir / "artifacts")
+
+    remote = tmp_path / "web.git"
+    seed = tmp_path / "seed"
+    git("init", "--bare", "-b", "main", str(remote))
+    git("init", "-b", "main", str(seed))
+    (seed / "README.md").write_text("web\n")
+    git("add", "README.md", cwd=seed)
+    git("-c", "user.name=seed", "-c", "user.email=seed@test", "commit", "-m", "init", cwd=seed)
+    git("push", str(remote), "main", cwd=seed)
+
+    gh = tmp_path / "gh"
+    gh.write_text(FAKE_GH)
+    gh.chmod(0o755)
+
+    monkeypatch.setenv("WEB_REMOTE_URL", str(remote))
+    monkeypatch.delenv("WEB_REPO_PATH", raising=False)
+    monkeypatch.delenv("AINEWS_CONTENT_PATH", raising=False)
+    monkeypatch.setenv("PUBLISH_GIT_NAME", "news-automation")
+    monkeypatch.setenv("PUBLISH_GIT_EMAIL", "bot@test")
+    monkeypatch.setenv("GH_BIN", str(gh))
+    monkeypatch.setenv("GH_LOG", str(tmp_path / "gh.log"))
+    monkeypatch.setenv("GH_FAIL", str(tmp_path / "gh.fail"))
+
+    return {"tmp": tmp_path, "remote": remote, "mirror": tmp_path / "mirror.git"}
+
+
+def make_work_dir(tmp: Path, slug: str) -> Path:
+    work_dir = tmp / "output" / slug
+    work_dir.mkdir(parents=True)
+    (work_dir / "final.md").write_text(
+        f"---\ntitle: \"{slug} 제목\"\nsummary:\n  - {slug} 요약\n---\n\n본문\n",
+        encoding="utf-8",
+    )
+    return work_dir
+
+
+def gh_calls(tmp: Path) -> list[list[str]]:
+    return [p.read_text().splitlines() for p in sorted(tmp.glob("gh.log.*"))]
+
+
+def remote_branches(remote: Path) -> list[str]:
+    refs = git("--git-dir", str(remote), "for-each-ref", "--format=%(refname:short)", "refs/heads/")
+    return sorted(refs.splitlines())
+
+
+def test_flush_pushes_batch_and_creates_pr(env):
+    tmp = env["tmp"]
+    for slug in ("26-01-01-a", "26-01-02-b"):
+        publish_queue.enqueue(slug, make_work_dir(tmp, slug))
+
+    result = publish_queue.flush(force=True, mirror=env["mirror"])
+
+    assert result["pr_url"] == "https://example.test/pull/1"
+    assert result["slugs"] == ["26-01-01-a", "26-01-02-b"]
+    assert result["branch"].startswith("ainews/batch-")
+    assert remote_branches(env["remote"]) == sorted(["main", result["branch"]])
+
+    # 이슈마다 한 커밋, main 위에 쌓임
+    log = git("--git-dir", str(env["remote"]), "log", "--format=%s", result["branch"]).splitlines()
+    assert log == [
+        "feat(ainews): Add AI news - 26-01-02-b",
+        "feat(ainews): Add AI news - 26-01-01-a",
+        "init",
+    ]
+    files = git("--git-dir", str(env["remote"]), "ls-tree", "-r", "--name-only", result["branch"])
+    assert "src/content/ainews/ko/26-01-01-a.md" in files.splitlines()
+
+    [call] = gh_calls(tmp)
+    assert call[call.index("--head") + 1] == result["branch"]
+    assert call[call.index("--base") + 1] == "main"
+
+    queue = publish_queue.load_queue()
+    assert queue["items"] == [] and "pending" not in queue
+    assert state_manager.get_status("26-01-01-a") == state_manager.ProcessStatus.SUCCESS.value
+
+
+def test_gh_failure_keeps_items_and_reuses_pushed_branch(env):
+    tmp = env["tmp"]
+    for slug in ("26-01-01-a", "26-01-02-b"):
+        publish_queue.enqueue(slug, make_work_dir(tmp, slug))
+
+    (tmp / "gh.fail").touch()
+    with pytest.raises(PublishError, match="gh pr create failed"):
+        publish_queue.flush(force=True, mirror=env["mirror"])
+
+    queue = publish_queue.load_queue()
+    assert [i["slug"] for i in queue["items"]] == ["26-01-01-a", "26-01-02-b"]
+    branch = queue["pending"]["branch"]
+    assert branch in remote_branches(env["remote"])
+
+    # 실패 이후 들어온 항목은 재시도 배치에 섞이지 않음
+    publish_queue.enqueue("26-01-03-c", make_work_dir(tmp, "26-01-03-c"))
+
+    # 재시도는 정책과 무관하게 같은 브랜치로 진행 (새 batch 브랜치를 만들지 않음)
+    (tmp / "gh.fail").unlink()
+    result = publish_queue.flush(mirror=env["mirror"])
+
+    assert result["branch"] == branch
+    assert result["reason"].startswith("retry pending PR")
+    assert result["slugs"] == ["26-01-01-a", "26-01-02-b"]
+    assert remote_branches(env["remote"]) == sorted(["main", branch])
+
+    calls = gh_calls(tmp)
+    assert len(calls) == 2
+    assert all(c[c.index("--head") + 1] == branch for c in calls)
+
+    queue = publish_queue.load_queue()
+    assert [i["slug"] for i in queue["items"]] == ["26-01-03-c"]
+    assert "pending" not in queue
+
+
+def test_pending_branch_dropped_when_items_are_gone(env):
+    tmp = env["tmp"]
+    publish_queue.enqueue("26-01-01-a", make_work_dir(tmp, "26-01-01-a"))
+    publish_queue.enqueue("26-01-02-b", make_work_dir(tmp, "26-01-02-b"))
+
+    queue = publish_queue.load_queue()
+    queue["pending"] = {"branch": "ainews/batch-stale", "keys": [["26-01-09-x", "ko"]]}
+    publish_queue.save_queue(queue)
+
+    result = publish_queue.flush(force=True, mirror=env["mirror"])
+
+    assert result["branch"] != "ainews/batch-stale"
+    assert result["reason"] == "manual"
+    assert "pending" not in publish_queue.load_queue()
+
+
+def test_enqueue_waits_for_queue_lock(env):
+    tmp = env["tmp"]
+    work_dir = make_work_dir(tmp, "26-01-01-a")
+    done = threading.Event()
+
+    def worker():
+        publish_queue.enqueue("26-01-01-a", work_dir)
+        done.set()
+
+    with publish_queue.queue_lock():
+        thread = threading.Thread(target=worker)
+        thread.start()
+        # 플러시가 잠금을 잡고 있는 동안에는 큐 파일을 수정하지 않음
+        assert not done.wait(0.3)
+        assert not publish_queue.QUEUE_FILE.exists()
+
+    thread.join(timeout=5)
+    assert done.is_set()
+    assert [i["slug"] for i in publish_queue.load_queue()["items"]] == ["26-01-01-a"]
+    assert json.loads(publish_queue.QUEUE_FILE.read_text(encoding="utf-8"))["last_flush"] is None